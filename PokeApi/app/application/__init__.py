@@ -3,7 +3,7 @@
 Application layer containing use cases and business rules
 
 Exposes:
-- UseCases: FetchAndStorePosts, FetchAndStoreComments, ProcessPost, ProcessComment
+- UseCases: FetchAndStorePosts, FetchAndStoreComments, ProcessPost, ProcessComment, FindSimilarBerries
 - DTOs: PokeApiPostDTO, PokeApiPostListDTO
 """
 
@@ -11,7 +11,8 @@ from .use_cases import (
     FetchAndStorePostsUseCase,
     FetchAndStoreCommentsUseCase,
     ProcessPostUseCase,
-    ProcessCommentUseCase
+    ProcessCommentUseCase,
+    FindSimilarBerriesUseCase
 )
 from .dtos.pokeapi import PokeApiPostDTO, PokeApiPostListDTO
 
@@ -20,6 +21,7 @@ __all__ = [
     'FetchAndStoreCommentsUseCase',
     'ProcessPostUseCase',
     'ProcessCommentUseCase',
+    'FindSimilarBerriesUseCase',
     'PokeApiPostDTO',
     'PokeApiPostListDTO'
 ]
\ No newline at end of file
@@ -5,8 +5,10 @@ Data Transfer Objects for application layer
 Contains:
 - PokeApiPostDTO: DTO for PokeAPI post data
 - PokeApiPostListDTO: DTO for PokeAPI post list
+- ErrorSummary: Bounded per-type failure counts with a sample reservoir
 """
 
 from .pokeapi import PokeApiPostDTO, PokeApiPostListDTO
+from .pipeline_stats import ErrorSummary
 
-__all__ = ['PokeApiPostDTO', 'PokeApiPostListDTO']
\ No newline at end of file
+__all__ = ['PokeApiPostDTO', 'PokeApiPostListDTO', 'ErrorSummary']
\ No newline at end of file
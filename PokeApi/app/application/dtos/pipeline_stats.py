@@ -0,0 +1,55 @@
+# app/application/dtos/pipeline_stats.py
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ErrorSummary:
+    """
+    Bounded summary of pipeline failures
+    Keeps a count per error type plus a uniform reservoir sample of failed items,
+    so memory stays constant no matter how many items fail
+    """
+    sample_size: int = 20
+    max_message_length: int = 200
+    total: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+    samples: List[Dict[str, Any]] = field(default_factory=list)
+    _rng: random.Random = field(default_factory=random.Random, repr=False, compare=False)
+
+    def record(self, error_type: str, item_id: Any = None, message: Optional[str] = None) -> None:
+        """
+        Count a failure and offer it to the sample reservoir
+
+        Args:
+            error_type: Failure category (e.g. 'processing_failed', 'store_failed')
+            item_id: Id of the failed post or comment
+            message: Optional error detail, truncated to max_message_length
+        """
+        self.total += 1
+        self.counts[error_type] = self.counts.get(error_type, 0) + 1
+
+        # Reservoir sampling (Algorithm R): every failure has equal odds of being kept
+        if len(self.samples) < self.sample_size:
+            slot = len(self.samples)
+            self.samples.append({})
+        else:
+            slot = self._rng.randrange(self.total)
+            if slot >= self.sample_size:
+                return
+        self.samples[slot] = {
+            'type': error_type,
+            'id': item_id,
+            'message': message[:self.max_message_length] if message else None
+        }
+
+    def __len__(self) -> int:
+        return self.total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'by_type': dict(self.counts),
+            'samples': [dict(sample) for sample in self.samples]
+        }
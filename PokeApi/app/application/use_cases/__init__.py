@@ -7,16 +7,19 @@ Contains:
 - FetchAndStoreCommentsUseCase: Gets and stores comments for posts
 - ProcessPostUseCase: Processes post data
 - ProcessCommentUseCase: Processes comment data
+- FindSimilarBerriesUseCase: Nearest-neighbour lookups over the similarity index
 """
 
 from .fetch_posts import FetchAndStorePostsUseCase
 from .fetch_comments import FetchAndStoreCommentsUseCase
 from .process_post import ProcessPostUseCase
 from .process_comment import ProcessCommentUseCase
+from .find_similar_berries import FindSimilarBerriesUseCase
 
 __all__ = [
     'FetchAndStorePostsUseCase',
     'FetchAndStoreCommentsUseCase',
     'ProcessPostUseCase',
-    'ProcessCommentUseCase'
+    'ProcessCommentUseCase',
+    'FindSimilarBerriesUseCase'
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 # app/application/use_cases/fetch_comments.py
-from typing import List
+from typing import Iterator, List, Optional
+from app.application.dtos.pipeline_stats import ErrorSummary
 from app.domain.entities.post import Post
 from app.domain.entities.comment import Comment
 from app.domain.interfaces.services import IPokeAPIService
@@ -51,4 +52,30 @@ class FetchAndStoreCommentsUseCase:
         except RepositoryError as e:
             raise RepositoryError(f"Failed to store comments for post {post.id}: {str(e)}")
         except Exception as e:
-            raise ServiceError(f"Unexpected error in FetchAndStoreCommentsUseCase: {str(e)}")
\ No newline at end of file
+            raise ServiceError(f"Unexpected error in FetchAndStoreCommentsUseCase: {str(e)}")
+
+    def stream(self, post: Post, errors: Optional[ErrorSummary] = None) -> Iterator[Comment]:
+        """
+        Streaming variant of execute(): yields each comment as soon as it is stored
+        
+        Args:
+            post: The Post entity to fetch comments for
+            errors: Optional summary receiving 'store_failed' entries
+            
+        Raises:
+            ServiceError: If there's an issue with the PokeAPI service
+            RepositoryError: If there's an issue with the repository
+        """
+        try:
+            for comment in self.pokeapi_service.iter_comments_for_post(post):
+                if self.comment_repository.save(comment):
+                    yield comment
+                elif errors is not None:
+                    errors.record('store_failed', comment.id)
+                    
+        except ServiceError as e:
+            raise ServiceError(f"Failed to fetch comments for post {post.id}: {str(e)}")
+        except RepositoryError as e:
+            raise RepositoryError(f"Failed to store comments for post {post.id}: {str(e)}")
+        except Exception as e:
+            raise ServiceError(f"Unexpected error in FetchAndStoreCommentsUseCase: {str(e)}")
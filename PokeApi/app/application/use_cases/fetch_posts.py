@@ -1,5 +1,6 @@
 # app/application/use_cases/fetch_posts.py
-from typing import List
+from typing import Iterator, List, Optional
+from app.application.dtos.pipeline_stats import ErrorSummary
 from app.domain.entities.post import Post
 from app.domain.interfaces.services import IPokeAPIService
 from app.domain.interfaces.repositories import IPostRepository
@@ -47,4 +48,41 @@ class FetchAndStorePostsUseCase:
         except RepositoryError as e:
             raise RepositoryError(f"Failed to store posts: {str(e)}")
         except Exception as e:
-            raise ServiceError(f"Unexpected error in FetchAndStorePostsUseCase: {str(e)}")
\ No newline at end of file
+            raise ServiceError(f"Unexpected error in FetchAndStorePostsUseCase: {str(e)}")
+
+    def stream(
+        self,
+        errors: Optional[ErrorSummary] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Iterator[Post]:
+        """
+        Streaming variant of execute(): yields each post as soon as it is
+        stored, so only one post is held in memory at a time
+        
+        Args:
+            errors: Optional summary receiving 'fetch_failed' and 'store_failed' entries
+            offset: Listing position to start from (used for shards)
+            limit: Maximum number of listing entries to cover
+            
+        Raises:
+            ServiceError: If there's an issue with the PokeAPI service
+            RepositoryError: If there's an issue with the repository
+        """
+        on_error = None
+        if errors is not None:
+            on_error = lambda post_id, e: errors.record('fetch_failed', post_id, str(e))
+
+        try:
+            for post in self.pokeapi_service.iter_posts(on_error=on_error, offset=offset, limit=limit):
+                if self.post_repository.save(post):
+                    yield post
+                elif errors is not None:
+                    errors.record('store_failed', post.id)
+                    
+        except ServiceError as e:
+            raise ServiceError(f"Failed to fetch posts: {str(e)}")
+        except RepositoryError as e:
+            raise RepositoryError(f"Failed to store posts: {str(e)}")
+        except Exception as e:
+            raise ServiceError(f"Unexpected error in FetchAndStorePostsUseCase: {str(e)}")
@@ -0,0 +1,83 @@
+# app/application/use_cases/find_similar_berries.py
+import logging
+import threading
+from typing import Any, Dict, List, Sequence
+
+from app.domain.exceptions import NotFoundError, RepositoryError, ValidationError
+from app.domain.interfaces.repositories import ICommentRepository, IPostRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FindSimilarBerriesUseCase:
+    """
+    Use case for "similar berries" lookups served from an in-memory
+    similarity index (SimilarityIndex). The index is loaded on first use and
+    brought up to date with the cache version before each lookup, so the
+    repositories are only read when the pipeline has changed berries. When
+    an update fails the previous index keeps serving and the next lookup
+    retries.
+    """
+
+    def __init__(
+        self,
+        post_repository: IPostRepository,
+        comment_repository: ICommentRepository,
+        index,
+        cache_version=None
+    ):
+        self.post_repository = post_repository
+        self.comment_repository = comment_repository
+        self.index = index
+        self.cache_version = cache_version
+        self._lock = threading.Lock()
+
+    def execute(self, post_id: Any, k: int = 5, metric: str = 'cosine') -> List[Dict[str, Any]]:
+        """
+        Args:
+            post_id: Berry to find neighbours for
+            k: Number of neighbours
+            metric: 'cosine' or 'l2'
+
+        Returns:
+            List[Dict]: Neighbours with id, name and score, closest first
+
+        Raises:
+            NotFoundError: If the berry is not stored
+            ValidationError: On an unknown metric
+            RepositoryError: If the index is not loaded yet and loading it fails
+        """
+        return self.execute_many([post_id], k, metric)[0]
+
+    def execute_many(self, post_ids: Sequence[Any], k: int = 5, metric: str = 'cosine') -> List[List[Dict[str, Any]]]:
+        """Neighbours of several berries, computed as one batch"""
+        if k < 1:
+            raise ValidationError('k', "must be a positive integer")
+        self.refresh()
+        for post_id in post_ids:
+            try:
+                if post_id not in self.index:
+                    raise NotFoundError("Berry", str(post_id))
+            except (TypeError, ValueError):
+                raise ValidationError('post_id', f"invalid berry id {post_id!r}")
+        try:
+            return self.index.similar_many(post_ids, k, metric)
+        except ValueError as e:
+            raise ValidationError('metric', str(e))
+
+    def refresh(self) -> None:
+        """Load the index, or apply the berries changed since the last refresh"""
+        if self.index.loaded and (self.cache_version is None
+                                  or int(self.cache_version.current()) == self.index.version):
+            return
+        with self._lock:
+            try:
+                if self.cache_version is None:
+                    if not self.index.loaded:
+                        self.index.load(self.post_repository, self.comment_repository)
+                else:
+                    self.index.sync(self.post_repository, self.comment_repository, self.cache_version)
+            except RepositoryError as e:
+                if not self.index.loaded:
+                    raise
+                logger.error(f"Similarity index refresh failed, serving version {self.index.version}: {str(e)}")
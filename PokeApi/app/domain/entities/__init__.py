@@ -5,9 +5,11 @@ Domain entities representing core business objects
 Contains:
 - Post: Represents a social media post (berry)
 - Comment: Represents a comment on a post (flavor)
+- RawPayload: Immutable JSON buffer for upstream payloads
 """
 
 from .post import Post
 from .comment import Comment
+from .raw_payload import RawPayload
 
-__all__ = ['Post', 'Comment']
\ No newline at end of file
+__all__ = ['Post', 'Comment', 'RawPayload']
\ No newline at end of file
@@ -1,33 +1,119 @@
-from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, Optional
 import uuid
 
-@dataclass
+from app.domain.entities.raw_payload import RawPayload, coerce_id
+
+
 class Comment:
-    id: str
-    post_id: int
-    flavor: str
-    potency: int
-    raw_data: Dict
-    created_at: str = datetime.utcnow().isoformat()
+    """
+    Berry flavor comment entity.
+
+    Uses __slots__ and keeps the flavor entry as a RawPayload buffer parsed on
+    demand. to_dict() is memoized per instance and reset whenever a field changes.
+
+    Ids are derived from (post_id, flavor), so ingesting the same berry again
+    overwrites its comments instead of adding new rows.
+    """
+
+    __slots__ = ('id', 'post_id', 'flavor', 'potency', 'raw_payload', 'created_at', '_dict_cache')
+
+    FIELDS = ('id', 'post_id', 'flavor', 'potency', 'raw_data', 'created_at')
+    # Berry flavors defined by PokeAPI
+    FLAVORS = ('spicy', 'dry', 'sweet', 'bitter', 'sour')
+    # Namespace of the name-based (uuid5) comment ids; changing it re-keys every comment
+    ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'https://pokeapi.co/api/v2/berry-flavor/')
+
+    def __init__(
+        self,
+        id: str,
+        post_id: int,
+        flavor: str,
+        potency: int,
+        raw_data: Any,
+        created_at: Optional[str] = None
+    ):
+        # object.__setattr__ skips the cache-invalidating __setattr__ below
+        _set = object.__setattr__
+        _set(self, 'id', id)
+        _set(self, 'post_id', post_id)
+        _set(self, 'flavor', flavor)
+        _set(self, 'potency', potency)
+        _set(self, 'raw_payload', RawPayload.wrap(raw_data))
+        _set(self, 'created_at', created_at or datetime.utcnow().isoformat())
+        _set(self, '_dict_cache', None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_dict_cache', None)
+
+    @property
+    def raw_data(self) -> Optional[Dict]:
+        """Decoded flavor entry (parsed on every access)"""
+        return self.raw_payload.to_dict() if self.raw_payload is not None else None
+
+    @raw_data.setter
+    def raw_data(self, value: Any) -> None:
+        self.raw_payload = RawPayload.wrap(value)
+
+    @classmethod
+    def make_id(cls, post_id: Any, flavor: str) -> str:
+        """Deterministic id of the comment for one flavor of one berry"""
+        return str(uuid.uuid5(cls.ID_NAMESPACE, f"{coerce_id(post_id)}:{flavor}"))
 
     @classmethod
     def create(cls, post_id: int, flavor_data: Dict) -> 'Comment':
+        flavor = flavor_data['flavor']['name']
         return cls(
-            id=str(uuid.uuid4()),
+            id=cls.make_id(post_id, flavor),
             post_id=post_id,
-            flavor=flavor_data['flavor']['name'],
+            flavor=flavor,
             potency=flavor_data['potency'],
-            raw_data=flavor_data
+            raw_data=RawPayload(value=flavor_data)
         )
 
-    def to_dict(self) -> Dict:
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Comment':
+        """
+        Build a Comment from a stored item, ignoring derived attributes such as
+        'content' and restoring the numeric post_id and potency
+        """
+        values = {field: data.get(field) for field in cls.FIELDS}
+        values['post_id'] = coerce_id(values['post_id'])
+        if values['potency'] is not None:
+            values['potency'] = int(values['potency'])
+        return cls(**values)
+
+    def to_fields(self) -> Dict:
+        """
+        Same keys as to_dict(), with raw_data left as the unparsed RawPayload
+        (or None), for consumers that only read the attribute fields
+        """
         return {
             "id": self.id,
             "post_id": self.post_id,
             "flavor": self.flavor,
             "potency": self.potency,
-            "raw_data": self.raw_data,
+            "raw_data": self.raw_payload,
             "created_at": self.created_at
-        }
\ No newline at end of file
+        }
+
+    def to_dict(self) -> Dict:
+        if self._dict_cache is None:
+            fields = self.to_fields()
+            fields["raw_data"] = self.raw_data
+            object.__setattr__(self, '_dict_cache', fields)
+        # Shallow copy: callers may rewrite top-level keys but share raw_data
+        return dict(self._dict_cache)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Comment):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__ if slot[0] != '_')
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Comment(id={self.id!r}, post_id={self.post_id!r}, flavor={self.flavor!r}, "
+                f"potency={self.potency!r}, raw_data={self.raw_payload!r}, created_at={self.created_at!r})")
@@ -1,22 +1,95 @@
-from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
-import uuid
+from typing import Any, Dict, Optional
+
+from app.domain.entities.raw_payload import RawPayload, coerce_id
+
 
-@dataclass
 class Post:
-    id: int
-    name: str
-    growth_time: int
-    max_harvest: int
-    natural_gift_power: int
-    size: int
-    smoothness: int
-    soil_dryness: int
-    raw_data: Dict
-    created_at: str = datetime.utcnow().isoformat()
+    """
+    Berry post entity.
 
-    def to_dict(self) -> Dict:
+    Uses __slots__ and keeps the PokeAPI document as a shared RawPayload buffer
+    that is parsed only when raw_data or to_dict() is accessed. to_dict() and
+    to_json() are memoized per instance and reset whenever a field changes.
+    """
+
+    __slots__ = (
+        'id', 'name', 'growth_time', 'max_harvest', 'natural_gift_power',
+        'size', 'smoothness', 'soil_dryness', 'raw_payload', 'created_at',
+        '_dict_cache', '_json_cache'
+    )
+
+    FIELDS = (
+        'id', 'name', 'growth_time', 'max_harvest', 'natural_gift_power',
+        'size', 'smoothness', 'soil_dryness', 'raw_data', 'created_at'
+    )
+    NUMERIC_FIELDS = (
+        'growth_time', 'max_harvest', 'natural_gift_power',
+        'size', 'smoothness', 'soil_dryness'
+    )
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        growth_time: int,
+        max_harvest: int,
+        natural_gift_power: int,
+        size: int,
+        smoothness: int,
+        soil_dryness: int,
+        raw_data: Any,
+        created_at: Optional[str] = None
+    ):
+        # object.__setattr__ skips the cache-invalidating __setattr__ below,
+        # which would otherwise dominate construction cost
+        _set = object.__setattr__
+        _set(self, 'id', id)
+        _set(self, 'name', name)
+        _set(self, 'growth_time', growth_time)
+        _set(self, 'max_harvest', max_harvest)
+        _set(self, 'natural_gift_power', natural_gift_power)
+        _set(self, 'size', size)
+        _set(self, 'smoothness', smoothness)
+        _set(self, 'soil_dryness', soil_dryness)
+        _set(self, 'raw_payload', RawPayload.wrap(raw_data))
+        _set(self, 'created_at', created_at or datetime.utcnow().isoformat())
+        _set(self, '_dict_cache', None)
+        _set(self, '_json_cache', None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_dict_cache', None)
+            object.__setattr__(self, '_json_cache', None)
+
+    @property
+    def raw_data(self) -> Optional[Dict]:
+        """Decoded PokeAPI document (parsed on every access)"""
+        return self.raw_payload.to_dict() if self.raw_payload is not None else None
+
+    @raw_data.setter
+    def raw_data(self, value: Any) -> None:
+        self.raw_payload = RawPayload.wrap(value)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Post':
+        """
+        Build a Post from a stored item, ignoring unknown attributes and
+        normalizing DynamoDB Decimal numbers back to int
+        """
+        values = {field: data.get(field) for field in cls.FIELDS}
+        for field in cls.NUMERIC_FIELDS:
+            if values[field] is not None:
+                values[field] = int(values[field])
+        values['id'] = coerce_id(values['id'])
+        return cls(**values)
+
+    def to_fields(self) -> Dict:
+        """
+        Same keys as to_dict(), with raw_data left as the unparsed RawPayload
+        (or None), for consumers that only read the attribute fields
+        """
         return {
             "id": self.id,
             "name": self.name,
@@ -26,6 +99,37 @@ class Post:
             "size": self.size,
             "smoothness": self.smoothness,
             "soil_dryness": self.soil_dryness,
-            "raw_data": self.raw_data,
+            "raw_data": self.raw_payload,
             "created_at": self.created_at
-        }
\ No newline at end of file
+        }
+
+    def to_dict(self) -> Dict:
+        if self._dict_cache is None:
+            fields = self.to_fields()
+            fields["raw_data"] = self.raw_data
+            object.__setattr__(self, '_dict_cache', fields)
+        # Shallow copy: callers may rewrite top-level keys but share raw_data
+        return dict(self._dict_cache)
+
+    def to_json(self) -> bytes:
+        """JSON encoding of to_dict(), splicing in the raw buffer without re-encoding it"""
+        if self._json_cache is None:
+            fields = self.to_fields()
+            fields.pop("raw_data")
+            head = RawPayload.wrap(fields)
+            raw = bytes(self.raw_payload) if self.raw_payload is not None else b'null'
+            object.__setattr__(self, '_json_cache', bytes(head)[:-1] + b',"raw_data":' + raw + b'}')
+        return self._json_cache
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Post):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__ if slot[0] != '_')
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Post(id={self.id!r}, name={self.name!r}, growth_time={self.growth_time!r}, "
+                f"max_harvest={self.max_harvest!r}, natural_gift_power={self.natural_gift_power!r}, "
+                f"size={self.size!r}, smoothness={self.smoothness!r}, soil_dryness={self.soil_dryness!r}, "
+                f"raw_data={self.raw_payload!r}, created_at={self.created_at!r})")
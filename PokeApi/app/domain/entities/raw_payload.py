@@ -0,0 +1,95 @@
+import json
+from decimal import Decimal
+from typing import Any, Optional
+
+
+def _json_default(value: Any) -> Any:
+    # DynamoDB hands numbers back as Decimal
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def coerce_id(value: Any) -> Any:
+    """Numeric ids are stored as strings in DynamoDB; restore them to int"""
+    if value is None or (isinstance(value, str) and not value.isdigit()):
+        return value
+    return int(value)
+
+
+_UNSET = object()
+
+
+class RawPayload:
+    """
+    Read-only holder for an upstream JSON payload.
+
+    Payloads received as bytes (e.g. an HTTP response body) stay as that
+    compact buffer and are parsed only when `to_dict()` is called. Payloads
+    that are already decoded keep the original object and are encoded only
+    when `bytes()` is requested. Either way nothing is copied eagerly, and
+    instances are shared between entities and never mutated.
+    """
+
+    __slots__ = ('_buffer', '_value')
+
+    def __init__(self, buffer: Optional[bytes] = None, value: Any = _UNSET):
+        if buffer is None and value is _UNSET:
+            raise ValueError("RawPayload needs a buffer or a decoded value")
+        self._buffer = bytes(buffer) if buffer is not None else None
+        self._value = value
+
+    @classmethod
+    def wrap(cls, value: Any) -> Optional['RawPayload']:
+        """
+        Build a payload from encoded bytes, a JSON string or a decoded object
+
+        Args:
+            value: RawPayload, bytes-like, str or JSON-serializable object
+
+        Returns:
+            RawPayload, or None when value is None
+        """
+        if value is None or isinstance(value, RawPayload):
+            return value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return cls(buffer=value)
+        if isinstance(value, str):
+            return cls(buffer=value.encode('utf-8'))
+        return cls(value=value)
+
+    @property
+    def is_encoded(self) -> bool:
+        """True when the payload is held as an encoded buffer"""
+        return self._buffer is not None
+
+    def to_dict(self) -> Any:
+        """
+        Decoded payload. Buffers are parsed into a fresh object on every call;
+        decoded payloads return the shared original, which must not be mutated.
+        """
+        if self._buffer is None:
+            return self._value
+        return json.loads(self._buffer)
+
+    def __bytes__(self) -> bytes:
+        if self._buffer is not None:
+            return self._buffer
+        return json.dumps(self._value, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+    def __len__(self) -> int:
+        return len(bytes(self))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RawPayload):
+            if self._buffer is not None and self._buffer == other._buffer:
+                return True
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        if self._buffer is not None:
+            return f"RawPayload({len(self._buffer)} bytes)"
+        return f"RawPayload(decoded {type(self._value).__name__})"
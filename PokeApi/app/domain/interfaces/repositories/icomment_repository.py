@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from app.domain.entities.comment import Comment
 
 class ICommentRepository(ABC):
@@ -9,4 +9,28 @@ class ICommentRepository(ABC):
 
     @abstractmethod
     def get_by_post_id(self, post_id: int) -> List[Comment]:
-        pass
\ No newline at end of file
+        pass
+
+    def save_many(self, comments: Iterable[Comment]) -> int:
+        """Store several comments; returns how many were saved"""
+        return sum(1 for comment in comments if self.save(comment))
+
+    def get_by_post_ids(self, post_ids: Iterable[Any]) -> Dict[str, List[Comment]]:
+        """
+        Comments of several posts, keyed by post id. Implementations should
+        raise RepositoryError when a lookup fails, so callers never mistake a
+        failure for a post without comments; this default uses get_by_post_id().
+        """
+        return {str(post_id): self.get_by_post_id(post_id) for post_id in post_ids}
+
+    def list_page(
+        self,
+        limit: int,
+        start_key: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Comment], Optional[Dict[str, Any]]]:
+        """
+        Return one page of comments and the key to continue from (None on the
+        last page), raising RepositoryError when it cannot be read. Callers
+        fall back to get_by_post_id() when this is not implemented.
+        """
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from app.domain.entities.post import Post
 
 class IPostRepository(ABC):
@@ -13,4 +13,31 @@ class IPostRepository(ABC):
 
     @abstractmethod
     def get_all(self) -> List[Post]:
-        pass
\ No newline at end of file
+        pass
+
+    def get_many(self, post_ids: Iterable[Any]) -> Dict[str, Optional[Post]]:
+        """
+        Look up several posts; missing ones map to None. Implementations
+        should raise RepositoryError when a lookup fails, so callers never
+        mistake a failure for a deleted post; this default uses get_by_id().
+        """
+        return {str(post_id): self.get_by_id(post_id) for post_id in post_ids}
+
+    def list_page(
+        self,
+        limit: int,
+        start_key: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Post], Optional[Dict[str, Any]]]:
+        """
+        Return one page of posts and the key to continue from (None on the
+        last page). Implementations should read only the requested page and
+        raise RepositoryError when it cannot be read; this default slices
+        get_all() ordered by id.
+        """
+        posts = sorted(self.get_all(), key=lambda post: str(post.id))
+        start = 0
+        if start_key:
+            start = next((i + 1 for i, post in enumerate(posts) if str(post.id) == str(start_key['id'])), len(posts))
+        page = posts[start:start + limit]
+        next_key = {'id': str(page[-1].id)} if page and start + limit < len(posts) else None
+        return page, next_key
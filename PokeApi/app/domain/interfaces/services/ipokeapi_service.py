@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional
 from app.domain.entities.post import Post
 from app.domain.entities.comment import Comment
 
@@ -18,4 +19,26 @@ class IPokeAPIService(ABC):
 
     @abstractmethod
     def fetch_comments_for_post(self, post: Post) -> List[Comment]:
-        pass
\ No newline at end of file
+        pass
+
+    def iter_posts(
+        self,
+        on_error: Optional[Callable[[int, Exception], None]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Iterator[Post]:
+        """
+        Yield posts one at a time. Implementations should page through the
+        listing lazily; this default falls back to the materialized list.
+
+        Args:
+            on_error: Called with (post_id, error) for posts that could not be fetched
+            offset: Listing position to start from
+            limit: Maximum number of listing entries to cover
+        """
+        stop = None if limit is None else offset + limit
+        yield from islice(self.fetch_and_transform_posts(), offset, stop)
+
+    def iter_comments_for_post(self, post: Post) -> Iterator[Comment]:
+        """Yield the comments for a post one at a time"""
+        yield from self.fetch_comments_for_post(post)
@@ -8,8 +8,16 @@ Exposes:
 - Utilities: CircuitBreaker, DeadLetterQueue
 """
 
-from .persistence import DynamoDBPostRepository, DynamoDBCommentRepository
-from .external import PokeAPIService, ProcessingService, CircuitBreaker, DeadLetterQueue
+from app.infrastructure.config.lazy import lazy_exports
+
+_EXPORTS = {
+    'DynamoDBPostRepository': '.persistence',
+    'DynamoDBCommentRepository': '.persistence',
+    'PokeAPIService': '.external',
+    'ProcessingService': '.external',
+    'CircuitBreaker': '.external',
+    'DeadLetterQueue': '.external'
+}
 
 __all__ = [
     'DynamoDBPostRepository',
@@ -18,4 +26,6 @@ __all__ = [
     'ProcessingService',
     'CircuitBreaker',
     'DeadLetterQueue'
-]
\ No newline at end of file
+]
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
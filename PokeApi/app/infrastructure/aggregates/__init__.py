@@ -0,0 +1,11 @@
+# app/infrastructure/aggregates/__init__.py
+"""
+Aggregates maintained during ingest
+
+Contains:
+- FlavorAggregates: Per-flavor counts, potency sums and strongest berries in Redis
+"""
+
+from .flavor_aggregates import FlavorAggregates
+
+__all__ = ['FlavorAggregates']
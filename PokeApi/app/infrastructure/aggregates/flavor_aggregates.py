@@ -0,0 +1,120 @@
+# app/infrastructure/aggregates/flavor_aggregates.py
+import os
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.domain.entities.comment import Comment
+from app.domain.entities.raw_payload import coerce_id
+
+logger = logging.getLogger(__name__)
+
+# Apply the contributions of a batch of comments. Each (flavor, berry) pair is
+# counted once: the stored potency of a pair already seen is replaced, so
+# re-ingesting an item leaves count and sum unchanged.
+# KEYS[1]: contributions hash, KEYS[2]: flavor set,
+# KEYS[2j+1], KEYS[2j+2]: stats hash and potency zset of item j
+# ARGV[3j-2], ARGV[3j-1], ARGV[3j]: flavor, berry id and potency of item j
+_RECORD_SCRIPT = """
+local added = 0
+for j = 1, #ARGV / 3 do
+    local flavor, berry, potency = ARGV[3 * j - 2], ARGV[3 * j - 1], tonumber(ARGV[3 * j])
+    local stats, top = KEYS[2 * j + 1], KEYS[2 * j + 2]
+    local field = flavor .. '|' .. berry
+    local previous = redis.call('hget', KEYS[1], field)
+    if not previous then
+        redis.call('hincrby', stats, 'count', 1)
+        redis.call('hincrby', stats, 'sum', potency)
+        added = added + 1
+    else
+        redis.call('hincrby', stats, 'sum', potency - tonumber(previous))
+    end
+    redis.call('hset', KEYS[1], field, potency)
+    redis.call('zadd', top, potency, berry)
+    redis.call('sadd', KEYS[2], flavor)
+end
+return added
+"""
+
+
+def _text(value: Any) -> Any:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class FlavorAggregates:
+    """
+    Per-flavor aggregates kept up to date as comments are stored:
+    - number of berries with the flavor and the sum of their potencies
+    - berries ranked by potency, for "strongest berry per flavor" queries
+    Updates are idempotent per (flavor, berry) and atomic through a Lua
+    script, and queries read a handful of keys regardless of table size.
+    """
+
+    def __init__(self, redis_client, namespace: Optional[str] = None, default_top_k: int = 3):
+        """
+        Args:
+            redis_client: Redis client holding the aggregates
+            namespace: Prefix for Redis keys (falls back to FLAVOR_AGGREGATES_NAMESPACE env var)
+            default_top_k: Berries returned per flavor when top_k is not given
+        """
+        self.redis = redis_client
+        self.namespace = namespace or os.getenv('FLAVOR_AGGREGATES_NAMESPACE', 'agg:flavor')
+        self.default_top_k = default_top_k
+        self._record = redis_client.register_script(_RECORD_SCRIPT)
+
+    def _key(self, *parts) -> str:
+        return ":".join([self.namespace] + [str(part) for part in parts])
+
+    def record(self, comments: Iterable[Comment]) -> int:
+        """
+        Fold stored comments into the aggregates
+
+        Args:
+            comments: Comments just written to the repository
+
+        Returns:
+            int: Number of (flavor, berry) pairs seen for the first time
+        """
+        keys = [self._key("contributions"), self._key("flavors")]
+        args: List[Any] = []
+        for comment in comments:
+            if comment.flavor is None or comment.potency is None:
+                continue
+            keys.extend([self._key("stats", comment.flavor), self._key("top", comment.flavor)])
+            args.extend([comment.flavor, comment.post_id, int(comment.potency)])
+        if not args:
+            return 0
+        return int(self._record(keys=keys, args=args))
+
+    def flavors(self) -> List[str]:
+        return sorted(_text(flavor) for flavor in self.redis.smembers(self._key("flavors")))
+
+    def get(self, flavor: str, top_k: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Aggregates of one flavor
+
+        Returns:
+            Dict with berry_count, total_potency, average_potency and the
+            `top_k` strongest berries, or None if the flavor was never seen
+        """
+        top_k = self.default_top_k if top_k is None else top_k
+        with self.redis.pipeline() as pipe:
+            pipe.hmget(self._key("stats", flavor), ['count', 'sum'])
+            pipe.zrevrange(self._key("top", flavor), 0, top_k - 1, withscores=True)
+            (count, total), top = pipe.execute()
+        if count is None:
+            return None
+        count, total = int(count), int(total or 0)
+        return {
+            'flavor': flavor,
+            'berry_count': count,
+            'total_potency': total,
+            'average_potency': total / count if count else 0.0,
+            'strongest': [
+                {'post_id': coerce_id(_text(berry)), 'potency': int(potency)} for berry, potency in (top if top_k > 0 else [])
+            ]
+        }
+
+    def summary(self, top_k: int = 1) -> List[Dict[str, Any]]:
+        """Aggregates of every flavor seen so far"""
+        results = (self.get(flavor, top_k) for flavor in self.flavors())
+        return [result for result in results if result is not None]
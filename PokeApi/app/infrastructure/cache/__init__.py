@@ -0,0 +1,13 @@
+# app/infrastructure/cache/__init__.py
+"""
+In-process caching for read paths
+
+Contains:
+- TTLCache: Thread-safe LRU cache with per-entry expiry
+- CacheVersion: Redis-backed version counter that writers bump to invalidate readers
+"""
+
+from .ttl_cache import TTLCache
+from .cache_version import CacheVersion
+
+__all__ = ['TTLCache', 'CacheVersion']
@@ -0,0 +1,123 @@
+# app/infrastructure/cache/cache_version.py
+import os
+import time
+import logging
+import threading
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Increment the version and record the changed ids under it in one step, so
+# a reader never sees the new version without its change log entries.
+# KEYS[1]: version counter, KEYS[2]: change log zset
+# ARGV[1]: versions kept in the change log, ARGV[2..]: changed ids
+_BUMP_SCRIPT = """
+local version = redis.call('incr', KEYS[1])
+if #ARGV > 1 then
+    for i = 2, #ARGV do
+        redis.call('zadd', KEYS[2], version, ARGV[i])
+    end
+    redis.call('zremrangebyscore', KEYS[2], '-inf', version - tonumber(ARGV[1]))
+end
+return version
+"""
+
+
+class CacheVersion:
+    """
+    Version counter stored in Redis and shared by writers and readers:
+    - Writers call bump() after storing data, optionally with the ids they
+      changed; those are kept in a change log for `history` versions
+    - Readers call current() and drop their cached responses when it changes;
+      Redis is polled at most once per `check_interval` seconds, so a cache hit
+      normally costs no network round trip
+    - Readers holding derived state (e.g. snapshots) call changes_since() to
+      update only the ids written since the version they last saw
+    Without a Redis client the version never changes and entries only expire
+    by TTL.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        key: Optional[str] = None,
+        check_interval: Optional[float] = None,
+        history: Optional[int] = None
+    ):
+        """
+        Args:
+            redis_client: Redis client holding the counter
+            key: Redis key of the counter (falls back to CACHE_VERSION_KEY env var)
+            check_interval: Seconds between Redis reads in current()
+                (falls back to CACHE_VERSION_CHECK_INTERVAL env var)
+            history: Versions covered by the change log (falls back to
+                CACHE_CHANGE_HISTORY env var)
+        """
+        self.redis = redis_client
+        self.key = key or os.getenv('CACHE_VERSION_KEY', 'cache:posts:version')
+        self.changes_key = f"{self.key}:changes"
+        self.check_interval = (check_interval if check_interval is not None
+                               else float(os.getenv('CACHE_VERSION_CHECK_INTERVAL', '1')))
+        self.history = history or int(os.getenv('CACHE_CHANGE_HISTORY', '100'))
+        self._version = '0'
+        self._checked_at = float('-inf')
+        self._lock = threading.Lock()
+        self._bump = redis_client.register_script(_BUMP_SCRIPT) if redis_client is not None else None
+
+    def current(self) -> str:
+        if self.redis is None:
+            return self._version
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return self._version
+        with self._lock:
+            if now - self._checked_at >= self.check_interval:
+                try:
+                    value = self.redis.get(self.key)
+                    self._version = str(value.decode() if isinstance(value, bytes) else value or '0')
+                except Exception as e:
+                    # Keep serving the last known version; TTL still bounds staleness
+                    logger.warning(f"Failed to read cache version {self.key}: {str(e)}")
+                self._checked_at = now
+        return self._version
+
+    def bump(self, changed_ids: Iterable = ()) -> Optional[int]:
+        """
+        Invalidate every reader's cache
+
+        Args:
+            changed_ids: Ids written since the previous bump, recorded in the change log
+
+        Returns:
+            The new version, or None without Redis or on error
+        """
+        if self.redis is None:
+            return None
+        try:
+            changed = list(dict.fromkeys(str(item_id) for item_id in changed_ids))
+            version = int(self._bump(keys=[self.key, self.changes_key], args=[self.history] + changed))
+            logger.debug(f"Bumped cache version {self.key} to {version} ({len(changed)} changed ids)")
+            return version
+        except Exception as e:
+            logger.warning(f"Failed to bump cache version {self.key}: {str(e)}")
+            return None
+
+    def changes_since(self, version: int, current: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Ids written after `version`
+
+        Args:
+            version: Version the caller's state reflects
+            current: Version to compare against (read from Redis when omitted)
+
+        Returns:
+            List of ids, or None when the change log does not reach back to
+            `version` and the caller has to rebuild from scratch
+        """
+        if self.redis is None:
+            return None
+        current = int(self.current()) if current is None else current
+        if current - version > self.history:
+            return None
+        members = self.redis.zrangebyscore(self.changes_key, f"({version}", '+inf')
+        return [member.decode() if isinstance(member, bytes) else member for member in members]
@@ -4,8 +4,14 @@ Configuration utilities for infrastructure
 
 Contains:
 - database: Database connection utilities
+- ClientRegistry: Pooled clients shared by every component, with pool usage stats
+- LazyProxy: Defers building a client until it is first used
+- lazy_import: Defers executing a module until it is first used
+- lazy_exports: Module __getattr__ importing a package's exports on first access
 """
 
+from .client_registry import ClientRegistry, get_client_registry
 from .database import get_dynamodb_resource
+from .lazy import LazyProxy, lazy_exports, lazy_import
 
-__all__ = ['get_dynamodb_resource']
\ No newline at end of file
+__all__ = ['ClientRegistry', 'get_client_registry', 'get_dynamodb_resource', 'LazyProxy', 'lazy_exports', 'lazy_import']
\ No newline at end of file
@@ -0,0 +1,253 @@
+# app/infrastructure/config/client_registry.py
+import os
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional
+
+from app.infrastructure.config import database
+
+logger = logging.getLogger(__name__)
+
+
+def _manager_pools(managers) -> Iterator[Any]:
+    """Connection pools (one per host) of urllib3 PoolManagers"""
+    for manager in managers:
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is not None:
+                yield pool
+
+
+def _urllib3_stats(pools: Iterable[Any]) -> Dict[str, int]:
+    """Summed figures of urllib3 connection pools"""
+    stats = {'pools': 0, 'max_size': 0, 'in_use': 0, 'connections_created': 0, 'requests': 0}
+    for pool in pools:
+        stats['pools'] += 1
+        if pool.pool is not None:
+            # The queue holds idle connections (or None placeholders); what
+            # is missing from it is checked out
+            stats['max_size'] += pool.pool.maxsize
+            stats['in_use'] += pool.pool.maxsize - pool.pool.qsize()
+        stats['connections_created'] += pool.num_connections
+        stats['requests'] += pool.num_requests
+    return stats
+
+
+def _botocore_pools(client) -> Iterator[Any]:
+    http_session = client._endpoint.http_session
+    managers = [http_session._manager] + list(getattr(http_session, '_proxy_managers', {}).values())
+    return _manager_pools(managers)
+
+
+class ClientRegistry:
+    """
+    Process-wide owner of the clients every component talks through:
+    - One requests Session (keep-alive pools) for PokeAPI and processing calls
+    - One DynamoDB resource per endpoint, one SQS client per region/endpoint
+    - One OpenSearch client and one blocking Redis connection pool, sized
+      separately since every thread of every component shares it
+
+    Each client is built once, on first use, under a lock; boto3, requests,
+    opensearch-py and redis clients are all safe to share across threads once
+    built. Pool sizes, timeouts and TCP keep-alive come from one place, and
+    pool_stats() reports how much of each pool is in use.
+    """
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        tcp_keepalive: Optional[bool] = None,
+        redis_pool_size: Optional[int] = None,
+        redis_pool_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            pool_size: Connections kept per host and client (falls back to
+                CLIENT_POOL_SIZE, then HTTP_POOL_SIZE env var)
+            connect_timeout: Seconds to establish a connection (falls back to
+                CLIENT_CONNECT_TIMEOUT env var)
+            read_timeout: Seconds to wait for a response (falls back to
+                CLIENT_READ_TIMEOUT env var)
+            tcp_keepalive: Enable TCP keep-alive probes on AWS and Redis sockets
+                (falls back to CLIENT_TCP_KEEPALIVE env var)
+            redis_pool_size: Redis connections shared by the process (falls
+                back to REDIS_POOL_SIZE env var)
+            redis_pool_timeout: Seconds a caller waits for a free Redis
+                connection before failing (falls back to REDIS_POOL_TIMEOUT env var)
+        """
+        self.pool_size = pool_size or int(os.getenv('CLIENT_POOL_SIZE') or os.getenv('HTTP_POOL_SIZE', '10'))
+        self.connect_timeout = (connect_timeout if connect_timeout is not None
+                                else float(os.getenv('CLIENT_CONNECT_TIMEOUT', '5')))
+        self.read_timeout = (read_timeout if read_timeout is not None
+                             else float(os.getenv('CLIENT_READ_TIMEOUT', '10')))
+        if tcp_keepalive is None:
+            tcp_keepalive = os.getenv('CLIENT_TCP_KEEPALIVE', 'true').lower() in ('1', 'true', 'yes')
+        self.tcp_keepalive = tcp_keepalive
+        self.redis_pool_size = redis_pool_size or int(os.getenv('REDIS_POOL_SIZE', '50'))
+        self.redis_pool_timeout = (redis_pool_timeout if redis_pool_timeout is not None
+                                   else float(os.getenv('REDIS_POOL_TIMEOUT', '5')))
+        self._clients: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = factory()
+                    logger.debug(f"Built shared client {key}")
+        return client
+
+    def _botocore_config(self):
+        from botocore.config import Config
+        return Config(
+            max_pool_connections=self.pool_size,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            tcp_keepalive=self.tcp_keepalive,
+            retries={'max_attempts': 3, 'mode': 'standard'}
+        )
+
+    def http_session(self):
+        """Shared requests Session; retries stay with the callers"""
+        from app.infrastructure.external.http_session import build_http_session
+        return self._get(('http',), lambda: build_http_session(self.pool_size))
+
+    def dynamodb(self, endpoint_url: Optional[str] = None):
+        """Shared boto3 DynamoDB resource for an endpoint"""
+        return self._get(
+            ('dynamodb', endpoint_url),
+            lambda: database.build_dynamodb_resource(endpoint_url=endpoint_url, config=self._botocore_config())
+        )
+
+    def sqs(self, region_name: Optional[str] = None, endpoint_url: Optional[str] = None):
+        """Shared boto3 SQS client for a region and endpoint"""
+        region_name = region_name or os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+        def build():
+            import boto3
+            return boto3.client('sqs', region_name=region_name, endpoint_url=endpoint_url,
+                                config=self._botocore_config())
+
+        return self._get(('sqs', region_name, endpoint_url), build)
+
+    def opensearch(self):
+        """Shared OpenSearch client configured from OPENSEARCH_* env vars"""
+        def build():
+            from app.infrastructure.search import opensearch_service
+            return opensearch_service.OpenSearch(
+                hosts=[{"host": os.getenv("OPENSEARCH_HOST"), "port": int(os.getenv("OPENSEARCH_PORT", 9200))}],
+                http_auth=(os.getenv("OPENSEARCH_USER"), os.getenv("OPENSEARCH_PASS")),
+                use_ssl=False,
+                verify_certs=False,
+                serializer=opensearch_service.CodecSerializer(),
+                pool_maxsize=self.pool_size,
+                timeout=self.read_timeout
+            )
+
+        return self._get(('opensearch',), build)
+
+    def redis(self):
+        """
+        Shared Redis client over a bounded connection pool (REDIS_* env vars).
+        When every connection is in use, callers wait up to redis_pool_timeout
+        seconds for one instead of failing at once.
+        """
+        def build():
+            import redis
+            pool = redis.BlockingConnectionPool(
+                host=os.getenv('REDIS_HOST', 'redis'),
+                port=int(os.getenv('REDIS_PORT', '6379')),
+                db=int(os.getenv('REDIS_DB', '0')),
+                max_connections=self.redis_pool_size,
+                timeout=self.redis_pool_timeout,
+                socket_timeout=self.read_timeout,
+                socket_connect_timeout=self.connect_timeout,
+                socket_keepalive=self.tcp_keepalive,
+                decode_responses=True,
+                health_check_interval=30
+            )
+            return redis.Redis(connection_pool=pool)
+
+        return self._get(('redis',), build)
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Pool usage of every client built so far
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per client: max_size, in_use,
+            connections_created and utilisation (in_use / max_size), plus
+            pools and requests for HTTP-based clients
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        for key, client in list(self._clients.items()):
+            name = ':'.join(str(part) for part in key if part)
+            try:
+                stats[name] = self._client_stats(key[0], client)
+            except Exception as e:
+                # Clients without real pools (fakes, mocks) are reported as such
+                logger.debug(f"No pool stats for {name}: {e}")
+                stats[name] = {'available': False}
+                continue
+            max_size = stats[name]['max_size']
+            stats[name]['utilisation'] = round(stats[name]['in_use'] / max_size, 4) if max_size else 0.0
+        return stats
+
+    @staticmethod
+    def _client_stats(kind: str, client) -> Dict[str, Any]:
+        if kind == 'http':
+            # One adapter is mounted for both schemes
+            adapters = {id(adapter): adapter for adapter in client.adapters.values()}.values()
+            return _urllib3_stats(_manager_pools(adapter.poolmanager for adapter in adapters))
+        if kind == 'dynamodb':
+            return _urllib3_stats(_botocore_pools(client.meta.client))
+        if kind == 'sqs':
+            return _urllib3_stats(_botocore_pools(client))
+        if kind == 'opensearch':
+            return _urllib3_stats(connection.pool for connection in client.transport.connection_pool.connections)
+        pool = client.connection_pool
+        # The queue holds idle connections and None placeholders for
+        # connections not created yet
+        created = len(pool._connections)
+        idle = sum(1 for connection in list(pool.pool.queue) if connection is not None)
+        return {
+            'max_size': pool.max_connections,
+            'in_use': created - idle,
+            'connections_created': created
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection; clients are rebuilt on next use"""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for key, client in clients.items():
+            try:
+                if key[0] == 'dynamodb':
+                    client.meta.client.close()
+                elif key[0] == 'redis':
+                    client.connection_pool.disconnect()
+                elif hasattr(client, 'close'):
+                    client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close client {key}: {e}")
+
+
+_default_registry: Optional[ClientRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """
+    Process-wide registry used when a component is not given its own; built
+    on first call, so it reads configuration loaded after import
+    """
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = ClientRegistry()
+    return _default_registry
@@ -1,12 +1,22 @@
 # app/infrastructure/config/database.py
 import os
-import boto3
 
-def get_dynamodb_resource(endpoint_url: str = None):
+
+def build_dynamodb_resource(endpoint_url: str = None, config=None):
+    """New boto3 DynamoDB resource; prefer the shared one from get_dynamodb_resource"""
+    # Imported here so modules depending on this one do not pay for boto3 at import time
+    import boto3
     return boto3.resource(
         'dynamodb',
         region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1'),
         aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID', 'test'),
         aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY', 'test'),
-        endpoint_url=endpoint_url
+        endpoint_url=endpoint_url,
+        config=config
     )
+
+
+def get_dynamodb_resource(endpoint_url: str = None):
+    """DynamoDB resource for an endpoint, shared through the process-wide ClientRegistry"""
+    from app.infrastructure.config.client_registry import get_client_registry
+    return get_client_registry().dynamodb(endpoint_url)
@@ -0,0 +1,91 @@
+# app/infrastructure/config/lazy.py
+import sys
+import importlib
+import threading
+import importlib.util
+from types import ModuleType
+from typing import Any, Callable, Mapping
+
+
+class LazyProxy:
+    """
+    Stand-in for an object that is expensive to build (clients, repositories).
+    The factory runs on first attribute access, once, and every later access
+    is forwarded to the built object.
+    """
+
+    __slots__ = ('_factory', '_target', '_lock')
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _resolve(self) -> Any:
+        target = object.__getattribute__(self, '_target')
+        if target is None:
+            with object.__getattribute__(self, '_lock'):
+                target = object.__getattribute__(self, '_target')
+                if target is None:
+                    target = object.__getattribute__(self, '_factory')()
+                    object.__setattr__(self, '_target', target)
+        return target
+
+    @property
+    def is_resolved(self) -> bool:
+        return object.__getattribute__(self, '_target') is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __repr__(self) -> str:
+        if self.is_resolved:
+            return f"LazyProxy({object.__getattribute__(self, '_target')!r})"
+        return "LazyProxy(<unresolved>)"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return a module that is only executed on first attribute access
+    (importlib.util.LazyLoader). Already imported modules are returned as is.
+
+    Args:
+        name: Absolute module name, e.g. 'redis'
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def lazy_exports(module_name: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Module-level __getattr__ importing a package's exports on first access,
+    so importing one submodule does not pull in every client library of its
+    siblings. Resolved values are cached in the package namespace.
+
+    Args:
+        module_name: The package's __name__
+        exports: Export name -> submodule, relative to the package (e.g. '.item_codec')
+
+    Usage:
+        __getattr__ = lazy_exports(__name__, _EXPORTS)
+    """
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            value = getattr(importlib.import_module(exports[name], module_name), name)
+            setattr(sys.modules[module_name], name, value)
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -0,0 +1,82 @@
+# app/infrastructure/config/readiness.py
+import os
+import time
+import logging
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one readiness check"""
+    name: str
+    ok: bool
+    duration: float
+    value: Any = None
+    error: Optional[str] = None
+
+
+def _timed(name: str, check: Callable[[], Any]) -> CheckResult:
+    started = time.perf_counter()
+    try:
+        value = check()
+        return CheckResult(name=name, ok=True, duration=time.perf_counter() - started, value=value)
+    except Exception as e:
+        return CheckResult(name=name, ok=False, duration=time.perf_counter() - started, error=str(e))
+
+
+def run_readiness_checks(
+    checks: Dict[str, Callable[[], Any]],
+    required: Iterable[str] = (),
+    timeout: Optional[float] = None
+) -> Dict[str, CheckResult]:
+    """
+    Run independent startup checks (connects, pings, index/table lookups)
+    concurrently, so startup waits for the slowest dependency instead of
+    the sum of all of them
+
+    Args:
+        checks: Check name -> callable; the callable's return value is kept
+            in the result (e.g. the connected client)
+        required: Names whose failure should fail startup; the others only warn
+        timeout: Seconds to wait for all checks (falls back to
+            STARTUP_READINESS_TIMEOUT env var). Checks still running at the
+            deadline are reported as failed.
+
+    Returns:
+        Dict[str, CheckResult]: Result per check name
+    """
+    timeout = timeout if timeout is not None else float(os.getenv('STARTUP_READINESS_TIMEOUT', '30'))
+    required = set(required)
+    results: Dict[str, CheckResult] = {}
+
+    executor = ThreadPoolExecutor(max_workers=max(1, len(checks)), thread_name_prefix='readiness')
+    try:
+        futures = {name: executor.submit(_timed, name, check) for name, check in checks.items()}
+        wait(futures.values(), timeout=timeout)
+        for name, future in futures.items():
+            if future.done():
+                results[name] = future.result()
+            else:
+                results[name] = CheckResult(name=name, ok=False, duration=timeout,
+                                            error=f"timed out after {timeout}s")
+    finally:
+        # Do not block startup on a check that is stuck past the deadline
+        executor.shutdown(wait=False)
+
+    for name, result in results.items():
+        if result.ok:
+            logger.info(f"Readiness check {name} passed in {result.duration * 1000:.0f}ms")
+        elif name in required:
+            logger.error(f"Required readiness check {name} failed: {result.error}")
+        else:
+            logger.warning(f"Readiness check {name} failed, continuing: {result.error}")
+    return results
+
+
+def failed_required(results: Dict[str, CheckResult], required: Iterable[str]) -> Dict[str, str]:
+    """Errors of the required checks that did not pass"""
+    return {name: results[name].error for name in required if name in results and not results[name].ok}
@@ -0,0 +1,15 @@
+# app/infrastructure/coordination/__init__.py
+"""
+Coordination between ingest replicas
+
+Contains:
+- ShardCoordinator: Redis work leases splitting one run into shards
+- LeaseLostError: Raised when a shard lease was taken over
+- SingleFlight: Coalesces identical concurrent fetches, in-process and across replicas
+- leases: Owner-checked renew/release Lua scripts for Redis leases
+"""
+
+from .shard_coordinator import ShardCoordinator, LeaseLostError
+from .single_flight import SingleFlight
+
+__all__ = ['ShardCoordinator', 'LeaseLostError', 'SingleFlight']
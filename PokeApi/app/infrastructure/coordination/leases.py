@@ -0,0 +1,24 @@
+# app/infrastructure/coordination/leases.py
+"""
+Lua scripts for Redis leases held as 'SET key <owner> NX PX': a lease is only
+renewed or released by the owner that set it, so a holder whose lease expired
+and was taken over cannot extend or delete the new holder's lease.
+
+KEYS[1]: lease key; ARGV[1]: owner token; ARGV[2]: new lifetime in ms (renew)
+"""
+
+# Extend a lease only while we still own it
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Delete a lease only while we still own it
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
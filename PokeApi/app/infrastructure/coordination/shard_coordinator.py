@@ -0,0 +1,258 @@
+# app/infrastructure/coordination/shard_coordinator.py
+import os
+import time
+import uuid
+import socket
+import logging
+import threading
+from typing import Dict, Iterator, Optional, Set
+from app.infrastructure.config.lazy import lazy_import
+from app.infrastructure.coordination.leases import RELEASE_SCRIPT, RENEW_SCRIPT
+
+# Loaded on first use; only processes that talk to Redis pay for the import
+redis = lazy_import('redis')
+
+logger = logging.getLogger(__name__)
+
+# Mark a shard done and fold its stats into the run totals exactly once,
+# even if an expired lease let two replicas finish the same shard
+_COMPLETE_SCRIPT = """
+if redis.call('sadd', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+for i = 4, #ARGV, 2 do
+    redis.call('hincrby', KEYS[2], ARGV[i], ARGV[i + 1])
+end
+redis.call('expire', KEYS[1], ARGV[2])
+redis.call('expire', KEYS[2], ARGV[2])
+if redis.call('get', KEYS[3]) == ARGV[3] then
+    redis.call('del', KEYS[3])
+end
+return 1
+"""
+
+
+class LeaseLostError(Exception):
+    """Raised when a shard lease could not be renewed"""
+    pass
+
+
+class ShardCoordinator:
+    """
+    Redis-backed work leases for splitting one ingest run across replicas:
+    - The run is split into fixed-size shards of the berry listing
+    - Each shard is claimed with SET NX PX and renewed by a heartbeat thread
+    - Leases of dead replicas expire and the shard is picked up by another one
+    - Completed shards and per-shard stats are recorded once per run
+    """
+
+    def __init__(
+        self,
+        redis_client: 'redis.Redis',
+        run_id: Optional[str] = None,
+        shard_size: Optional[int] = None,
+        lease_ttl: Optional[float] = None,
+        run_ttl: int = 86400,
+        namespace: str = "ingest"
+    ):
+        """
+        Args:
+            redis_client: Connected Redis client
+            run_id: Identifier shared by every replica of one run, and unique
+                per run (falls back to INGEST_RUN_ID env var)
+            shard_size: Berries per shard (falls back to INGEST_SHARD_SIZE env var)
+            lease_ttl: Lease lifetime in seconds (falls back to INGEST_LEASE_TTL env var)
+            run_ttl: Seconds run bookkeeping is kept in Redis
+            namespace: Prefix for Redis keys
+
+        Raises:
+            ValueError: If no run id is given; a fixed default would make the
+                next run find every shard already done
+        """
+        self.redis = redis_client
+        self.run_id = run_id or os.getenv('INGEST_RUN_ID')
+        if not self.run_id:
+            raise ValueError("Sharded ingestion requires a run id: set INGEST_RUN_ID to a value unique to this run")
+        self.shard_size = shard_size or int(os.getenv('INGEST_SHARD_SIZE', '50'))
+        self.lease_ttl = lease_ttl or float(os.getenv('INGEST_LEASE_TTL', '30'))
+        self.run_ttl = run_ttl
+        self.namespace = namespace
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._renew = redis_client.register_script(RENEW_SCRIPT)
+        self._release = redis_client.register_script(RELEASE_SCRIPT)
+        self._complete = redis_client.register_script(_COMPLETE_SCRIPT)
+
+        self._held: Set[int] = set()
+        self._lost: Set[int] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def _key(self, *parts) -> str:
+        return ":".join([self.namespace, self.run_id] + [str(part) for part in parts])
+
+    @property
+    def _lease_ms(self) -> int:
+        return int(self.lease_ttl * 1000)
+
+    def initialize(self, total_items: int) -> int:
+        """
+        Fix the shard count for the run; the first replica to call this wins
+
+        Args:
+            total_items: Number of berries in the listing
+
+        Returns:
+            int: Shard count agreed by all replicas
+        """
+        shard_count = max(1, -(-total_items // self.shard_size))
+        self.redis.set(self._key("shards"), shard_count, nx=True, ex=self.run_ttl)
+        self.redis.set(self._key("shard_size"), self.shard_size, nx=True, ex=self.run_ttl)
+        # Replicas must use the layout of whoever initialized the run
+        agreed = int(self.redis.get(self._key("shards")))
+        self.shard_size = int(self.redis.get(self._key("shard_size")))
+        logger.info("Run %s has %s shards of %s berries", self.run_id, agreed, self.shard_size)
+        return agreed
+
+    def shard_count(self) -> int:
+        value = self.redis.get(self._key("shards"))
+        return int(value) if value is not None else 0
+
+    def completed_shards(self) -> Set[int]:
+        return {int(shard) for shard in self.redis.smembers(self._key("done"))}
+
+    def is_complete(self) -> bool:
+        total = self.shard_count()
+        return total > 0 and self.redis.scard(self._key("done")) >= total
+
+    def claim_next(self) -> Optional[int]:
+        """
+        Claim the first shard that is neither done nor leased
+
+        Returns:
+            Optional[int]: Claimed shard index, or None if nothing is claimable now
+        """
+        done = self.completed_shards()
+        for shard in range(self.shard_count()):
+            if shard in done:
+                continue
+            if self.redis.set(self._key("lease", shard), self.owner, nx=True, px=self._lease_ms):
+                with self._lock:
+                    self._held.add(shard)
+                    self._lost.discard(shard)
+                logger.info("Claimed shard %s of run %s", shard, self.run_id)
+                return shard
+        return None
+
+    def shard_range(self, shard: int) -> Dict[str, int]:
+        """Listing offset/limit covered by a shard"""
+        return {'offset': shard * self.shard_size, 'limit': self.shard_size}
+
+    def complete(self, shard: int, stats: Optional[Dict[str, int]] = None) -> bool:
+        """
+        Mark a shard done, add its stats to the run totals and release the lease
+
+        Returns:
+            bool: False if another replica had already completed the shard
+        """
+        args = [shard, self.run_ttl, self.owner]
+        for field, value in (stats or {}).items():
+            args.extend([field, int(value)])
+        recorded = bool(self._complete(keys=[self._key("done"), self._key("stats"), self._key("lease", shard)],
+                                       args=args))
+        with self._lock:
+            self._held.discard(shard)
+        if not recorded:
+            logger.warning("Shard %s of run %s was already completed elsewhere", shard, self.run_id)
+        return recorded
+
+    def release(self, shard: int) -> None:
+        """Give a shard back without completing it so another replica can take it"""
+        try:
+            self._release(keys=[self._key("lease", shard)], args=[self.owner])
+        except redis.RedisError as e:
+            logger.error("Failed to release shard %s: %s", shard, str(e))
+        with self._lock:
+            self._held.discard(shard)
+
+    def release_all(self) -> None:
+        with self._lock:
+            held = list(self._held)
+        for shard in held:
+            self.release(shard)
+
+    def renew_all(self) -> None:
+        """Extend every held lease; shards whose lease was taken over are marked lost"""
+        with self._lock:
+            held = list(self._held)
+        for shard in held:
+            try:
+                renewed = self._renew(keys=[self._key("lease", shard)], args=[self.owner, self._lease_ms])
+            except redis.RedisError as e:
+                logger.error("Failed to renew lease for shard %s: %s", shard, str(e))
+                continue
+            if not renewed:
+                logger.warning("Lost lease for shard %s of run %s", shard, self.run_id)
+                with self._lock:
+                    self._held.discard(shard)
+                    self._lost.add(shard)
+
+    def check_lease(self, shard: int) -> None:
+        """Raise LeaseLostError if the heartbeat found the shard's lease taken over"""
+        with self._lock:
+            if shard in self._lost:
+                raise LeaseLostError(f"Lease for shard {shard} of run {self.run_id} was lost")
+
+    def start_heartbeat(self) -> None:
+        if self._heartbeat is not None:
+            return
+        self._stop.clear()
+        self._heartbeat = threading.Thread(target=self._heartbeat_loop, name='shard-lease-heartbeat', daemon=True)
+        self._heartbeat.start()
+
+    def stop_heartbeat(self) -> None:
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join(timeout=self.lease_ttl)
+            self._heartbeat = None
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop.wait(self.lease_ttl / 3):
+            self.renew_all()
+
+    def claimed_shards(self) -> Iterator[int]:
+        """
+        Claim and yield shards until every shard of the run is done. When all
+        remaining shards are leased by other replicas, waits for them to finish
+        or for their leases to expire and be handed over.
+        """
+        poll = max(self.lease_ttl / 6, 0.05)
+        while not self.is_complete():
+            shard = self.claim_next()
+            if shard is None:
+                time.sleep(poll)
+                continue
+            yield shard
+
+    def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
+        """
+        Run-level barrier: block until every shard is done
+
+        Returns:
+            bool: True if the run completed within the timeout
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while not self.is_complete():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(max(self.lease_ttl / 6, 0.05))
+        return True
+
+    def run_stats(self) -> Dict[str, int]:
+        """Stats aggregated from every completed shard of the run"""
+        raw = self.redis.hgetall(self._key("stats")) or {}
+        return {
+            (key.decode() if isinstance(key, bytes) else key): int(value)
+            for key, value in raw.items()
+        }
@@ -0,0 +1,190 @@
+# app/infrastructure/coordination/single_flight.py
+import os
+import time
+import uuid
+import heapq
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from app.infrastructure.coordination.leases import RELEASE_SCRIPT
+from app.infrastructure.observability.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """One in-flight call that followers in this process wait on"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent fetches into one upstream call:
+    - In-process: callers for a key already in flight wait for that call and
+      share its result (or its error)
+    - Across processes (with a Redis client): the leader holds a short
+      SET NX PX lock on the key and publishes the response body under a
+      result key; followers elsewhere poll for it instead of calling
+      upstream, and take over when the lock expires without a result
+
+    Results are bytes. Redis errors never fail a fetch: the call is simply
+    made without cross-process coalescing.
+
+    Metrics: '<name>.calls', '<name>.upstream', '<name>.coalesced' (in this
+    process) and '<name>.coalesced_remote' (from another process's result).
+    Per-key counts are kept out of the registry, for the most recently
+    coalesced keys only, and reported by hot_keys().
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        namespace: str = 'sf:pokeapi',
+        lock_ttl: Optional[float] = None,
+        result_ttl: Optional[float] = None,
+        poll_interval: float = 0.01,
+        name: str = 'pokeapi.single_flight',
+        metrics: Optional[MetricsRegistry] = None,
+        tracked_keys: Optional[int] = None
+    ):
+        """
+        Args:
+            redis_client: Redis client for cross-process coalescing (in-process only when None)
+            namespace: Prefix of the lock and result keys
+            lock_ttl: Seconds a leader may hold a key, and followers wait for its
+                result (falls back to POKEAPI_SINGLE_FLIGHT_LOCK_TTL env var)
+            result_ttl: Seconds a published result stays readable by followers
+                (falls back to POKEAPI_SINGLE_FLIGHT_RESULT_TTL env var)
+            poll_interval: First delay between result polls; doubles up to 100ms
+            name: Metric name prefix
+            metrics: Registry receiving coalescing counts
+            tracked_keys: Keys whose coalesced counts are kept for hot_keys()
+                (falls back to POKEAPI_SINGLE_FLIGHT_TRACKED_KEYS env var)
+        """
+        self.redis = redis_client
+        self.namespace = namespace
+        self.lock_ttl = lock_ttl or float(os.getenv('POKEAPI_SINGLE_FLIGHT_LOCK_TTL', '10'))
+        self.result_ttl = result_ttl or float(os.getenv('POKEAPI_SINGLE_FLIGHT_RESULT_TTL', '5'))
+        self.poll_interval = poll_interval
+        self.name = name
+        self.metrics = metrics or get_metrics()
+        self.tracked_keys = tracked_keys or int(os.getenv('POKEAPI_SINGLE_FLIGHT_TRACKED_KEYS', '256'))
+        self._hot: 'OrderedDict[str, int]' = OrderedDict()
+        self.owner = uuid.uuid4().hex
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._release = redis_client.register_script(RELEASE_SCRIPT) if redis_client is not None else None
+
+    @classmethod
+    def from_env(cls, redis_client=None, metrics: Optional[MetricsRegistry] = None) -> Optional['SingleFlight']:
+        """
+        Coalescing mode from POKEAPI_SINGLE_FLIGHT: 'redis' (default; in-process
+        only when no client is given), 'local' or 'off' (returns None)
+        """
+        mode = os.getenv('POKEAPI_SINGLE_FLIGHT', 'redis').lower()
+        if mode in ('off', 'false', '0', 'no'):
+            return None
+        return cls(redis_client=redis_client if mode == 'redis' else None, metrics=metrics)
+
+    def do(self, key: str, func: Callable[[], bytes]) -> bytes:
+        """
+        Return func's result, shared with every concurrent caller for key
+
+        Args:
+            key: Identity of the fetch, e.g. the berry id or URL
+            func: Performs the upstream call and returns the response body
+        """
+        self.metrics.increment(f"{self.name}.calls")
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self._coalesced(key, 'coalesced')
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._fetch_shared(key, func) if self.redis is not None else self._fetch(func)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def hot_keys(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most coalesced keys among the tracked ones, as {'key', 'coalesced'} dicts"""
+        with self._lock:
+            counts = list(self._hot.items())
+        return [{'key': key, 'coalesced': count}
+                for key, count in heapq.nlargest(limit, counts, key=lambda item: item[1])]
+
+    def _fetch(self, func: Callable[[], bytes]) -> bytes:
+        self.metrics.increment(f"{self.name}.upstream")
+        return func()
+
+    def _coalesced(self, key: str, kind: str) -> None:
+        self.metrics.increment(f"{self.name}.{kind}")
+        with self._lock:
+            # Least recently coalesced keys are forgotten first
+            self._hot[key] = self._hot.pop(key, 0) + 1
+            if len(self._hot) > self.tracked_keys:
+                self._hot.popitem(last=False)
+
+    def _key(self, kind: str, key: str) -> str:
+        return f"{self.namespace}:{kind}:{key}"
+
+    def _fetch_shared(self, key: str, func: Callable[[], bytes]) -> bytes:
+        lock_key, result_key = self._key('lock', key), self._key('result', key)
+        deadline = time.monotonic() + self.lock_ttl
+        delay = self.poll_interval
+        try:
+            while True:
+                published = self.redis.get(result_key)
+                if published is not None:
+                    self._coalesced(key, 'coalesced_remote')
+                    return published.encode('utf-8') if isinstance(published, str) else published
+                if self.redis.set(lock_key, self.owner, nx=True, px=int(self.lock_ttl * 1000)):
+                    break
+                if time.monotonic() >= deadline:
+                    logger.warning("No result for %s after %ss; fetching it directly", key, self.lock_ttl)
+                    return self._fetch(func)
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
+        except Exception as e:
+            logger.warning("Cross-process coalescing unavailable for %s: %s", key, e)
+            return self._fetch(func)
+
+        try:
+            result = self._fetch(func)
+            self._publish(result_key, result)
+            return result
+        finally:
+            self._unlock(lock_key)
+
+    def _publish(self, result_key: str, result: Any) -> None:
+        try:
+            self.redis.set(result_key, result, px=int(self.result_ttl * 1000))
+        except Exception as e:
+            logger.warning("Failed to publish %s: %s", result_key, e)
+
+    def _unlock(self, lock_key: str) -> None:
+        try:
+            self._release(keys=[lock_key], args=[self.owner])
+        except Exception as e:
+            logger.warning("Failed to release %s: %s", lock_key, e)
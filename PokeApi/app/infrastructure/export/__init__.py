@@ -0,0 +1,14 @@
+# app/infrastructure/export/__init__.py
+"""
+Bulk exports of stored data
+
+Contains:
+- export_tables: Streams the posts and comments tables into columnar files (Parquet, or NPZ without pyarrow)
+- export_table: Writes one stream of items in bounded row groups
+- iter_items: Paginated DynamoDB Scan, optionally limited to items created after a watermark
+- read_npz_export: Loads an NPZ export back into one array per column
+"""
+
+from .columnar_export import export_table, export_tables, iter_items, read_npz_export
+
+__all__ = ['export_table', 'export_tables', 'iter_items', 'read_npz_export']
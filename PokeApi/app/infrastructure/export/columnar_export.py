@@ -0,0 +1,286 @@
+# app/infrastructure/export/columnar_export.py
+import os
+import json
+import zipfile
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.domain.entities.comment import Comment
+from app.domain.entities.post import Post
+from app.infrastructure.persistence.item_codec import ItemCodec
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - exercised only without pyarrow installed
+    pyarrow = None
+
+
+def _named(value: Any) -> Optional[str]:
+    """Name of a PokeAPI named resource ({'name': ..., 'url': ...})"""
+    return value.get('name') if isinstance(value, dict) else None
+
+
+def _flavor_potency(flavor: str) -> Callable[[Dict], Optional[int]]:
+    def extract(raw: Dict) -> Optional[int]:
+        for entry in raw.get('flavors') or ():
+            if _named(entry.get('flavor')) == flavor:
+                return int(entry.get('potency', 0))
+        return None
+    return extract
+
+
+# Column name, type ('int' or 'str') and extractor over (entity, raw_data)
+Column = Tuple[str, str, Callable[[Any, Dict], Any]]
+
+POST_COLUMNS: List[Column] = [
+    ('id', 'int', lambda post, raw: post.id),
+    ('name', 'str', lambda post, raw: post.name),
+] + [
+    (field, 'int', (lambda name: lambda post, raw: getattr(post, name))(field)) for field in Post.NUMERIC_FIELDS
+] + [
+    ('firmness', 'str', lambda post, raw: _named(raw.get('firmness'))),
+    ('natural_gift_type', 'str', lambda post, raw: _named(raw.get('natural_gift_type'))),
+    ('item', 'str', lambda post, raw: _named(raw.get('item'))),
+] + [
+    (f"potency_{flavor}", 'int', (lambda extract: lambda post, raw: extract(raw))(_flavor_potency(flavor)))
+    for flavor in Comment.FLAVORS
+] + [
+    ('created_at', 'str', lambda post, raw: post.created_at),
+]
+
+COMMENT_COLUMNS: List[Column] = [
+    ('id', 'str', lambda comment, raw: comment.id),
+    ('post_id', 'int', lambda comment, raw: comment.post_id),
+    ('flavor', 'str', lambda comment, raw: comment.flavor),
+    ('potency', 'int', lambda comment, raw: comment.potency),
+    ('flavor_url', 'str', lambda comment, raw: (raw.get('flavor') or {}).get('url')),
+    ('created_at', 'str', lambda comment, raw: comment.created_at),
+]
+
+TABLES = {
+    'posts': (Post, POST_COLUMNS),
+    'comments': (Comment, COMMENT_COLUMNS),
+}
+
+# Missing integers in NPZ exports, which have no null support
+NPZ_INT_MISSING = -1
+
+
+def iter_items(table, page_size: int = 1000, created_after: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Yield every item of a DynamoDB table, one Scan page at a time
+
+    Args:
+        table: boto3 Table
+        page_size: Items requested per Scan call
+        created_after: Only items with a later ISO created_at (applied as a
+            Scan filter, so only matching items cross the network)
+    """
+    params: Dict[str, Any] = {'Limit': page_size}
+    if created_after:
+        from boto3.dynamodb.conditions import Attr
+        params['FilterExpression'] = Attr('created_at').gt(created_after)
+    while True:
+        response = table.scan(**params)
+        for item in response.get('Items', []):
+            if created_after and str(item.get('created_at') or '') <= created_after:
+                continue
+            yield item
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return
+        params['ExclusiveStartKey'] = last_key
+
+
+class _ParquetSink:
+    extension = 'parquet'
+
+    def __init__(self, path: str, columns: List[Column], compression: str):
+        self.path = path
+        fields = [pyarrow.field(name, pyarrow.int64() if kind == 'int' else pyarrow.string())
+                  for name, kind, _ in columns]
+        self.schema = pyarrow.schema(fields)
+        self._writer = pyarrow.parquet.ParquetWriter(path, self.schema, compression=compression)
+
+    def write(self, batch: Dict[str, list]) -> None:
+        self._writer.write_table(pyarrow.Table.from_pydict(batch, schema=self.schema))
+
+    def close(self, metadata: Dict[str, Any]) -> None:
+        self._writer.add_key_value_metadata({'export': json.dumps(metadata)})
+        self._writer.close()
+
+
+class _NpzSink:
+    """
+    NPZ fallback: each row group is written as its own set of .npy members
+    ('<column>/<group>') into a deflate-compressed zip, so groups stream to
+    disk instead of being concatenated in memory. read_npz_export joins them.
+    """
+
+    extension = 'npz'
+
+    def __init__(self, path: str, columns: List[Column], compression: str):
+        self.path = path
+        self.columns = columns
+        self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._groups = 0
+
+    def write(self, batch: Dict[str, list]) -> None:
+        for name, kind, _ in self.columns:
+            values = batch[name]
+            if kind == 'int':
+                array = np.array([NPZ_INT_MISSING if value is None else value for value in values], dtype=np.int64)
+            else:
+                array = np.array(['' if value is None else value for value in values], dtype=str)
+            with self._zip.open(f"{name}/{self._groups:06d}.npy", 'w', force_zip64=True) as member:
+                np.lib.format.write_array(member, array, allow_pickle=False)
+        self._groups += 1
+
+    def close(self, metadata: Dict[str, Any]) -> None:
+        self._zip.writestr('export.json', json.dumps(dict(metadata, row_groups=self._groups)))
+        self._zip.close()
+
+
+def resolve_format(name: str = 'auto') -> str:
+    if name == 'auto':
+        return 'parquet' if pyarrow is not None else 'npz'
+    if name == 'parquet' and pyarrow is None:
+        raise ImportError("pyarrow is required for Parquet exports")
+    if name not in ('parquet', 'npz'):
+        raise ValueError(f"Unknown export format: {name}")
+    return name
+
+
+def export_table(
+    items: Iterator[Dict],
+    table_name: str,
+    path_prefix: str,
+    fmt: str = 'auto',
+    row_group_size: int = 10000,
+    compression: str = 'zstd'
+) -> Dict[str, Any]:
+    """
+    Stream items into a columnar file, flattening raw_data into typed columns
+
+    Args:
+        items: Stored items (e.g. from iter_items)
+        table_name: 'posts' or 'comments'
+        path_prefix: Output path without extension
+        fmt: 'parquet', 'npz' or 'auto' (Parquet when pyarrow is installed)
+        row_group_size: Rows buffered before a row group is written; bounds memory
+        compression: Parquet codec
+
+    Returns:
+        Dict with path, rows, row_groups and the highest created_at exported
+    """
+    entity, columns = TABLES[table_name]
+    fmt = resolve_format(fmt)
+    sink_class = _ParquetSink if fmt == 'parquet' else _NpzSink
+    path = f"{path_prefix}.{sink_class.extension}"
+    sink = sink_class(path, columns, compression)
+
+    batch: Dict[str, list] = {name: [] for name, _, _ in columns}
+    rows = groups = 0
+    watermark: Optional[str] = None
+
+    def flush() -> None:
+        nonlocal groups
+        if batch['id']:
+            sink.write(batch)
+            groups += 1
+            for values in batch.values():
+                values.clear()
+
+    try:
+        for item in items:
+            record = entity.from_dict(ItemCodec.decode(item))
+            raw = record.raw_data or {}
+            for name, _, extract in columns:
+                batch[name].append(extract(record, raw))
+            rows += 1
+            if record.created_at and (watermark is None or record.created_at > watermark):
+                watermark = record.created_at
+            if len(batch['id']) >= row_group_size:
+                flush()
+        flush()
+    finally:
+        sink.close({'table': table_name, 'rows': rows, 'watermark': watermark,
+                    'exported_at': datetime.utcnow().isoformat()})
+
+    logger.info(f"Exported {rows} {table_name} in {groups} row groups to {path}")
+    return {'table': table_name, 'path': path, 'rows': rows, 'row_groups': groups, 'watermark': watermark}
+
+
+def read_npz_export(path: str) -> Dict[str, np.ndarray]:
+    """Load an NPZ export, joining its row groups into one array per column"""
+    with zipfile.ZipFile(path) as archive:
+        groups: Dict[str, List[str]] = {}
+        for member in sorted(archive.namelist()):
+            if member.endswith('.npy'):
+                groups.setdefault(os.path.dirname(member), []).append(member)
+        columns = {}
+        for name, members in groups.items():
+            arrays = []
+            for member in members:
+                with archive.open(member) as handle:
+                    arrays.append(np.lib.format.read_array(handle, allow_pickle=False))
+            columns[name] = np.concatenate(arrays)
+        return columns
+
+
+def export_tables(
+    tables: Dict[str, Any],
+    output_dir: str,
+    fmt: str = 'auto',
+    row_group_size: int = 10000,
+    page_size: int = 1000,
+    incremental: bool = False,
+    since: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Export each table to its own file under output_dir
+
+    Every run writes new '<table>-<timestamp>' files and records the highest
+    created_at per table in output_dir/export_state.json; incremental runs
+    export only the items created after that watermark.
+
+    Args:
+        tables: Table name ('posts' or 'comments') -> boto3 Table
+        output_dir: Destination directory (created when missing)
+        fmt: 'parquet', 'npz' or 'auto'
+        row_group_size: Rows per row group
+        page_size: Items per Scan call
+        incremental: Resume from the watermarks in the state file
+        since: Explicit created_at lower bound, overriding the state file
+
+    Returns:
+        One export_table() summary per table
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    state_path = os.path.join(output_dir, 'export_state.json')
+    state: Dict[str, str] = {}
+    if os.path.exists(state_path):
+        with open(state_path) as handle:
+            state = json.load(handle)
+
+    stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+    results = []
+    for table_name, table in tables.items():
+        created_after = since or (state.get(table_name) if incremental else None)
+        items = iter_items(table, page_size=page_size, created_after=created_after)
+        result = export_table(items, table_name, os.path.join(output_dir, f"{table_name}-{stamp}"),
+                              fmt=fmt, row_group_size=row_group_size)
+        result['since'] = created_after
+        if result['watermark'] and result['watermark'] > state.get(table_name, ''):
+            state[table_name] = result['watermark']
+        results.append(result)
+
+    with open(state_path, 'w') as handle:
+        json.dump(state, handle, indent=2)
+    return results
@@ -7,16 +7,37 @@ Contains:
 - ProcessingService: Data processing implementation
 - CircuitBreaker: Circuit breaker pattern
 - DeadLetterQueue: Dead letter queue implementation
+- DLQDeduplicator: Content-hash deduplication of dead-letter messages
+- build_http_session: Shared keep-alive HTTP session
+- PayloadProjector: Per-item-type field projection of processing payloads
+- RequestHedger: Hedges slow calls with a second identical call
+- Prefetcher: Bounded read-ahead of the listing and berry details
 """
 
-from .pokeapi_service import PokeAPIService
-from .processing_service import ProcessingService
-from .circuit_breaker import CircuitBreaker
-from .dead_letter_queue import DeadLetterQueue
+from app.infrastructure.config.lazy import lazy_exports
+
+_EXPORTS = {
+    'PokeAPIService': '.pokeapi_service',
+    'ProcessingService': '.processing_service',
+    'CircuitBreaker': '.circuit_breaker',
+    'DeadLetterQueue': '.dead_letter_queue',
+    'DLQDeduplicator': '.dlq_dedupe',
+    'build_http_session': '.http_session',
+    'PayloadProjector': '.payload_projection',
+    'RequestHedger': '.request_hedger',
+    'Prefetcher': '.prefetcher'
+}
 
 __all__ = [
     'PokeAPIService',
     'ProcessingService',
     'CircuitBreaker',
-    'DeadLetterQueue'
-]
\ No newline at end of file
+    'DeadLetterQueue',
+    'DLQDeduplicator',
+    'build_http_session',
+    'PayloadProjector',
+    'RequestHedger',
+    'Prefetcher'
+]
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -3,7 +3,10 @@ import time
 import logging
 from typing import Optional, Callable, Any
 from functools import wraps
-import redis
+from app.infrastructure.config.lazy import lazy_import
+
+# Loaded on first use; only processes that talk to Redis pay for the import
+redis = lazy_import('redis')
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +25,7 @@ class CircuitBreaker:
 
     def __init__(
         self,
-        redis_client: redis.Redis,
+        redis_client: 'redis.Redis',
         failure_threshold: int = 5,
         reset_timeout: int = 60,
         namespace: str = "circuit_breaker"
@@ -53,9 +56,8 @@ class CircuitBreaker:
         }
     
     def record_success(self, service_name: str):
-        # Reset failure count and status after success
-        self._reset(service_name)
-        logger.info(f"Circuit breaker for {service_name} reset after success")
+        # Reset the failure count tracked by is_open/record_failure
+        self.reset(service_name)
 
     def record_failure(self, service_name: str) -> None:
         """
@@ -1,25 +1,32 @@
 import os
-import json
 import logging
-import boto3
 from typing import Dict, Any, Optional
 from datetime import datetime
-from botocore.config import Config
 from pathlib import Path
+from app.infrastructure.config.client_registry import ClientRegistry, get_client_registry
+from app.infrastructure.external.dlq_dedupe import DLQDeduplicator
+from app.infrastructure.serialization import JsonCodec, get_codec, encode_envelope
 
 logger = logging.getLogger(__name__)
 
 class DeadLetterQueue:
-    def __init__(self, queue_url: str = None, region_name: str = None):
+    def __init__(self, queue_url: str = None, region_name: str = None, codec: Optional[JsonCodec] = None,
+                 clients: Optional[ClientRegistry] = None, dedupe: Optional[DLQDeduplicator] = None):
         """
         Dead Letter Queue implementation with SQS backend and local fallback.
         
         Args:
             queue_url: SQS queue URL (optional, falls back to DLQ_QUEUE_URL env var)
             region_name: AWS region (optional, falls back to AWS_DEFAULT_REGION env var)
+            codec: JSON codec for message bodies (defaults to the shared codec)
+            clients: Registry providing the shared SQS client (the process-wide registry by default)
+            dedupe: Skips items identical to one already queued (no deduplication by default)
         """
         self.queue_url = queue_url or os.getenv('DLQ_QUEUE_URL')
         self.region_name = region_name or os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+        self.codec = codec or get_codec()
+        self.clients = clients
+        self.dedupe = dedupe
         self._fallback_path = Path(os.getenv('DLQ_FALLBACK_PATH', '/tmp/dlq_fallback'))
         self._client = None
         
@@ -30,18 +37,9 @@ class DeadLetterQueue:
 
     @property
     def client(self):
-        """Lazy-loaded SQS client with retry configuration"""
+        """Shared SQS client (pooled, standard retries), looked up on first use"""
         if self._client is None and self.queue_url:
-            self._client = boto3.client(
-                'sqs',
-                region_name=self.region_name,
-                config=Config(
-                    retries={
-                        'max_attempts': 3,
-                        'mode': 'standard'
-                    }
-                )
-            )
+            self._client = (self.clients or get_client_registry()).sqs(region_name=self.region_name)
         return self._client
 
     def add_failed_item(self, item_type: str, item_data: Dict[str, Any]) -> bool:
@@ -53,22 +51,31 @@ class DeadLetterQueue:
             item_data: The item data to store
             
         Returns:
-            bool: True if successfully queued (or fallback succeeded), False otherwise
+            bool: True if successfully queued (or fallback succeeded), or an
+            identical item is already queued; False otherwise
         """
         message = {
             'type': item_type,
-            'data': item_data,
             'timestamp': datetime.utcnow().isoformat(),
             'retry_count': 0,
             'source': 'processing_service'
         }
+        if self.dedupe is not None:
+            # Sent along so the worker does not hash the payload again
+            message['fingerprint'] = self.dedupe.fingerprint(item_type, item_data)
+            if not self.dedupe.claim(item_type, message['fingerprint']):
+                logger.debug("Identical %s %s already in the DLQ, not enqueued", item_type, item_data.get('id'))
+                return True
+        # The item is spliced in under 'data'; an EncodedPayload reuses the
+        # bytes already sent to the processing endpoint
+        body = encode_envelope(message, 'data', item_data, self.codec)
 
         # Try SQS first if configured
         if self.queue_url and self.client:
             try:
                 response = self.client.send_message(
                     QueueUrl=self.queue_url,
-                    MessageBody=json.dumps(message),
+                    MessageBody=body.decode('utf-8'),
                     MessageAttributes={
                         'ItemType': {
                             'DataType': 'String',
@@ -81,11 +88,16 @@ class DeadLetterQueue:
             except Exception as e:
                 logger.warning(f"SQS DLQ failed: {str(e)}. Attempting fallback...")
 
+        # The worker only reads SQS: keep the queued mark only for messages
+        # that reached it, so identical failures are not dropped meanwhile
+        if self.dedupe is not None:
+            self.dedupe.release(message['fingerprint'])
+
         # Fallback to local storage
         try:
             fallback_file = self._fallback_path / f"{item_type}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(fallback_file, 'w') as f:
-                json.dump(message, f)
+            with open(fallback_file, 'wb') as f:
+                f.write(body)
             logger.warning(f"Used fallback DLQ storage: {fallback_file}")
             return True
         except Exception as e:
@@ -97,8 +109,7 @@ class DeadLetterQueue:
         items = []
         for file in self._fallback_path.glob('*.json'):
             try:
-                with open(file) as f:
-                    items.append(json.load(f))
+                items.append(self.codec.loads(file.read_bytes()))
             except Exception as e:
                 logger.error(f"Error reading fallback file {file}: {str(e)}")
         return items
\ No newline at end of file
@@ -0,0 +1,168 @@
+# app/infrastructure/external/dlq_dedupe.py
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, FrozenSet, Optional
+
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.observability.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class DLQDeduplicator:
+    """
+    Content-hash deduplication of dead-letter messages, so draining a backlog
+    costs work per unique failure rather than per enqueued copy.
+
+    Each message is identified by a 128-bit hash of its type, item id and
+    payload (without per-attempt fields such as created_at), and two
+    expiring marks are kept per hash:
+    - 'queued': set by the producer when it enqueues a message; identical
+      failures (a re-run, or the reprocessor failing again) are not enqueued
+      while it is set
+    - 'done': set by the reprocessor once an item was reprocessed, clearing
+      'queued'; any copy still in the queue is acknowledged without being
+      reprocessed. Enqueuing the same content again clears it.
+
+    With a Redis client the marks are 'SET NX EX' keys shared by every
+    producer and worker; otherwise they live in a bounded in-process TTLCache.
+    Redis errors never drop a message: it is handled as unique.
+
+    Metrics: 'dlq.dedupe.enqueue_skipped' and 'dlq.dedupe.reprocess_skipped',
+    each also per item type, e.g. 'dlq.dedupe.reprocess_skipped[post]'.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        namespace: str = 'dlq:dedupe',
+        ttl: Optional[int] = None,
+        ignore_fields: Optional[FrozenSet[str]] = None,
+        max_entries: Optional[int] = None,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        """
+        Args:
+            redis_client: Redis client holding the marks (in-process when None)
+            namespace: Prefix of the mark keys
+            ttl: Seconds a mark is kept (falls back to DLQ_DEDUPE_TTL env var)
+            ignore_fields: Top-level payload fields left out of the hash (falls
+                back to the comma-separated DLQ_DEDUPE_IGNORE_FIELDS env var)
+            max_entries: In-process marks kept (falls back to
+                DLQ_DEDUPE_MAX_ENTRIES env var)
+            metrics: Registry receiving skipped counts
+        """
+        self.redis = redis_client
+        self.namespace = namespace
+        self.ttl = ttl or int(os.getenv('DLQ_DEDUPE_TTL', '86400'))
+        if ignore_fields is None:
+            ignore_fields = frozenset(
+                name.strip() for name in os.getenv('DLQ_DEDUPE_IGNORE_FIELDS', 'created_at').split(',') if name.strip()
+            )
+        self.ignore_fields = ignore_fields
+        self.metrics = metrics or get_metrics()
+        self._local = TTLCache(max_entries=max_entries or int(os.getenv('DLQ_DEDUPE_MAX_ENTRIES', '100000')),
+                               ttl=self.ttl)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, redis_client=None, metrics: Optional[MetricsRegistry] = None) -> Optional['DLQDeduplicator']:
+        """
+        Deduplication mode from DLQ_DEDUPE: 'redis' (default; in-process when
+        no client is given), 'local' or 'off' (returns None)
+        """
+        mode = os.getenv('DLQ_DEDUPE', 'redis').lower()
+        if mode in ('off', 'false', '0', 'no'):
+            return None
+        return cls(redis_client=redis_client if mode == 'redis' else None, metrics=metrics)
+
+    def fingerprint(self, item_type: str, payload: Dict[str, Any]) -> str:
+        """Hash of (type, id, payload); key order and ignored fields do not change it"""
+        content = {key: value for key, value in payload.items() if key not in self.ignore_fields}
+        canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (item_type, str(payload.get('id')), canonical):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def claim(self, item_type: str, fingerprint: str) -> bool:
+        """
+        Producer side: mark a message as queued
+
+        Returns:
+            False if an identical message is already queued (skip enqueuing it)
+        """
+        queued, done = self._key('queued', fingerprint), self._key('done', fingerprint)
+        if self.redis is not None:
+            try:
+                if not self.redis.set(queued, 1, nx=True, ex=self.ttl):
+                    self._count('enqueue_skipped', item_type)
+                    return False
+                self.redis.delete(done)
+                return True
+            except Exception as e:
+                logger.warning("DLQ dedupe unavailable, enqueuing %s anyway: %s", item_type, e)
+                return True
+        with self._lock:
+            if self._local.get(queued) is not None:
+                self._count('enqueue_skipped', item_type)
+                return False
+            self._local.set(queued, True)
+            self._local.invalidate(done)
+        return True
+
+    def release(self, fingerprint: str) -> None:
+        """Producer side: drop the queued mark of a message that could not be enqueued"""
+        self._delete(self._key('queued', fingerprint))
+
+    def is_done(self, item_type: str, fingerprint: str) -> bool:
+        """
+        Worker side: whether an identical message was already reprocessed;
+        a True result is counted as a skipped duplicate
+        """
+        done = self._key('done', fingerprint)
+        if self.redis is not None:
+            try:
+                seen = self.redis.get(done) is not None
+            except Exception as e:
+                logger.warning("DLQ dedupe unavailable, reprocessing %s anyway: %s", item_type, e)
+                return False
+        else:
+            seen = self._local.get(done) is not None
+        if seen:
+            self._count('reprocess_skipped', item_type)
+        return seen
+
+    def mark_done(self, fingerprint: str) -> None:
+        """Worker side: record a successful reprocessing and clear the queued mark"""
+        done, queued = self._key('done', fingerprint), self._key('queued', fingerprint)
+        if self.redis is not None:
+            try:
+                self.redis.set(done, 1, ex=self.ttl)
+                self.redis.delete(queued)
+            except Exception as e:
+                logger.warning("Failed to record reprocessed DLQ message: %s", e)
+            return
+        with self._lock:
+            self._local.set(done, True)
+            self._local.invalidate(queued)
+
+    def _delete(self, key: str) -> None:
+        if self.redis is None:
+            self._local.invalidate(key)
+            return
+        try:
+            self.redis.delete(key)
+        except Exception as e:
+            logger.warning("Failed to clear DLQ dedupe mark %s: %s", key, e)
+
+    def _count(self, kind: str, item_type: str) -> None:
+        self.metrics.increment(f"dlq.dedupe.{kind}")
+        self.metrics.increment(f"dlq.dedupe.{kind}[{item_type}]")
+
+    def _key(self, kind: str, fingerprint: str) -> str:
+        return f"{self.namespace}:{kind}:{fingerprint}"
@@ -0,0 +1,31 @@
+# app/infrastructure/external/http_session.py
+import os
+import logging
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+def build_http_session(pool_size: Optional[int] = None) -> requests.Session:
+    """
+    Build a requests Session with keep-alive connection pools, shared by the
+    HTTP services so repeated calls reuse warm TCP/TLS connections.
+
+    Retries stay with the callers (tenacity / _retry), so the adapter does not retry.
+
+    Args:
+        pool_size: Connections kept per host (falls back to HTTP_POOL_SIZE env var)
+
+    Returns:
+        requests.Session with mounted http/https adapters
+    """
+    pool_size = pool_size or int(os.getenv('HTTP_POOL_SIZE', '10'))
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    logger.debug(f"HTTP session created with pool size {pool_size}")
+    return session
@@ -0,0 +1,93 @@
+# app/infrastructure/external/payload_projection.py
+import os
+import logging
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+from app.domain.entities.raw_payload import RawPayload
+from app.infrastructure.serialization import EncodedPayload
+
+logger = logging.getLogger(__name__)
+
+# Fields the processing endpoint reads; raw_data is left out unless configured
+DEFAULT_FIELDS = {
+    'post': ('id', 'name', 'growth_time', 'max_harvest', 'natural_gift_power',
+             'size', 'smoothness', 'soil_dryness', 'created_at'),
+    'comment': ('id', 'post_id', 'flavor', 'potency', 'created_at')
+}
+
+
+def _parse_fields(value: str) -> Optional[Tuple[str, ...]]:
+    value = value.strip()
+    if value == '*':
+        return None
+    return tuple(field.strip() for field in value.split(',') if field.strip())
+
+
+class PayloadProjector:
+    """
+    Trims processing payloads to the fields configured per item type.
+
+    Fields are top-level keys or dotted paths into nested dicts, e.g.
+    'raw_data.firmness.name' keeps only that leaf of raw_data. A RawPayload
+    value is parsed only when a dotted path reads into it. Item types
+    without a projection (or configured as '*') are passed through unchanged,
+    keeping any cached encoding.
+    """
+
+    def __init__(self, fields: Optional[Mapping[str, Optional[Sequence[str]]]] = None):
+        """
+        Args:
+            fields: Item type -> fields to keep (None keeps everything)
+        """
+        self.fields = {
+            item_type: tuple(selected) if selected is not None else None
+            for item_type, selected in (DEFAULT_FIELDS if fields is None else fields).items()
+        }
+
+    @classmethod
+    def from_env(cls) -> 'PayloadProjector':
+        """
+        Projection from PROCESSING_FIELDS_POST / PROCESSING_FIELDS_COMMENT
+        (comma-separated fields, '*' for the full payload), defaulting to
+        DEFAULT_FIELDS
+        """
+        fields: Dict[str, Optional[Tuple[str, ...]]] = dict(DEFAULT_FIELDS)
+        for item_type in DEFAULT_FIELDS:
+            value = os.getenv(f"PROCESSING_FIELDS_{item_type.upper()}")
+            if value is not None:
+                fields[item_type] = _parse_fields(value)
+        return cls(fields)
+
+    def project(self, item_type: str, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Args:
+            item_type: 'post' or 'comment'
+            payload: Full item payload
+
+        Returns:
+            The projected payload as an EncodedPayload, or `payload` itself
+            when the item type is not projected
+        """
+        selected = self.fields.get(item_type)
+        if selected is None:
+            return payload
+        source = payload
+        nested = {path.split('.', 1)[0] for path in selected if '.' in path}
+        parsed = {key: payload[key].to_dict() for key in nested if isinstance(payload.get(key), RawPayload)}
+        if parsed:
+            source = {**payload, **parsed}
+        projected: Dict[str, Any] = {}
+        for path in selected:
+            self._copy(source, projected, path.split('.'))
+        return EncodedPayload(projected)
+
+    @staticmethod
+    def _copy(source: Mapping[str, Any], target: Dict[str, Any], keys: Sequence[str]) -> None:
+        node = source
+        for key in keys[:-1]:
+            node = node.get(key) if isinstance(node, Mapping) else None
+        if not isinstance(node, Mapping) or keys[-1] not in node:
+            return
+        for key in keys[:-1]:
+            target = target.setdefault(key, {})
+        target[keys[-1]] = node[keys[-1]]
@@ -1,57 +1,155 @@
 # app/infrastructure/external/pokeapi_service.py
+import os
+import logging
 import requests
 import time
 import random
-from typing import List, Dict, Optional
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from app.domain.entities.post import Post
 from app.domain.entities.comment import Comment
+from app.domain.entities.raw_payload import RawPayload
 from app.domain.interfaces.services.ipokeapi_service import IPokeAPIService
 from app.infrastructure.external.circuit_breaker import CircuitBreaker
+from app.infrastructure.external.prefetcher import Prefetcher
+from app.infrastructure.external.request_hedger import RequestHedger
+from app.infrastructure.coordination.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
 
 class PokeAPIService(IPokeAPIService):
     BASE_URL = "https://pokeapi.co/api/v2/berry"
     
-    def __init__(self, circuit_breaker: CircuitBreaker = None):
+    def __init__(
+        self,
+        circuit_breaker: CircuitBreaker = None,
+        base_url: Optional[str] = None,
+        page_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+        hedger: Optional[RequestHedger] = None,
+        single_flight: Optional[SingleFlight] = None,
+        prefetcher: Optional[Prefetcher] = None
+    ):
+        """
+        Args:
+            circuit_breaker: Circuit breaker guarding PokeAPI calls
+            base_url: Berry endpoint root (falls back to POKEAPI_BASE_URL env var)
+            page_size: Listing page size (falls back to POKEAPI_PAGE_SIZE env var)
+            timeout: Per-request timeout in seconds (falls back to POKEAPI_TIMEOUT env var)
+            session: Shared requests Session for connection reuse (module-level
+                requests functions are used when omitted)
+            hedger: Hedges slow berry detail fetches with a second request
+                (configured from POKEAPI_HEDGE_* env vars, off by default)
+            single_flight: Coalesces concurrent fetches of the same berry into one
+                request (in-process only by default; see SingleFlight.from_env)
+            prefetcher: Reads the listing and berry details ahead of iter_posts'
+                consumer (configured from POKEAPI_PREFETCH_* env vars)
+        """
         self.circuit_breaker = circuit_breaker or CircuitBreaker(
             failure_threshold=5,
             reset_timeout=60
         )
+        self.base_url = (base_url or os.getenv('POKEAPI_BASE_URL', self.BASE_URL)).rstrip('/')
+        self.page_size = page_size or int(os.getenv('POKEAPI_PAGE_SIZE', '100'))
+        self.timeout = timeout or float(os.getenv('POKEAPI_TIMEOUT', '10'))
+        self.http = session or requests
+        self.hedger = hedger if hedger is not None else RequestHedger.from_env()
+        self.single_flight = single_flight if single_flight is not None else SingleFlight.from_env()
+        self.prefetcher = prefetcher if prefetcher is not None else Prefetcher.from_env()
 
     def get_all_posts(self) -> List[Dict]:
+        """Fetch the full berry listing, following `next` pagination links"""
+        return list(self.iter_listing())
+
+    def count_posts(self) -> int:
+        """Total number of berries reported by the listing"""
+        return int(self._retry(lambda: self._get_listing_page(f"{self.base_url}/?limit=1"))['count'])
+
+    def iter_listing(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Yield listing entries page by page; only one page is held at a time
+
+        Args:
+            offset: Listing position to start from
+            limit: Maximum number of entries to yield (all remaining when None)
+        """
+        remaining = limit
+        page_size = self.page_size if limit is None else min(self.page_size, limit)
+        url = f"{self.base_url}/?offset={offset}&limit={page_size}" if offset else f"{self.base_url}/?limit={page_size}"
+        while url and (remaining is None or remaining > 0):
+            page = self._retry(lambda: self._get_listing_page(url))
+            results = page['results'] if remaining is None else page['results'][:remaining]
+            yield from results
+            if remaining is not None:
+                remaining -= len(results)
+            url = page.get('next')
+
+    def _get_listing_page(self, url: str) -> Dict:
         if self.circuit_breaker.is_open("pokeapi"):
             raise Exception("Circuit breaker is open - PokeAPI is unavailable")
 
         try:
-            response = requests.get(f"{self.BASE_URL}/")
+            response = self.http.get(url, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()['results']
+            self.circuit_breaker.record_success("pokeapi")
+            return response.json()
         except requests.exceptions.RequestException as e:
-            self.circuit_breaker.record_failure()
+            self.circuit_breaker.record_failure("pokeapi")
             raise Exception(f"Failed to fetch posts from PokeAPI: {e}")
 
     def get_post_details(self, post_id: int) -> Optional[Dict]:
+        return self._get_post_payload(post_id).to_dict()
+
+    def _get_post_payload(self, post_id: int) -> RawPayload:
+        """Fetch berry details, keeping the response body as an undecoded buffer"""
+        url = f"{self.base_url}/{post_id}/"
+        fetch = partial(self._request_post_body, url)
+        if self.hedger is not None:
+            fetch = partial(self.hedger.call, fetch)
+        if self.single_flight is not None:
+            return RawPayload(self.single_flight.do(url, fetch))
+        return RawPayload(fetch())
+
+    def _request_post_body(self, url: str) -> bytes:
         if self.circuit_breaker.is_open("pokeapi"):
             raise Exception("Circuit breaker is open - PokeAPI is unavailable")
 
         try:
-            response = requests.get(f"{self.BASE_URL}/{post_id}/")
+            response = self.http.get(url, timeout=self.timeout)
             response.raise_for_status()
             self.circuit_breaker.record_success("pokeapi")
-            return response.json()
+            return response.content
         except requests.exceptions.RequestException as e:
-            self.circuit_breaker.record_failure()
+            self.circuit_breaker.record_failure("pokeapi")
             raise Exception(f"Failed to fetch post details from PokeAPI: {e}")
 
     def fetch_and_transform_posts(self) -> List[Post]:
-        posts_data = self._retry(self.get_all_posts)
-        posts = []
-        
-        for post_data in posts_data:
-            post_id = int(post_data['url'].split('/')[-2])
+        return list(self.iter_posts())
+
+    def iter_posts(
+        self,
+        on_error: Optional[Callable[[int, Exception], None]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Iterator[Post]:
+        """
+        Stream posts while paging through the listing
+
+        Args:
+            on_error: Called with (post_id, error) when a berry cannot be fetched;
+                errors are logged when omitted
+            offset: Listing position to start from
+            limit: Maximum number of listing entries to cover
+        """
+        post_ids = (int(post_data['url'].split('/')[-2]) for post_data in self.iter_listing(offset=offset, limit=limit))
+        for post_id, fetched in self._fetch_payloads(post_ids):
             try:
-                details = self._retry(lambda: self.get_post_details(post_id))
+                payload = fetched()
+                details = payload.to_dict()
                 if details:
-                    post = Post(
+                    yield Post(
                         id=post_id,
                         name=details['name'],
                         growth_time=details['growth_time'],
@@ -60,14 +158,28 @@ class PokeAPIService(IPokeAPIService):
                         size=details['size'],
                         smoothness=details['smoothness'],
                         soil_dryness=details['soil_dryness'],
-                        raw_data=details
+                        raw_data=payload
                     )
-                    posts.append(post)
             except Exception as e:
-                print(f"Error processing post {post_id}: {e}")
+                if on_error is not None:
+                    on_error(post_id, e)
+                else:
+                    logger.warning("Error processing post %s: %s", post_id, e)
                 continue
-                
-        return posts
+
+    def _fetch_payloads(self, post_ids: Iterator[int]) -> Iterator[Tuple[int, Callable[[], RawPayload]]]:
+        """
+        Yield (post_id, fetched) where fetched() returns the detail payload or
+        raises its fetch error; with a prefetcher, the listing and details are
+        read ahead on background threads
+        """
+        fetch = lambda post_id: self._retry(lambda: self._get_post_payload(post_id))
+        if self.prefetcher is None:
+            for post_id in post_ids:
+                yield post_id, partial(fetch, post_id)
+            return
+        for post_id, future in self.prefetcher.map(post_ids, fetch):
+            yield post_id, future.result
 
     def fetch_comments_for_post(self, post: Post) -> List[Comment]:
         try:
@@ -77,7 +189,7 @@ class PokeAPIService(IPokeAPIService):
                 
             return [Comment.create(post.id, flavor) for flavor in details['flavors']]
         except Exception as e:
-            print(f"Error fetching comments for post {post.id}: {e}")
+            logger.warning("Error fetching comments for post %s: %s", post.id, e)
             return []
 
     def _retry(self, func, max_retries=3, initial_delay=1, max_delay=10):
@@ -0,0 +1,138 @@
+# app/infrastructure/external/prefetcher.py
+import os
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from app.infrastructure.observability.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+_DONE = object()
+
+
+class _SourceError:
+    """Carries an exception raised by the source iterator to the consumer"""
+
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class Prefetcher:
+    """
+    Read-ahead over a stream of keys and a fetch per key:
+    - A producer thread walks the source (e.g. the paged berry listing, so the
+      next page is requested while the current one is still being consumed)
+      and starts fetch(key) on a worker pool
+    - Started fetches wait in a bounded buffer of `lookahead` entries; when the
+      consumer falls behind the producer blocks, so at most that many fetches
+      are ahead of it (backpressure)
+    - Results are handed out in source order
+
+    Metrics: '<name>.consumer_wait_seconds' (time the consumer waited for a
+    result, i.e. network time not hidden by read-ahead) and
+    '<name>.producer_blocked' (times the buffer was full).
+    """
+
+    def __init__(
+        self,
+        lookahead: int = 8,
+        workers: int = 4,
+        name: str = 'pokeapi.prefetch',
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        """
+        Args:
+            lookahead: Fetches kept started ahead of the consumer
+            workers: Threads running fetches
+            name: Metric name prefix
+            metrics: Registry receiving wait times and backpressure counts
+        """
+        self.lookahead = lookahead
+        self.workers = workers
+        self.name = name
+        self.metrics = metrics or get_metrics()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='prefetch')
+
+    @classmethod
+    def from_env(cls, metrics: Optional[MetricsRegistry] = None) -> Optional['Prefetcher']:
+        """
+        Prefetcher configured from POKEAPI_PREFETCH_LOOKAHEAD (0 disables
+        read-ahead and returns None) and POKEAPI_PREFETCH_WORKERS
+        """
+        lookahead = int(os.getenv('POKEAPI_PREFETCH_LOOKAHEAD', '8'))
+        if lookahead <= 0:
+            return None
+        return cls(lookahead=lookahead, workers=int(os.getenv('POKEAPI_PREFETCH_WORKERS', '4')), metrics=metrics)
+
+    def map(self, source: Iterable[K], fetch: Callable[[K], V]) -> Iterator[Tuple[K, Future]]:
+        """
+        Yield (key, future of fetch(key)) in source order, fetching ahead
+
+        Errors of a fetch are raised by its future's result(); an error of the
+        source itself is raised from this generator after the keys before it.
+        Closing the generator early stops the producer and cancels fetches that
+        have not started.
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=self.lookahead)
+        stop = threading.Event()
+
+        def put(entry) -> bool:
+            blocked = False
+            while not stop.is_set():
+                try:
+                    buffer.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    if not blocked:
+                        blocked = True
+                        self.metrics.increment(f"{self.name}.producer_blocked")
+            return False
+
+        def produce():
+            try:
+                for key in source:
+                    if stop.is_set() or not put((key, self._executor.submit(fetch, key))):
+                        return
+            except BaseException as e:
+                put(_SourceError(e))
+                return
+            put(_DONE)
+
+        producer = threading.Thread(target=produce, name='prefetch-producer', daemon=True)
+        producer.start()
+        try:
+            while True:
+                entry = buffer.get()
+                if entry is _DONE:
+                    return
+                if isinstance(entry, _SourceError):
+                    raise entry.error
+                key, future = entry
+                if not future.done():
+                    started = time.perf_counter()
+                    # Exceptions are left for the caller's result() call
+                    future.exception()
+                    self.metrics.observe(f"{self.name}.consumer_wait_seconds", time.perf_counter() - started)
+                yield key, future
+        finally:
+            stop.set()
+            while True:
+                try:
+                    entry = buffer.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(entry, tuple):
+                    entry[1].cancel()
+
+    def close(self) -> None:
+        """Stop the fetch threads once running fetches finish"""
+        self._executor.shutdown(wait=False)
@@ -1,52 +1,105 @@
 import requests
 import os
+import gzip
 import logging
 from typing import Dict, Optional
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from app.domain.interfaces.services.iprocessing_service import IProcessingService
 from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+from app.infrastructure.external.payload_projection import PayloadProjector
+from app.infrastructure.observability.logging_setup import LogSampler
+from app.infrastructure.observability.metrics import MetricsRegistry, get_metrics
+from app.infrastructure.serialization import JsonCodec, get_codec, encode
 
 logger = logging.getLogger(__name__)
+# Per-item outcomes are sampled; failures also reach the DLQ and the run stats
+sampled = LogSampler(logger)
 
 
 class ProcessingService(IProcessingService):
-    def __init__(self, dlq: DeadLetterQueue = None, endpoint: Optional[str] = None):
+    def __init__(
+        self,
+        dlq: DeadLetterQueue = None,
+        endpoint: Optional[str] = None,
+        codec: Optional[JsonCodec] = None,
+        session: Optional[requests.Session] = None,
+        projector: Optional[PayloadProjector] = None,
+        gzip_min_bytes: Optional[int] = None,
+        metrics: Optional[MetricsRegistry] = None
+    ):
         """
         Initialize processing service with configurable endpoint and dead letter queue.
         
         Args:
             dlq: Dead letter queue instance for failed items
             endpoint: Processing endpoint URL
+            codec: JSON codec for request and response bodies (defaults to the shared codec)
+            session: Shared requests Session for connection reuse (module-level
+                requests functions are used when omitted)
+            projector: Per-item-type field projection applied before sending and
+                before the DLQ hand-off (configured from env by default)
+            gzip_min_bytes: Bodies at least this large are sent gzip-compressed;
+                0 disables compression (falls back to PROCESSING_GZIP_MIN_BYTES env var)
+            metrics: Registry receiving payload and request byte counts
         """
         self.dlq = dlq or DeadLetterQueue()
         self.processing_endpoint = endpoint or os.getenv('PROCESSING_ENDPOINT', 'https://httpbin.org/post')
         self.timeout = int(os.getenv('PROCESSING_TIMEOUT', '5'))  # seconds
+        self.codec = codec or get_codec()
+        self.http = session or requests
+        self._headers = {'Content-Type': self.codec.content_type}
+        self._gzip_headers = dict(self._headers, **{'Content-Encoding': 'gzip'})
+        self.projector = projector or PayloadProjector.from_env()
+        self.gzip_min_bytes = (gzip_min_bytes if gzip_min_bytes is not None
+                               else int(os.getenv('PROCESSING_GZIP_MIN_BYTES', '1024')))
+        self.metrics = metrics or get_metrics()
 
         logger.info(f"🚀 ProcessingService initialized with endpoint: {self.processing_endpoint}")
 
+    def _make_request(self, data: Dict) -> Dict:
+        """
+        Encode the item once, compress it when large enough and send it.
+        EncodedPayload bodies are sent as their cached bytes, so retries and a
+        later DLQ hand-off do not re-encode the item.
+        """
+        body = encode(data, self.codec)
+        self.metrics.observe('processing.payload_bytes', len(body))
+        headers = self._headers
+        if self.gzip_min_bytes and len(body) >= self.gzip_min_bytes:
+            body = gzip.compress(body, compresslevel=5)
+            headers = self._gzip_headers
+            self.metrics.increment('processing.requests_compressed')
+        return self._send(body, headers, data.get('id'))
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
         retry=retry_if_exception_type(requests.exceptions.RequestException),
         reraise=True
     )
-    def _make_request(self, data: Dict) -> Dict:
-        """Internal method to handle the actual HTTP request with retry logic"""
+    def _send(self, body: bytes, headers: Dict[str, str], item_id) -> Dict:
+        """
+        Internal method to handle the actual HTTP request with retry logic.
+        """
+        # Counted per attempt: retried bytes cross the network again
+        self.metrics.observe('processing.request_bytes', len(body))
         try:
-            response = requests.post(
+            response = self.http.post(
                 self.processing_endpoint,
-                json=data,
+                data=body,
+                headers=headers,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return self.codec.loads(response.content)
         except requests.exceptions.RequestException as e:
-            logger.warning(f"⚠️ Request failed for item {data.get('id')}: {str(e)}")
+            sampled.log(logging.WARNING, "request_failed", "⚠️ Request failed for item %s: %s", item_id, e)
             raise
 
     def process_post(self, post_data: Dict) -> Optional[Dict]:
         """
         Process a post through the external service.
+        Only the projected fields are sent, and stored in the DLQ on failure.
         
         Args:
             post_data: Post data to process
@@ -55,18 +108,20 @@ class ProcessingService(IProcessingService):
             Processed result or None if failed
         """
         item_id = post_data.get("id", "unknown")
+        post_data = self.projector.project("post", post_data)
         try:
             result = self._make_request(post_data)
-            logger.info(f"✅ Post {item_id} processed successfully")
+            sampled.info("post_processed", "✅ Post %s processed successfully", item_id)
             return result
         except Exception as e:
-            logger.error(f"❌ Failed to process post {item_id}: {str(e)}")
+            sampled.log(logging.ERROR, "post_failed", "❌ Failed to process post %s: %s", item_id, e)
             self._send_to_dlq("post", post_data)
             return None
 
     def process_comment(self, comment_data: Dict) -> Optional[Dict]:
         """
         Process a comment through the external service.
+        Only the projected fields are sent, and stored in the DLQ on failure.
         
         Args:
             comment_data: Comment data to process
@@ -75,12 +130,13 @@ class ProcessingService(IProcessingService):
             Processed result or None if failed
         """
         item_id = comment_data.get("id", "unknown")
+        comment_data = self.projector.project("comment", comment_data)
         try:
             result = self._make_request(comment_data)
-            logger.info(f"✅ Comment {item_id} processed successfully")
+            sampled.info("comment_processed", "✅ Comment %s processed successfully", item_id)
             return result
         except Exception as e:
-            logger.error(f"❌ Failed to process comment {item_id}: {str(e)}")
+            sampled.log(logging.ERROR, "comment_failed", "❌ Failed to process comment %s: %s", item_id, e)
             self._send_to_dlq("comment", comment_data)
             return None
 
@@ -94,6 +150,6 @@ class ProcessingService(IProcessingService):
         """
         try:
             self.dlq.add_failed_item(item_type, payload)
-            logger.info(f"📦 Sent {item_type} {payload.get('id', 'unknown')} to DLQ")
+            sampled.info("sent_to_dlq", "📦 Sent %s %s to DLQ", item_type, payload.get('id', 'unknown'))
         except Exception as e:
-            logger.error(f"🔥 Failed to enqueue {item_type} to DLQ: {str(e)}")
+            logger.error("🔥 Failed to enqueue %s to DLQ: %s", item_type, e)
@@ -0,0 +1,164 @@
+# app/infrastructure/external/request_hedger.py
+import os
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional, TypeVar
+
+from app.infrastructure.observability.metrics import MetricsRegistry, get_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class RequestHedger:
+    """
+    Hedged calls: when a call has not returned after the configured latency
+    percentile of recent calls, an identical second call is started and the
+    first one to succeed wins.
+
+    - The threshold adapts to a sliding window of observed latencies and is
+      only applied once enough samples exist
+    - Hedges draw from a token bucket refilled by `budget` tokens per call,
+      so they never exceed that share of calls (plus a small burst)
+    - The losing call is abandoned: it is cancelled if it has not started,
+      otherwise its result is discarded when it completes (a blocking HTTP
+      read cannot be interrupted), returning its connection to the pool
+
+    Metrics ('<name>.calls', '<name>.hedged', '<name>.hedge_wins',
+    '<name>.budget_exhausted') are recorded in the given registry.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 500,
+        burst: float = 10.0,
+        max_workers: int = 16,
+        name: str = 'hedge',
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        """
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            budget: Hedges allowed per call, e.g. 0.05 for at most 5% extra calls
+            min_delay: Lower bound of the hedge threshold in seconds
+            min_samples: Latencies observed before hedging starts
+            window: Number of recent latencies the threshold is computed from
+            burst: Maximum hedge tokens saved up during quiet periods
+            max_workers: Threads running hedged calls
+            name: Metric name prefix
+            metrics: Registry receiving hedge counts
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.burst = burst
+        self.name = name
+        self.metrics = metrics or get_metrics()
+        self._latencies = deque(maxlen=window)
+        self._tokens = burst
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-hedge")
+
+    @classmethod
+    def from_env(cls, name: str = 'pokeapi', metrics: Optional[MetricsRegistry] = None) -> Optional['RequestHedger']:
+        """
+        Hedger configured from POKEAPI_HEDGE_* env vars, or None unless
+        POKEAPI_HEDGE is enabled
+        """
+        if os.getenv('POKEAPI_HEDGE', 'false').lower() not in ('1', 'true', 'yes'):
+            return None
+        return cls(
+            percentile=float(os.getenv('POKEAPI_HEDGE_PERCENTILE', '0.95')),
+            budget=float(os.getenv('POKEAPI_HEDGE_BUDGET', '0.05')),
+            min_delay=float(os.getenv('POKEAPI_HEDGE_MIN_DELAY', '0.05')),
+            min_samples=int(os.getenv('POKEAPI_HEDGE_MIN_SAMPLES', '20')),
+            name=name,
+            metrics=metrics
+        )
+
+    def delay(self) -> Optional[float]:
+        """Current hedge threshold in seconds, or None while warming up"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return max(self.min_delay, latencies[int(self.percentile * (len(latencies) - 1))])
+
+    def _record(self, started: float) -> None:
+        with self._lock:
+            self._latencies.append(time.perf_counter() - started)
+
+    def _refill(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.budget)
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _submit(self, func: Callable[[], T]) -> Future:
+        started = time.perf_counter()
+        future = self._executor.submit(func)
+        future.add_done_callback(lambda done: done.cancelled() or self._record(started))
+        return future
+
+    def call(self, func: Callable[[], T]) -> T:
+        """
+        Run func, hedging it with a second call when it is slow
+
+        Returns:
+            The result of the first call to succeed
+
+        Raises:
+            Exception: The last error when every started call failed
+        """
+        self.metrics.increment(f"{self.name}.calls")
+        self._refill()
+        delay = self.delay()
+        if delay is None:
+            # Warming up: run inline and learn the latency distribution
+            started = time.perf_counter()
+            try:
+                return func()
+            finally:
+                self._record(started)
+
+        primary = self._submit(func)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        if not self._take_token():
+            self.metrics.increment(f"{self.name}.budget_exhausted")
+            return primary.result()
+
+        self.metrics.increment(f"{self.name}.hedged")
+        hedge = self._submit(func)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if future is hedge:
+                        self.metrics.increment(f"{self.name}.hedge_wins")
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def close(self) -> None:
+        """Stop the hedge threads without waiting for abandoned calls"""
+        self._executor.shutdown(wait=False)
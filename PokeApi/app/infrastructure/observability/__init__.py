@@ -0,0 +1,16 @@
+# app/infrastructure/observability/__init__.py
+"""
+Observability utilities for the ingest pipeline and workers
+
+Contains:
+- StageProfiler: Opt-in per-stage CPU and allocation profiling
+- MetricsRegistry / get_metrics: Thread-safe counters and value summaries
+- configure_logging: Queue-based, optionally JSON, root logging setup
+- LogSampler: Samples per-item log lines and counts what it suppresses
+"""
+
+from .profiler import StageProfiler
+from .metrics import MetricsRegistry, get_metrics
+from .logging_setup import configure_logging, JsonFormatter, LogSampler
+
+__all__ = ['StageProfiler', 'MetricsRegistry', 'get_metrics', 'configure_logging', 'JsonFormatter', 'LogSampler']
@@ -0,0 +1,168 @@
+# app/infrastructure/observability/logging_setup.py
+import os
+import sys
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+from typing import Dict, Optional
+
+from app.infrastructure.observability.metrics import MetricsRegistry, get_metrics
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configure_lock = threading.Lock()
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queues records unformatted: the listener thread does the %-formatting
+    (the stdlib handler formats in the caller, ahead of pickling for other
+    processes, which an in-process queue does not need)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, any `extra` fields and the traceback"""
+
+    def __init__(self, codec=None):
+        super().__init__()
+        self._codec = codec
+
+    @property
+    def codec(self):
+        if self._codec is None:
+            from app.infrastructure.serialization import get_codec
+            self._codec = get_codec()
+        return self._codec
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return self.codec.dumps(entry).decode('utf-8')
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    json_format: Optional[bool] = None,
+    asynchronous: Optional[bool] = None,
+    stream=None
+) -> None:
+    """
+    Configure the root logger, replacing its handlers
+
+    With asynchronous logging, callers only put records on an in-memory queue;
+    a listener thread formats them and writes to the stream, so a slow stderr
+    never blocks the pipeline. Records still queued are flushed at exit.
+
+    Args:
+        level: Root level (falls back to LOG_LEVEL env var)
+        json_format: One JSON object per line instead of text (falls back to
+            LOG_FORMAT=json env var)
+        asynchronous: Write through a queue and listener thread (falls back to
+            LOG_ASYNC env var)
+        stream: Output stream (stderr by default)
+    """
+    global _listener
+    level = level or os.getenv('LOG_LEVEL', 'INFO')
+    if json_format is None:
+        json_format = os.getenv('LOG_FORMAT', 'text').lower() == 'json'
+    if asynchronous is None:
+        asynchronous = os.getenv('LOG_ASYNC', 'true').lower() in ('1', 'true', 'yes')
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+
+    with _configure_lock:
+        root = logging.getLogger()
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        if asynchronous:
+            records: queue.Queue = queue.Queue(-1)
+            _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+            _listener.start()
+            root.addHandler(_DeferredQueueHandler(records))
+        else:
+            root.addHandler(handler)
+        root.setLevel(level)
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    with _configure_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+class LogSampler:
+    """
+    Sampling for per-item log lines: for each key, the first record and then
+    every `every`-th one is logged; the rest are counted in the metrics
+    registry ('logging.suppressed' and 'logging.suppressed[<key>]') and the
+    next logged record notes how many were skipped.
+
+    Records below the logger's level cost one level check and nothing else.
+
+    Example:
+        sampler.info('post_saved', "Post %s saved", post.id)
+    """
+
+    def __init__(self, logger: logging.Logger, every: Optional[int] = None, metrics: Optional[MetricsRegistry] = None):
+        """
+        Args:
+            logger: Logger receiving the sampled records
+            every: Log one record in this many per key; 1 logs everything
+                (falls back to LOG_SAMPLE_EVERY env var)
+            metrics: Registry receiving suppressed counts
+        """
+        self.logger = logger
+        self.every = max(1, every or int(os.getenv('LOG_SAMPLE_EVERY', '100')))
+        self.metrics = metrics or get_metrics()
+        self._seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def log(self, level: int, key: str, msg: str, *args) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        with self._lock:
+            seen = self._seen.get(key, 0)
+            self._seen[key] = seen + 1
+        if seen % self.every:
+            self.metrics.increment('logging.suppressed')
+            self.metrics.increment(f"logging.suppressed[{key}]")
+            return
+        if seen:
+            msg = f"{msg} (%d similar suppressed)"
+            args = args + (self.every - 1,)
+        self.logger.log(level, msg, *args)
+
+    def debug(self, key: str, msg: str, *args) -> None:
+        self.log(logging.DEBUG, key, msg, *args)
+
+    def info(self, key: str, msg: str, *args) -> None:
+        self.log(logging.INFO, key, msg, *args)
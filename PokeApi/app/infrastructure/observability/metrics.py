@@ -0,0 +1,83 @@
+# app/infrastructure/observability/metrics.py
+import threading
+from typing import Any, Dict, Optional
+
+
+class _Summary:
+    """Running count, sum, min and max of observed values"""
+
+    __slots__ = ('count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min,
+            'max': self.max,
+            'avg': self.total / self.count if self.count else None
+        }
+
+
+class MetricsRegistry:
+    """
+    In-process counters and value summaries, safe to update from any thread.
+
+    Metric names are dotted strings (e.g. 'processing.request_bytes');
+    snapshot() returns everything recorded so far, for run results and logs.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, float] = {}
+        self._summaries: Dict[str, _Summary] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                summary = self._summaries[name] = _Summary()
+            summary.add(value)
+
+    def counter(self, name: str) -> float:
+        return self._counters.get(name, 0)
+
+    def summary(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            summary = self._summaries.get(name)
+            return summary.to_dict() if summary is not None else _Summary().to_dict()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'summaries': {name: summary.to_dict() for name, summary in self._summaries.items()}
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+
+_default_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Process-wide registry used when a component is not given its own"""
+    return _default_registry
@@ -0,0 +1,331 @@
+# app/infrastructure/observability/profiler.py
+import os
+import sys
+import json
+import time
+import cProfile
+import pstats
+import logging
+import threading
+import tracemalloc
+from array import array
+from collections import Counter
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Shared no-op context returned when profiling is off, so a disabled
+# profiler costs one attribute lookup and an empty ``with`` block per stage.
+_NULL_STAGE = nullcontext()
+
+CPU_MODES = ('deterministic', 'sampling', 'timing')
+
+
+class _StageStats:
+    """Accumulated measurements for a single pipeline stage"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.durations = array('d')
+        self.net_allocated = 0
+        self.profiles: Dict[int, cProfile.Profile] = {}
+        self.samples: Counter = Counter()
+        self.allocators: Counter = Counter()
+        self.lock = threading.Lock()
+
+
+class _StageContext:
+    """Context manager measuring one execution of a stage"""
+
+    __slots__ = ('profiler', 'stats', 'started', 'profile', 'snapshot', 'traced', 'previous_stage')
+
+    def __init__(self, profiler: 'StageProfiler', stats: _StageStats):
+        self.profiler = profiler
+        self.stats = stats
+        self.profile = None
+        self.snapshot = None
+        self.traced = 0
+        self.previous_stage = None
+
+    def __enter__(self):
+        profiler = self.profiler
+        stats = self.stats
+        with stats.lock:
+            stats.calls += 1
+            call_number = stats.calls
+
+        if profiler.trace_memory:
+            if profiler.snapshot_every and (call_number - 1) % profiler.snapshot_every == 0:
+                self.snapshot = tracemalloc.take_snapshot()
+            self.traced = tracemalloc.get_traced_memory()[0]
+
+        thread_id = threading.get_ident()
+        if profiler.cpu_mode == 'sampling':
+            self.previous_stage = profiler._active_stages.get(thread_id)
+            profiler._active_stages[thread_id] = stats.name
+        elif profiler.cpu_mode == 'deterministic' and not getattr(profiler._local, 'profiling', False):
+            # cProfile cannot nest on one thread; inner stages only get timings
+            profile = stats.profiles.get(thread_id)
+            if profile is None:
+                profile = stats.profiles.setdefault(thread_id, cProfile.Profile())
+            try:
+                profile.enable()
+                profiler._local.profiling = True
+                self.profile = profile
+            except ValueError:
+                self.profile = None
+
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        profiler = self.profiler
+        stats = self.stats
+
+        if self.profile is not None:
+            self.profile.disable()
+            profiler._local.profiling = False
+        if profiler.cpu_mode == 'sampling':
+            thread_id = threading.get_ident()
+            if self.previous_stage is None:
+                profiler._active_stages.pop(thread_id, None)
+            else:
+                profiler._active_stages[thread_id] = self.previous_stage
+
+        allocated = 0
+        diff = None
+        if profiler.trace_memory:
+            allocated = tracemalloc.get_traced_memory()[0] - self.traced
+            if self.snapshot is not None:
+                diff = tracemalloc.take_snapshot().compare_to(self.snapshot, 'lineno')
+
+        with stats.lock:
+            stats.durations.append(elapsed)
+            stats.net_allocated += allocated
+            if diff:
+                for stat in diff:
+                    if stat.size_diff > 0:
+                        stats.allocators[str(stat.traceback)] += stat.size_diff
+        return False
+
+
+class StageProfiler:
+    """
+    Opt-in profiler wrapping each pipeline stage with:
+    - Deterministic (cProfile) or sampling CPU profiling
+    - tracemalloc allocation tracking with periodic snapshot diffs
+    - Per-stage wall-clock latencies
+
+    Produces per-stage ``.pstats`` files (deterministic mode), collapsed-stack
+    ``.collapsed`` files for flamegraph tooling (sampling mode), an
+    ``allocations.txt`` summary of the top allocators and a ``summary.json``.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        cpu_mode: str = 'deterministic',
+        trace_memory: bool = True,
+        output_dir: str = '/tmp/pokeapi_profiles',
+        sample_interval: float = 0.005,
+        snapshot_every: int = 100,
+        top_allocators: int = 25
+    ):
+        """
+        Initialize the stage profiler
+
+        Args:
+            enabled: Whether stages are measured at all
+            cpu_mode: 'deterministic', 'sampling' or 'timing' (latencies only)
+            trace_memory: Track allocations with tracemalloc
+            output_dir: Directory where profile reports are written
+            sample_interval: Seconds between stack samples in sampling mode
+            snapshot_every: Take tracemalloc snapshot diffs every N calls of a stage
+            top_allocators: Number of allocation sites reported per stage
+        """
+        if cpu_mode not in CPU_MODES:
+            raise ValueError(f"Unknown profiling mode: {cpu_mode}")
+
+        self.enabled = enabled
+        self.cpu_mode = cpu_mode
+        self.trace_memory = enabled and trace_memory
+        self.output_dir = Path(output_dir)
+        self.sample_interval = sample_interval
+        self.snapshot_every = snapshot_every
+        self.top_allocators = top_allocators
+
+        self._stages: Dict[str, _StageStats] = {}
+        self._stages_lock = threading.Lock()
+        self._local = threading.local()
+        self._active_stages: Dict[int, str] = {}
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampling = threading.Event()
+        self._started_tracemalloc = False
+
+        if self.enabled:
+            self._start()
+
+    @classmethod
+    def from_env(cls) -> 'StageProfiler':
+        """
+        Build a profiler from PROFILE_* environment variables.
+        PROFILE_MODE=off (default) disables profiling entirely.
+        """
+        mode = os.getenv('PROFILE_MODE', 'off').lower()
+        if mode in ('', 'off', '0', 'false'):
+            return cls(enabled=False)
+        return cls(
+            enabled=True,
+            cpu_mode=mode,
+            trace_memory=os.getenv('PROFILE_MEMORY', '1') == '1',
+            output_dir=os.getenv('PROFILE_OUTPUT_DIR', '/tmp/pokeapi_profiles'),
+            sample_interval=float(os.getenv('PROFILE_SAMPLE_INTERVAL_MS', '5')) / 1000,
+            snapshot_every=int(os.getenv('PROFILE_SNAPSHOT_EVERY', '100')),
+            top_allocators=int(os.getenv('PROFILE_TOP_ALLOCATORS', '25'))
+        )
+
+    def _start(self) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start(int(os.getenv('PROFILE_TRACEMALLOC_FRAMES', '1')))
+            self._started_tracemalloc = True
+        if self.cpu_mode == 'sampling':
+            self._sampler = threading.Thread(target=self._sample_loop, name='stage-profiler-sampler', daemon=True)
+            self._sampler.start()
+        logger.info("Stage profiling enabled (mode=%s, memory=%s, output=%s)",
+                    self.cpu_mode, self.trace_memory, self.output_dir)
+
+    def stage(self, name: str):
+        """
+        Context manager measuring one execution of the named stage
+
+        Args:
+            name: Stage name used for report file names
+
+        Returns:
+            A context manager (a shared no-op when profiling is disabled)
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+
+        stats = self._stages.get(name)
+        if stats is None:
+            with self._stages_lock:
+                stats = self._stages.setdefault(name, _StageStats(name))
+        return _StageContext(self, stats)
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop_sampling.wait(self.sample_interval):
+            frames = sys._current_frames()
+            for thread_id, stage_name in list(self._active_stages.items()):
+                if thread_id == own_id:
+                    continue
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_filename}:{code.co_name}")
+                    frame = frame.f_back
+                stats = self._stages.get(stage_name)
+                if stats is not None:
+                    stats.samples[';'.join(reversed(stack))] += 1
+
+    def latencies(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize recorded stage latencies
+
+        Returns:
+            Dictionary mapping stage names to call counts and latency percentiles (seconds)
+        """
+        summary = {}
+        for name, stats in list(self._stages.items()):
+            with stats.lock:
+                durations = sorted(stats.durations)
+                net_allocated = stats.net_allocated
+            if not durations:
+                continue
+            summary[name] = {
+                'calls': len(durations),
+                'total': sum(durations),
+                'p50': _percentile(durations, 50),
+                'p99': _percentile(durations, 99),
+                'max': durations[-1],
+                'net_allocated_bytes': net_allocated
+            }
+        return summary
+
+    def dump(self, label: str = 'pipeline') -> Optional[Path]:
+        """
+        Write profile reports for every stage recorded so far
+
+        Args:
+            label: Name of the profiled run (e.g. 'pipeline', 'dlq_worker')
+
+        Returns:
+            Path of the report directory, or None when profiling is disabled
+        """
+        if not self.enabled:
+            return None
+
+        report_dir = self.output_dir / f"{label}_{time.strftime('%Y%m%d_%H%M%S')}"
+        report_dir.mkdir(parents=True, exist_ok=True)
+
+        allocation_lines = []
+        for name, stats in list(self._stages.items()):
+            with stats.lock:
+                profiles = list(stats.profiles.values())
+                samples = dict(stats.samples)
+                allocators = stats.allocators.most_common(self.top_allocators)
+
+            if profiles:
+                merged = None
+                for profile in profiles:
+                    if merged is None:
+                        merged = pstats.Stats(profile)
+                    else:
+                        merged.add(profile)
+                if merged is not None and merged.stats:
+                    merged.dump_stats(str(report_dir / f"{name}.pstats"))
+
+            if samples:
+                with open(report_dir / f"{name}.collapsed", 'w') as f:
+                    for stack, count in sorted(samples.items()):
+                        f.write(f"{stack} {count}\n")
+
+            if allocators:
+                allocation_lines.append(f"== {name}")
+                allocation_lines.extend(f"{size:>12} B  {site}" for site, size in allocators)
+                allocation_lines.append('')
+
+        if allocation_lines:
+            (report_dir / 'allocations.txt').write_text('\n'.join(allocation_lines))
+
+        with open(report_dir / 'summary.json', 'w') as f:
+            json.dump({'mode': self.cpu_mode, 'stages': self.latencies()}, f, indent=2)
+
+        logger.info("Stage profiles written to %s", report_dir)
+        return report_dir
+
+    def stop(self) -> None:
+        """Stop background sampling and release tracemalloc if we started it"""
+        self._stop_sampling.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=1)
+            self._sampler = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+
+def _percentile(sorted_values, percent: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
@@ -5,9 +5,17 @@ Persistence implementations for data access
 Contains:
 - DynamoDBPostRepository: DynamoDB implementation for posts
 - DynamoDBCommentRepository: DynamoDB implementation for comments
+- ItemCodec: Compressed binary storage of raw_data inside items
 """
 
-from .dynamodb_post_repository import DynamoDBPostRepository
-from .dynamodb_comment_repository import DynamoDBCommentRepository
+from app.infrastructure.config.lazy import lazy_exports
 
-__all__ = ['DynamoDBPostRepository', 'DynamoDBCommentRepository']
\ No newline at end of file
+_EXPORTS = {
+    'DynamoDBPostRepository': '.dynamodb_post_repository',
+    'DynamoDBCommentRepository': '.dynamodb_comment_repository',
+    'ItemCodec': '.item_codec'
+}
+
+__all__ = ['DynamoDBPostRepository', 'DynamoDBCommentRepository', 'ItemCodec']
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
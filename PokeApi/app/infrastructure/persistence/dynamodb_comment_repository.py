@@ -1,32 +1,74 @@
 import os
 import logging
-from typing import List
-from boto3.dynamodb.conditions import Key
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from botocore.exceptions import ClientError
 
 from app.domain.entities.comment import Comment
+from app.domain.exceptions import RepositoryError
 from app.domain.interfaces.repositories.icomment_repository import ICommentRepository
+from app.infrastructure.config.client_registry import ClientRegistry
 from app.infrastructure.config.database import get_dynamodb_resource
+from app.infrastructure.aggregates import FlavorAggregates
+from app.infrastructure.persistence.item_codec import ItemCodec, backfill_table, migrate_items
 
 logger = logging.getLogger(__name__)
 
+
+def _key(name: str):
+    # boto3 is imported on first query rather than at module import
+    from boto3.dynamodb.conditions import Key
+    return Key(name)
+
+
 class DynamoDBCommentRepository(ICommentRepository):
-    def __init__(self, table_name: str = None, endpoint_url: str = None):
-        self.dynamodb = get_dynamodb_resource(endpoint_url=endpoint_url)
+    def __init__(self, table_name: str = None, endpoint_url: str = None,
+                 aggregates: Optional[FlavorAggregates] = None, codec: Optional[ItemCodec] = None,
+                 clients: Optional[ClientRegistry] = None):
+        """
+        Args:
+            table_name: Optional custom table name
+            endpoint_url: DynamoDB endpoint (LocalStack or DynamoDB Local)
+            aggregates: Per-flavor aggregates updated after every successful save
+            codec: Storage format of raw_data (an env-configured ItemCodec by default)
+            clients: Registry providing the shared DynamoDB resource (the
+                process-wide registry by default)
+        """
+        self.endpoint_url = endpoint_url
+        self.aggregates = aggregates
+        self.codec = codec or ItemCodec()
+        self.clients = clients
+        self._dynamodb = None
+        self._table = None
         self.table_name = table_name or os.getenv('DYNAMODB_TABLE_COMMENTS', 'Comments')
-        self.table = self.dynamodb.Table(self.table_name)
         logger.info(f"Initialized repository for table: {self.table_name}")
 
+    @property
+    def dynamodb(self):
+        """Shared boto3 DynamoDB resource, looked up (and boto3 imported) on first use"""
+        if self._dynamodb is None:
+            if self.clients is not None:
+                self._dynamodb = self.clients.dynamodb(self.endpoint_url)
+            else:
+                self._dynamodb = get_dynamodb_resource(endpoint_url=self.endpoint_url)
+        return self._dynamodb
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = self.dynamodb.Table(self.table_name)
+        return self._table
+
     def save(self, comment: Comment) -> bool:
         try:
             item = self._adapt_comment_structure(comment)
-            logger.debug(f"Saving adapted comment: {item}")
+            logger.debug("Saving adapted comment: %s", item)
             
             self.table.put_item(Item=item)
+            self._record_aggregates([comment])
             return True
             
         except ValueError as e:
-            logger.warning(f"Validation error: {e}. Comment data: {comment.__dict__}")
+            logger.warning("Validation error: %s. Comment data: %s", e, comment)
             return False
         except ClientError as e:
             logger.error(f"DynamoDB error saving comment: {e}")
@@ -35,49 +77,193 @@ class DynamoDBCommentRepository(ICommentRepository):
             logger.error(f"Unexpected error saving comment: {e}", exc_info=True)
             return False
 
+    def save_many(self, comments: Iterable[Comment]) -> int:
+        """
+        Store comments with batched writes and fold them into the aggregates
+        in one round trip. Comments that fail validation are skipped; repeated
+        ids within the batch collapse to the last one.
+
+        Returns:
+            int: Number of comments written
+        """
+        saved: List[Comment] = []
+        try:
+            with self.table.batch_writer(overwrite_by_pkeys=['id']) as batch:
+                for comment in comments:
+                    try:
+                        batch.put_item(Item=self._adapt_comment_structure(comment))
+                        saved.append(comment)
+                    except ValueError as e:
+                        logger.warning(f"Validation error: {e}. Comment data: {comment.to_dict()}")
+        except ClientError as e:
+            logger.error(f"DynamoDB error saving comment batch: {e}")
+            return 0
+        except Exception as e:
+            logger.error(f"Unexpected error saving comment batch: {e}", exc_info=True)
+            return 0
+        self._record_aggregates(saved)
+        return len(saved)
+
+    def _record_aggregates(self, comments: List[Comment]) -> None:
+        if self.aggregates is None or not comments:
+            return
+        try:
+            self.aggregates.record(comments)
+        except Exception as e:
+            # The item is stored; the aggregates catch up when it is ingested again
+            logger.error(f"Failed to update flavor aggregates: {e}")
+
     def get_by_post_id(self, post_id: str) -> List[Comment]:
         try:
             response = self.table.query(
                 IndexName='post_id-index',
-                KeyConditionExpression=Key('post_id').eq(str(post_id)),
+                KeyConditionExpression=_key('post_id').eq(str(post_id)),
             )
-            return [Comment(**item) for item in response.get('Items', [])]
+            return self._load(response.get('Items', []))
         except Exception as e:
             logger.error(f"Error getting comments: {e}")
             return []
 
+    def get_by_post_ids(self, post_ids: Iterable[Any]) -> Dict[str, List[Comment]]:
+        """
+        Retrieves the Comments of several posts, one query each.
+
+        Args:
+            post_ids: Post IDs to look up
+
+        Returns:
+            Dict[str, List[Comment]]: Comments per post ID
+
+        Raises:
+            RepositoryError: If a query fails, so a failure is never mistaken
+                for a post without comments
+        """
+        comments: Dict[str, List[Comment]] = {}
+        for post_id in post_ids:
+            post_id = str(post_id)
+            try:
+                response = self.table.query(
+                    IndexName='post_id-index',
+                    KeyConditionExpression=_key('post_id').eq(post_id),
+                )
+            except Exception as e:
+                logger.error(f"Error getting comments of post {post_id}: {e}")
+                raise RepositoryError(f"Failed to read comments of post {post_id}: {e}", {'post_id': post_id})
+            comments[post_id] = self._load(response.get('Items', []))
+        return comments
+
+    def list_page(
+        self,
+        limit: int,
+        start_key: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Comment], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of Comments, reading at most `limit` items.
+
+        Args:
+            limit: Maximum number of Comments to return
+            start_key: LastEvaluatedKey of the previous page
+
+        Returns:
+            Tuple[List[Comment], Optional[Dict]]: Comments and the key of the next page
+
+        Raises:
+            RepositoryError: If the page cannot be read, so a failure is never
+                mistaken for an empty last page
+        """
+        params = {'Limit': limit}
+        if start_key:
+            params['ExclusiveStartKey'] = start_key
+        try:
+            response = self.table.scan(**params)
+        except Exception as e:
+            logger.error(f"Error fetching comments page: {e}")
+            raise RepositoryError(f"Failed to read comments page: {e}", {'start_key': start_key})
+        return self._load(response.get('Items', [])), response.get('LastEvaluatedKey')
+
+    def compact(self, page_size: int = 500, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Collapse comments stored under random ids by earlier versions into one
+        row per (post_id, flavor) under its deterministic id. The newest row of
+        each pair is kept (rewritten under the deterministic id when needed) and
+        every other row is deleted. The table is scanned in full before any
+        write, so the scan never sees its own changes.
+
+        Args:
+            page_size: Items per Scan call
+            dry_run: Only count what would change
+
+        Returns:
+            Dict[str, int]: scanned, kept, rewritten and deleted row counts
+        """
+        newest: Dict[str, Dict] = {}
+        stale: List[str] = []
+        scanned = 0
+        params: Dict[str, Any] = {'Limit': page_size}
+        while True:
+            response = self.table.scan(**params)
+            for item in response.get('Items', []):
+                scanned += 1
+                if item.get('post_id') is None or not isinstance(item.get('flavor'), str):
+                    continue
+                canonical = Comment.make_id(item['post_id'], item['flavor'])
+                if item['id'] != canonical:
+                    stale.append(item['id'])
+                current = newest.get(canonical)
+                if current is None or str(item.get('created_at') or '') > str(current.get('created_at') or ''):
+                    newest[canonical] = item
+            if not response.get('LastEvaluatedKey'):
+                break
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+        rewrites = [dict(item, id=canonical) for canonical, item in newest.items() if item['id'] != canonical]
+        stats = {'scanned': scanned, 'kept': len(newest), 'rewritten': len(rewrites), 'deleted': len(stale)}
+        if dry_run:
+            logger.info(f"Comment compaction dry run: {stats}")
+            return stats
+
+        with self.table.batch_writer() as batch:
+            for item in rewrites:
+                batch.put_item(Item=item)
+            for comment_id in stale:
+                batch.delete_item(Key={'id': comment_id})
+        logger.info(f"Compacted comments table {self.table_name}: {stats}")
+        return stats
+
+    def backfill(self, page_size: int = 500, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Rewrite every item still in the legacy layout (raw_data map, stringified
+        fields, derived 'content') in the compact format.
+
+        Returns:
+            Dict[str, int]: scanned, legacy and migrated item counts
+        """
+        return backfill_table(self.table, self._migrated_item, page_size, dry_run)
+
+    def _load(self, items: List[Dict[str, Any]]) -> List[Comment]:
+        """Decode stored items, migrating legacy ones when enabled"""
+        comments = [Comment.from_dict(self.codec.decode(item)) for item in items]
+        if self.codec.migrate_on_read:
+            migrate_items(self.table, items, self._migrated_item)
+        return comments
+
+    def _migrated_item(self, item: Dict[str, Any]) -> dict:
+        return self._adapt_comment_structure(Comment.from_dict(item))
+
     def _adapt_comment_structure(self, comment: Comment) -> dict:
         """
-        Adapts comment structure handling both dict and string flavor data.
-        Preserves original dictionaries while converting other fields to strings.
+        Builds the stored item: native attributes (post_id as a string, the
+        key type of post_id-index) plus raw_data as one binary attribute
+        (see ItemCodec).
         """
-        item = comment.to_dict()
-        
         # Validate required fields
-        if 'id' not in item:
+        if comment.id is None:
             raise ValueError("Comment must have an 'id' field")
-        if 'post_id' not in item:
+        if comment.post_id is None:
             raise ValueError("Comment must have a 'post_id' field")
-        
+
+        item = {field: getattr(comment, field) for field in Comment.FIELDS if field != 'raw_data'}
         # Convert IDs to strings
         item['id'] = str(item['id'])
         item['post_id'] = str(item['post_id'])
-        
-        # Generate content from flavor data if missing
-        if 'content' not in item:
-            flavor_data = item.get('flavor')
-            potency = item.get('potency', 0)
-            
-            if isinstance(flavor_data, dict):
-                item['content'] = f"{flavor_data.get('name', 'unknown')} (potency: {potency})"
-            elif isinstance(flavor_data, str):
-                item['content'] = f"{flavor_data} (potency: {potency})"
-            else:
-                item['content'] = f"Berry flavor (potency: {potency})"
-        
-        # Convert non-dict fields to strings
-        for key in item:
-            if not isinstance(item[key], (str, dict)):
-                item[key] = str(item[key])
-                
-        return item
\ No newline at end of file
+        return self.codec.encode(item, comment.raw_payload)
@@ -1,15 +1,19 @@
 import os
 import logging
-from typing import List, Optional
-from boto3.dynamodb.conditions import Key
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from botocore.exceptions import ClientError
 
 from app.domain.entities.post import Post
+from app.domain.exceptions import RepositoryError
 from app.domain.interfaces.repositories.ipost_repository import IPostRepository
+from app.infrastructure.config.client_registry import ClientRegistry
 from app.infrastructure.config.database import get_dynamodb_resource
+from app.infrastructure.observability.logging_setup import LogSampler
+from app.infrastructure.persistence.item_codec import ItemCodec, backfill_table, migrate_items
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
+sampled = LogSampler(logger)
 
 class DynamoDBPostRepository(IPostRepository):
     """
@@ -22,20 +26,43 @@ class DynamoDBPostRepository(IPostRepository):
         table: Reference to the DynamoDB table
     """
     
-    def __init__(self, table_name: str = None, endpoint_url: str = None):
+    def __init__(self, table_name: str = None, endpoint_url: str = None, codec: Optional[ItemCodec] = None,
+                 clients: Optional[ClientRegistry] = None):
         """
-        Initializes the DynamoDB connection and target table.
+        Configures the target table; the DynamoDB resource is created on first use.
         
         Args:
             table_name: Optional custom table name
             endpoint_url: Optional endpoint URL (for local testing)
+            codec: Storage format of raw_data (an env-configured ItemCodec by default)
+            clients: Registry providing the shared DynamoDB resource (the
+                process-wide registry by default)
         """
-        self.dynamodb = get_dynamodb_resource(endpoint_url=endpoint_url)
+        self.endpoint_url = endpoint_url
+        self.codec = codec or ItemCodec()
+        self.clients = clients
+        self._dynamodb = None
+        self._table = None
         self.table_name = table_name or os.getenv('DYNAMODB_TABLE_POSTS', 'Posts')
-        self.table = self.dynamodb.Table(self.table_name)
         
         logger.info(f"Initialized repository for table: {self.table_name}")
 
+    @property
+    def dynamodb(self):
+        """Shared boto3 DynamoDB resource, looked up (and boto3 imported) on first use"""
+        if self._dynamodb is None:
+            if self.clients is not None:
+                self._dynamodb = self.clients.dynamodb(self.endpoint_url)
+            else:
+                self._dynamodb = get_dynamodb_resource(endpoint_url=self.endpoint_url)
+        return self._dynamodb
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = self.dynamodb.Table(self.table_name)
+        return self._table
+
     def save(self, post: Post) -> bool:
         """
         Saves a Post entity to DynamoDB with automatic type conversion.
@@ -48,16 +75,16 @@ class DynamoDBPostRepository(IPostRepository):
         """
         try:
             item = self._convert_post_to_item(post)
-            logger.debug(f"Attempting to save item: {item}")
+            logger.debug("Attempting to save item: %s", item)
             
             self.table.put_item(Item=item)
-            logger.info(f"Post saved successfully with ID: {item['id']}")
+            sampled.info("post_saved", "Post saved successfully with ID: %s", item['id'])
             return True
             
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code')
             if error_code == 'ValidationException':
-                logger.error(f"Validation error when saving post. Item: {item}. Error: {str(e)}")
+                logger.error("Validation error when saving post. Item: %s. Error: %s", item, e)
             else:
                 logger.error(f"DynamoDB error when saving post: {str(e)}")
             return False
@@ -84,10 +111,10 @@ class DynamoDBPostRepository(IPostRepository):
             response = self.table.get_item(Key={'id': post_id})
             
             if 'Item' not in response:
-                logger.info(f"Post not found for ID: {post_id}")
+                logger.debug("Post not found for ID: %s", post_id)
                 return None
                 
-            return Post(**response['Item'])
+            return self._load([response['Item']])[0]
             
         except ClientError as e:
             logger.error(f"Error fetching post ID {post_id}: {str(e)}")
@@ -97,6 +124,31 @@ class DynamoDBPostRepository(IPostRepository):
             logger.error(f"Unexpected error when fetching post: {str(e)}", exc_info=True)
             return None
 
+    def get_many(self, post_ids: Iterable[Any]) -> Dict[str, Optional[Post]]:
+        """
+        Retrieves several Posts, one GetItem each.
+
+        Args:
+            post_ids: Post IDs to look up
+
+        Returns:
+            Dict[str, Optional[Post]]: Post per ID, None for IDs not stored
+
+        Raises:
+            RepositoryError: If a lookup fails, so a failure is never
+                mistaken for a deleted post
+        """
+        posts: Dict[str, Optional[Post]] = {}
+        for post_id in post_ids:
+            post_id = str(post_id)
+            try:
+                response = self.table.get_item(Key={'id': post_id})
+            except Exception as e:
+                logger.error(f"Error fetching post ID {post_id}: {str(e)}")
+                raise RepositoryError(f"Failed to read post {post_id}: {str(e)}", {'post_id': post_id})
+            posts[post_id] = self._load([response['Item']])[0] if 'Item' in response else None
+        return posts
+
     def get_all(self) -> List[Post]:
         """
         Retrieves all Posts from the table.
@@ -109,7 +161,7 @@ class DynamoDBPostRepository(IPostRepository):
             items = response.get('Items', [])
             
             logger.info(f"Found {len(items)} posts")
-            return [Post(**item) for item in items]
+            return self._load(items)
             
         except ClientError as e:
             logger.error(f"Error fetching all posts: {str(e)}")
@@ -119,9 +171,95 @@ class DynamoDBPostRepository(IPostRepository):
             logger.error(f"Unexpected error when fetching posts: {str(e)}", exc_info=True)
             return []
 
+    def list_page(
+        self,
+        limit: int,
+        start_key: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Post], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of Posts, reading at most `limit` items.
+
+        Args:
+            limit: Maximum number of Posts to return
+            start_key: LastEvaluatedKey of the previous page
+
+        Returns:
+            Tuple[List[Post], Optional[Dict]]: Posts and the key of the next page
+
+        Raises:
+            RepositoryError: If the page cannot be read, so a failure is never
+                mistaken for an empty last page
+        """
+        params = {'Limit': limit}
+        if start_key:
+            params['ExclusiveStartKey'] = start_key
+        try:
+            response = self.table.scan(**params)
+        except Exception as e:
+            logger.error(f"Error fetching posts page: {str(e)}")
+            raise RepositoryError(f"Failed to read posts page: {str(e)}", {'start_key': start_key})
+        return self._load(response.get('Items', [])), response.get('LastEvaluatedKey')
+
+    def scan_segment(
+        self,
+        segment: int,
+        total_segments: int,
+        limit: int,
+        start_key: Optional[Dict[str, Any]] = None,
+        created_after: Optional[str] = None
+    ) -> Tuple[List[Post], Optional[Dict[str, Any]]]:
+        """
+        Reads one page of one segment of a parallel Scan. Errors are raised
+        as is, so a caller walking the whole table never mistakes a failure
+        for the end of a segment.
+
+        Args:
+            segment: Segment read by this caller (0-based)
+            total_segments: Number of segments the table is split into
+            limit: Maximum number of items read
+            start_key: LastEvaluatedKey of the previous page of this segment
+            created_after: Only Posts with a later ISO created_at (applied as a
+                Scan filter, so only matching items cross the network)
+
+        Returns:
+            Tuple[List[Post], Optional[Dict]]: Posts and the key of the next page
+        """
+        params: Dict[str, Any] = {'Limit': limit, 'Segment': segment, 'TotalSegments': total_segments}
+        if start_key:
+            params['ExclusiveStartKey'] = start_key
+        if created_after:
+            from boto3.dynamodb.conditions import Attr
+            params['FilterExpression'] = Attr('created_at').gt(created_after)
+        response = self.table.scan(**params)
+        items = response.get('Items', [])
+        if created_after:
+            items = [item for item in items if str(item.get('created_at') or '') > created_after]
+        return self._load(items), response.get('LastEvaluatedKey')
+
+    def backfill(self, page_size: int = 500, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Rewrite every item still storing raw_data as a map in the compressed format.
+
+        Returns:
+            Dict[str, int]: scanned, legacy and migrated item counts
+        """
+        return backfill_table(self.table, self._migrated_item, page_size, dry_run)
+
+    def _load(self, items: List[Dict[str, Any]]) -> List[Post]:
+        """Decode stored items, migrating legacy ones when enabled"""
+        posts = [Post.from_dict(self.codec.decode(item)) for item in items]
+        if self.codec.migrate_on_read:
+            migrate_items(self.table, items, self._migrated_item)
+        return posts
+
+    def _migrated_item(self, item: Dict[str, Any]) -> dict:
+        return self._convert_post_to_item(Post.from_dict(item))
+
     def _convert_post_to_item(self, post: Post) -> dict:
         """
         Converts a Post entity to a DynamoDB-compatible dictionary.
+        Attributes are stored natively and raw_data as one binary attribute
+        (see ItemCodec).
         
         Args:
             post: Post entity to convert
@@ -132,17 +270,11 @@ class DynamoDBPostRepository(IPostRepository):
         Raises:
             ValueError: If required fields are missing or invalid
         """
-        item = post.to_dict()
-        
-        # Ensure ID is string type (DynamoDB requirement)
-        if 'id' not in item:
+        if post.id is None:
             raise ValueError("Post must contain an 'id' field")
+        # Built from the attributes so an encoded raw payload is never parsed here
+        item = {field: getattr(post, field) for field in Post.FIELDS if field != 'raw_data'}
+
+        # Ensure ID is string type (DynamoDB requirement)
         item['id'] = str(item['id'])
-            
-        # Convert other required fields to string if needed
-        required_string_fields = ['title', 'content']
-        for field in required_string_fields:
-            if field in item and not isinstance(item[field], str):
-                item[field] = str(item[field])
-                
-        return item
\ No newline at end of file
+        return self.codec.encode(item, post.raw_payload)
@@ -0,0 +1,183 @@
+# app/infrastructure/persistence/item_codec.py
+import os
+import zlib
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from app.domain.entities.raw_payload import RawPayload
+
+logger = logging.getLogger(__name__)
+
+# Binary attribute holding the encoded raw_data; legacy items keep a 'raw_data' map
+RAW_ATTRIBUTE = 'raw_data_b'
+
+# First byte of RAW_ATTRIBUTE: how the JSON that follows is stored. A new
+# dictionary needs a new marker; existing items keep decoding with theirs.
+_PLAIN = b'j'
+_DEFLATE_V1 = b'd'
+
+# Preset deflate dictionary of the strings every PokeAPI berry and flavor
+# entry repeats, so even a single comment's flavor entry compresses to a few
+# bytes. Most frequent strings go last, where matches are cheapest.
+_DICTIONARY_V1 = (
+    b'"natural_gift_type":{"name":"","url":"https://pokeapi.co/api/v2/type/'
+    b'"item":{"name":"-berry","url":"https://pokeapi.co/api/v2/item/'
+    b'"firmness":{"name":"very-soft","url":"https://pokeapi.co/api/v2/berry-firmness/'
+    b'"growth_time":"max_harvest":"natural_gift_power":"size":"smoothness":"soil_dryness":"flavors":['
+    b'{"flavor":{"name":"spicy","url":"https://pokeapi.co/api/v2/berry-flavor/1/"},"potency":'
+    b'{"flavor":{"name":"dry","url":"https://pokeapi.co/api/v2/berry-flavor/2/"},"potency":'
+    b'{"flavor":{"name":"sweet","url":"https://pokeapi.co/api/v2/berry-flavor/3/"},"potency":'
+    b'{"flavor":{"name":"bitter","url":"https://pokeapi.co/api/v2/berry-flavor/4/"},"potency":'
+    b'{"flavor":{"name":"sour","url":"https://pokeapi.co/api/v2/berry-flavor/5/"},"potency":'
+)
+
+
+class ItemCodec:
+    """
+    Storage format of the raw PokeAPI document inside DynamoDB items.
+
+    Hot fields stay native top-level attributes (numbers as numbers, so scans
+    and filters keep working), while raw_data is stored as one binary
+    attribute: raw deflate of the JSON against a preset dictionary of PokeAPI
+    strings, or plain JSON when compression does not make it smaller.
+    Decoded items hand raw_data back as a RawPayload buffer, so it is only
+    parsed when an entity reads it.
+
+    Items written before this format carry raw_data as a DynamoDB map; they
+    decode unchanged and are rewritten by migrate-on-read or backfill.
+    """
+
+    def __init__(
+        self,
+        level: Optional[int] = None,
+        migrate_on_read: Optional[bool] = None
+    ):
+        """
+        Args:
+            level: Deflate compression level (falls back to ITEM_COMPRESSION_LEVEL env var)
+            migrate_on_read: Rewrite legacy items when repositories read them
+                (falls back to ITEM_MIGRATE_ON_READ env var)
+        """
+        self.level = level if level is not None else int(os.getenv('ITEM_COMPRESSION_LEVEL', '6'))
+        if migrate_on_read is None:
+            migrate_on_read = os.getenv('ITEM_MIGRATE_ON_READ', 'true').lower() in ('1', 'true', 'yes')
+        self.migrate_on_read = migrate_on_read
+
+    def encode_raw(self, raw: Any) -> Optional[bytes]:
+        """Binary attribute value for a raw_data value (RawPayload, bytes or decoded)"""
+        payload = RawPayload.wrap(raw)
+        if payload is None:
+            return None
+        data = bytes(payload)
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=_DICTIONARY_V1)
+        compressed = compressor.compress(data) + compressor.flush()
+        if len(compressed) < len(data):
+            return _DEFLATE_V1 + compressed
+        return _PLAIN + data
+
+    def encode(self, item: Dict[str, Any], raw: Any) -> Dict[str, Any]:
+        """
+        Replace raw_data in an item with its binary attribute
+
+        Args:
+            item: Item with native attributes (its raw_data key, if any, is dropped)
+            raw: raw_data of the entity, preferably its RawPayload so an encoded
+                buffer is stored without re-serializing
+
+        Returns:
+            The item, modified in place
+        """
+        item.pop('raw_data', None)
+        value = self.encode_raw(raw)
+        if value is not None:
+            item[RAW_ATTRIBUTE] = value
+        return item
+
+    @staticmethod
+    def decode(item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Item with raw_data restored (as a RawPayload for the binary format);
+        legacy items are returned unchanged
+        """
+        value = item.get(RAW_ATTRIBUTE)
+        if value is None:
+            return item
+        data = bytes(getattr(value, 'value', value))
+        body = data[1:]
+        if data[:1] == _DEFLATE_V1:
+            decompressor = zlib.decompressobj(-15, zdict=_DICTIONARY_V1)
+            body = decompressor.decompress(body) + decompressor.flush()
+        elif data[:1] != _PLAIN:
+            raise ValueError(f"Unknown raw_data encoding {data[:1]!r} in item {item.get('id')}")
+        decoded = {key: item_value for key, item_value in item.items() if key != RAW_ATTRIBUTE}
+        decoded['raw_data'] = RawPayload(buffer=body)
+        return decoded
+
+    @staticmethod
+    def is_legacy(item: Dict[str, Any]) -> bool:
+        """True for items still storing raw_data as a map"""
+        return isinstance(item.get('raw_data'), dict)
+
+
+def _raw_data_exists():
+    # boto3 is imported on first migration rather than at module import
+    from boto3.dynamodb.conditions import Attr
+    return Attr('raw_data').exists()
+
+
+def migrate_items(table, items: Iterable[Dict[str, Any]], to_item: Callable[[Dict[str, Any]], Dict[str, Any]]) -> int:
+    """
+    Rewrite legacy items in the binary format. Each write is conditional on
+    the item still being legacy, so a concurrent save in the new format is
+    never overwritten with older data.
+
+    Args:
+        table: boto3 Table
+        items: Stored items; those already in the binary format are skipped
+        to_item: Builds the new item from a legacy one (the repository's own
+            entity-to-item conversion)
+
+    Returns:
+        int: Number of items rewritten
+    """
+    migrated = 0
+    for item in items:
+        if not ItemCodec.is_legacy(item):
+            continue
+        try:
+            table.put_item(Item=to_item(item), ConditionExpression=_raw_data_exists())
+            migrated += 1
+        except Exception as e:
+            code = getattr(e, 'response', {}).get('Error', {}).get('Code')
+            if code != 'ConditionalCheckFailedException':
+                logger.warning(f"Failed to migrate item {item.get('id')} in {getattr(table, 'name', table)}: {e}")
+    return migrated
+
+
+def backfill_table(
+    table,
+    to_item: Callable[[Dict[str, Any]], Dict[str, Any]],
+    page_size: int = 500,
+    dry_run: bool = False
+) -> Dict[str, int]:
+    """
+    Scan a table and rewrite every legacy item in the binary format
+
+    Returns:
+        Dict[str, int]: scanned, legacy and migrated item counts
+    """
+    stats = {'scanned': 0, 'legacy': 0, 'migrated': 0}
+    params: Dict[str, Any] = {'Limit': page_size}
+    while True:
+        response = table.scan(**params)
+        items = response.get('Items', [])
+        legacy = [item for item in items if ItemCodec.is_legacy(item)]
+        stats['scanned'] += len(items)
+        stats['legacy'] += len(legacy)
+        if legacy and not dry_run:
+            stats['migrated'] += migrate_items(table, legacy, to_item)
+        if not response.get('LastEvaluatedKey'):
+            break
+        params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    logger.info(f"Backfilled {getattr(table, 'name', table)}: {stats}")
+    return stats
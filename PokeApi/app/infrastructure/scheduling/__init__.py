@@ -0,0 +1,12 @@
+# app/infrastructure/scheduling/__init__.py
+"""
+Scheduling for the long-running ingest daemon
+
+Contains:
+- RunScheduler: Slot-aligned, jittered, non-overlapping job runner
+- RunRecord: Timing and outcome of one run
+"""
+
+from .run_scheduler import RunScheduler, RunRecord
+
+__all__ = ['RunScheduler', 'RunRecord']
@@ -0,0 +1,230 @@
+# app/infrastructure/scheduling/run_scheduler.py
+import os
+import time
+import uuid
+import random
+import socket
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from app.infrastructure.coordination.leases import RELEASE_SCRIPT, RENEW_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RunRecord:
+    """Timing and outcome of one scheduled run"""
+    slot: int
+    run_id: str
+    scheduled_at: float
+    started_at: float
+    duration: float = 0.0
+    status: str = 'running'
+    error: Optional[str] = None
+
+    @property
+    def delay(self) -> float:
+        """Seconds between the slot boundary and the actual start (jitter plus lateness)"""
+        return self.started_at - self.scheduled_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['delay'] = self.delay
+        return data
+
+
+class RunScheduler:
+    """
+    Runs a job on wall-clock aligned slots with jitter:
+    - Slots are multiples of `interval`, so replicas agree on slot numbers
+    - Each start is delayed by a random jitter to spread upstream load
+    - Runs never overlap: a run that overruns skips the slots it missed, and
+      with `exclusive` only one replica claims each slot through Redis. The
+      replica also holds a run lock (SET NX PX, renewed by a heartbeat thread)
+      for the whole run, so no replica starts a later slot while a run is
+      still in progress elsewhere; the lock of a dead replica expires
+    - Keeps timing records for the most recent runs
+    """
+
+    def __init__(
+        self,
+        job: Callable[[str], Dict[str, Any]],
+        interval: Optional[float] = None,
+        jitter: Optional[float] = None,
+        redis_client=None,
+        exclusive: bool = True,
+        name: str = "ingest",
+        history_size: int = 50,
+        namespace: str = "scheduler",
+        lock_ttl: Optional[float] = None
+    ):
+        """
+        Args:
+            job: Called with the run id; returns the run result
+            interval: Seconds between slots (falls back to DAEMON_INTERVAL env var)
+            jitter: Maximum random start delay in seconds (falls back to DAEMON_JITTER env var)
+            redis_client: Redis client used to claim slots across replicas
+            exclusive: Let only one replica run each slot (requires redis_client)
+            name: Job name used in run ids and Redis keys
+            history_size: Number of RunRecords kept
+            namespace: Prefix for Redis keys
+            lock_ttl: Lifetime in seconds of the run lock, renewed every third of
+                it while the job runs (falls back to DAEMON_LOCK_TTL env var)
+        """
+        self.job = job
+        self.interval = interval or float(os.getenv('DAEMON_INTERVAL', '300'))
+        self.jitter = jitter if jitter is not None else float(os.getenv('DAEMON_JITTER', str(self.interval * 0.1)))
+        self.redis = redis_client
+        self.exclusive = exclusive and redis_client is not None
+        self.name = name
+        self.namespace = namespace
+        self.lock_ttl = lock_ttl or float(os.getenv('DAEMON_LOCK_TTL', '60'))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.history: Deque[RunRecord] = deque(maxlen=history_size)
+        self._running = threading.Lock()
+        self._stop = threading.Event()
+        self._rng = random.Random()
+        if self.exclusive:
+            self._renew = redis_client.register_script(RENEW_SCRIPT)
+            self._release = redis_client.register_script(RELEASE_SCRIPT)
+
+    def slot_for(self, timestamp: float) -> int:
+        return int(timestamp // self.interval)
+
+    def run_id_for(self, slot: int) -> str:
+        return f"{self.name}-{slot}"
+
+    def _claim_slot(self, slot: int) -> bool:
+        if not self.exclusive:
+            return True
+        key = f"{self.namespace}:{self.name}:slot:{slot}"
+        return bool(self.redis.set(key, self.owner, nx=True, ex=int(self.interval * 2)))
+
+    @property
+    def _lock_key(self) -> str:
+        return f"{self.namespace}:{self.name}:running"
+
+    @property
+    def _lock_ms(self) -> int:
+        return int(self.lock_ttl * 1000)
+
+    def _acquire_run_lock(self) -> bool:
+        if not self.exclusive:
+            return True
+        return bool(self.redis.set(self._lock_key, self.owner, nx=True, px=self._lock_ms))
+
+    def _release_run_lock(self) -> None:
+        if not self.exclusive:
+            return
+        try:
+            self._release(keys=[self._lock_key], args=[self.owner])
+        except Exception as e:
+            logger.error(f"Failed to release run lock {self._lock_key}: {str(e)}")
+
+    def _renew_run_lock(self, finished: threading.Event) -> None:
+        while not finished.wait(self.lock_ttl / 3):
+            try:
+                if not self._renew(keys=[self._lock_key], args=[self.owner, self._lock_ms]):
+                    logger.warning(f"Lost run lock {self._lock_key}; another replica may start a run")
+                    return
+            except Exception as e:
+                logger.error(f"Failed to renew run lock {self._lock_key}: {str(e)}")
+
+    def run_slot(self, slot: int) -> Optional[RunRecord]:
+        """
+        Run the job for one slot unless a run is already in progress here or
+        on another replica, or another replica claimed the slot
+
+        Returns:
+            RunRecord, or None when the slot was skipped
+        """
+        if not self._running.acquire(blocking=False):
+            logger.warning(f"Skipping slot {slot}: previous run still in progress")
+            return None
+        try:
+            if not self._acquire_run_lock():
+                logger.warning(f"Skipping slot {slot}: a run is still in progress on another replica")
+                return None
+            try:
+                if not self._claim_slot(slot):
+                    logger.info(f"Slot {slot} already claimed by another replica")
+                    return None
+                return self._run(slot)
+            finally:
+                self._release_run_lock()
+        finally:
+            self._running.release()
+
+    def _run(self, slot: int) -> RunRecord:
+        record = RunRecord(
+            slot=slot,
+            run_id=self.run_id_for(slot),
+            scheduled_at=slot * self.interval,
+            started_at=time.time()
+        )
+        self.history.append(record)
+        finished = threading.Event()
+        if self.exclusive:
+            threading.Thread(target=self._renew_run_lock, args=(finished,), name='run-lock-heartbeat',
+                             daemon=True).start()
+        started = time.perf_counter()
+        try:
+            result = self.job(record.run_id)
+            record.status = (result or {}).get('status', 'success')
+        except Exception as e:
+            record.status = 'error'
+            record.error = str(e)
+            logger.error(f"Run {record.run_id} failed: {str(e)}", exc_info=True)
+        finally:
+            finished.set()
+        record.duration = time.perf_counter() - started
+        logger.info(f"Run {record.run_id} finished with status {record.status} "
+                    f"in {record.duration:.2f}s (started {record.delay:.2f}s after slot)")
+        return record
+
+    def run_forever(self, run_immediately: bool = True) -> None:
+        """
+        Run the job on every slot until stop() is called
+
+        Args:
+            run_immediately: Run the current slot at startup instead of waiting for the next one
+        """
+        next_slot = self.slot_for(time.time())
+        if not run_immediately:
+            next_slot += 1
+
+        while not self._stop.is_set():
+            start_at = next_slot * self.interval + self._rng.uniform(0, self.jitter)
+            if run_immediately and next_slot == self.slot_for(time.time()):
+                start_at = time.time()
+            run_immediately = False
+            if self._stop.wait(max(0.0, start_at - time.time())):
+                break
+
+            self.run_slot(next_slot)
+            # Skip slots that passed while the run was in progress instead of
+            # starting them back to back
+            next_slot = max(next_slot + 1, self.slot_for(time.time()) + 1)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def recent_runs(self) -> List[Dict[str, Any]]:
+        return [record.to_dict() for record in self.history]
+
+    def timing_summary(self) -> Dict[str, Any]:
+        """Count, mean and max duration over the recorded runs"""
+        durations = [record.duration for record in self.history if record.status != 'running']
+        if not durations:
+            return {'runs': 0}
+        return {
+            'runs': len(durations),
+            'failed': sum(1 for record in self.history if record.status == 'error'),
+            'mean_seconds': sum(durations) / len(durations),
+            'max_seconds': max(durations),
+            'last_seconds': durations[-1]
+        }
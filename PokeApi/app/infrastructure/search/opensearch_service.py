@@ -1,19 +1,94 @@
 # app/infrastructure/search/opensearch_service.py
-from opensearchpy import OpenSearch
-import os
+import logging
+import threading
+from typing import Optional
+
+from app.infrastructure.config.client_registry import ClientRegistry, get_client_registry
+from app.infrastructure.serialization import get_codec, encode
+
+logger = logging.getLogger(__name__)
+
+# Explicit types for the fields queried and sorted on: integer attributes,
+# full-text name with a keyword copy for sorting, and the raw PokeAPI document
+# stored but not indexed
+POST_MAPPINGS = {
+    'properties': {
+        'id': {'type': 'long'},
+        'name': {'type': 'text', 'fields': {'keyword': {'type': 'keyword'}}},
+        'growth_time': {'type': 'integer'},
+        'max_harvest': {'type': 'integer'},
+        'natural_gift_power': {'type': 'integer'},
+        'size': {'type': 'integer'},
+        'smoothness': {'type': 'integer'},
+        'soil_dryness': {'type': 'integer'},
+        'raw_data': {'type': 'object', 'enabled': False}
+    }
+}
+
+
+def OpenSearch(*args, **kwargs):
+    """Build an opensearch-py client; the library is imported on first use"""
+    from opensearchpy import OpenSearch as _OpenSearch
+    return _OpenSearch(*args, **kwargs)
+
+
+class CodecSerializer:
+    """opensearch-py serializer backed by the shared JSON codec; encoded bodies pass through"""
+
+    mimetype = 'application/json'
+
+    def __init__(self, codec=None):
+        self.codec = codec or get_codec()
+
+    def loads(self, s):
+        return self.codec.loads(s)
+
+    def dumps(self, data):
+        if isinstance(data, (str, bytes)):
+            return data
+        return encode(data, self.codec)
+
 
 class OpenSearchService:
-    def __init__(self):
-        self.client = OpenSearch(
-            hosts=[{"host": os.getenv("OPENSEARCH_HOST"), "port": int(os.getenv("OPENSEARCH_PORT", 9200))}],
-            http_auth=(os.getenv("OPENSEARCH_USER"), os.getenv("OPENSEARCH_PASS")),
-            use_ssl=False,
-            verify_certs=False
-        )
+    """
+    OpenSearch indexing for posts. The client is built on first use and the
+    index existence check runs once, before the first write (or explicitly
+    through ensure_index() during readiness checks), so construction never
+    touches the network.
+    """
+
+    def __init__(self, clients: Optional[ClientRegistry] = None):
+        """
+        Args:
+            clients: Registry providing the shared OpenSearch client (the
+                process-wide registry by default)
+        """
+        self.codec = get_codec()
+        self.clients = clients
         self.index_name = "posts"
+        self._client = None
+        self._index_ready = False
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = (self.clients or get_client_registry()).opensearch()
+        return self._client
 
-        if not self.client.indices.exists(index=self.index_name):
-            self.client.indices.create(index=self.index_name)
+    def ensure_index(self) -> None:
+        """Create the posts index if it does not exist (checked once per process)"""
+        if self._index_ready:
+            return
+        client = self.client
+        if not client.indices.exists(index=self.index_name):
+            # 400 means a concurrent caller created it first
+            client.indices.create(index=self.index_name, body={'mappings': POST_MAPPINGS}, ignore=400)
+        self._index_ready = True
 
     def index_post(self, post_id: str, body: dict):
-        self.client.index(index=self.index_name, id=post_id, body=body)
+        self.ensure_index()
+        # Encode here so an EncodedPayload's cached bytes are sent unchanged
+        self.client.index(index=self.index_name, id=post_id, body=encode(body, self.codec))
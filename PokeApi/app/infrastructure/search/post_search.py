@@ -0,0 +1,279 @@
+# app/infrastructure/search/post_search.py
+import os
+import base64
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.domain.entities.post import Post
+from app.domain.exceptions import ValidationError
+from app.infrastructure.cache import TTLCache, CacheVersion
+from app.infrastructure.search.opensearch_service import OpenSearchService
+from app.infrastructure.serialization import get_codec
+
+logger = logging.getLogger(__name__)
+
+_RANGE_OPS = ('gt', 'gte', 'lt', 'lte')
+_SORT_FIELDS = {field: field for field in Post.NUMERIC_FIELDS}
+_SORT_FIELDS.update({'id': 'id', 'name': 'name.keyword'})
+
+
+class PostSearchService:
+    """
+    Post queries over the OpenSearch index:
+    - Full-text match on the berry name, range filters on the integer
+      attributes and a sort on any of them (relevance by default when a name
+      is given), always tie-broken by id so the order is total
+    - The first page is a plain search; following pages are read with
+      search_after inside a point in time opened on the second page and passed
+      along in the cursor, so deep pages cost the same as the first one and
+      see one consistent view of the index instead of shifting with writes
+    - Pages are cached in a bounded TTLCache keyed by the normalized query
+      (so '?q=Cheri&size=10..' and '?size=gte:10&q=cheri' share an entry)
+      and the cache version; a writer's bump, including an index swap by the
+      reindex job, drops every cached page
+
+    An expired point in time is reopened transparently; the page then
+    continues after the cursor's sort values on the current index.
+
+    Points in time are shared per query: a second page of a query that
+    already has one open in this process reuses it, at most `max_pits` are
+    kept open (the least recently used one is closed first) and all of them
+    are closed when the cache version changes, so cursors abandoned before
+    their last page do not pile up open contexts on the cluster. When one
+    cannot be opened (e.g. the cluster's limit is reached) the page is read
+    with plain search_after.
+    """
+
+    def __init__(
+        self,
+        search_service: Optional[OpenSearchService] = None,
+        cache: Optional[TTLCache] = None,
+        version: Optional[CacheVersion] = None,
+        keep_alive: Optional[str] = None,
+        codec=None,
+        max_pits: Optional[int] = None
+    ):
+        """
+        Args:
+            search_service: Service owning the client and the index name
+                (a new OpenSearchService by default)
+            cache: Result cache (falls back to SEARCH_CACHE_MAX_ENTRIES and
+                SEARCH_CACHE_TTL env vars)
+            version: Shared version counter (never changes by default)
+            keep_alive: Point-in-time lifetime between two pages (falls back to
+                SEARCH_PIT_KEEP_ALIVE env var)
+            max_pits: Points in time kept open by this process (falls back to
+                SEARCH_PIT_MAX env var)
+        """
+        self.search_service = search_service or OpenSearchService()
+        self.cache = cache or TTLCache(
+            max_entries=int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '512')),
+            ttl=float(os.getenv('SEARCH_CACHE_TTL', '30'))
+        )
+        self.version = version or CacheVersion()
+        self.keep_alive = keep_alive or os.getenv('SEARCH_PIT_KEEP_ALIVE', '1m')
+        self.codec = codec or get_codec()
+        self.max_pits = max_pits or int(os.getenv('SEARCH_PIT_MAX', '64'))
+        self._pits: 'OrderedDict[str, str]' = OrderedDict()
+        self._pits_lock = threading.Lock()
+        self._seen_version = self.version.current()
+        self._version_lock = threading.Lock()
+
+    def search(
+        self,
+        name: Optional[str] = None,
+        filters: Iterable[Tuple[str, str, int]] = (),
+        order_by: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run one page of a post query
+
+        Args:
+            name: Words to match in the berry name
+            filters: (field, op, value) with op one of eq, gt, gte, lt, lte
+            order_by: Field to sort on, '-' prefixed for descending
+            limit: Posts per page
+            cursor: next_cursor of the previous page
+
+        Returns:
+            Dict with 'items' (indexed posts without raw_data) and 'next_cursor'
+            (None on the last page)
+
+        Raises:
+            ValidationError: Unknown filter or sort field, or a cursor from another query
+        """
+        query = self.normalize(name, filters, order_by, limit)
+        fingerprint = hashlib.blake2b(repr(query).encode('utf-8'), digest_size=8).hexdigest()
+        after, pit_id = None, None
+        if cursor:
+            position = self._decode_cursor(cursor)
+            if position.get('q') != fingerprint or not isinstance(position.get('after'), list):
+                raise ValidationError('cursor', 'does not belong to this query')
+            after, pit_id = position['after'], position.get('pit')
+
+        version = self._check_version()
+        key = (version, query, tuple(after) if after else None)
+        return self.cache.get_or_load(key, lambda: self._load(query, fingerprint, after, pit_id))
+
+    @staticmethod
+    def normalize(
+        name: Optional[str],
+        filters: Iterable[Tuple[str, str, int]],
+        order_by: Optional[str],
+        limit: int
+    ) -> Tuple:
+        """
+        Canonical, hashable form of a query: lower-cased words of the name,
+        bounds merged per field and sorted, default sort made explicit
+        """
+        words = ' '.join((name or '').lower().split()) or None
+        bounds: Dict[str, Dict[str, int]] = {}
+        for field, op, value in filters:
+            if field not in Post.NUMERIC_FIELDS:
+                raise ValidationError(field, 'is not a filterable attribute')
+            ops = ('gte', 'lte') if op == 'eq' else (op,)
+            if ops[0] not in _RANGE_OPS:
+                raise ValidationError(field, f"unknown operator '{op}'")
+            for bound in ops:
+                current = bounds.setdefault(field, {}).get(bound)
+                # Keep the tighter of two bounds on the same side
+                if current is None or (value > current if bound in ('gt', 'gte') else value < current):
+                    bounds[field][bound] = value
+        ranges = tuple(sorted((field, tuple(sorted(ops.items()))) for field, ops in bounds.items()))
+
+        if order_by:
+            field = order_by.lstrip('-')
+            if field not in _SORT_FIELDS:
+                raise ValidationError('order_by', f"cannot sort on '{field}'")
+            sort = (field, 'desc' if order_by.startswith('-') else 'asc')
+        else:
+            sort = ('_score', 'desc') if words else ('id', 'asc')
+        return words, ranges, sort, limit
+
+    def _load(self, query: Tuple, fingerprint: str, after: Optional[List], pit_id: Optional[str]) -> Dict[str, Any]:
+        words, ranges, (sort_field, sort_order), limit = query
+        clauses: Dict[str, List] = {'filter': [{'range': {field: dict(ops)}} for field, ops in ranges]}
+        if words:
+            clauses['must'] = [{'match': {'name': {'query': words, 'operator': 'and'}}}]
+        sort = [{_SORT_FIELDS.get(sort_field, sort_field): sort_order}]
+        if sort_field != 'id':
+            sort.append({'id': 'asc'})
+        body: Dict[str, Any] = {
+            'query': {'bool': clauses},
+            'sort': sort,
+            # One extra hit tells whether another page exists
+            'size': limit + 1,
+            '_source': {'excludes': ['raw_data']},
+            'track_total_hits': False
+        }
+
+        if after is None:
+            response = self.client.search(index=self.index_name, body=body)
+        else:
+            body['search_after'] = after
+            response, pit_id = self._search_in_pit(body, fingerprint, pit_id)
+
+        hits = response['hits']['hits']
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            next_cursor = self._encode_cursor({'q': fingerprint, 'after': hits[-1]['sort'], 'pit': pit_id})
+        elif pit_id is not None:
+            self._forget_pit(fingerprint, pit_id)
+            self._close_pit(pit_id)
+        return {'items': [hit['_source'] for hit in hits], 'next_cursor': next_cursor}
+
+    def _search_in_pit(self, body: Dict[str, Any], fingerprint: str,
+                       pit_id: Optional[str]) -> Tuple[Dict, Optional[str]]:
+        if pit_id is None:
+            pit_id = self._shared_pit(fingerprint)
+        if pit_id is not None:
+            try:
+                return self._pit_search(body, pit_id), pit_id
+            except Exception as e:
+                if getattr(e, 'status_code', None) != 404:
+                    raise
+                logger.info("Point in time expired, reopening it")
+                self._forget_pit(fingerprint, pit_id)
+        try:
+            pit_id = self._open_pit(fingerprint)
+        except Exception as e:
+            # Pages stay in order, they just see writes made between them
+            logger.warning("Could not open a point in time, paging without one: %s", e)
+            return self.client.search(index=self.index_name, body=body), None
+        return self._pit_search(body, pit_id), pit_id
+
+    def _pit_search(self, body: Dict[str, Any], pit_id: str) -> Dict:
+        return self.client.search(body=dict(body, pit={'id': pit_id, 'keep_alive': self.keep_alive}))
+
+    def _shared_pit(self, fingerprint: str) -> Optional[str]:
+        with self._pits_lock:
+            pit_id = self._pits.get(fingerprint)
+            if pit_id is not None:
+                self._pits.move_to_end(fingerprint)
+            return pit_id
+
+    def _open_pit(self, fingerprint: str) -> str:
+        pit_id = self.client.create_point_in_time(index=self.index_name, keep_alive=self.keep_alive)['pit_id']
+        evicted = []
+        with self._pits_lock:
+            replaced = self._pits.pop(fingerprint, None)
+            if replaced is not None:
+                evicted.append(replaced)
+            self._pits[fingerprint] = pit_id
+            while len(self._pits) > self.max_pits:
+                evicted.append(self._pits.popitem(last=False)[1])
+        for stale in evicted:
+            self._close_pit(stale)
+        return pit_id
+
+    def _forget_pit(self, fingerprint: str, pit_id: str) -> None:
+        with self._pits_lock:
+            if self._pits.get(fingerprint) == pit_id:
+                del self._pits[fingerprint]
+
+    def _close_pit(self, pit_id: str) -> None:
+        try:
+            self.client.delete_point_in_time(body={'pit_id': [pit_id]})
+        except Exception as e:
+            # It expires on its own after keep_alive
+            logger.debug("Failed to delete point in time: %s", e)
+
+    def _check_version(self) -> str:
+        version = self.version.current()
+        if version != self._seen_version:
+            with self._version_lock:
+                if version != self._seen_version:
+                    logger.info(f"Cache version changed {self._seen_version} -> {version}, dropping cached searches")
+                    self._seen_version = version
+                    self.cache.clear()
+                    with self._pits_lock:
+                        stale, self._pits = list(self._pits.values()), OrderedDict()
+                    for pit_id in stale:
+                        self._close_pit(pit_id)
+        return version
+
+    @property
+    def client(self):
+        return self.search_service.client
+
+    @property
+    def index_name(self) -> str:
+        return self.search_service.index_name
+
+    def _encode_cursor(self, position: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(self.codec.dumps(position)).rstrip(b'=').decode('ascii')
+
+    def _decode_cursor(self, cursor: str) -> Dict[str, Any]:
+        try:
+            position = self.codec.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        except Exception:
+            raise ValidationError('cursor', 'is not a valid cursor')
+        if not isinstance(position, dict):
+            raise ValidationError('cursor', 'is not a valid cursor')
+        return position
@@ -0,0 +1,363 @@
+# app/infrastructure/search/reindex.py
+import os
+import json
+import time
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.domain.entities.post import Post
+from app.domain.exceptions import ServiceError
+from app.infrastructure.cache import CacheVersion
+from app.infrastructure.observability.metrics import MetricsRegistry, get_metrics
+from app.infrastructure.persistence import DynamoDBPostRepository
+from app.infrastructure.search.opensearch_service import POST_MAPPINGS, OpenSearchService
+from app.infrastructure.serialization import get_codec
+
+logger = logging.getLogger(__name__)
+
+# Posts stamped shortly before the job started may come from hosts whose
+# clocks run behind; the catch-up pass reaches back this far
+_CLOCK_SKEW = timedelta(minutes=1)
+
+
+class _RateLimiter:
+    """Spaces out acquisitions so that, across threads, at most `rate` units pass per second"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, units: int) -> float:
+        """Block until `units` may pass; returns the seconds waited"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + units / self.rate
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0.0)
+
+
+class PostReindexer:
+    """
+    Rebuilds the posts index from DynamoDB while searches keep being served:
+    1. Creates a versioned index '<alias>-<timestamp>' with the current
+       mappings, refresh disabled and no replicas
+    2. Streams the posts table with a parallel segmented Scan, one thread per
+       segment. Each page becomes one bulk request, sent from a pool of
+       `workers` threads while the segment reads its next page
+    3. Restores refresh and replicas, then checks that the new index holds
+       every scanned post and no fewer posts than the live index
+    4. Points the alias at the new index in one atomic _aliases call (a
+       legacy concrete index of that name is removed in the same call), bumps
+       the cache version, then indexes the posts written since the job started
+
+    The index name and the LastEvaluatedKey of every segment are checkpointed
+    to a state file once each bulk request is acknowledged, so an interrupted
+    job resumes where each segment stopped. Documents are the Post.to_json()
+    bodies the pipeline indexes; PokeAPI and the processing endpoint are never
+    called.
+
+    Metrics: 'reindex.indexed', 'reindex.bulk_requests', 'reindex.bulk_retries'
+    and 'reindex.throttled_seconds'.
+    """
+
+    def __init__(
+        self,
+        post_repository: DynamoDBPostRepository,
+        search_service: Optional[OpenSearchService] = None,
+        version: Optional[CacheVersion] = None,
+        segments: Optional[int] = None,
+        workers: Optional[int] = None,
+        page_size: Optional[int] = None,
+        max_rate: Optional[float] = None,
+        state_path: Optional[str] = None,
+        replicas: Optional[int] = None,
+        refresh_interval: Optional[str] = None,
+        max_retries: int = 5,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        """
+        Args:
+            post_repository: Source of the posts
+            search_service: Service owning the client; its index name is the
+                alias being swapped (a new OpenSearchService by default)
+            version: Cache version bumped after the swap, so cached searches are dropped
+            segments: Parallel Scan segments (falls back to REINDEX_SEGMENTS env var)
+            workers: Threads sending bulk requests (falls back to REINDEX_WORKERS env var)
+            page_size: Items per Scan page and bulk request (falls back to
+                REINDEX_PAGE_SIZE env var)
+            max_rate: Documents per second across all segments, 0 for no limit
+                (falls back to REINDEX_MAX_RATE env var)
+            state_path: Checkpoint file (falls back to REINDEX_STATE_PATH env var)
+            replicas: Replicas of the new index once loaded (falls back to
+                REINDEX_REPLICAS env var)
+            refresh_interval: Refresh interval once loaded (falls back to
+                REINDEX_REFRESH_INTERVAL env var)
+            max_retries: Attempts for documents rejected with 429 before the job fails
+            metrics: Registry receiving progress counters
+        """
+        self.post_repository = post_repository
+        self.search_service = search_service or OpenSearchService()
+        self.version = version or CacheVersion()
+        self.segments = segments or int(os.getenv('REINDEX_SEGMENTS', '4'))
+        self.workers = workers or int(os.getenv('REINDEX_WORKERS', '4'))
+        self.page_size = page_size or int(os.getenv('REINDEX_PAGE_SIZE', '500'))
+        self.max_rate = max_rate if max_rate is not None else float(os.getenv('REINDEX_MAX_RATE', '0'))
+        self.state_path = state_path or os.getenv('REINDEX_STATE_PATH', 'reindex_state.json')
+        self.replicas = replicas if replicas is not None else int(os.getenv('REINDEX_REPLICAS', '0'))
+        self.refresh_interval = refresh_interval or os.getenv('REINDEX_REFRESH_INTERVAL', '1s')
+        self.max_retries = max_retries
+        self.metrics = metrics or get_metrics()
+        self.codec = get_codec()
+        self._limiter = _RateLimiter(self.max_rate) if self.max_rate > 0 else None
+        self._state_lock = threading.Lock()
+
+    @property
+    def client(self):
+        return self.search_service.client
+
+    @property
+    def alias(self) -> str:
+        return self.search_service.index_name
+
+    def run(self, resume: bool = True, force: bool = False, delete_previous: bool = False) -> Dict[str, Any]:
+        """
+        Build, check and swap in a new index
+
+        Args:
+            resume: Continue the job recorded in the state file, if any
+            force: Swap even if the new index holds fewer posts than the live one
+            delete_previous: Delete the indexes the alias pointed to before
+
+        Returns:
+            Dict with the new index, previous indexes and document counts
+
+        Raises:
+            ServiceError: A count check failed or documents were rejected; the
+                alias is left unchanged and the job can be resumed
+        """
+        started = time.perf_counter()
+        state = self._load_state() if resume else None
+        if state is not None and not self.client.indices.exists(index=state['index']):
+            logger.warning(f"Index {state['index']} from {self.state_path} no longer exists, starting over")
+            state = None
+        if state is None:
+            state = self._create_index()
+        else:
+            logger.info(f"Resuming reindex into {state['index']}")
+
+        self._copy(state['index'], state['total_segments'], state['segments'], checkpoint=state)
+        index = state['index']
+        scanned = sum(progress['scanned'] for progress in state['segments'].values())
+        self.client.indices.put_settings(
+            index=index,
+            body={'index': {'refresh_interval': self.refresh_interval, 'number_of_replicas': self.replicas}}
+        )
+        self.client.indices.refresh(index=index)
+        count = self.client.count(index=index)['count']
+
+        previous, legacy = self._live_indexes()
+        live_count = self.client.count(index=self.alias)['count'] if previous else 0
+        if count != scanned:
+            raise ServiceError(f"Reindex count check failed: {index} holds {count} posts, {scanned} were scanned",
+                               {'index': index, 'count': count, 'scanned': scanned})
+        if count < live_count and not force:
+            raise ServiceError(f"Reindex count check failed: {index} holds {count} posts, "
+                               f"{self.alias} serves {live_count}; pass force to swap anyway",
+                               {'index': index, 'count': count, 'live_count': live_count})
+
+        self._swap_alias(index, previous, legacy)
+        self.version.bump()
+
+        # Writes that went to the previous index during the copy
+        catch_up = {str(segment): {'last_key': None, 'done': False, 'scanned': 0}
+                    for segment in range(state['total_segments'])}
+        self._copy(index, state['total_segments'], catch_up, created_after=state['started_at'])
+        caught_up = sum(progress['scanned'] for progress in catch_up.values())
+        if caught_up:
+            self.version.bump()
+
+        if delete_previous and not legacy:
+            for old in previous:
+                if old != index:
+                    self.client.indices.delete(index=old)
+        self._clear_state()
+
+        summary = {
+            'index': index,
+            'alias': self.alias,
+            'previous': [] if legacy else [old for old in previous if old != index],
+            'scanned': scanned,
+            'count': count,
+            'live_count': live_count,
+            'caught_up': caught_up,
+            'seconds': round(time.perf_counter() - started, 3)
+        }
+        logger.info(f"Reindex finished: {summary}")
+        return summary
+
+    def _create_index(self) -> Dict[str, Any]:
+        now = datetime.utcnow()
+        index = f"{self.alias}-{now.strftime('%Y%m%d%H%M%S')}"
+        self.client.indices.create(index=index, body={
+            'settings': {'index': {'refresh_interval': '-1', 'number_of_replicas': 0}},
+            'mappings': POST_MAPPINGS
+        })
+        state = {
+            'index': index,
+            'started_at': (now - _CLOCK_SKEW).isoformat(),
+            'total_segments': self.segments,
+            'segments': {str(segment): {'last_key': None, 'done': False, 'scanned': 0}
+                         for segment in range(self.segments)}
+        }
+        self._save_state(state)
+        logger.info(f"Reindexing {self.alias} into {index} with {self.segments} segments")
+        return state
+
+    def _copy(
+        self,
+        index: str,
+        total_segments: int,
+        segments: Dict[str, Dict[str, Any]],
+        created_after: Optional[str] = None,
+        checkpoint: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Scan every unfinished segment in parallel into `index`; the first error stops them all"""
+        pending = [(int(segment), progress) for segment, progress in segments.items() if not progress['done']]
+        if not pending:
+            return
+        stop = threading.Event()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='reindex-bulk') as bulk_pool, \
+                ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix='reindex-scan') as scan_pool:
+            futures = [
+                scan_pool.submit(self._copy_segment, index, segment, total_segments, progress,
+                                 bulk_pool, stop, created_after, checkpoint)
+                for segment, progress in pending
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                stop.set()
+                raise
+
+    def _copy_segment(
+        self,
+        index: str,
+        segment: int,
+        total_segments: int,
+        progress: Dict[str, Any],
+        bulk_pool: ThreadPoolExecutor,
+        stop: threading.Event,
+        created_after: Optional[str],
+        checkpoint: Optional[Dict[str, Any]]
+    ) -> None:
+        # One bulk request stays in flight while the next page is read; its
+        # page is checkpointed only once it has been acknowledged
+        start_key = progress['last_key']
+        in_flight: Optional[Tuple[Optional[Future], Optional[Dict], int]] = None
+        while not stop.is_set():
+            posts, next_key = self.post_repository.scan_segment(
+                segment, total_segments, self.page_size, start_key, created_after
+            )
+            if in_flight is not None:
+                self._settle(progress, *in_flight, checkpoint=checkpoint)
+            if posts and self._limiter is not None:
+                self.metrics.observe('reindex.throttled_seconds', self._limiter.acquire(len(posts)))
+            future = bulk_pool.submit(self._bulk, index, posts) if posts else None
+            in_flight = (future, next_key, len(posts))
+            if not next_key:
+                break
+            start_key = next_key
+        if in_flight is not None:
+            self._settle(progress, *in_flight, checkpoint=checkpoint)
+
+    def _settle(
+        self,
+        progress: Dict[str, Any],
+        future: Optional[Future],
+        next_key: Optional[Dict],
+        scanned: int,
+        checkpoint: Optional[Dict[str, Any]]
+    ) -> None:
+        if future is not None:
+            future.result()
+        with self._state_lock:
+            progress['last_key'] = next_key
+            progress['scanned'] += scanned
+            progress['done'] = next_key is None
+            if checkpoint is not None:
+                self._save_state(checkpoint)
+
+    def _bulk(self, index: str, posts: List[Post]) -> None:
+        """Index one page; documents rejected with 429 are retried with backoff"""
+        documents = [(str(post.id), post.to_json()) for post in posts]
+        for attempt in range(self.max_retries):
+            lines = []
+            for post_id, document in documents:
+                lines.append(self.codec.dumps({'index': {'_index': index, '_id': post_id}}))
+                lines.append(document)
+            response = self.client.bulk(body=b'\n'.join(lines) + b'\n')
+            self.metrics.increment('reindex.bulk_requests')
+            if not response.get('errors'):
+                self.metrics.increment('reindex.indexed', len(documents))
+                return
+
+            rejected = []
+            for document, item in zip(documents, response['items']):
+                result = item.get('index', {})
+                status = result.get('status', 200)
+                if status == 429:
+                    rejected.append(document)
+                elif status >= 300:
+                    raise ServiceError(f"Bulk indexing of post {document[0]} failed: {result.get('error')}",
+                                       {'index': index, 'id': document[0], 'status': status})
+            self.metrics.increment('reindex.indexed', len(documents) - len(rejected))
+            if not rejected:
+                return
+            documents = rejected
+            self.metrics.increment('reindex.bulk_retries')
+            time.sleep(0.5 * 2 ** attempt)
+        raise ServiceError(f"Bulk indexing into {index} still rejected after {self.max_retries} attempts",
+                           {'index': index, 'rejected': len(documents)})
+
+    def _live_indexes(self) -> Tuple[List[str], bool]:
+        """Indexes currently behind the alias, and whether the name is a concrete (legacy) index"""
+        indices = self.client.indices
+        if indices.exists_alias(name=self.alias):
+            return sorted(indices.get_alias(name=self.alias)), False
+        if indices.exists(index=self.alias):
+            return [self.alias], True
+        return [], False
+
+    def _swap_alias(self, index: str, previous: List[str], legacy: bool) -> None:
+        actions: List[Dict[str, Any]] = [{'add': {'index': index, 'alias': self.alias}}]
+        if legacy:
+            actions.append({'remove_index': {'index': self.alias}})
+        else:
+            actions.extend({'remove': {'index': old, 'alias': self.alias}} for old in previous if old != index)
+        self.client.indices.update_aliases(body={'actions': actions})
+        logger.info(f"Alias {self.alias} now points to {index} (previously {previous or 'nothing'})")
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self.state_path):
+            return None
+        with open(self.state_path) as handle:
+            return json.load(handle)
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        # Written aside and renamed, so an interrupted write never leaves a truncated file
+        temporary = f"{self.state_path}.tmp"
+        with open(temporary, 'w') as handle:
+            json.dump(state, handle, indent=2)
+        os.replace(temporary, self.state_path)
+
+    def _clear_state(self) -> None:
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
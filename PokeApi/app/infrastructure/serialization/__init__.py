@@ -0,0 +1,32 @@
+# app/infrastructure/serialization/__init__.py
+"""
+Shared JSON serialization for queue, HTTP, search and storage paths
+
+Contains:
+- JsonCodec / OrjsonCodec: stdlib and orjson codecs producing compact bytes
+- get_codec: Process-wide codec selection (SERIALIZATION_CODEC)
+- EncodedPayload: Dict that encodes once and reuses its bytes
+- encode / decode / encode_envelope: Codec helpers
+"""
+
+from .codec import (
+    JsonCodec,
+    OrjsonCodec,
+    EncodedPayload,
+    get_codec,
+    set_default_codec,
+    encode,
+    decode,
+    encode_envelope
+)
+
+__all__ = [
+    'JsonCodec',
+    'OrjsonCodec',
+    'EncodedPayload',
+    'get_codec',
+    'set_default_codec',
+    'encode',
+    'decode',
+    'encode_envelope'
+]
@@ -0,0 +1,189 @@
+# app/infrastructure/serialization/codec.py
+import os
+import json
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for types neither JSON backend handles natively"""
+    # DynamoDB hands numbers back as Decimal
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonCodec:
+    """
+    JSON codec producing compact UTF-8 bytes.
+
+    The stdlib implementation is the fallback; OrjsonCodec is used when orjson
+    is installed. Both accept bytes or str in `loads`.
+    """
+
+    name = 'json'
+    content_type = 'application/json'
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=_default).encode('utf-8')
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson-backed codec (several times faster than stdlib for both directions)"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=_default, option=self._options)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+
+_CODECS = {
+    'json': JsonCodec,
+    'orjson': OrjsonCodec
+}
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Resolve a codec by name.
+
+    Args:
+        name: 'orjson', 'json' or 'auto'. Defaults to the SERIALIZATION_CODEC
+            env var ('auto'), which picks orjson when it is importable.
+
+    Returns:
+        JsonCodec instance; the default codec is shared process-wide
+    """
+    global _default_codec
+    if name is None and _default_codec is not None:
+        return _default_codec
+
+    requested = (name or os.getenv('SERIALIZATION_CODEC', 'auto')).lower()
+    if requested == 'auto':
+        codec = OrjsonCodec() if orjson is not None else JsonCodec()
+    elif requested in _CODECS:
+        codec = _CODECS[requested]()
+    else:
+        raise ValueError(f"Unknown serialization codec: {requested}")
+
+    if name is None:
+        _default_codec = codec
+        logger.debug(f"Using {codec.name} serialization codec")
+    return codec
+
+
+def set_default_codec(codec: Optional[JsonCodec]) -> None:
+    """Override (or with None, reset) the process-wide codec"""
+    global _default_codec
+    _default_codec = codec
+
+
+class EncodedPayload(dict):
+    """
+    Dict that remembers its encoded JSON form.
+
+    The first `encoded()` call serializes the payload (or adopts bytes supplied
+    by the producer) and every later consumer - the processing request, the DLQ
+    message and the search document - reuses the same buffer. The payload is
+    treated as read-only once encoded: mutating it drops the cached bytes.
+    """
+
+    __slots__ = ('_encoded',)
+
+    def __init__(self, *args, encoded: Optional[bytes] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._encoded = encoded
+
+    def encoded(self, codec: Optional[JsonCodec] = None) -> bytes:
+        if self._encoded is None:
+            self._encoded = (codec or get_codec()).dumps(self)
+        return self._encoded
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._encoded = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._encoded = None
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._encoded = None
+
+    def pop(self, *args):
+        self._encoded = None
+        return super().pop(*args)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._encoded = None
+        return super().setdefault(key, default)
+
+    def clear(self):
+        super().clear()
+        self._encoded = None
+
+
+def encode(value: Any, codec: Optional[JsonCodec] = None) -> bytes:
+    """
+    Encode a value, reusing the cached bytes of an EncodedPayload
+
+    Args:
+        value: EncodedPayload, bytes (passed through) or any JSON-serializable value
+        codec: Codec to use (defaults to the process-wide codec)
+    """
+    if isinstance(value, EncodedPayload):
+        return value.encoded(codec)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return (codec or get_codec()).dumps(value)
+
+
+def decode(data: Union[bytes, bytearray, memoryview, str], codec: Optional[JsonCodec] = None) -> Any:
+    """Decode JSON bytes or text with the process-wide codec"""
+    return (codec or get_codec()).loads(data)
+
+
+def encode_envelope(fields: Dict[str, Any], key: str, payload: Any, codec: Optional[JsonCodec] = None) -> bytes:
+    """
+    Encode `fields` plus `payload` under `key` without re-encoding the payload
+
+    The envelope fields are small and encoded on every call; the payload bytes
+    come from `encode()` so an EncodedPayload is spliced in as-is.
+
+    Returns:
+        bytes: JSON object equivalent to {**fields, key: payload}
+    """
+    codec = codec or get_codec()
+    head = codec.dumps(fields)
+    body = encode(payload, codec)
+    separator = b',' if len(head) > 2 else b''
+    return head[:-1] + separator + codec.dumps(key) + b':' + body + b'}'
@@ -0,0 +1,13 @@
+# app/infrastructure/snapshot/__init__.py
+"""
+In-memory columnar snapshots of stored data
+
+Contains:
+- BerrySnapshot: NumPy columns of post attributes with vectorized filter, sort and top-k
+- SimilarityIndex: Normalized attribute and flavor vectors with batched cosine/L2 top-k
+"""
+
+from .berry_snapshot import BerrySnapshot
+from .similarity_index import SimilarityIndex
+
+__all__ = ['BerrySnapshot', 'SimilarityIndex']
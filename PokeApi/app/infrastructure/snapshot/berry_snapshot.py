@@ -0,0 +1,247 @@
+# app/infrastructure/snapshot/berry_snapshot.py
+import logging
+import operator
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.domain.entities.post import Post
+from app.domain.interfaces.repositories import IPostRepository
+
+logger = logging.getLogger(__name__)
+
+_OPERATORS = {
+    'lt': operator.lt,
+    'lte': operator.le,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'eq': operator.eq,
+    'ne': operator.ne
+}
+
+Filter = Tuple[str, str, Any]
+
+
+class _Columns:
+    """One immutable-size generation of column arrays; rows past `count` are spare capacity"""
+
+    __slots__ = ('ids', 'names', 'numeric', 'count')
+
+    def __init__(self, capacity: int):
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.names = np.empty(capacity, dtype=object)
+        self.numeric = {name: np.zeros(capacity, dtype=np.int32) for name in Post.NUMERIC_FIELDS}
+        self.count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.ids)
+
+    def grown(self, capacity: int) -> '_Columns':
+        columns = _Columns(capacity)
+        columns.ids[:self.count] = self.ids[:self.count]
+        columns.names[:self.count] = self.names[:self.count]
+        for name, values in self.numeric.items():
+            columns.numeric[name][:self.count] = values[:self.count]
+        columns.count = self.count
+        return columns
+
+
+class BerrySnapshot:
+    """
+    Columnar in-memory copy of the posts table for attribute queries:
+    - One NumPy array per numeric Post field plus id and name columns
+    - Built by streaming the repository page by page
+    - Updated in place with upsert(), or through sync() from the ids the
+      pipeline reports in the CacheVersion change log
+    - Filters, sorts and top-k run as vectorized operations over the columns
+
+    Example:
+        snapshot.query([('size', 'gte', 10), ('size', 'lte', 50), ('smoothness', 'lt', 30)],
+                       order_by='growth_time', limit=10)
+    """
+
+    FIELDS = Post.NUMERIC_FIELDS
+
+    def __init__(self, initial_capacity: int = 256):
+        self._columns = _Columns(initial_capacity)
+        self._row_of: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.version: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self._columns.count
+
+    @property
+    def loaded(self) -> bool:
+        return self.version is not None
+
+    def upsert(self, posts: Iterable[Post]) -> int:
+        """
+        Insert new posts and overwrite the columns of known ones
+
+        Returns:
+            int: Number of posts applied
+        """
+        applied = 0
+        with self._lock:
+            columns = self._columns
+            for post in posts:
+                if post is None:
+                    continue
+                post_id = int(post.id)
+                row = self._row_of.get(post_id)
+                if row is None:
+                    if columns.count == columns.capacity:
+                        # Readers keep using the previous generation until the swap below
+                        columns = columns.grown(columns.capacity * 2)
+                        self._columns = columns
+                    row = columns.count
+                    columns.ids[row] = post_id
+                    columns.count += 1
+                    self._row_of[post_id] = row
+                columns.names[row] = post.name
+                for name in self.FIELDS:
+                    columns.numeric[name][row] = getattr(post, name) or 0
+                applied += 1
+        return applied
+
+    def remove(self, post_ids: Iterable[Any]) -> int:
+        """
+        Drop posts from the snapshot; readers keep the previous generation
+        until the compacted one is swapped in
+
+        Returns:
+            int: Number of posts removed
+        """
+        with self._lock:
+            doomed = {self._row_of[int(post_id)] for post_id in post_ids if int(post_id) in self._row_of}
+            if not doomed:
+                return 0
+            columns = self._columns
+            keep = np.array([row for row in range(columns.count) if row not in doomed], dtype=np.int64)
+            fresh = _Columns(columns.capacity)
+            fresh.count = len(keep)
+            fresh.ids[:fresh.count] = columns.ids[keep]
+            fresh.names[:fresh.count] = columns.names[keep]
+            for name, values in columns.numeric.items():
+                fresh.numeric[name][:fresh.count] = values[keep]
+            self._columns = fresh
+            self._row_of = {int(post_id): row for row, post_id in enumerate(fresh.ids[:fresh.count].tolist())}
+        return len(doomed)
+
+    def load(self, repository: IPostRepository, page_size: int = 500, version: Optional[int] = None) -> int:
+        """
+        Rebuild the snapshot by streaming every page of the posts table; the
+        previous snapshot keeps serving queries until the new one is complete,
+        and is kept if any page fails
+
+        Returns:
+            int: Number of posts loaded
+
+        Raises:
+            RepositoryError: If a page cannot be read
+        """
+        fresh = BerrySnapshot(initial_capacity=self._columns.capacity)
+        start_key = None
+        while True:
+            posts, start_key = repository.list_page(page_size, start_key)
+            fresh.upsert(posts)
+            if not start_key:
+                break
+        with self._lock:
+            self._columns, self._row_of = fresh._columns, fresh._row_of
+        self.version = version if version is not None else 0
+        logger.info(f"Loaded berry snapshot with {len(self)} posts")
+        return len(self)
+
+    def sync(self, repository: IPostRepository, cache_version) -> None:
+        """
+        Bring the snapshot up to the current CacheVersion: only the posts
+        written since the last sync are re-read (one GetItem each), and the
+        table is streamed again only when the change log does not reach back.
+        Posts no longer stored are dropped. The version only advances once
+        every changed post was read, so a failed sync is retried in full.
+
+        Raises:
+            RepositoryError: If a post cannot be read
+        """
+        current = int(cache_version.current())
+        if self.version is not None and current == self.version:
+            return
+        changed = cache_version.changes_since(self.version, current) if self.version is not None else None
+        if changed is None:
+            self.load(repository, version=current)
+            return
+        posts = repository.get_many(changed)
+        applied = self.upsert(post for post in posts.values() if post is not None)
+        removed = self.remove(post_id for post_id, post in posts.items() if post is None)
+        self.version = current
+        logger.info(f"Applied {applied} changed and {removed} removed posts to the berry snapshot "
+                    f"(version {current})")
+
+    def query(
+        self,
+        filters: Sequence[Filter] = (),
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter, sort and cut the snapshot
+
+        Args:
+            filters: (field, op, value) triples combined with AND; op is one of
+                lt, lte, gt, gte, eq, ne
+            order_by: Numeric field (or 'id') to sort by
+            descending: Sort order
+            limit: Maximum rows returned (top-k when combined with order_by)
+
+        Returns:
+            List of rows with id, name and the numeric fields
+        """
+        if limit is not None and limit <= 0:
+            return []
+        columns = self._columns
+        rows = np.flatnonzero(self._mask(columns, filters))
+
+        if order_by is not None:
+            if order_by != 'id' and order_by not in columns.numeric:
+                raise ValueError(f"Unknown field: {order_by}")
+            keys = (columns.ids if order_by == 'id' else columns.numeric[order_by])[rows]
+            if descending:
+                keys = -keys.astype(np.int64)
+            if limit is not None and limit < len(rows):
+                # Partial selection, then sort only the k survivors
+                top = np.argpartition(keys, limit - 1)[:limit]
+                rows = rows[top[np.argsort(keys[top], kind='stable')]]
+            else:
+                rows = rows[np.argsort(keys, kind='stable')]
+        elif limit is not None:
+            rows = rows[:limit]
+
+        return [self._row(columns, row) for row in rows.tolist()]
+
+    def count(self, filters: Sequence[Filter] = ()) -> int:
+        """Number of posts matching the filters"""
+        return int(self._mask(self._columns, filters).sum())
+
+    @staticmethod
+    def _mask(columns: _Columns, filters: Sequence[Filter]) -> np.ndarray:
+        count = columns.count
+        mask = np.ones(count, dtype=bool)
+        for field, op, value in filters:
+            if field not in columns.numeric:
+                raise ValueError(f"Unknown field: {field}")
+            if op not in _OPERATORS:
+                raise ValueError(f"Unknown operator: {op}")
+            mask &= _OPERATORS[op](columns.numeric[field][:count], value)
+        return mask
+
+    @staticmethod
+    def _row(columns: _Columns, row: int) -> Dict[str, Any]:
+        result = {'id': int(columns.ids[row]), 'name': columns.names[row]}
+        for name, values in columns.numeric.items():
+            result[name] = int(values[row])
+        return result
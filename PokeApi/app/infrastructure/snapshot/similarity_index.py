@@ -0,0 +1,300 @@
+# app/infrastructure/snapshot/similarity_index.py
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.domain.entities.comment import Comment
+from app.domain.entities.post import Post
+from app.domain.interfaces.repositories import ICommentRepository, IPostRepository
+
+logger = logging.getLogger(__name__)
+
+METRICS = ('cosine', 'l2')
+
+# Largest query-by-index score block computed at once (float32 cells)
+_MAX_SCORE_CELLS = 1 << 22
+
+
+class _Vectors:
+    """One generation of raw feature rows plus the normalized matrices queries use"""
+
+    __slots__ = ('ids', 'names', 'features', 'count', 'unit', 'scaled', 'sq_norms')
+
+    def __init__(self, capacity: int, dimensions: int):
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.names = np.empty(capacity, dtype=object)
+        self.features = np.zeros((capacity, dimensions), dtype=np.float64)
+        self.count = 0
+        self.unit = self.scaled = self.sq_norms = None
+
+    @property
+    def capacity(self) -> int:
+        return len(self.ids)
+
+    def grown(self, capacity: int) -> '_Vectors':
+        vectors = _Vectors(capacity, self.features.shape[1])
+        vectors.ids[:self.count] = self.ids[:self.count]
+        vectors.names[:self.count] = self.names[:self.count]
+        vectors.features[:self.count] = self.features[:self.count]
+        vectors.count = self.count
+        return vectors
+
+    def normalize(self) -> None:
+        """
+        Standardize every dimension (z-score) so attributes measured on large
+        scales do not dominate, then precompute unit rows for cosine and
+        squared norms for L2
+        """
+        features = self.features[:self.count]
+        std = features.std(axis=0)
+        std[std == 0] = 1.0
+        scaled = ((features - features.mean(axis=0)) / std).astype(np.float32)
+        norms = np.linalg.norm(scaled, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.scaled = scaled
+        self.unit = scaled / norms
+        self.sq_norms = np.einsum('ij,ij->i', scaled, scaled)
+
+
+class SimilarityIndex:
+    """
+    Nearest-neighbour index of berries:
+    - Each berry is a vector of its numeric Post attributes and the potency
+      of every flavor from its Comments
+    - Vectors live in one NumPy matrix, standardized per dimension and
+      normalized once per change rather than per query
+    - similar_many() answers a batch of queries with one matrix product per
+      block of queries and a partial top-k selection per row
+    - sync() re-reads only the berries listed in the CacheVersion change log
+
+    Example:
+        index.similar(post_id=5, k=3, metric='cosine')
+    """
+
+    DIMENSIONS = Post.NUMERIC_FIELDS + tuple(f"potency_{flavor}" for flavor in Comment.FLAVORS)
+
+    def __init__(self, initial_capacity: int = 256):
+        self._vectors = _Vectors(initial_capacity, len(self.DIMENSIONS))
+        self._row_of: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.version: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self._vectors.count
+
+    def __contains__(self, post_id: Any) -> bool:
+        return int(post_id) in self._row_of
+
+    @property
+    def loaded(self) -> bool:
+        return self.version is not None
+
+    @classmethod
+    def vector(cls, post: Post, comments: Iterable[Comment]) -> np.ndarray:
+        """Raw (unnormalized) feature vector of one berry"""
+        potencies = dict.fromkeys(Comment.FLAVORS, 0)
+        for comment in comments:
+            if comment.flavor in potencies:
+                potencies[comment.flavor] = max(potencies[comment.flavor], comment.potency or 0)
+        values = [getattr(post, name) or 0 for name in Post.NUMERIC_FIELDS]
+        values.extend(potencies[flavor] for flavor in Comment.FLAVORS)
+        return np.array(values, dtype=np.float64)
+
+    def upsert(self, berries: Iterable[Tuple[Post, Iterable[Comment]]]) -> int:
+        """
+        Insert or replace berries given as (post, comments) pairs
+
+        Returns:
+            int: Number of berries applied
+        """
+        applied = 0
+        with self._lock:
+            vectors = self._vectors.grown(self._vectors.capacity)
+            row_of = dict(self._row_of)
+            for post, comments in berries:
+                if post is None:
+                    continue
+                post_id = int(post.id)
+                row = row_of.get(post_id)
+                if row is None:
+                    if vectors.count == vectors.capacity:
+                        vectors = vectors.grown(vectors.capacity * 2)
+                    row = vectors.count
+                    vectors.ids[row] = post_id
+                    vectors.count += 1
+                    row_of[post_id] = row
+                vectors.names[row] = post.name
+                vectors.features[row] = self.vector(post, comments)
+                applied += 1
+            vectors.normalize()
+            # Queries keep using the previous generation until this swap
+            self._vectors, self._row_of = vectors, row_of
+        return applied
+
+    def remove(self, post_ids: Iterable[Any]) -> int:
+        """
+        Drop berries from the index
+
+        Returns:
+            int: Number of berries removed
+        """
+        with self._lock:
+            doomed = {self._row_of[int(post_id)] for post_id in post_ids if int(post_id) in self._row_of}
+            if not doomed:
+                return 0
+            current = self._vectors
+            keep = np.array([row for row in range(current.count) if row not in doomed], dtype=np.int64)
+            vectors = _Vectors(current.capacity, current.features.shape[1])
+            vectors.count = len(keep)
+            vectors.ids[:vectors.count] = current.ids[keep]
+            vectors.names[:vectors.count] = current.names[keep]
+            vectors.features[:vectors.count] = current.features[keep]
+            vectors.normalize()
+            self._vectors = vectors
+            self._row_of = {int(post_id): row for row, post_id in enumerate(vectors.ids[:vectors.count].tolist())}
+        return len(doomed)
+
+    def load(
+        self,
+        post_repository: IPostRepository,
+        comment_repository: ICommentRepository,
+        page_size: int = 500,
+        version: Optional[int] = None
+    ) -> int:
+        """
+        Rebuild the index by streaming the posts table, and the comments table
+        when the repository pages it (otherwise one query per post). The
+        previous index keeps serving queries until the new one is complete,
+        and is kept if any page fails.
+
+        Returns:
+            int: Number of berries indexed
+
+        Raises:
+            RepositoryError: If a page cannot be read
+        """
+        posts: List[Post] = []
+        start_key = None
+        while True:
+            page, start_key = post_repository.list_page(page_size, start_key)
+            posts.extend(page)
+            if not start_key:
+                break
+
+        comments = self._comments_by_post(comment_repository, page_size)
+        if comments is None:
+            comments = {int(post.id): comment_repository.get_by_post_id(post.id) for post in posts}
+
+        fresh = SimilarityIndex(initial_capacity=max(len(posts), 1))
+        fresh.upsert((post, comments.get(int(post.id), ())) for post in posts)
+        with self._lock:
+            self._vectors, self._row_of = fresh._vectors, fresh._row_of
+        self.version = version if version is not None else 0
+        logger.info(f"Loaded similarity index with {len(self)} berries")
+        return len(self)
+
+    @staticmethod
+    def _comments_by_post(comment_repository: ICommentRepository, page_size: int) -> Optional[Dict[int, List[Comment]]]:
+        grouped: Dict[int, List[Comment]] = {}
+        start_key = None
+        try:
+            while True:
+                page, start_key = comment_repository.list_page(page_size, start_key)
+                for comment in page:
+                    grouped.setdefault(int(comment.post_id), []).append(comment)
+                if not start_key:
+                    return grouped
+        except NotImplementedError:
+            return None
+
+    def sync(self, post_repository: IPostRepository, comment_repository: ICommentRepository, cache_version) -> None:
+        """
+        Bring the index up to the current CacheVersion, re-reading only the
+        berries written since the last sync; falls back to load() when the
+        change log does not reach back. Berries no longer stored are dropped.
+        The version only advances once every changed berry was read, so a
+        failed sync leaves the index as it was and is retried in full.
+
+        Raises:
+            RepositoryError: If a post or its comments cannot be read
+        """
+        current = int(cache_version.current())
+        if self.version is not None and current == self.version:
+            return
+        changed = cache_version.changes_since(self.version, current) if self.version is not None else None
+        if changed is None:
+            self.load(post_repository, comment_repository, version=current)
+            return
+        posts = post_repository.get_many(changed)
+        comments = comment_repository.get_by_post_ids(post_id for post_id, post in posts.items() if post is not None)
+        applied = self.upsert((post, comments[post_id]) for post_id, post in posts.items() if post is not None)
+        removed = self.remove(post_id for post_id, post in posts.items() if post is None)
+        self.version = current
+        logger.info(f"Applied {applied} changed and {removed} removed berries to the similarity index "
+                    f"(version {current})")
+
+    def similar(self, post_id: Any, k: int = 5, metric: str = 'cosine') -> List[Dict[str, Any]]:
+        """
+        Berries most similar to one berry
+
+        Raises:
+            KeyError: When post_id is not indexed
+        """
+        return self.similar_many([post_id], k, metric)[0]
+
+    def similar_many(self, post_ids: Sequence[Any], k: int = 5, metric: str = 'cosine') -> List[List[Dict[str, Any]]]:
+        """
+        Top-k neighbours of several berries at once
+
+        Args:
+            post_ids: Indexed berry ids
+            k: Neighbours per berry (the berry itself is excluded)
+            metric: 'cosine' (higher score is closer) or 'l2' (distance, lower is closer)
+
+        Returns:
+            One list of {'id', 'name', 'score'} per post id, closest first
+
+        Raises:
+            KeyError: When a post id is not indexed
+            ValueError: On an unknown metric
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        vectors, row_of = self._vectors, self._row_of
+        rows = np.array([row_of[int(post_id)] for post_id in post_ids], dtype=np.int64)
+        k = min(k, vectors.count - 1)
+        if k <= 0 or not len(rows):
+            return [[] for _ in post_ids]
+
+        # Queries are scored in blocks so the score matrix stays bounded
+        block = max(1, _MAX_SCORE_CELLS // vectors.count)
+        results: List[List[Dict[str, Any]]] = []
+        for start in range(0, len(rows), block):
+            results.extend(self._top_k(vectors, rows[start:start + block], k, metric))
+        return results
+
+    @staticmethod
+    def _top_k(vectors: _Vectors, rows: np.ndarray, k: int, metric: str) -> List[List[Dict[str, Any]]]:
+        if metric == 'cosine':
+            # Negate so that smaller is closer for both metrics
+            scores = -(vectors.unit[rows] @ vectors.unit.T)
+        else:
+            scores = vectors.sq_norms[rows, None] + vectors.sq_norms[None, :] \
+                - 2 * (vectors.scaled[rows] @ vectors.scaled.T)
+            np.maximum(scores, 0, out=scores)
+        scores[np.arange(len(rows)), rows] = np.inf
+
+        top = np.argpartition(scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        top_scores = -top_scores if metric == 'cosine' else np.sqrt(top_scores)
+
+        return [
+            [{'id': int(vectors.ids[row]), 'name': vectors.names[row], 'score': round(float(score), 6)}
+             for row, score in zip(neighbours.tolist(), scores_row.tolist())]
+            for neighbours, scores_row in zip(top, top_scores)
+        ]
@@ -1,3 +1,12 @@
-from .dlq_reprocessor import process_message, run
+from app.infrastructure.config.lazy import lazy_exports
 
-__all__ = ["process_message", "run"]
+_EXPORTS = {
+    'process_message': '.dlq_reprocessor',
+    'handle_message': '.dlq_reprocessor',
+    'poll_once': '.dlq_reprocessor',
+    'run': '.dlq_reprocessor'
+}
+
+__all__ = ["process_message", "handle_message", "poll_once", "run"]
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -1,80 +1,168 @@
 # app/infrastructure/workers/dlq_reprocessor.py
 
-import boto3
-import json
+import os
 import time
+import atexit
 import logging
+from functools import lru_cache
+from typing import Optional
 from app.infrastructure.persistence.dynamodb_post_repository import DynamoDBPostRepository
 from app.infrastructure.search.opensearch_service import OpenSearchService
 from app.infrastructure.external.processing_service import ProcessingService
+from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+from app.infrastructure.external.dlq_dedupe import DLQDeduplicator
+from app.infrastructure.observability.profiler import StageProfiler
+from app.infrastructure.observability.logging_setup import LogSampler, configure_logging
+from app.infrastructure.config.client_registry import get_client_registry
+from app.infrastructure.config.lazy import LazyProxy
+from app.infrastructure.observability.metrics import get_metrics
+from app.infrastructure.serialization import EncodedPayload, decode
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+sampled = LogSampler(logger)
 
-sqs = boto3.client("sqs", endpoint_url="http://localstack:4566", region_name="us-east-1")
-DLQ_URL = "http://localstack:4566/000000000000/dead-letter-queue"
+DLQ_URL = os.getenv("DLQ_QUEUE_URL", "http://localstack:4566/000000000000/dead-letter-queue")
+SQS_ENDPOINT = os.getenv("SQS_ENDPOINT", "http://localstack:4566")
 RETRY_DELAY = 20  # seconds
 
-# Services
-post_repo = DynamoDBPostRepository()
-opensearch = OpenSearchService()
-processor = ProcessingService()
+
+def _sqs_client():
+    return get_client_registry().sqs(region_name="us-east-1", endpoint_url=SQS_ENDPOINT)
+
+
+@lru_cache(maxsize=1)
+def deduplicator() -> Optional[DLQDeduplicator]:
+    """Content-hash deduplication shared with the producers (None when DLQ_DEDUPE=off)"""
+    redis_client = get_client_registry().redis() if os.getenv("REDIS_HOST") else None
+    return DLQDeduplicator.from_env(redis_client=redis_client)
+
+
+def _processor():
+    clients = get_client_registry()
+    # A failed retry finds the message it came from still queued and is not enqueued again
+    dlq = DeadLetterQueue(clients=clients, dedupe=deduplicator())
+    return ProcessingService(dlq=dlq, session=clients.http_session())
+
+
+# Services are built on first use and share the process-wide client
+# registry, so importing this module (e.g. from tests or CLI tools) does not
+# import boto3 or touch the network
+sqs = LazyProxy(_sqs_client)
+post_repo = LazyProxy(lambda: DynamoDBPostRepository(clients=get_client_registry()))
+opensearch = LazyProxy(lambda: OpenSearchService(clients=get_client_registry()))
+processor = LazyProxy(_processor)
+profiler = StageProfiler.from_env()
+
+if profiler.enabled:
+    atexit.register(profiler.dump, 'dlq_worker')
 
 def process_message(item_type: str, payload: dict) -> bool:
     item_id = payload.get("id", "unknown")
 
-    logger.info(f"🔁 Reprocessing {item_type} {item_id}")
+    sampled.info("reprocessing", "🔁 Reprocessing %s %s", item_type, item_id)
 
     try:
         if item_type == "post":
-            result = processor.process_post(payload)
+            with profiler.stage("reprocess_post"):
+                result = processor.process_post(payload)
             if result:
-                opensearch.index_post(item_id, payload)
-                logger.info(f"✅ Post {item_id} reprocessed and reindexed")
+                # Indexing is best effort, as in the pipeline: a search outage
+                # must not send a processed post back to the DLQ. The DLQ holds
+                # the projected payload, so the full document is read back from
+                # the table rather than replacing it with a trimmed one.
+                try:
+                    with profiler.stage("index_post"):
+                        post = post_repo.get_by_id(str(item_id))
+                        if post is None:
+                            logger.warning("⚠️ Post %s reprocessed but not stored, index left unchanged", item_id)
+                            return True
+                        opensearch.index_post(post.id, post.to_json())
+                    sampled.info("post_reprocessed", "✅ Post %s reprocessed and reindexed", item_id)
+                except Exception as e:
+                    logger.warning("⚠️ Post %s reprocessed but not reindexed: %s", item_id, e)
                 return True
 
         elif item_type == "comment":
-            result = processor.process_comment(payload)
+            with profiler.stage("reprocess_comment"):
+                result = processor.process_comment(payload)
             if result:
-                logger.info(f"✅ Comment {item_id} reprocessed successfully")
+                sampled.info("comment_reprocessed", "✅ Comment %s reprocessed successfully", item_id)
                 return True
 
-        logger.warning(f"❌ Failed to reprocess {item_type} {item_id}")
+        logger.warning("❌ Failed to reprocess %s %s", item_type, item_id)
         return False
 
     except Exception as e:
-        logger.error(f"🔥 Error reprocessing {item_type} {item_id}: {str(e)}")
+        logger.error("🔥 Error reprocessing %s %s: %s", item_type, item_id, e)
         return False
 
-def run():
-    logger.info("🚀 DLQ worker started")
+def handle_message(msg: dict) -> bool:
+    """
+    Reprocess a single SQS message and delete it once it succeeds.
 
-    while True:
-        response = sqs.receive_message(
-            QueueUrl=DLQ_URL,
-            MaxNumberOfMessages=10,
-            WaitTimeSeconds=10
-        )
-
-        messages = response.get("Messages", [])
-        if not messages:
-            logger.info("⏳ DLQ is empty. Waiting before retrying...")
-            time.sleep(RETRY_DELAY)
-            continue
+    Returns:
+        bool: True if the message was reprocessed and deleted
+    """
+    try:
+        body = decode(msg["Body"])
+        item_type = body.get("type")  # 'post' or 'comment'
+        # DeadLetterQueue stores the item under 'data'; 'payload' is kept for older messages
+        payload = body.get("payload") or body.get("data")
+
+        if not item_type or not payload:
+            logger.warning("⚠️ DLQ message missing 'type' or 'payload'. Skipping.")
+            return False
+
+        dedupe = deduplicator()
+        fingerprint = None
+        if dedupe is not None:
+            fingerprint = body.get("fingerprint") or dedupe.fingerprint(item_type, payload)
+            if dedupe.is_done(item_type, fingerprint):
+                # A copy of an item already reprocessed: acknowledged, not redone
+                sqs.delete_message(QueueUrl=DLQ_URL, ReceiptHandle=msg["ReceiptHandle"])
+                sampled.info("duplicate_deleted", "♻️ Duplicate DLQ message for %s %s deleted",
+                             item_type, payload.get('id'))
+                return True
+
+        # Encoded once, then shared by the processing request and the index call
+        payload = EncodedPayload(payload)
+
+        if process_message(item_type, payload):
+            if fingerprint is not None:
+                dedupe.mark_done(fingerprint)
+            sqs.delete_message(QueueUrl=DLQ_URL, ReceiptHandle=msg["ReceiptHandle"])
+            sampled.info("message_deleted", "🗑️ DLQ message for %s %s deleted", item_type, payload.get('id'))
+            return True
+        return False
+
+    except Exception as e:
+        logger.error(f"❌ Error handling DLQ message: {str(e)}")
+        return False
+
+def poll_once(max_messages: int = 10, wait_seconds: int = 10) -> int:
+    """
+    Receive one batch from the DLQ and reprocess it.
 
-        for msg in messages:
-            try:
-                body = json.loads(msg["Body"])
-                item_type = body.get("type")  # 'post' or 'comment'
-                payload = body.get("payload")
+    Returns:
+        int: Number of messages received
+    """
+    response = sqs.receive_message(
+        QueueUrl=DLQ_URL,
+        MaxNumberOfMessages=max_messages,
+        WaitTimeSeconds=wait_seconds
+    )
 
-                if not item_type or not payload:
-                    logger.warning("⚠️ DLQ message missing 'type' or 'payload'. Skipping.")
-                    continue
+    messages = response.get("Messages", [])
+    for msg in messages:
+        handle_message(msg)
+    return len(messages)
 
-                if process_message(item_type, payload):
-                    sqs.delete_message(QueueUrl=DLQ_URL, ReceiptHandle=msg["ReceiptHandle"])
-                    logger.info(f"🗑️ DLQ message for {item_type} {payload.get('id')} deleted")
+def run():
+    configure_logging()
+    logger.info("🚀 DLQ worker started")
 
-            except Exception as e:
-                logger.error(f"❌ Error handling DLQ message: {str(e)}")
+    while True:
+        if not poll_once():
+            logger.info("⏳ DLQ is empty, %d duplicate messages skipped so far. Waiting before retrying...",
+                        get_metrics().counter("dlq.dedupe.reprocess_skipped"))
+            time.sleep(RETRY_DELAY)
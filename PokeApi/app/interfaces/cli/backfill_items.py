@@ -0,0 +1,50 @@
+# app/interfaces/cli/backfill_items.py
+"""
+Rewrite items stored in the legacy layout (raw_data as a DynamoDB map) in the
+compressed ItemCodec format
+
+Usage:
+    python -m app.interfaces.cli.backfill_items --dry-run
+    python -m app.interfaces.cli.backfill_items --tables posts
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+
+from app.infrastructure.persistence import DynamoDBCommentRepository, DynamoDBPostRepository
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Migrate stored posts and comments to the compressed item format')
+    parser.add_argument('--tables', default='posts,comments')
+    parser.add_argument('--page-size', type=int, default=500)
+    parser.add_argument('--dry-run', action='store_true', help='Only count legacy items')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'INFO'),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    endpoint_url = os.getenv('DYNAMODB_ENDPOINT', 'http://dynamodb:8000')
+    repositories = {
+        'posts': DynamoDBPostRepository(
+            table_name=os.getenv("DYNAMODB_TABLE_POSTS", "Posts"),
+            endpoint_url=endpoint_url
+        ),
+        'comments': DynamoDBCommentRepository(
+            table_name=os.getenv("DYNAMODB_TABLE_COMMENTS", "Comments"),
+            endpoint_url=endpoint_url
+        )
+    }
+    results = {name: repositories[name].backfill(page_size=args.page_size, dry_run=args.dry_run)
+               for name in args.tables.split(',')}
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
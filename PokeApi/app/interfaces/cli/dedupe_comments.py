@@ -0,0 +1,40 @@
+# app/interfaces/cli/dedupe_comments.py
+"""
+One-off compaction of the comments table: rows written under random ids by
+earlier pipeline versions are collapsed to one row per (post_id, flavor)
+
+Usage:
+    python -m app.interfaces.cli.dedupe_comments --dry-run
+    python -m app.interfaces.cli.dedupe_comments
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+
+from app.infrastructure.persistence import DynamoDBCommentRepository
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Remove duplicate comments left by earlier ingests')
+    parser.add_argument('--dry-run', action='store_true', help='Only report what would change')
+    parser.add_argument('--page-size', type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'INFO'),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    repository = DynamoDBCommentRepository(
+        table_name=os.getenv("DYNAMODB_TABLE_COMMENTS", "Comments"),
+        endpoint_url=os.getenv('DYNAMODB_ENDPOINT', 'http://dynamodb:8000')
+    )
+    print(json.dumps(repository.compact(page_size=args.page_size, dry_run=args.dry_run), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+# app/interfaces/cli/export_columnar.py
+"""
+Export the posts and comments tables to columnar files
+
+Usage:
+    python -m app.interfaces.cli.export_columnar --output exports/
+    python -m app.interfaces.cli.export_columnar --output exports/ --incremental
+    python -m app.interfaces.cli.export_columnar --output exports/ --format npz --since 2024-01-01T00:00:00
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+
+from app.infrastructure.export import export_tables
+from app.infrastructure.persistence import DynamoDBCommentRepository, DynamoDBPostRepository
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Export posts and comments to Parquet (or NPZ)')
+    parser.add_argument('--output', default=os.getenv('EXPORT_DIR', 'exports'))
+    parser.add_argument('--format', choices=('auto', 'parquet', 'npz'), default='auto')
+    parser.add_argument('--row-group-size', type=int, default=int(os.getenv('EXPORT_ROW_GROUP_SIZE', '10000')))
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--tables', default='posts,comments')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only export items created after the previous export')
+    parser.add_argument('--since', help='Only export items created after this ISO timestamp')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'INFO'),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    endpoint_url = os.getenv('DYNAMODB_ENDPOINT', 'http://dynamodb:8000')
+    repositories = {
+        'posts': DynamoDBPostRepository(
+            table_name=os.getenv("DYNAMODB_TABLE_POSTS", "Posts"),
+            endpoint_url=endpoint_url
+        ),
+        'comments': DynamoDBCommentRepository(
+            table_name=os.getenv("DYNAMODB_TABLE_COMMENTS", "Comments"),
+            endpoint_url=endpoint_url
+        )
+    }
+    tables = {name: repositories[name].table for name in args.tables.split(',')}
+
+    results = export_tables(tables, args.output, fmt=args.format, row_group_size=args.row_group_size,
+                            page_size=args.page_size, incremental=args.incremental, since=args.since)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# app/interfaces/cli/reindex_posts.py
+"""
+Rebuild the posts OpenSearch index from DynamoDB and swap the `posts` alias
+to it without downtime
+
+Usage:
+    python -m app.interfaces.cli.reindex_posts
+    python -m app.interfaces.cli.reindex_posts --segments 8 --workers 8 --max-rate 2000
+    python -m app.interfaces.cli.reindex_posts --restart --delete-previous
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+
+from app.infrastructure.cache import CacheVersion
+from app.infrastructure.config.client_registry import get_client_registry
+from app.infrastructure.observability.logging_setup import configure_logging
+from app.infrastructure.persistence import DynamoDBPostRepository
+from app.infrastructure.search.opensearch_service import OpenSearchService
+from app.infrastructure.search.reindex import PostReindexer
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Reindex posts from DynamoDB into a new index and swap the alias')
+    parser.add_argument('--segments', type=int, help='Parallel Scan segments (REINDEX_SEGMENTS)')
+    parser.add_argument('--workers', type=int, help='Bulk request threads (REINDEX_WORKERS)')
+    parser.add_argument('--page-size', type=int, help='Items per Scan page and bulk request (REINDEX_PAGE_SIZE)')
+    parser.add_argument('--max-rate', type=float, help='Documents per second, 0 for no limit (REINDEX_MAX_RATE)')
+    parser.add_argument('--state', help='Checkpoint file (REINDEX_STATE_PATH)')
+    parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and start a new index')
+    parser.add_argument('--force', action='store_true',
+                        help='Swap even if the new index holds fewer posts than the live one')
+    parser.add_argument('--delete-previous', action='store_true',
+                        help='Delete the indexes the alias pointed to before')
+    args = parser.parse_args()
+
+    configure_logging()
+    clients = get_client_registry()
+    repository = DynamoDBPostRepository(
+        table_name=os.getenv("DYNAMODB_TABLE_POSTS", "Posts"),
+        endpoint_url=os.getenv('DYNAMODB_ENDPOINT', 'http://dynamodb:8000'),
+        clients=clients
+    )
+    reindexer = PostReindexer(
+        repository,
+        search_service=OpenSearchService(clients=clients),
+        version=CacheVersion(clients.redis() if os.getenv('REDIS_HOST') else None),
+        segments=args.segments,
+        workers=args.workers,
+        page_size=args.page_size,
+        max_rate=args.max_rate,
+        state_path=args.state
+    )
+    try:
+        result = reindexer.run(resume=not args.restart, force=args.force, delete_previous=args.delete_previous)
+    except Exception as e:
+        logger.error(f"Reindex failed, rerun to resume: {str(e)}")
+        return 1
+    finally:
+        clients.close()
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+# app/interfaces/cli/similar_berries.py
+"""
+Print the berries most similar to one or more berries
+
+Usage:
+    python -m app.interfaces.cli.similar_berries 1 5 --k 3
+    python -m app.interfaces.cli.similar_berries 12 --metric l2
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+
+from app.application.use_cases import FindSimilarBerriesUseCase
+from app.domain.exceptions import NotFoundError, ValidationError
+from app.infrastructure.persistence import DynamoDBCommentRepository, DynamoDBPostRepository
+from app.infrastructure.snapshot import SimilarityIndex
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Find similar berries by attributes and flavor potencies')
+    parser.add_argument('post_ids', nargs='+', help='Berry ids')
+    parser.add_argument('--k', type=int, default=5, help='Neighbours per berry')
+    parser.add_argument('--metric', choices=('cosine', 'l2'), default='cosine')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'WARNING'),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    endpoint_url = os.getenv('DYNAMODB_ENDPOINT', 'http://dynamodb:8000')
+    use_case = FindSimilarBerriesUseCase(
+        DynamoDBPostRepository(table_name=os.getenv("DYNAMODB_TABLE_POSTS", "Posts"), endpoint_url=endpoint_url),
+        DynamoDBCommentRepository(table_name=os.getenv("DYNAMODB_TABLE_COMMENTS", "Comments"),
+                                  endpoint_url=endpoint_url),
+        SimilarityIndex()
+    )
+    try:
+        results = use_case.execute_many(args.post_ids, args.k, args.metric)
+    except (NotFoundError, ValidationError) as e:
+        print(e.message, file=sys.stderr)
+        return 1
+    print(json.dumps(dict(zip(args.post_ids, results)), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,10 @@
 import logging
 import os
+import sys
 import time
+import signal
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
-import redis
 
 from app.presentation.controllers.social_media_controller import SocialMediaController
 from app.infrastructure.persistence.dynamodb_post_repository import DynamoDBPostRepository
@@ -11,14 +12,25 @@ from app.infrastructure.persistence.dynamodb_comment_repository import DynamoDBC
 from app.infrastructure.external.pokeapi_service import PokeAPIService
 from app.infrastructure.external.processing_service import ProcessingService
 from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+from app.infrastructure.external.dlq_dedupe import DLQDeduplicator
 from app.infrastructure.external.circuit_breaker import CircuitBreaker
 from app.presentation.error_handling.error_handler import ErrorHandler
+from app.infrastructure.observability.logging_setup import configure_logging
+from app.infrastructure.observability.metrics import get_metrics
+from app.infrastructure.observability.profiler import StageProfiler
+from app.infrastructure.coordination.shard_coordinator import ShardCoordinator
+from app.infrastructure.coordination.single_flight import SingleFlight
+from app.infrastructure.scheduling.run_scheduler import RunScheduler
+from app.infrastructure.search.opensearch_service import OpenSearchService
+from app.infrastructure.cache import CacheVersion
+from app.infrastructure.aggregates import FlavorAggregates
+from app.infrastructure.config.client_registry import ClientRegistry, get_client_registry
+from app.infrastructure.config.lazy import lazy_import
+from app.infrastructure.config.readiness import run_readiness_checks, failed_required
+
+# Loaded on first use; only processes that talk to Redis pay for the import
+redis = lazy_import('redis')
 
-# Initialize logging
-logging.basicConfig(
-    level=os.getenv('LOG_LEVEL', 'INFO'),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -45,22 +57,19 @@ def load_configuration() -> None:
         raise
 
 
-def initialize_redis_connection() -> redis.Redis:
-    """Initialize Redis connection with retry logic"""
+def initialize_redis_connection(clients: Optional[ClientRegistry] = None) -> 'redis.Redis':
+    """
+    Initialize Redis connection with retry logic
+
+    Args:
+        clients: Registry owning the Redis connection pool (the process-wide registry by default)
+    """
     max_retries = 3
     retry_delay = 2
+    redis_conn = (clients or get_client_registry()).redis()
 
     for attempt in range(max_retries):
         try:
-            redis_conn = redis.Redis(
-                host=os.getenv('REDIS_HOST', 'redis'),
-                port=int(os.getenv('REDIS_PORT', '6379')),
-                db=int(os.getenv('REDIS_DB', '0')),
-                socket_timeout=5,
-                socket_connect_timeout=5,
-                decode_responses=True,
-                health_check_interval=30
-            )
             if not redis_conn.ping():
                 raise redis.ConnectionError("Redis ping failed")
             logger.info("Redis connection established")
@@ -74,51 +83,100 @@ def initialize_redis_connection() -> redis.Redis:
             time.sleep(retry_delay)
 
 
-def initialize_services() -> tuple[SocialMediaController, ErrorHandler]:
-    """Initialize all application services"""
+def initialize_services(
+    redis_conn: Optional['redis.Redis'] = None,
+    clients: Optional[ClientRegistry] = None,
+    shard_run_id: Optional[str] = None
+) -> tuple[SocialMediaController, ErrorHandler]:
+    """
+    Initialize all application services
+
+    Args:
+        redis_conn: Existing Redis connection to reuse (connects when omitted)
+        clients: Registry of the pooled clients shared by every service (the
+            process-wide registry by default)
+        shard_run_id: Run id of sharded ingestion (INGEST_RUN_ID, required
+            when sharding, by default)
+    """
     try:
         logger.info("Starting service initialization...")
-
-        # Redis & Circuit Breaker
-        redis_conn = initialize_redis_connection()
-        circuit_breaker = CircuitBreaker(
-            redis_client=redis_conn,
-            failure_threshold=int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5")),
-            reset_timeout=int(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "60"))
-        )
+        clients = clients or get_client_registry()
 
         # DynamoDB endpoint config (for LocalStack or custom)
         endpoint_url = os.getenv('DYNAMODB_ENDPOINT', 'http://dynamodb:8000')
 
-        # DLQ
+        # Services are cheap to construct; the registry builds each pooled
+        # client on first use and hands the same one to every service
         dlq = DeadLetterQueue(
             queue_url=os.getenv("DLQ_QUEUE_URL"),
-            region_name=os.getenv('AWS_REGION', 'us-east-1')
+            region_name=os.getenv('AWS_REGION', 'us-east-1'),
+            clients=clients
         )
-
-        # Repositories
         post_repository = DynamoDBPostRepository(
             table_name=os.getenv("DYNAMODB_TABLE_POSTS", "Posts"),
-            endpoint_url=endpoint_url
+            endpoint_url=endpoint_url,
+            clients=clients
         )
         comment_repository = DynamoDBCommentRepository(
             table_name=os.getenv("DYNAMODB_TABLE_COMMENTS", "Comments"),
-            endpoint_url=endpoint_url
+            endpoint_url=endpoint_url,
+            clients=clients
+        )
+        opensearch_service = OpenSearchService(clients=clients)
+
+        # Connect to every dependency in parallel; only Redis is required
+        existing_redis = redis_conn
+        results = run_readiness_checks({
+            'redis': lambda: existing_redis or initialize_redis_connection(clients),
+            'dynamodb': lambda: (post_repository.table.load(), comment_repository.table.load()),
+            'opensearch': opensearch_service.ensure_index,
+            'dlq': lambda: dlq.client
+        }, required=('redis',))
+        failures = failed_required(results, ('redis',))
+        if failures:
+            raise ServiceInitializationError(f"Required dependencies unavailable: {failures}")
+        redis_conn = results['redis'].value
+        # Identical failures (re-runs, retries) are queued once across replicas
+        dlq.dedupe = DLQDeduplicator.from_env(redis_client=redis_conn)
+        if os.getenv('FLAVOR_AGGREGATES', 'true').lower() in ('1', 'true', 'yes'):
+            comment_repository.aggregates = FlavorAggregates(redis_conn)
+
+        # Circuit Breaker
+        circuit_breaker = CircuitBreaker(
+            redis_client=redis_conn,
+            failure_threshold=int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5")),
+            reset_timeout=int(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "60"))
         )
 
-        # Services
-        pokeapi_service = PokeAPIService(circuit_breaker=circuit_breaker)
+        # Services share one keep-alive HTTP session
+        http_session = clients.http_session()
+        pokeapi_service = PokeAPIService(
+            circuit_breaker=circuit_breaker,
+            session=http_session,
+            # Replicas fetching the same berry share one upstream request
+            single_flight=SingleFlight.from_env(redis_client=redis_conn)
+        )
         processing_service = ProcessingService(
             dlq=dlq,
-            endpoint=os.getenv("PROCESSING_ENDPOINT", "http://httpbin.org/post")
+            endpoint=os.getenv("PROCESSING_ENDPOINT", "http://httpbin.org/post"),
+            session=http_session
         )
 
+        # Shard leases, so several replicas can split one run
+        shard_coordinator = None
+        if os.getenv('INGEST_SHARDING', 'false').lower() in ('1', 'true', 'yes'):
+            shard_coordinator = ShardCoordinator(redis_client=redis_conn, run_id=shard_run_id)
+
         # Controller
         controller = SocialMediaController(
             post_repository=post_repository,
             comment_repository=comment_repository,
             pokeapi_service=pokeapi_service,
-            processing_service=processing_service
+            processing_service=processing_service,
+            profiler=StageProfiler.from_env(),
+            shard_coordinator=shard_coordinator,
+            opensearch_service=opensearch_service,
+            cache_version=CacheVersion(redis_conn)
         )
 
         logger.info("All services initialized successfully")
@@ -129,15 +187,25 @@ def initialize_services() -> tuple[SocialMediaController, ErrorHandler]:
         raise ServiceInitializationError("Service initialization failed") from e
 
 
-def execute_pipeline(controller: SocialMediaController) -> Dict[str, Any]:
-    """Execute the main application pipeline"""
+def execute_pipeline(controller: SocialMediaController, clients: Optional[ClientRegistry] = None) -> Dict[str, Any]:
+    """
+    Execute the main application pipeline
+
+    Args:
+        controller: Controller built by initialize_services
+        clients: Registry whose pool utilisation is reported (the process-wide registry by default)
+    """
     try:
         logger.info("Starting data pipeline execution")
         result = controller.execute_pipeline()
         logger.info("Pipeline execution completed successfully")
+        single_flight = getattr(controller.pokeapi_service, 'single_flight', None)
         return {
             'status': 'success',
             'data': result,
+            'metrics': get_metrics().snapshot(),
+            'coalesced_keys': single_flight.hot_keys() if single_flight is not None else [],
+            'pools': (clients or get_client_registry()).pool_stats(),
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
         }
     except Exception as e:
@@ -150,17 +218,80 @@ def execute_pipeline(controller: SocialMediaController) -> Dict[str, Any]:
         }
 
 
+def _exit_on_sigterm(signum, frame):
+    # Turn a container stop into SystemExit so held shard leases are released
+    raise SystemExit(128 + signum)
+
+
+def daemon_mode_enabled(argv: Optional[list] = None) -> bool:
+    argv = sys.argv[1:] if argv is None else argv
+    return '--daemon' in argv or os.getenv('DAEMON_MODE', 'false').lower() in ('1', 'true', 'yes')
+
+
+def run_daemon() -> int:
+    """
+    Long-running mode: connect once, keep every client and connection pool
+    warm, and run the pipeline on jittered, non-overlapping schedule slots
+    """
+    load_configuration()
+    clients = get_client_registry()
+    redis_conn = initialize_redis_connection(clients)
+    base_run_id = os.getenv('INGEST_RUN_ID') or 'ingest'
+    # Each slot gets its own run id below, so no unique id is needed here
+    controller, error_handler = initialize_services(redis_conn=redis_conn, clients=clients, shard_run_id=base_run_id)
+    coordinator = controller.shard_coordinator
+
+    @error_handler.wrap_endpoint
+    def _run(run_id: str) -> Dict[str, Any]:
+        if coordinator is not None:
+            # Replicas on the same slot share the run id and split its shards
+            coordinator.run_id = run_id
+        result = execute_pipeline(controller, clients)
+        controller.profiler.dump(run_id)
+        return result
+
+    scheduler = RunScheduler(
+        job=_run,
+        redis_client=redis_conn,
+        # Sharded replicas cooperate on each slot instead of taking turns
+        exclusive=coordinator is None,
+        name=base_run_id
+    )
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    logger.info("Daemon started: every %ss with up to %ss jitter", scheduler.interval, scheduler.jitter)
+    try:
+        scheduler.run_forever()
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("Daemon stopping")
+    finally:
+        scheduler.stop()
+        logger.info("Daemon run timings: %s", scheduler.timing_summary())
+        logger.info("Connection pools: %s", clients.pool_stats())
+        clients.close()
+    return 0
+
+
 def main() -> int:
     """Application entry point"""
+    configure_logging()
+    if daemon_mode_enabled():
+        try:
+            return run_daemon()
+        except Exception as e:
+            logger.critical("Daemon failed catastrophically: %s", str(e), exc_info=True)
+            return 1
+
     try:
         load_configuration()
         controller, error_handler = initialize_services()
+        signal.signal(signal.SIGTERM, _exit_on_sigterm)
 
         @error_handler.wrap_endpoint
         def _execute_pipeline():
             return execute_pipeline(controller)
 
         result = _execute_pipeline()
+        controller.profiler.dump('pipeline')
 
         if result['status'] == 'success':
             logger.info("Application completed successfully")
@@ -1,14 +1,25 @@
 # app/presentation/controllers/social_media_controller.py
+import os
 import logging
-from typing import List, Dict, Any
+from typing import Iterable, Iterator, List, Dict, Any, Optional
+from app.application.dtos.pipeline_stats import ErrorSummary
+from app.application.use_cases import FetchAndStorePostsUseCase, FetchAndStoreCommentsUseCase
 from app.domain.entities.post import Post
 from app.domain.entities.comment import Comment
 from app.domain.interfaces.repositories import IPostRepository, ICommentRepository
 from app.domain.interfaces.services import IPokeAPIService, IProcessingService
 from app.presentation.error_handling.error_handler import ErrorHandler
 from app.infrastructure.search.opensearch_service import OpenSearchService  # ➕ Import OpenSearch
+from app.infrastructure.observability.profiler import StageProfiler
+from app.infrastructure.observability.logging_setup import LogSampler
+from app.infrastructure.coordination.shard_coordinator import ShardCoordinator, LeaseLostError
+from app.infrastructure.serialization import EncodedPayload
+from app.infrastructure.cache import CacheVersion
 
 logger = logging.getLogger(__name__)
+sampled = LogSampler(logger)
+
+_EXHAUSTED = object()
 
 class SocialMediaController:
     """
@@ -23,13 +34,40 @@ class SocialMediaController:
         post_repository: IPostRepository,
         comment_repository: ICommentRepository,
         pokeapi_service: IPokeAPIService,
-        processing_service: IProcessingService
+        processing_service: IProcessingService,
+        profiler: Optional[StageProfiler] = None,
+        streaming: Optional[bool] = None,
+        error_sample_size: Optional[int] = None,
+        shard_coordinator: Optional[ShardCoordinator] = None,
+        opensearch_service: Optional[OpenSearchService] = None,
+        cache_version: Optional[CacheVersion] = None
     ):
+        """
+        Args:
+            streaming: Stream posts and comments through the pipeline one at a
+                time with summarized errors (falls back to PIPELINE_STREAMING env var)
+            error_sample_size: Failed items kept as samples per error summary
+                (falls back to PIPELINE_ERROR_SAMPLE_SIZE env var)
+            shard_coordinator: When set, the run is split into shards shared
+                with other replicas through Redis leases (implies streaming)
+            opensearch_service: Search indexer (a new OpenSearchService by default)
+            cache_version: Bumped after every run with the ids of the stored
+                posts, so read API caches and snapshots pick up the new data
+        """
         self.post_repository = post_repository
         self.comment_repository = comment_repository
         self.pokeapi_service = pokeapi_service
         self.processing_service = processing_service
-        self.opensearch_service = OpenSearchService()  # ➕ Instância de OpenSearch
+        self.profiler = profiler or StageProfiler()
+        if streaming is None:
+            streaming = os.getenv('PIPELINE_STREAMING', 'false').lower() in ('1', 'true', 'yes')
+        self.streaming = streaming
+        self.error_sample_size = error_sample_size or int(os.getenv('PIPELINE_ERROR_SAMPLE_SIZE', '20'))
+        self.shard_coordinator = shard_coordinator
+        self.barrier_timeout = float(os.getenv('INGEST_BARRIER_TIMEOUT', '3600'))
+        self.opensearch_service = opensearch_service or OpenSearchService()  # ➕ Instância de OpenSearch
+        self.cache_version = cache_version
+        self._changed_post_ids = set()
 
     def execute_pipeline(self) -> Dict[str, Any]:
         """
@@ -42,9 +80,19 @@ class SocialMediaController:
         """
         @ErrorHandler.wrap_endpoint
         def _execute():
+            if self.shard_coordinator is not None:
+                return self._execute_sharded_run()
+            if self.streaming:
+                return self._execute_pipeline_streaming()
             return self._execute_pipeline_internal()
-            
-        return _execute()
+
+        self._changed_post_ids = set()
+        try:
+            return _execute()
+        finally:
+            # Failed runs may have stored part of their items too
+            if self.cache_version is not None:
+                self.cache_version.bump(self._changed_post_ids)
 
     def _execute_pipeline_internal(self) -> Dict[str, Any]:
         """
@@ -61,6 +109,7 @@ class SocialMediaController:
         }
         
         for post in posts:
+            self._changed_post_ids.add(post.id)
             post_result = self._process_post(post)
             if post_result['status'] == 'processed':
                 stats['posts_processed'] += 1
@@ -81,33 +130,149 @@ class SocialMediaController:
             'stats': stats
         }
 
+    def _execute_sharded_run(self) -> Dict[str, Any]:
+        """
+        Cooperate with other replicas on one run: claim shards until every
+        shard is done (taking over shards whose lease expired), then wait at
+        the run-level barrier and report stats aggregated across replicas
+        """
+        coordinator = self.shard_coordinator
+        shard_count = coordinator.initialize(self.pokeapi_service.count_posts())
+        logger.info(f"Joining run {coordinator.run_id} as {coordinator.owner} ({shard_count} shards)")
+
+        processed_here = 0
+        coordinator.start_heartbeat()
+        try:
+            for shard in coordinator.claimed_shards():
+                bounds = coordinator.shard_range(shard)
+                try:
+                    result = self._execute_pipeline_streaming(offset=bounds['offset'], limit=bounds['limit'])
+                    coordinator.check_lease(shard)
+                except LeaseLostError as e:
+                    logger.warning(f"{str(e)}; leaving it to its new owner")
+                    continue
+                except BaseException:
+                    # Hand the shard back now rather than after the lease expires
+                    coordinator.release(shard)
+                    raise
+                coordinator.complete(shard, self._shard_counters(result['stats']))
+                processed_here += 1
+        finally:
+            coordinator.stop_heartbeat()
+            coordinator.release_all()
+
+        if not coordinator.wait_for_completion(timeout=self.barrier_timeout):
+            raise TimeoutError(f"Run {coordinator.run_id} did not complete within {self.barrier_timeout}s")
+
+        logger.info(f"Run {coordinator.run_id} complete; {processed_here} shards processed by this replica")
+        return {
+            'status': 'completed',
+            'run_id': coordinator.run_id,
+            'shards': shard_count,
+            'shards_processed_here': processed_here,
+            'stats': coordinator.run_stats()
+        }
+
+    @staticmethod
+    def _shard_counters(stats: Dict[str, Any]) -> Dict[str, int]:
+        """Flatten one shard's stats into counters summed across replicas"""
+        counters = {
+            'posts_processed': stats['posts_processed'],
+            'comments_processed': stats['comments_processed']
+        }
+        for kind in ('post_errors', 'comment_errors'):
+            for error_type, count in stats[kind]['by_type'].items():
+                counters[f"{kind}:{error_type}"] = count
+        return counters
+
+    def _execute_pipeline_streaming(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Streaming implementation of the pipeline: posts and comments flow
+        through the use cases as generators and failures are summarized, so
+        memory stays flat regardless of catalogue size or failure count
+        """
+        logger.info("Starting social media data pipeline (streaming, offset=%s, limit=%s)", offset, limit)
+
+        post_errors = ErrorSummary(sample_size=self.error_sample_size)
+        comment_errors = ErrorSummary(sample_size=self.error_sample_size)
+        stats = {
+            'posts_processed': 0,
+            'comments_processed': 0
+        }
+        fetch_posts = FetchAndStorePostsUseCase(self.pokeapi_service, self.post_repository)
+        fetch_comments = FetchAndStoreCommentsUseCase(self.pokeapi_service, self.comment_repository)
+
+        # 'fetch_post'/'fetch_comment' stages include storing the item
+        posts = fetch_posts.stream(errors=post_errors, offset=offset, limit=limit)
+        for post in self._timed(posts, 'fetch_post'):
+            self._changed_post_ids.add(post.id)
+            if self._process_post(post)['status'] == 'processed':
+                stats['posts_processed'] += 1
+            else:
+                post_errors.record('processing_failed', post.id)
+
+            comments = fetch_comments.stream(post, errors=comment_errors)
+            for comment in self._timed(comments, 'fetch_comment'):
+                if self._process_comment(comment)['status'] == 'processed':
+                    stats['comments_processed'] += 1
+                else:
+                    comment_errors.record('processing_failed', comment.id)
+
+        stats['post_errors'] = post_errors.to_dict()
+        stats['comment_errors'] = comment_errors.to_dict()
+        logger.info("Pipeline execution completed: %s posts, %s comments, %s failures",
+                    stats['posts_processed'], stats['comments_processed'],
+                    post_errors.total + comment_errors.total)
+        return {
+            'status': 'completed',
+            'stats': stats
+        }
+
+    def _timed(self, items: Iterable, stage: str) -> Iterator:
+        """Yield from `items`, timing each step of the underlying generator as `stage`"""
+        iterator = iter(items)
+        while True:
+            with self.profiler.stage(stage):
+                item = next(iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            yield item
+
     def _fetch_and_store_posts(self) -> List[Post]:
         """Fetch posts from PokeAPI and store in repository"""
         logger.debug("Fetching posts from PokeAPI")
-        posts = self.pokeapi_service.fetch_and_transform_posts()
+        with self.profiler.stage('fetch_posts'):
+            posts = self.pokeapi_service.fetch_and_transform_posts()
         saved_posts = []
         
         for post in posts:
-            if self.post_repository.save(post):
+            with self.profiler.stage('store_post'):
+                saved = self.post_repository.save(post)
+            if saved:
                 saved_posts.append(post)
-                logger.debug(f"Saved post: {post.id}")
+                logger.debug("Saved post: %s", post.id)
         
         logger.info(f"Saved {len(saved_posts)} posts")
         return saved_posts
 
     def _process_post(self, post: Post) -> Dict[str, Any]:
         """Process post data through the processing service"""
-        logger.debug(f"Processing post {post.id}")
-        result = self.processing_service.process_post(post.to_dict())
+        logger.debug("Processing post %s", post.id)
+        # One encoding serves the processing call, a DLQ hand-off and the index
+        # document; raw_data stays unparsed unless the projection reads into it
+        payload = EncodedPayload(post.to_fields(), encoded=post.to_json())
+        with self.profiler.stage('process_post'):
+            result = self.processing_service.process_post(payload)
 
         if result:
-            logger.debug(f"Successfully processed post {post.id}")
+            logger.debug("Successfully processed post %s", post.id)
 
             try:
-                self.opensearch_service.index_post(post.id, post.to_dict())
-                logger.info(f"✅ Post {post.id} indexed in OpenSearch")
+                with self.profiler.stage('index_post'):
+                    self.opensearch_service.index_post(post.id, payload)
+                sampled.info("post_indexed", "✅ Post %s indexed in OpenSearch", post.id)
             except Exception as e:
-                logger.warning(f"⚠️ Failed to index post {post.id}: {str(e)}")
+                sampled.log(logging.WARNING, "index_failed", "⚠️ Failed to index post %s: %s", post.id, e)
 
             return {'post_id': post.id, 'status': 'processed'}
 
@@ -115,23 +280,27 @@ class SocialMediaController:
 
     def _fetch_and_store_comments(self, post: Post) -> List[Comment]:
         """Fetch comments for a post and store in repository"""
-        logger.debug(f"Fetching comments for post {post.id}")
-        comments = self.pokeapi_service.fetch_comments_for_post(post)
+        logger.debug("Fetching comments for post %s", post.id)
+        with self.profiler.stage('fetch_comments'):
+            comments = self.pokeapi_service.fetch_comments_for_post(post)
         saved_comments = []
         
         for comment in comments:
-            if self.comment_repository.save(comment):
+            with self.profiler.stage('store_comment'):
+                saved = self.comment_repository.save(comment)
+            if saved:
                 saved_comments.append(comment)
-                logger.debug(f"Saved comment: {comment.id}")
+                logger.debug("Saved comment: %s", comment.id)
         
-        logger.info(f"Saved {len(saved_comments)} comments for post {post.id}")
+        sampled.info("comments_saved", "Saved %s comments for post %s", len(saved_comments), post.id)
         return saved_comments
 
     def _process_comment(self, comment: Comment) -> Dict[str, Any]:
         """Process comment data through the processing service"""
-        logger.debug(f"Processing comment {comment.id}")
-        result = self.processing_service.process_comment(comment.to_dict())
+        logger.debug("Processing comment %s", comment.id)
+        with self.profiler.stage('process_comment'):
+            result = self.processing_service.process_comment(EncodedPayload(comment.to_fields()))
         if result:
-            logger.debug(f"Successfully processed comment {comment.id}")
+            logger.debug("Successfully processed comment %s", comment.id)
             return {'comment_id': comment.id, 'status': 'processed'}
         return {'comment_id': comment.id, 'status': 'failed'}
@@ -0,0 +1,15 @@
+# app/presentation/http/__init__.py
+"""
+HTTP read API over stored posts and comments
+
+Contains:
+- ReadApi: Routing, cursor pagination, ETags and the response cache
+- ApiResponse: Status, body and headers of one response
+- build_server: Threaded or thread-pool HTTP server for a ReadApi
+- serve_forever: Serve in one process or in forked workers
+"""
+
+from .read_api import ReadApi, ApiResponse
+from .server import build_server, serve_forever
+
+__all__ = ['ReadApi', 'ApiResponse', 'build_server', 'serve_forever']
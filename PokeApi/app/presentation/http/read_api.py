@@ -0,0 +1,365 @@
+# app/presentation/http/read_api.py
+import os
+import base64
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from app.application.use_cases.find_similar_berries import FindSimilarBerriesUseCase
+from app.domain.entities.post import Post
+from app.domain.exceptions import NotFoundError, RepositoryError, ValidationError
+from app.domain.interfaces.repositories import IPostRepository, ICommentRepository
+from app.infrastructure.cache import TTLCache, CacheVersion
+from app.infrastructure.aggregates import FlavorAggregates
+from app.infrastructure.search.post_search import PostSearchService
+from app.infrastructure.serialization import get_codec
+from app.infrastructure.snapshot import BerrySnapshot
+from app.presentation.error_handling.error_handler import ErrorHandler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ApiResponse:
+    """Status, body and headers of one HTTP response"""
+    status: int
+    body: bytes = b''
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    status: int
+    body: bytes
+    etag: str
+
+
+class ReadApi:
+    """
+    Read-only HTTP API over stored posts and comments:
+    - GET /posts?limit=&cursor=   cursor-paginated list
+    - GET /posts/{id}             one post
+    - GET /posts/{id}/comments    comments of a post
+    - GET /flavors                per-flavor aggregates (with FlavorAggregates)
+    - GET /flavors/{name}         aggregates of one flavor, ?top=N strongest berries
+    - GET /berries                attribute filters over the BerrySnapshot, e.g.
+                                  ?size=10..50&smoothness=lt:30&order_by=-growth_time&limit=5
+    - GET /berries/{id}/similar   nearest berries by attributes and flavors, ?k=5&metric=cosine|l2
+                                  (with FindSimilarBerriesUseCase)
+    - GET /search                 OpenSearch query (with PostSearchService), e.g.
+                                  ?q=cheri&size=10..50&order_by=-growth_time&limit=5&cursor=
+    - GET /health                 liveness and cache statistics
+
+    Responses are cached per path and query, carry an ETag and honour
+    If-None-Match. Cached entries expire by TTL and are dropped as soon as a
+    writer bumps the shared CacheVersion, so repeated reads never reach
+    DynamoDB and list pages only read `limit` items when they do. Repository
+    failures are answered with a 500 and never cached.
+    """
+
+    def __init__(
+        self,
+        post_repository: IPostRepository,
+        comment_repository: ICommentRepository,
+        cache: Optional[TTLCache] = None,
+        version: Optional[CacheVersion] = None,
+        codec=None,
+        aggregates: Optional[FlavorAggregates] = None,
+        snapshot: Optional[BerrySnapshot] = None,
+        similarity: Optional[FindSimilarBerriesUseCase] = None,
+        search: Optional[PostSearchService] = None,
+        default_page_size: Optional[int] = None,
+        max_page_size: Optional[int] = None,
+        max_age: Optional[int] = None
+    ):
+        """
+        Args:
+            cache: Response cache (a TTLCache configured from env by default)
+            version: Shared version counter (never changes by default)
+            aggregates: Flavor aggregates served under /flavors (routes disabled without it)
+            snapshot: Columnar snapshot served under /berries, loaded on first use and
+                synced in the background whenever the cache version changes
+            similarity: Similar-berries lookups served under /berries/{id}/similar
+            search: Post queries served under /search, cached by the service itself
+            default_page_size: Posts per page without ?limit (falls back to API_PAGE_SIZE env var)
+            max_page_size: Largest accepted ?limit (falls back to API_MAX_PAGE_SIZE env var)
+            max_age: Cache-Control max-age for clients (falls back to API_MAX_AGE env var)
+        """
+        self.post_repository = post_repository
+        self.comment_repository = comment_repository
+        self.cache = cache or TTLCache()
+        self.version = version or CacheVersion()
+        self.codec = codec or get_codec()
+        self.aggregates = aggregates
+        self.snapshot = snapshot
+        self.similarity = similarity
+        self.search = search
+        self._snapshot_lock = threading.Lock()
+        self.default_page_size = default_page_size or int(os.getenv('API_PAGE_SIZE', '20'))
+        self.max_page_size = max_page_size or int(os.getenv('API_MAX_PAGE_SIZE', '100'))
+        self.max_age = max_age if max_age is not None else int(os.getenv('API_MAX_AGE', '5'))
+        self._seen_version = self.version.current()
+
+    def handle(self, method: str, target: str, headers: Optional[Dict[str, str]] = None) -> ApiResponse:
+        """
+        Serve one request
+
+        Args:
+            method: HTTP method
+            target: Request target (path plus query string)
+            headers: Request headers; only If-None-Match is used
+
+        Returns:
+            ApiResponse ready to be written by the server
+        """
+        if method not in ('GET', 'HEAD'):
+            return self._json(405, {'error': {'type': 'method_not_allowed', 'message': f"{method} not allowed"}},
+                              extra={'Allow': 'GET, HEAD'})
+
+        url = urlsplit(target)
+        parts = [part for part in url.path.split('/') if part]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if parts == ['health']:
+            return self._json(200, {'status': 'ok', 'cache': self.cache.stats(), 'version': self.version.current()})
+
+        if parts == ['berries'] and self.snapshot is not None:
+            return self._query_snapshot(method, query, headers)
+
+        if parts == ['search'] and self.search is not None:
+            return self._search_posts(method, query, headers)
+
+        try:
+            route = self._route(parts, query)
+        except ValidationError as e:
+            return self._error(e)
+        if route is None:
+            return self._json(404, {'error': {'type': 'not_found', 'message': f"No route for {url.path}"}})
+        key, loader = route
+
+        self._check_version()
+        try:
+            cached = self.cache.get_or_load(key, lambda: self._render(loader))
+        except RepositoryError as e:
+            return self._error(e)
+        # Only a cached 200 can be revalidated; a cached 404 stays a 404
+        if cached.status == 200 and self._matches(headers, cached.etag):
+            return ApiResponse(304, b'', self._cache_headers(cached.etag))
+        response_headers = self._cache_headers(cached.etag)
+        response_headers['Content-Type'] = self.codec.content_type
+        return ApiResponse(cached.status, b'' if method == 'HEAD' else cached.body, response_headers)
+
+    def _route(self, parts, query) -> Optional[Tuple[Tuple, Callable[[], Any]]]:
+        if parts == ['posts']:
+            limit = self._parse_limit(query.get('limit'))
+            cursor = query.get('cursor') or None
+            start_key = self._decode_cursor(cursor) if cursor else None
+            return ('posts', limit, cursor), lambda: self._list_posts(limit, start_key)
+        if len(parts) == 2 and parts[0] == 'posts':
+            post_id = parts[1]
+            return ('post', post_id), lambda: self._get_post(post_id)
+        if len(parts) == 3 and parts[0] == 'posts' and parts[2] == 'comments':
+            post_id = parts[1]
+            return ('comments', post_id), lambda: self._get_comments(post_id)
+        if self.aggregates is not None and parts and parts[0] == 'flavors' and len(parts) <= 2:
+            top_k = self._parse_top(query.get('top'))
+            if len(parts) == 1:
+                return ('flavors', top_k), lambda: {'items': self.aggregates.summary(top_k)}
+            flavor = parts[1]
+            return ('flavor', flavor, top_k), lambda: self._get_flavor(flavor, top_k)
+        if self.similarity is not None and len(parts) == 3 and parts[0] == 'berries' and parts[2] == 'similar':
+            post_id = parts[1]
+            if not post_id.isdigit():
+                raise ValidationError('id', 'must be an integer')
+            k = self._parse_top(query.get('k', '5'), 'k')
+            if k < 1:
+                raise ValidationError('k', 'must be at least 1')
+            metric = query.get('metric', 'cosine')
+            if metric not in ('cosine', 'l2'):
+                raise ValidationError('metric', "must be 'cosine' or 'l2'")
+            return ('similar', post_id, k, metric), lambda: {'items': self.similarity.execute(post_id, k, metric)}
+        return None
+
+    def _list_posts(self, limit: int, start_key: Optional[Dict]) -> Dict[str, Any]:
+        posts, next_key = self.post_repository.list_page(limit, start_key)
+        return {
+            'items': [post.to_dict() for post in posts],
+            'next_cursor': self._encode_cursor(next_key) if next_key else None
+        }
+
+    def _get_post(self, post_id: str) -> Dict[str, Any]:
+        post = self.post_repository.get_by_id(post_id)
+        if post is None:
+            raise NotFoundError('Post', post_id)
+        return post.to_dict()
+
+    def _get_comments(self, post_id: str) -> Dict[str, Any]:
+        comments = self.comment_repository.get_by_post_id(post_id)
+        return {'post_id': post_id, 'items': [comment.to_dict() for comment in comments]}
+
+    def _query_snapshot(self, method: str, query: Dict[str, str], headers) -> ApiResponse:
+        # Not response-cached: the query itself is a few vectorized passes and
+        # the snapshot is updated in place between version bumps
+        try:
+            filters = [self._parse_filter(name, query[name]) for name in BerrySnapshot.FIELDS if name in query]
+            order_by = query.get('order_by')
+            descending = bool(order_by) and order_by.startswith('-')
+            limit = self._parse_limit(query.get('limit'))
+            self._check_version()
+            self._ensure_snapshot()
+            rows = self.snapshot.query([f for group in filters for f in group],
+                                       order_by=order_by.lstrip('-') if order_by else None,
+                                       descending=descending, limit=limit)
+        except ValidationError as e:
+            return self._error(e)
+        except ValueError as e:
+            return self._error(ValidationError('query', str(e)))
+        except RepositoryError as e:
+            # The snapshot could not be loaded; the next request retries
+            return self._error(e)
+        return self._uncached(method, {'items': rows}, headers)
+
+    def _search_posts(self, method: str, query: Dict[str, str], headers) -> ApiResponse:
+        # Not response-cached: PostSearchService caches pages by normalized query
+        try:
+            filters = [self._parse_filter(name, query[name]) for name in Post.NUMERIC_FIELDS if name in query]
+            result = self.search.search(
+                name=query.get('q'),
+                filters=[f for group in filters for f in group],
+                order_by=query.get('order_by'),
+                limit=self._parse_limit(query.get('limit')),
+                cursor=query.get('cursor') or None
+            )
+        except ValidationError as e:
+            return self._error(e)
+        return self._uncached(method, result, headers)
+
+    def _uncached(self, method: str, payload: Any, headers) -> ApiResponse:
+        body = self.codec.dumps(payload)
+        etag = self._etag(body)
+        if self._matches(headers, etag):
+            return ApiResponse(304, b'', self._cache_headers(etag))
+        response_headers = self._cache_headers(etag)
+        response_headers['Content-Type'] = self.codec.content_type
+        return ApiResponse(200, b'' if method == 'HEAD' else body, response_headers)
+
+    @staticmethod
+    def _parse_filter(field: str, value: str) -> List[Tuple[str, str, int]]:
+        """'10..50' (inclusive, either end optional), 'lt:30', 'gte:5' or '7'"""
+        try:
+            if '..' in value:
+                low, high = value.split('..', 1)
+                bounds = [(field, 'gte', int(low))] if low else []
+                return bounds + ([(field, 'lte', int(high))] if high else [])
+            if ':' in value:
+                op, number = value.split(':', 1)
+                return [(field, op, int(number))]
+            return [(field, 'eq', int(value))]
+        except ValueError:
+            raise ValidationError(field, "expected N, MIN..MAX or op:N")
+
+    def _ensure_snapshot(self) -> None:
+        if not self.snapshot.loaded:
+            with self._snapshot_lock:
+                if not self.snapshot.loaded:
+                    self.snapshot.sync(self.post_repository, self.version)
+
+    def _sync_snapshot_in_background(self) -> None:
+        if not self._snapshot_lock.acquire(blocking=False):
+            return
+
+        def _sync():
+            try:
+                self.snapshot.sync(self.post_repository, self.version)
+            except Exception as e:
+                logger.error(f"Berry snapshot sync failed: {str(e)}")
+            finally:
+                self._snapshot_lock.release()
+
+        threading.Thread(target=_sync, name='snapshot-sync', daemon=True).start()
+
+    def _get_flavor(self, flavor: str, top_k: int) -> Dict[str, Any]:
+        result = self.aggregates.get(flavor, top_k)
+        if result is None:
+            raise NotFoundError('Flavor', flavor)
+        return result
+
+    def _render(self, loader: Callable[[], Any]) -> _CachedResponse:
+        # Not-found results are cached too, so probing missing ids stays cheap
+        try:
+            status, body = 200, self.codec.dumps(loader())
+        except NotFoundError as e:
+            status, body = 404, self.codec.dumps(ErrorHandler.handle_error(e)['error'])
+        return _CachedResponse(status, body, self._etag(body))
+
+    def _check_version(self) -> None:
+        version = self.version.current()
+        if version != self._seen_version:
+            logger.info(f"Cache version changed {self._seen_version} -> {version}, dropping cached responses")
+            self._seen_version = version
+            self.cache.clear()
+        # Also retries a sync that failed after an earlier version change
+        if self.snapshot is not None and self.snapshot.loaded and str(self.snapshot.version) != version:
+            self._sync_snapshot_in_background()
+
+    def _parse_limit(self, value: Optional[str]) -> int:
+        if value is None:
+            return self.default_page_size
+        try:
+            limit = int(value)
+        except ValueError:
+            raise ValidationError('limit', 'must be an integer')
+        if not 1 <= limit <= self.max_page_size:
+            raise ValidationError('limit', f"must be between 1 and {self.max_page_size}")
+        return limit
+
+    def _parse_top(self, value: Optional[str], name: str = 'top') -> int:
+        if value is None:
+            return 1
+        if not value.isdigit() or not 0 <= int(value) <= self.max_page_size:
+            raise ValidationError(name, f"must be between 0 and {self.max_page_size}")
+        return int(value)
+
+    def _encode_cursor(self, key: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(self.codec.dumps(key)).rstrip(b'=').decode('ascii')
+
+    def _decode_cursor(self, cursor: str) -> Dict[str, Any]:
+        try:
+            key = self.codec.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        except Exception:
+            raise ValidationError('cursor', 'is not a valid cursor')
+        if not isinstance(key, dict):
+            raise ValidationError('cursor', 'is not a valid cursor')
+        return key
+
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+    @staticmethod
+    def _matches(headers: Optional[Dict[str, str]], etag: str) -> bool:
+        if not headers:
+            return False
+        value = headers.get('If-None-Match') or headers.get('if-none-match')
+        if not value:
+            return False
+        if value.strip() == '*':
+            return True
+        # Weak comparison, as required for If-None-Match
+        candidates = {tag.strip()[2:] if tag.strip().startswith('W/') else tag.strip() for tag in value.split(',')}
+        return etag in candidates
+
+    def _cache_headers(self, etag: str) -> Dict[str, str]:
+        return {'ETag': etag, 'Cache-Control': f"max-age={self.max_age}"}
+
+    def _json(self, status: int, payload: Any, extra: Optional[Dict[str, str]] = None) -> ApiResponse:
+        headers = {'Content-Type': self.codec.content_type, 'Cache-Control': 'no-store'}
+        headers.update(extra or {})
+        return ApiResponse(status, self.codec.dumps(payload), headers)
+
+    def _error(self, error: Exception) -> ApiResponse:
+        response = ErrorHandler.handle_error(error)
+        return self._json(int(response['status_code']), {'error': response['error']})
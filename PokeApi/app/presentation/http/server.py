@@ -0,0 +1,211 @@
+# app/presentation/http/server.py
+import os
+import sys
+import signal
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+
+from app.presentation.http.read_api import ReadApi
+
+logger = logging.getLogger(__name__)
+
+
+class _ReadApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; with Nagle enabled, keep-alive
+    # clients stall on delayed ACKs (~40ms per response)
+    disable_nagle_algorithm = True
+    # Idle keep-alive connections are closed after this many seconds
+    timeout = float(os.getenv('API_KEEPALIVE_TIMEOUT', '5'))
+    server: 'HTTPServer'
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _serve(self) -> None:
+        response = self.server.api.handle(self.command, self.path, self.headers)
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        # HEAD reports the length of the body a GET would return
+        length = len(response.body)
+        self.send_header('Content-Length', str(length))
+        self.end_headers()
+        if self.command != 'HEAD' and length:
+            self.wfile.write(response.body)
+
+    def do_GET(self):
+        self._serve()
+
+    def do_HEAD(self):
+        self._serve()
+
+
+class ThreadedReadApiServer(ThreadingHTTPServer):
+    """One thread per connection; concurrency grows with the number of clients"""
+
+    daemon_threads = True
+    request_queue_size = int(os.getenv('API_BACKLOG', '128'))
+
+    def __init__(self, address: Tuple[str, int], api: ReadApi):
+        super().__init__(address, _ReadApiHandler)
+        self.api = api
+
+
+class PooledReadApiServer(HTTPServer):
+    """
+    Connections are served by a fixed-size thread pool, bounding memory and
+    concurrency. A keep-alive connection holds its thread until it goes idle
+    for API_KEEPALIVE_TIMEOUT seconds, so size the pool above the expected
+    number of concurrent clients.
+    """
+
+    request_queue_size = int(os.getenv('API_BACKLOG', '128'))
+
+    def __init__(self, address: Tuple[str, int], api: ReadApi, threads: int):
+        super().__init__(address, _ReadApiHandler)
+        self.api = api
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='read-api')
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request_thread, request, client_address)
+
+    def _process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False)
+
+
+def build_server(
+    api: ReadApi,
+    host: str = '0.0.0.0',
+    port: int = 8000,
+    worker_model: Optional[str] = None,
+    threads: Optional[int] = None
+) -> HTTPServer:
+    """
+    Create (and bind) the HTTP server for the read API
+
+    Args:
+        api: ReadApi serving the requests
+        worker_model: 'threads' (thread per connection) or 'pool' (fixed
+            thread pool); falls back to API_WORKER_MODEL env var
+        threads: Pool size for the 'pool' model (falls back to API_THREADS env var)
+    """
+    worker_model = (worker_model or os.getenv('API_WORKER_MODEL', 'pool')).lower()
+    if worker_model == 'threads':
+        return ThreadedReadApiServer((host, port), api)
+    if worker_model == 'pool':
+        return PooledReadApiServer((host, port), api, threads or int(os.getenv('API_THREADS', '32')))
+    raise ValueError(f"Unknown API worker model: {worker_model}")
+
+
+def serve_forever(server: HTTPServer, processes: Optional[int] = None) -> None:
+    """
+    Serve until interrupted. With more than one process the listening socket
+    is bound once and shared by forked workers, so requests are spread over
+    several interpreters (and several GILs); clients created lazily by the
+    repositories are built inside each worker after the fork.
+
+    Args:
+        processes: Worker processes (falls back to API_PROCESSES env var)
+    """
+    processes = processes or int(os.getenv('API_PROCESSES', '1'))
+    if processes <= 1 or not hasattr(os, 'fork'):
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+        return
+
+    children: List[int] = []
+    for _ in range(processes):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+            try:
+                server.serve_forever()
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    logger.info(f"Started {processes} read API workers: {children}")
+
+    def _stop(signum, frame):
+        for child in children:
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        for child in children:
+            os.waitpid(child, 0)
+    except KeyboardInterrupt:
+        _stop(signal.SIGINT, None)
+    finally:
+        server.server_close()
+
+
+def main() -> int:
+    """Run the read API with repositories and cache versioning configured from env"""
+    from app.application.use_cases import FindSimilarBerriesUseCase
+    from app.infrastructure.aggregates import FlavorAggregates
+    from app.infrastructure.cache import CacheVersion
+    from app.infrastructure.snapshot import BerrySnapshot, SimilarityIndex
+    from app.infrastructure.config.client_registry import get_client_registry
+    from app.infrastructure.observability.logging_setup import configure_logging
+    from app.infrastructure.persistence import DynamoDBPostRepository, DynamoDBCommentRepository
+    from app.infrastructure.search.opensearch_service import OpenSearchService
+    from app.infrastructure.search.post_search import PostSearchService
+
+    configure_logging()
+    endpoint_url = os.getenv('DYNAMODB_ENDPOINT', 'http://dynamodb:8000')
+    # Pooled clients shared with the rest of the process, configured from env
+    clients = get_client_registry()
+    redis_client = clients.redis() if os.getenv('REDIS_HOST') else None
+
+    post_repository = DynamoDBPostRepository(
+        table_name=os.getenv("DYNAMODB_TABLE_POSTS", "Posts"),
+        endpoint_url=endpoint_url,
+        clients=clients
+    )
+    comment_repository = DynamoDBCommentRepository(
+        table_name=os.getenv("DYNAMODB_TABLE_COMMENTS", "Comments"),
+        endpoint_url=endpoint_url,
+        clients=clients
+    )
+    version = CacheVersion(redis_client)
+    api = ReadApi(
+        post_repository=post_repository,
+        comment_repository=comment_repository,
+        version=version,
+        aggregates=FlavorAggregates(redis_client) if redis_client is not None else None,
+        snapshot=BerrySnapshot(),
+        similarity=FindSimilarBerriesUseCase(post_repository, comment_repository, SimilarityIndex(), version),
+        search=PostSearchService(OpenSearchService(clients=clients), version=version)
+    )
+    server = build_server(api, host=os.getenv('API_HOST', '0.0.0.0'), port=int(os.getenv('API_PORT', '8000')))
+    logger.info(f"Read API listening on {server.server_address[0]}:{server.server_address[1]}")
+    try:
+        serve_forever(server)
+    except KeyboardInterrupt:
+        logger.info("Read API stopping")
+    finally:
+        clients.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
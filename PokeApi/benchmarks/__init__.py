@@ -0,0 +1,17 @@
+# benchmarks/__init__.py
+"""
+Reproducible throughput benchmarks for the ingest pipeline
+
+Contains:
+- synthetic: Deterministic PokeAPI-shaped berry data
+- fakes: In-process stand-ins for PokeAPI, processing, DynamoDB, SQS, OpenSearch and Redis
+- run_pipeline: End-to-end pipeline and DLQ benchmark runner
+- compare: Diff two result files
+- simulator: HTTP PokeAPI/processing simulator with fault injection
+- bench_codec: Serialization codec micro-benchmark
+- bench_startup: Entry point cold-start benchmark
+- bench_read_api: Read API load test
+- bench_snapshot: BerrySnapshot attribute query benchmark
+- bench_similarity: SimilarityIndex query throughput
+- bench_item_size: Stored DynamoDB item size per layout
+"""
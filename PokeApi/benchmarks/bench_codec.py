@@ -0,0 +1,98 @@
+# benchmarks/bench_codec.py
+"""
+Per-item serialization cost: legacy stdlib path vs the shared codec
+
+The legacy path encodes each item independently for the processing request
+(requests' json=), the DLQ message and the OpenSearch document, and decodes the
+processing response and DLQ messages with stdlib json. The codec path encodes
+once into an EncodedPayload and reuses the bytes everywhere.
+
+Usage:
+    python -m benchmarks.bench_codec --iterations 20000
+"""
+import sys
+import json
+import timeit
+import argparse
+from datetime import datetime
+from typing import Callable, Dict
+
+from requests.models import complexjson
+from opensearchpy.serializer import JSONSerializer
+
+from app.domain.entities.comment import Comment
+from app.domain.entities.post import Post
+from app.domain.entities.raw_payload import RawPayload
+from app.infrastructure.serialization import EncodedPayload, get_codec, encode, encode_envelope
+from benchmarks.synthetic import berry_detail
+
+_opensearch_serializer = JSONSerializer()
+
+
+def _envelope(item_type: str) -> Dict:
+    return {
+        'type': item_type,
+        'timestamp': datetime.utcnow().isoformat(),
+        'retry_count': 0,
+        'source': 'processing_service'
+    }
+
+
+def legacy_round(item: Dict, item_type: str, index: bool) -> None:
+    """Serialization work the pipeline did per item before the codec layer"""
+    request_body = complexjson.dumps(item, allow_nan=False).encode('utf-8')
+    json.loads(b'{"json":' + request_body + b'}')  # processing response (httpbin echo)
+    message = dict(_envelope(item_type), data=item)
+    json.loads(json.dumps(message))  # DLQ send + worker receive
+    if index:
+        _opensearch_serializer.dumps(item)
+
+
+def codec_round(item: Dict, item_type: str, index: bool, codec, encoded: bytes = None) -> None:
+    """Same work through the shared codec with a single payload encoding"""
+    payload = EncodedPayload(item, encoded=encoded)
+    codec.loads(b'{"json":' + encode(payload, codec) + b'}')
+    codec.loads(encode_envelope(_envelope(item_type), 'data', payload, codec))
+    if index:
+        encode(payload, codec)
+
+
+def _measure(label: str, func: Callable[[], None], iterations: int) -> float:
+    best = min(timeit.repeat(func, number=iterations, repeat=3))
+    per_item = best / iterations * 1e6
+    print(f"{label:<28} {per_item:>9.2f} us/item", file=sys.stderr)
+    return per_item
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Serialization codec micro-benchmark')
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument('--codec', default=None, help='Codec to compare (default: SERIALIZATION_CODEC/auto)')
+    args = parser.parse_args()
+
+    codec = get_codec(args.codec)
+    details = berry_detail(7)
+    body = json.dumps(details).encode()
+    post = Post(
+        id=7, name=details['name'], growth_time=details['growth_time'], max_harvest=details['max_harvest'],
+        natural_gift_power=details['natural_gift_power'], size=details['size'],
+        smoothness=details['smoothness'], soil_dryness=details['soil_dryness'], raw_data=RawPayload(body)
+    )
+    post_dict = post.to_dict()
+    comment_dict = Comment.create(7, details['flavors'][0]).to_dict()
+
+    results = {'codec': codec.name}
+    results['post_legacy'] = _measure('post legacy (stdlib)', lambda: legacy_round(post_dict, 'post', True),
+                                      args.iterations)
+    results['post_codec'] = _measure(f'post {codec.name}', lambda: codec_round(
+        post_dict, 'post', True, codec, encoded=post.to_json()), args.iterations)
+    results['comment_legacy'] = _measure('comment legacy (stdlib)', lambda: legacy_round(
+        comment_dict, 'comment', False), args.iterations)
+    results['comment_codec'] = _measure(f'comment {codec.name}', lambda: codec_round(
+        comment_dict, 'comment', False, codec), args.iterations)
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
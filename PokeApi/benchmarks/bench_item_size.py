@@ -0,0 +1,87 @@
+# benchmarks/bench_item_size.py
+"""
+Stored item size: legacy layout (raw_data map, stringified comment fields)
+vs ItemCodec (native attributes plus compressed raw_data)
+
+Sizes follow DynamoDB's item size rules; WCUs are per item written, RCUs are
+for a full (eventually consistent) scan of every item.
+
+Usage:
+    python -m benchmarks.bench_item_size --berries 64
+"""
+import sys
+import json
+import math
+import argparse
+from decimal import Decimal
+
+from benchmarks.synthetic import berry_detail
+from app.domain.entities.comment import Comment
+from app.domain.entities.post import Post
+from app.infrastructure.persistence.dynamodb_comment_repository import DynamoDBCommentRepository
+from app.infrastructure.persistence.dynamodb_post_repository import DynamoDBPostRepository
+
+
+def attribute_size(value) -> int:
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, float, Decimal)):
+        return len(str(value).lstrip('-').replace('.', '')) // 2 + 2
+    if isinstance(value, dict):
+        return 3 + sum(len(key) + attribute_size(item) + 1 for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return 3 + sum(attribute_size(item) + 1 for item in value)
+    raise TypeError(type(value))
+
+
+def item_size(item) -> int:
+    return sum(len(key.encode('utf-8')) + attribute_size(value) for key, value in item.items())
+
+
+def legacy_post_item(post: Post):
+    return dict(post.to_dict(), id=str(post.id))
+
+
+def legacy_comment_item(comment: Comment):
+    item = comment.to_dict()
+    item['content'] = f"{item['flavor']} (potency: {item['potency']})"
+    return {key: value if isinstance(value, (str, dict)) else str(value) for key, value in item.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='DynamoDB item size benchmark')
+    parser.add_argument('--berries', type=int, default=64)
+    args = parser.parse_args()
+
+    posts, comments = [], []
+    for berry_id in range(1, args.berries + 1):
+        details = berry_detail(berry_id)
+        posts.append(Post(raw_data=json.dumps(details), created_at='2024-01-01T00:00:00.000000',
+                          **{field: details[field] for field in ('id', 'name') + Post.NUMERIC_FIELDS}))
+        comments.extend(Comment.create(berry_id, flavor) for flavor in details['flavors'])
+
+    post_repository = DynamoDBPostRepository(table_name='Posts')
+    comment_repository = DynamoDBCommentRepository(table_name='Comments')
+    results = {'berries': args.berries}
+    for label, entities, legacy, current in (
+        ('post', posts, legacy_post_item, post_repository._convert_post_to_item),
+        ('comment', comments, legacy_comment_item, comment_repository._adapt_comment_structure)
+    ):
+        for layout, convert in (('legacy', legacy), ('codec', current)):
+            sizes = [item_size(convert(entity)) for entity in entities]
+            results[f"{label}_{layout}"] = {
+                'avg_bytes': sum(sizes) / len(sizes),
+                'wcu_per_write': sum(math.ceil(size / 1024) for size in sizes) / len(sizes),
+                'scan_rcu': math.ceil(sum(sizes) / 4096) / 2
+            }
+            print(f"{label:<8} {layout:<7} {sum(sizes) / len(sizes):>8.0f} bytes/item", file=sys.stderr)
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# benchmarks/bench_read_api.py
+"""
+Local load test for the read API
+
+Starts the server in a child process over in-memory DynamoDB tables seeded
+with synthetic berries, then drives it from several client processes with
+keep-alive connections and reports sustained requests/s per scenario:
+
+- hot: one post, served from the response cache
+- conditional: the same post with If-None-Match (304 responses)
+- pages: first list pages of 20 posts
+- uncached: random posts with the response cache disabled (repository read per request)
+
+Usage:
+    python -m benchmarks.bench_read_api --posts 1000 --clients 16 --duration 5
+    python -m benchmarks.bench_read_api --worker-model threads --processes 2
+"""
+import os
+import sys
+import json
+import time
+import random
+import signal
+import argparse
+import http.client
+import multiprocessing
+import threading
+from typing import Dict, List, Tuple
+
+SCENARIOS = ('hot', 'conditional', 'pages', 'uncached')
+
+
+def _build_api(posts: int, cache_ttl: float):
+    from benchmarks.fakes import InMemoryDynamoDB
+    from benchmarks.synthetic import berry_detail
+    from app.domain.entities.comment import Comment
+    from app.domain.entities.post import Post
+    from app.infrastructure.cache import TTLCache
+    from app.infrastructure.persistence import DynamoDBPostRepository, DynamoDBCommentRepository
+    from app.presentation.http import ReadApi
+
+    dynamodb = InMemoryDynamoDB()
+    post_repository = DynamoDBPostRepository(table_name='Posts')
+    comment_repository = DynamoDBCommentRepository(table_name='Comments')
+    post_repository._dynamodb = comment_repository._dynamodb = dynamodb
+    for post_id in range(1, posts + 1):
+        details = berry_detail(post_id)
+        post_repository.save(Post(
+            id=post_id, name=details['name'], growth_time=details['growth_time'],
+            max_harvest=details['max_harvest'], natural_gift_power=details['natural_gift_power'],
+            size=details['size'], smoothness=details['smoothness'], soil_dryness=details['soil_dryness'],
+            raw_data=details
+        ))
+        for flavor in details['flavors']:
+            comment_repository.save(Comment.create(post_id, flavor))
+    return ReadApi(post_repository, comment_repository, cache=TTLCache(ttl=cache_ttl))
+
+
+def _serve(ready, port_value, posts: int, cache_ttl: float, worker_model: str, threads: int, processes: int) -> None:
+    import logging
+    logging.disable(logging.CRITICAL)
+    from app.presentation.http import build_server, serve_forever
+
+    server = build_server(_build_api(posts, cache_ttl), host='127.0.0.1', port=0,
+                          worker_model=worker_model, threads=threads)
+    port_value.value = server.server_address[1]
+    ready.set()
+    serve_forever(server, processes=processes)
+
+
+def _targets(scenario: str, posts: int, rng: random.Random) -> Tuple[str, Dict[str, str]]:
+    if scenario in ('hot', 'conditional'):
+        return '/posts/1', {}
+    if scenario == 'pages':
+        return '/posts?limit=20', {}
+    return f"/posts/{rng.randint(1, posts)}", {}
+
+
+def _client(port: int, scenario: str, posts: int, connections: int, duration: float, results) -> None:
+    counts: List[int] = [0] * connections
+    errors: List[int] = [0] * connections
+    deadline = time.perf_counter() + duration
+
+    def worker(index: int) -> None:
+        rng = random.Random(index)
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        etag = None
+        while time.perf_counter() < deadline:
+            path, headers = _targets(scenario, posts, rng)
+            if scenario == 'conditional' and etag:
+                headers = {'If-None-Match': etag}
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                etag = response.getheader('ETag')
+                if response.status in (200, 304):
+                    counts[index] += 1
+                else:
+                    errors[index] += 1
+            except (OSError, http.client.HTTPException):
+                errors[index] += 1
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        connection.close()
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(connections)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    results.put((sum(counts), sum(errors)))
+
+
+def run_scenario(args, scenario: str) -> Dict[str, float]:
+    context = multiprocessing.get_context('fork')
+    ready, port_value = context.Event(), context.Value('i', 0)
+    cache_ttl = 0.0 if scenario == 'uncached' else 60.0
+    server = context.Process(target=_serve, args=(ready, port_value, args.posts, cache_ttl, args.worker_model,
+                                                 args.threads, args.processes), daemon=False)
+    server.start()
+    if not ready.wait(60):
+        server.terminate()
+        raise RuntimeError('Read API server did not start')
+
+    results = context.Queue()
+    per_process = max(1, args.clients // args.client_processes)
+    clients = [context.Process(target=_client, args=(port_value.value, scenario, args.posts, per_process,
+                                                     args.duration, results))
+               for _ in range(args.client_processes)]
+    started = time.perf_counter()
+    for client in clients:
+        client.start()
+    totals = [results.get() for _ in clients]
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        client.join()
+
+    os.kill(server.pid, signal.SIGTERM)
+    server.join(10)
+    if server.is_alive():
+        server.kill()
+
+    ok = sum(count for count, _ in totals)
+    failed = sum(errors for _, errors in totals)
+    result = {'scenario': scenario, 'requests': ok, 'errors': failed, 'requests_per_second': ok / elapsed}
+    print(f"{scenario:<12} {result['requests_per_second']:>10.0f} req/s   "
+          f"({ok} ok, {failed} errors, {per_process * len(clients)} connections)", file=sys.stderr)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Read API load test')
+    parser.add_argument('--posts', type=int, default=1000)
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent keep-alive connections')
+    parser.add_argument('--client-processes', type=int, default=2)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--worker-model', choices=('pool', 'threads'), default='pool')
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    args = parser.parse_args()
+
+    results = [run_scenario(args, scenario) for scenario in args.scenarios.split(',')]
+    print(json.dumps({'config': vars(args), 'results': results}))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# benchmarks/bench_similarity.py
+"""
+Similar-berries query throughput: SimilarityIndex vs recomputing distances per request
+
+Usage:
+    python -m benchmarks.bench_similarity --posts 5000 --batch 64
+"""
+import sys
+import json
+import random
+import timeit
+import argparse
+
+import numpy as np
+
+from app.domain.entities.comment import Comment
+from app.domain.entities.post import Post
+from app.infrastructure.snapshot import SimilarityIndex
+
+
+def _berries(count: int):
+    rng = random.Random(13)
+    for post_id in range(1, count + 1):
+        post = Post(id=post_id, name=f"berry-{post_id}", growth_time=rng.randint(1, 24), max_harvest=rng.randint(1, 10),
+                    natural_gift_power=rng.randint(60, 100), size=rng.randint(10, 300),
+                    smoothness=rng.randint(5, 60), soil_dryness=rng.randint(5, 35), raw_data=None)
+        comments = [Comment(id=f"{post_id}-{flavor}", post_id=post_id, flavor=flavor, potency=rng.choice((0, 10, 20, 30)),
+                            raw_data=None) for flavor in Comment.FLAVORS]
+        yield post, comments
+
+
+def per_request(berries, post_id: int, k: int):
+    """What a handler without the index does: build and normalize vectors, then rank"""
+    ids = [post.id for post, _ in berries]
+    matrix = np.array([SimilarityIndex.vector(post, comments) for post, comments in berries])
+    std = matrix.std(axis=0)
+    std[std == 0] = 1
+    matrix = (matrix - matrix.mean(axis=0)) / std
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    scores = matrix @ matrix[ids.index(post_id)]
+    return [ids[row] for row in np.argsort(-scores)[1:k + 1]]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='SimilarityIndex benchmark')
+    parser.add_argument('--posts', type=int, default=5000)
+    parser.add_argument('--batch', type=int, default=64)
+    parser.add_argument('--k', type=int, default=5)
+    args = parser.parse_args()
+
+    berries = list(_berries(args.posts))
+    index = SimilarityIndex()
+    build = min(timeit.repeat(lambda: SimilarityIndex().upsert(berries), number=1, repeat=3))
+    index.upsert(berries)
+    rng = random.Random(1)
+    batch = [rng.randint(1, args.posts) for _ in range(args.batch)]
+
+    results = {'posts': args.posts, 'build_ms': build * 1000}
+    for label, func, queries in (
+        ('per_request', lambda: per_request(berries, batch[0], args.k), 1),
+        ('index_single', lambda: index.similar(batch[0], args.k), 1),
+        ('index_batch', lambda: index.similar_many(batch, args.k), len(batch))
+    ):
+        number = 3 if label == 'per_request' else 50
+        best = min(timeit.repeat(func, number=number, repeat=3)) / number
+        results[f"{label}_qps"] = queries / best
+        print(f"{label:<14} {queries / best:>12.0f} queries/s", file=sys.stderr)
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# benchmarks/bench_snapshot.py
+"""
+Attribute range query latency: BerrySnapshot columns vs filtering Post objects
+
+Query: size between 50 and 200 and smoothness < 30, ordered by growth_time,
+top 10.
+
+Usage:
+    python -m benchmarks.bench_snapshot --posts 100000
+"""
+import sys
+import json
+import random
+import timeit
+import argparse
+
+from app.domain.entities.post import Post
+from app.infrastructure.snapshot import BerrySnapshot
+
+FILTERS = [('size', 'gte', 50), ('size', 'lte', 200), ('smoothness', 'lt', 30)]
+
+
+def _posts(count: int):
+    rng = random.Random(11)
+    return [
+        Post(id=post_id, name=f"berry-{post_id}", growth_time=rng.randint(1, 24), max_harvest=rng.randint(1, 10),
+             natural_gift_power=rng.randint(60, 100), size=rng.randint(10, 300), smoothness=rng.randint(5, 60),
+             soil_dryness=rng.randint(5, 35), raw_data=None)
+        for post_id in range(1, count + 1)
+    ]
+
+
+def python_query(posts):
+    matches = [post for post in posts if 50 <= post.size <= 200 and post.smoothness < 30]
+    return sorted(matches, key=lambda post: post.growth_time)[:10]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='BerrySnapshot query benchmark')
+    parser.add_argument('--posts', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    posts = _posts(args.posts)
+    snapshot = BerrySnapshot()
+    build = min(timeit.repeat(lambda: BerrySnapshot().upsert(posts), number=1, repeat=3))
+    snapshot.upsert(posts)
+
+    results = {'posts': args.posts, 'build_ms': build * 1000}
+    for label, func in (
+        ('python_objects', lambda: python_query(posts)),
+        ('snapshot', lambda: snapshot.query(FILTERS, order_by='growth_time', limit=10))
+    ):
+        best = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat
+        results[f"{label}_us"] = best * 1e6
+        print(f"{label:<16} {best * 1e6:>12.1f} us/query", file=sys.stderr)
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+# benchmarks/bench_startup.py
+"""
+Cold-start cost of the entry points, each measured in a fresh interpreter
+
+- import app.main: module import of the pipeline entry point
+- initialize_services: client construction with readiness checks against
+  unreachable endpoints mocked out (Redis ping patched, other checks fail fast)
+- import dlq_reprocessor: module import of the DLQ worker
+
+Usage:
+    python -m benchmarks.bench_startup --repeat 5
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List
+
+_SNIPPETS = {
+    'import app.main': "import app.main",
+    'import dlq_reprocessor': "import app.infrastructure.workers.dlq_reprocessor",
+    'initialize_services': (
+        "from unittest.mock import patch\n"
+        "import app.main as m\n"
+        "from benchmarks.fakes import FakeRedis\n"
+        "with patch.object(m.OpenSearchService, 'ensure_index'), "
+        "patch('app.infrastructure.persistence.dynamodb_post_repository.DynamoDBPostRepository.table'), "
+        "patch('app.infrastructure.persistence.dynamodb_comment_repository.DynamoDBCommentRepository.table'):\n"
+        "    m.initialize_services(redis_conn=FakeRedis())\n"
+    )
+}
+
+_TIMER = (
+    "import time, sys\n"
+    "started = time.perf_counter()\n"
+    "{body}\n"
+    "sys.stdout.write(str(time.perf_counter() - started))\n"
+)
+
+
+def _run_once(body: str) -> float:
+    env = dict(os.environ, DLQ_QUEUE_URL=os.getenv('DLQ_QUEUE_URL', 'http://localhost/queue'),
+               LOG_LEVEL='CRITICAL')
+    output = subprocess.run(
+        [sys.executable, '-c', _TIMER.format(body=body)],
+        capture_output=True, text=True, check=True, env=env
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure(repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for label, body in _SNIPPETS.items():
+        samples: List[float] = [_run_once(body) for _ in range(repeat)]
+        results[label] = {'median_ms': statistics.median(samples) * 1000, 'min_ms': min(samples) * 1000}
+        print(f"{label:<24} median {results[label]['median_ms']:8.1f} ms   "
+              f"min {results[label]['min_ms']:8.1f} ms", file=sys.stderr)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Entry point cold-start benchmark')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(measure(args.repeat)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# benchmarks/compare.py
+"""
+Compare two benchmark result files produced by run_pipeline.py
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/baseline.json benchmarks/results/current.json
+"""
+import sys
+import json
+import argparse
+from typing import Dict, Tuple
+
+
+def _index(report: Dict) -> Dict[Tuple[str, int], Dict]:
+    return {(result['scenario'], result['berries']): result for result in report['results']}
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return '    n/a'
+    return f"{(after - before) / before * 100:+7.1f}%"
+
+
+def compare(baseline: Dict, current: Dict) -> str:
+    lines = [
+        f"baseline {baseline['meta']['revision']} vs current {current['meta']['revision']}",
+        f"{'scenario':>8} {'berries':>8} {'items/s':>12} {'delta':>8} {'peak MiB':>9} {'delta':>8}"
+    ]
+    before_index = _index(baseline)
+    for key, after in sorted(_index(current).items()):
+        before = before_index.get(key)
+        if before is None:
+            continue
+        lines.append(
+            f"{key[0]:>8} {key[1]:>8} {after['items_per_sec']:>12.1f} "
+            f"{_delta(before['items_per_sec'], after['items_per_sec']):>8} "
+            f"{after['peak_rss_kb'] / 1024:>9.1f} {_delta(before['peak_rss_kb'], after['peak_rss_kb']):>8}"
+        )
+        for stage, stats in sorted(after.get('stages', {}).items()):
+            previous = before.get('stages', {}).get(stage)
+            if previous:
+                lines.append(
+                    f"{'':>18} {stage:<18} p50 {stats['p50'] * 1e6:>9.1f}us {_delta(previous['p50'], stats['p50'])}"
+                    f"  p99 {stats['p99'] * 1e6:>9.1f}us {_delta(previous['p99'], stats['p99'])}"
+                )
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files')
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    print(compare(baseline, current))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,714 @@
+# benchmarks/fakes.py
+"""
+In-process stand-ins for every external dependency of the ingest pipeline
+
+- FakeRedis: the subset of redis-py used by CircuitBreaker, ShardCoordinator
+  and FlavorAggregates, including key expiry and their Lua scripts
+- InMemoryDynamoDB: boto3-resource-shaped tables that serialize items with the
+  real DynamoDB type serializer, so item conversion costs stay realistic
+- FakeSQSClient: send/receive/delete with in-memory queues
+- FakeOpenSearch: opensearch-py client shape that JSON-encodes each document
+  and answers bool/range searches with sort, search_after and point in time,
+  plus the bulk, settings and alias calls of the reindex job
+- FakeHTTP: replaces requests.get/requests.post with a synthetic PokeAPI and
+  an httpbin-style processing endpoint
+"""
+import gzip
+import json
+import re
+import time
+import threading
+import uuid
+import zlib
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+from urllib.parse import urlparse, parse_qs
+
+from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
+
+from benchmarks.synthetic import berry_detail, berry_listing
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class FakeRedis:
+    """Dictionary-backed Redis covering strings, hashes, sets, expiry and lease scripts"""
+
+    def __init__(self):
+        self._data: Dict[str, object] = {}
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def _alive(self, key) -> bool:
+        deadline = self._expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def ping(self) -> bool:
+        return True
+
+    def get(self, key):
+        with self._lock:
+            return self._data.get(key) if self._alive(key) else None
+
+    def set(self, key, value, nx: bool = False, ex=None, px=None):
+        with self._lock:
+            if nx and self._alive(key):
+                return None
+            # Values read back as strings, as with decode_responses=True
+            self._data[key] = value.decode('utf-8') if isinstance(value, bytes) else str(value)
+            self._expires.pop(key, None)
+            if ex is not None or px is not None:
+                self._expires[key] = time.monotonic() + (px / 1000.0 if px is not None else ex)
+            return True
+
+    def incr(self, key, amount: int = 1) -> int:
+        with self._lock:
+            value = int(self._data.get(key, 0) if self._alive(key) else 0) + amount
+            self._data[key] = str(value)
+            return value
+
+    def delete(self, *keys) -> int:
+        with self._lock:
+            removed = sum(1 for key in keys if self._alive(key) and self._data.pop(key, None) is not None)
+            for key in keys:
+                self._expires.pop(key, None)
+            return removed
+
+    def expire(self, key, seconds) -> bool:
+        with self._lock:
+            if not self._alive(key):
+                return False
+            self._expires[key] = time.monotonic() + float(seconds)
+            return True
+
+    def pexpire(self, key, milliseconds) -> bool:
+        return self.expire(key, float(milliseconds) / 1000.0)
+
+    def hset(self, key, field, value) -> int:
+        with self._lock:
+            self._alive(key)
+            self._data.setdefault(key, {})[field] = str(value)
+            return 1
+
+    def hincrby(self, key, field, amount: int = 1) -> int:
+        with self._lock:
+            self._alive(key)
+            bucket = self._data.setdefault(key, {})
+            bucket[field] = str(int(bucket.get(field, 0)) + int(amount))
+            return int(bucket[field])
+
+    def hget(self, key, field) -> Optional[str]:
+        with self._lock:
+            return (self._data.get(key) or {}).get(field) if self._alive(key) else None
+
+    def hmget(self, key, fields) -> List[Optional[str]]:
+        with self._lock:
+            bucket = self._data.get(key) if self._alive(key) else {}
+            return [bucket.get(field) for field in fields]
+
+    def hgetall(self, key) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._data.get(key) or {}) if self._alive(key) else {}
+
+    def sadd(self, key, *members) -> int:
+        with self._lock:
+            self._alive(key)
+            bucket = self._data.setdefault(key, set())
+            added = [str(member) for member in members if str(member) not in bucket]
+            bucket.update(added)
+            return len(added)
+
+    def smembers(self, key) -> set:
+        with self._lock:
+            return set(self._data.get(key) or ()) if self._alive(key) else set()
+
+    def scard(self, key) -> int:
+        return len(self.smembers(key))
+
+    def zadd(self, key, mapping: Dict[str, float]) -> int:
+        with self._lock:
+            self._alive(key)
+            bucket = self._data.setdefault(key, {})
+            added = sum(1 for member in mapping if str(member) not in bucket)
+            bucket.update({str(member): float(score) for member, score in mapping.items()})
+            return added
+
+    @staticmethod
+    def _score_bound(value):
+        text = str(value)
+        if text in ('-inf', '+inf', 'inf'):
+            return float(text), False
+        if text.startswith('('):
+            return float(text[1:]), True
+        return float(text), False
+
+    def _in_range(self, score: float, minimum, maximum) -> bool:
+        low, low_open = self._score_bound(minimum)
+        high, high_open = self._score_bound(maximum)
+        above = score > low if low_open else score >= low
+        below = score < high if high_open else score <= high
+        return above and below
+
+    def zrangebyscore(self, key, minimum, maximum) -> list:
+        with self._lock:
+            bucket = dict(self._data.get(key) or {}) if self._alive(key) else {}
+        ranked = sorted(bucket.items(), key=lambda item: (item[1], item[0]))
+        return [member for member, score in ranked if self._in_range(score, minimum, maximum)]
+
+    def zremrangebyscore(self, key, minimum, maximum) -> int:
+        with self._lock:
+            bucket = self._data.get(key) if self._alive(key) else None
+            if not bucket:
+                return 0
+            doomed = [member for member, score in bucket.items() if self._in_range(score, minimum, maximum)]
+            for member in doomed:
+                del bucket[member]
+            return len(doomed)
+
+    def zrevrange(self, key, start: int, end: int, withscores: bool = False) -> list:
+        with self._lock:
+            bucket = dict(self._data.get(key) or {}) if self._alive(key) else {}
+        ranked = sorted(bucket.items(), key=lambda item: (item[1], item[0]), reverse=True)
+        ranked = ranked[start:] if end == -1 else ranked[start:end + 1]
+        return ranked if withscores else [member for member, _ in ranked]
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def register_script(self, script: str):
+        return _FakeScript(self, script)
+
+
+class _FakeScript:
+    """Runs the Python equivalent of a known Lua script under the client lock"""
+
+    def __init__(self, redis_client: FakeRedis, script: str):
+        from app.infrastructure.coordination import leases, shard_coordinator
+        from app.infrastructure.aggregates import flavor_aggregates
+        from app.infrastructure.cache import cache_version
+        handlers = {
+            leases.RENEW_SCRIPT: self._renew,
+            leases.RELEASE_SCRIPT: self._release,
+            shard_coordinator._COMPLETE_SCRIPT: self._complete,
+            flavor_aggregates._RECORD_SCRIPT: self._record_flavors,
+            cache_version._BUMP_SCRIPT: self._bump_version
+        }
+        if script not in handlers:
+            raise NotImplementedError("FakeRedis cannot run this script")
+        self._redis = redis_client
+        self._handler = handlers[script]
+
+    def __call__(self, keys=(), args=()):
+        with self._redis._lock:
+            return self._handler([str(key) for key in keys], [str(arg) for arg in args])
+
+    def _renew(self, keys, args):
+        if self._redis.get(keys[0]) == args[0]:
+            return int(self._redis.pexpire(keys[0], int(args[1])))
+        return 0
+
+    def _release(self, keys, args):
+        if self._redis.get(keys[0]) == args[0]:
+            return self._redis.delete(keys[0])
+        return 0
+
+    def _complete(self, keys, args):
+        if self._redis.sadd(keys[0], args[0]) == 0:
+            return 0
+        for i in range(3, len(args), 2):
+            self._redis.hincrby(keys[1], args[i], int(args[i + 1]))
+        self._redis.expire(keys[0], args[1])
+        self._redis.expire(keys[1], args[1])
+        if self._redis.get(keys[2]) == args[2]:
+            self._redis.delete(keys[2])
+        return 1
+
+    def _record_flavors(self, keys, args):
+        added = 0
+        for j in range(len(args) // 3):
+            flavor, berry, potency = args[3 * j], args[3 * j + 1], int(args[3 * j + 2])
+            stats, top = keys[2 * j + 2], keys[2 * j + 3]
+            field = f"{flavor}|{berry}"
+            previous = self._redis.hget(keys[0], field)
+            if previous is None:
+                self._redis.hincrby(stats, 'count', 1)
+                self._redis.hincrby(stats, 'sum', potency)
+                added += 1
+            else:
+                self._redis.hincrby(stats, 'sum', potency - int(previous))
+            self._redis.hset(keys[0], field, potency)
+            self._redis.zadd(top, {berry: potency})
+            self._redis.sadd(keys[1], flavor)
+        return added
+
+    def _bump_version(self, keys, args):
+        version = self._redis.incr(keys[0])
+        if len(args) > 1:
+            self._redis.zadd(keys[1], {member: version for member in args[1:]})
+            self._redis.zremrangebyscore(keys[1], '-inf', version - int(args[0]))
+        return version
+
+
+class _FakePipeline:
+    def __init__(self, redis_client: FakeRedis):
+        self._redis = redis_client
+        self._calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        results = [getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+        self._calls = []
+        return results
+
+
+class InMemoryTable:
+    """DynamoDB table stand-in keyed on the `id` attribute"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._items: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def put_item(self, Item: Dict, **kwargs) -> Dict:
+        wire = {key: _serializer.serialize(value) for key, value in Item.items()}
+        with self._lock:
+            self._items[Item['id']] = wire
+        return {}
+
+    def batch_writer(self, **kwargs) -> '_InMemoryBatchWriter':
+        return _InMemoryBatchWriter(self)
+
+    def get_item(self, Key: Dict, **kwargs) -> Dict:
+        wire = self._items.get(Key['id'])
+        if wire is None:
+            return {}
+        return {'Item': self._decode(wire)}
+
+    def delete_item(self, Key: Dict, **kwargs) -> Dict:
+        with self._lock:
+            self._items.pop(Key['id'], None)
+        return {}
+
+    def scan(self, Limit: Optional[int] = None, ExclusiveStartKey: Optional[Dict] = None,
+             Segment: int = 0, TotalSegments: int = 1, **kwargs) -> Dict:
+        keys = sorted(key for key in self._items if zlib.crc32(key.encode('utf-8')) % TotalSegments == Segment)
+        start = 0
+        if ExclusiveStartKey:
+            start = next((i + 1 for i, key in enumerate(keys) if key == ExclusiveStartKey['id']), len(keys))
+        end = len(keys) if Limit is None else min(len(keys), start + Limit)
+        response = {
+            'Items': [self._decode(self._items[key]) for key in keys[start:end]],
+            'Count': end - start
+        }
+        if end < len(keys):
+            response['LastEvaluatedKey'] = {'id': keys[end - 1]}
+        return response
+
+    def query(self, IndexName: Optional[str] = None, KeyConditionExpression=None, **kwargs) -> Dict:
+        # Only equality on a single hash key is used by the repositories
+        condition = KeyConditionExpression.get_expression()
+        attribute = condition['values'][0].name
+        value = condition['values'][1]
+        items = [
+            self._decode(wire) for wire in list(self._items.values())
+            if attribute in wire and _deserializer.deserialize(wire[attribute]) == value
+        ]
+        return {'Items': items, 'Count': len(items)}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def _decode(wire: Dict) -> Dict:
+        return {key: _deserializer.deserialize(value) for key, value in wire.items()}
+
+
+class _InMemoryBatchWriter:
+    """boto3 batch_writer stand-in that writes on exit"""
+
+    def __init__(self, table: InMemoryTable):
+        self._table = table
+        self._items: List[Tuple[str, Dict]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        for action, value in self._items:
+            if action == 'put':
+                self._table.put_item(Item=value)
+            else:
+                self._table.delete_item(Key=value)
+        return False
+
+    def put_item(self, Item: Dict, **kwargs) -> None:
+        self._items.append(('put', Item))
+
+    def delete_item(self, Key: Dict, **kwargs) -> None:
+        self._items.append(('delete', Key))
+
+
+class InMemoryDynamoDB:
+    """boto3 DynamoDB resource stand-in handing out shared in-memory tables"""
+
+    def __init__(self):
+        self.tables: Dict[str, InMemoryTable] = {}
+
+    def Table(self, name: str) -> InMemoryTable:
+        if name not in self.tables:
+            self.tables[name] = InMemoryTable(name)
+        return self.tables[name]
+
+
+class FakeSQSClient:
+    """SQS client stand-in with at-least-once receive semantics"""
+
+    def __init__(self):
+        self._queues: Dict[str, deque] = {}
+        self._in_flight: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.deleted = 0
+
+    def send_message(self, QueueUrl: str, MessageBody, **kwargs) -> Dict:
+        message_id = str(uuid.uuid4())
+        with self._lock:
+            self._queues.setdefault(QueueUrl, deque()).append({'MessageId': message_id, 'Body': MessageBody})
+            self.sent += 1
+        return {'MessageId': message_id}
+
+    def receive_message(self, QueueUrl: str, MaxNumberOfMessages: int = 1, **kwargs) -> Dict:
+        messages = []
+        with self._lock:
+            queue = self._queues.setdefault(QueueUrl, deque())
+            while queue and len(messages) < MaxNumberOfMessages:
+                message = dict(queue.popleft())
+                message['ReceiptHandle'] = message['MessageId']
+                self._in_flight[message['ReceiptHandle']] = (QueueUrl, message)
+                messages.append(message)
+        return {'Messages': messages} if messages else {}
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str, **kwargs) -> Dict:
+        with self._lock:
+            if self._in_flight.pop(ReceiptHandle, None) is not None:
+                self.deleted += 1
+        return {}
+
+    def release_in_flight(self) -> None:
+        """Return undeleted messages to their queues (visibility timeout expiry)"""
+        with self._lock:
+            for queue_url, message in self._in_flight.values():
+                message.pop('ReceiptHandle', None)
+                self._queues.setdefault(queue_url, deque()).append(message)
+            self._in_flight.clear()
+
+    def depth(self, queue_url: str) -> int:
+        return len(self._queues.get(queue_url, ()))
+
+
+class FakeOpenSearchError(Exception):
+    """Carries the HTTP status like opensearch-py's TransportError"""
+
+    def __init__(self, status_code: int, error: str):
+        super().__init__(status_code, error)
+        self.status_code = status_code
+        self.error = error
+
+
+class _FakeIndices:
+    def __init__(self, client: 'FakeOpenSearch'):
+        self._client = client
+
+    def exists(self, index: str, **kwargs) -> bool:
+        return index in self._client.indexes or index in self._client.aliases
+
+    def create(self, index: str, body: Optional[Dict] = None, **kwargs) -> Dict:
+        self._client.indexes.setdefault(index, {})
+        self._client.settings.setdefault(index, {}).update((body or {}).get('settings', {}).get('index', {}))
+        return {'acknowledged': True, 'index': index}
+
+    def delete(self, index: str, **kwargs) -> Dict:
+        self._client.indexes.pop(index, None)
+        self._client.settings.pop(index, None)
+        return {'acknowledged': True}
+
+    def put_settings(self, body: Dict, index: str, **kwargs) -> Dict:
+        self._client.settings.setdefault(index, {}).update(body.get('index', {}))
+        return {'acknowledged': True}
+
+    def refresh(self, index: str, **kwargs) -> Dict:
+        self._client.refreshes.append(index)
+        return {'_shards': {'failed': 0}}
+
+    def exists_alias(self, name: str, **kwargs) -> bool:
+        return bool(self._client.aliases.get(name))
+
+    def get_alias(self, name: str, **kwargs) -> Dict:
+        indexes = self._client.aliases.get(name)
+        if not indexes:
+            raise FakeOpenSearchError(404, 'alias_missing')
+        return {index: {'aliases': {name: {}}} for index in indexes}
+
+    def update_aliases(self, body: Dict, **kwargs) -> Dict:
+        # Validated first and applied together, like the atomic _aliases call
+        client = self._client
+        for action in body['actions']:
+            (kind, target), = action.items()
+            if target['index'] not in client.indexes:
+                raise FakeOpenSearchError(404, 'index_not_found_exception')
+        with client._lock:
+            for action in body['actions']:
+                (kind, target), = action.items()
+                if kind == 'add':
+                    client.aliases.setdefault(target['alias'], set()).add(target['index'])
+                elif kind == 'remove':
+                    client.aliases.get(target['alias'], set()).discard(target['index'])
+                elif kind == 'remove_index':
+                    self.delete(target['index'])
+        return {'acknowledged': True}
+
+
+class FakeOpenSearch:
+    """opensearch-py client stand-in storing encoded documents per index"""
+
+    def __init__(self, *args, **kwargs):
+        self.indexes: Dict[str, Dict[str, bytes]] = {}
+        self.aliases: Dict[str, set] = {}
+        self.settings: Dict[str, Dict] = {}
+        self.indices = _FakeIndices(self)
+        self.pits: Dict[str, Dict[str, Dict]] = {}
+        self.searches: List[Dict] = []
+        self.refreshes: List[str] = []
+        self.bulk_requests = 0
+        self._lock = threading.Lock()
+
+    def _resolve(self, index: str) -> str:
+        """Concrete index behind an alias with a single index"""
+        indexes = self.aliases.get(index)
+        return next(iter(indexes)) if indexes and len(indexes) == 1 else index
+
+    def index(self, index: str, body, id=None, **kwargs) -> Dict:
+        encoded = body if isinstance(body, (bytes, str)) else json.dumps(body, default=str)
+        with self._lock:
+            self.indexes.setdefault(self._resolve(index), {})[str(id)] = encoded
+        return {'_id': id, 'result': 'created'}
+
+    def bulk(self, body, index: Optional[str] = None, **kwargs) -> Dict:
+        """NDJSON `index` actions; each line pair is one document"""
+        lines = (body.decode('utf-8') if isinstance(body, bytes) else body).splitlines()
+        items = []
+        with self._lock:
+            self.bulk_requests += 1
+            for action_line, document in zip(lines[::2], lines[1::2]):
+                action = json.loads(action_line)['index']
+                target = self._resolve(action.get('_index', index))
+                self.indexes.setdefault(target, {})[str(action['_id'])] = document
+                items.append({'index': {'_index': target, '_id': action['_id'], 'status': 201}})
+        return {'errors': False, 'items': items}
+
+    def count(self, index: str, **kwargs) -> Dict:
+        return {'count': len(self.indexes.get(self._resolve(index), {}))}
+
+    def create_point_in_time(self, index: str, keep_alive: Optional[str] = None, **kwargs) -> Dict:
+        pit_id = uuid.uuid4().hex
+        with self._lock:
+            self.pits[pit_id] = self._documents(index)
+        return {'pit_id': pit_id}
+
+    def delete_point_in_time(self, body: Dict, **kwargs) -> Dict:
+        with self._lock:
+            for pit_id in body.get('pit_id', ()):
+                self.pits.pop(pit_id, None)
+        return {'pits': [{'pit_id': pit_id, 'successful': True} for pit_id in body.get('pit_id', ())]}
+
+    def search(self, index: Optional[str] = None, body: Optional[Dict] = None, **kwargs) -> Dict:
+        """bool queries of `match` (on name) and `range` clauses, sort, search_after, size and point in time"""
+        body = body or {}
+        self.searches.append(body)
+        if 'pit' in body:
+            documents = self.pits.get(body['pit']['id'])
+            if documents is None:
+                raise FakeOpenSearchError(404, 'search_context_missing_exception')
+        else:
+            documents = self._documents(index)
+
+        clauses = body.get('query', {}).get('bool', {})
+        hits = []
+        for doc_id, document in documents.items():
+            score = self._score(document, clauses.get('must', ()))
+            if score is None or not all(self._in_range(document, clause['range']) for clause in clauses.get('filter', ())):
+                continue
+            hits.append({'_id': doc_id, '_score': score, '_source': document})
+
+        sort = [next(iter(spec.items())) for spec in body.get('sort', [{'_score': 'desc'}])]
+        for field, order in reversed(sort):
+            hits.sort(key=lambda hit: self._sort_value(hit, field), reverse=order == 'desc')
+        for hit in hits:
+            hit['sort'] = [self._sort_value(hit, field) for field, _ in sort]
+        if 'search_after' in body:
+            hits = [hit for hit in hits if self._is_after(hit['sort'], body['search_after'], sort)]
+
+        excludes = body.get('_source', {}).get('excludes', ())
+        hits = hits[:body.get('size', 10)]
+        for hit in hits:
+            hit['_source'] = {key: value for key, value in hit['_source'].items() if key not in excludes}
+        return {'hits': {'hits': hits}}
+
+    def _documents(self, index: str) -> Dict[str, Dict]:
+        return {doc_id: json.loads(encoded) for doc_id, encoded in self.indexes.get(self._resolve(index), {}).items()}
+
+    @staticmethod
+    def _score(document: Dict, must) -> Optional[float]:
+        tokens = set(re.split(r'[^a-z0-9]+', str(document.get('name', '')).lower()))
+        score = 1.0
+        for clause in must:
+            words = clause['match']['name']['query'].lower().split()
+            if not all(word in tokens for word in words):
+                return None
+            score += len(words) / len(tokens)
+        return score
+
+    @staticmethod
+    def _in_range(document: Dict, clause: Dict) -> bool:
+        (field, bounds), = clause.items()
+        value = document.get(field)
+        checks = {'gt': lambda v, b: v > b, 'gte': lambda v, b: v >= b,
+                  'lt': lambda v, b: v < b, 'lte': lambda v, b: v <= b}
+        return value is not None and all(checks[op](value, bound) for op, bound in bounds.items())
+
+    @staticmethod
+    def _sort_value(hit: Dict, field: str):
+        if field == '_score':
+            return hit['_score']
+        return hit['_source'].get(field.split('.')[0])
+
+    @staticmethod
+    def _is_after(values: List, after: List, sort: List[Tuple[str, str]]) -> bool:
+        for value, bound, (_, order) in zip(values, after, sort):
+            if value != bound:
+                return value > bound if order == 'asc' else value < bound
+        return False
+
+
+class FakeResponse:
+    """Minimal requests.Response replacement"""
+
+    def __init__(self, status_code: int, content: bytes, url: str = ''):
+        self.status_code = status_code
+        self.content = content
+        self.url = url
+        self.headers = {'Content-Type': 'application/json'}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            import requests
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class FakeHTTP:
+    """
+    Serves synthetic PokeAPI responses for GET and an httpbin-style echo for POST.
+    Response bodies are JSON-encoded and decoded exactly like real HTTP traffic.
+    """
+
+    def __init__(self, berry_count: int, page_size: Optional[int] = None):
+        self.berry_count = berry_count
+        self.page_size = page_size
+        self.gets = 0
+        self.posts = 0
+
+    def get(self, url: str, params: Optional[Dict] = None, **kwargs) -> FakeResponse:
+        self.gets += 1
+        parsed = urlparse(url)
+        parts = [part for part in parsed.path.split('/') if part]
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        query.update(params or {})
+
+        if parts and parts[-1] == 'berry':
+            limit = query.get('limit', self.page_size)
+            page = berry_listing(
+                self.berry_count,
+                offset=int(query.get('offset', 0)),
+                limit=int(limit) if limit is not None else None
+            )
+            return FakeResponse(200, json.dumps(page).encode(), url)
+
+        berry_id = int(parts[-1])
+        if not 1 <= berry_id <= self.berry_count:
+            return FakeResponse(404, b'{"detail": "Not found."}', url)
+        return FakeResponse(200, json.dumps(berry_detail(berry_id)).encode(), url)
+
+    def post(self, url: str, json_body=None, data=None, **kwargs) -> FakeResponse:
+        self.posts += 1
+        payload = kwargs.get('json', json_body)
+        body = data if data is not None else json.dumps(payload).encode()
+        if isinstance(body, str):
+            body = body.encode()
+        if (kwargs.get('headers') or {}).get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return FakeResponse(200, b'{"json": ' + body + b', "url": "' + url.encode() + b'"}', url)
+
+
+class LocalStack:
+    """Bundle of every fake, installed into the app modules by `install()`"""
+
+    def __init__(self, berry_count: int, page_size: Optional[int] = None):
+        self.redis = FakeRedis()
+        self.dynamodb = InMemoryDynamoDB()
+        self.sqs = FakeSQSClient()
+        self.opensearch = FakeOpenSearch()
+        self.http = FakeHTTP(berry_count, page_size=page_size)
+
+    @contextmanager
+    def install(self, patch_http: bool = True):
+        """
+        Patch DynamoDB, SQS and OpenSearch entry points (and the default
+        client registry) for the duration
+
+        Args:
+            patch_http: Also replace requests.get/post with FakeHTTP. Disable
+                when the app should talk to benchmarks.simulator over real HTTP.
+        """
+        with ExitStack() as stack:
+            if patch_http:
+                stack.enter_context(patch('requests.get', self.http.get))
+                stack.enter_context(patch('requests.post', self.http.post))
+                # Shared sessions from the client registry go through the fakes too
+                stack.enter_context(patch('requests.Session.get', lambda session, url, **kwargs: self.http.get(url, **kwargs)))
+                stack.enter_context(patch('requests.Session.post', lambda session, url, **kwargs: self.http.post(url, **kwargs)))
+            # A fresh default registry, so no client built against the fakes outlives them
+            from app.infrastructure.config.client_registry import ClientRegistry
+            stack.enter_context(patch('app.infrastructure.config.client_registry._default_registry', ClientRegistry()))
+            stack.enter_context(patch('app.infrastructure.config.database.build_dynamodb_resource',
+                                      lambda endpoint_url=None, config=None: self.dynamodb))
+            for module in ('app.infrastructure.persistence.dynamodb_post_repository',
+                           'app.infrastructure.persistence.dynamodb_comment_repository'):
+                stack.enter_context(patch(f'{module}.get_dynamodb_resource', lambda endpoint_url=None: self.dynamodb))
+            stack.enter_context(patch('app.infrastructure.search.opensearch_service.OpenSearch',
+                                      lambda *args, **kwargs: self.opensearch))
+            stack.enter_context(patch('boto3.client', lambda *args, **kwargs: self.sqs))
+            yield self
@@ -0,0 +1,278 @@
+# benchmarks/run_pipeline.py
+"""
+End-to-end throughput benchmark for the ingest pipeline and the DLQ reprocessor
+
+Each scenario/size pair runs in a fresh subprocess so peak RSS is measured per
+run. Results are written as JSON and can be compared with benchmarks/compare.py.
+
+Usage:
+    python -m benchmarks.run_pipeline --sizes 100,10000,100000 --output benchmarks/results/current.json
+
+With --transport http the app talks to benchmarks.simulator over real sockets;
+--fault-args passes simulator options (latency, errors, 429 bursts, slow drip).
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import platform
+import shlex
+import resource
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List
+
+SCENARIOS = ('pipeline', 'dlq')
+DEFAULT_SIZES = '100,1000,10000'
+
+
+def _peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+@contextmanager
+def _transport(berry_count: int, transport: str, fault_args: str):
+    """Yield (pokeapi_url, processing_url, simulator) for the chosen transport"""
+    if transport == 'fake':
+        yield None, 'http://processing.local/post', None
+        return
+
+    from benchmarks.simulator import SimulatorServer, build_parser, _profile_from_args, start_in_background
+    args = build_parser().parse_args(shlex.split(fault_args))
+    server = SimulatorServer(
+        ('127.0.0.1', 0),
+        berry_count=berry_count,
+        pokeapi_profile=_profile_from_args(args, 'pokeapi'),
+        processing_profile=_profile_from_args(args, 'processing'),
+        seed=args.seed
+    )
+    start_in_background(server)
+    try:
+        yield server.pokeapi_url, server.processing_url, server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def run_pipeline_scenario(berry_count: int, transport: str = 'fake', fault_args: str = '') -> Dict[str, Any]:
+    """Run SocialMediaController.execute_pipeline against the local stand-ins"""
+    from benchmarks.fakes import LocalStack
+    from app.infrastructure.observability.metrics import MetricsRegistry
+    from app.infrastructure.observability.profiler import StageProfiler
+
+    stack = LocalStack(berry_count)
+    metrics = MetricsRegistry()
+    with _transport(berry_count, transport, fault_args) as (pokeapi_url, processing_url, simulator), \
+            stack.install(patch_http=transport == 'fake'):
+        from app.infrastructure.external.circuit_breaker import CircuitBreaker
+        from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+        from app.infrastructure.external.http_session import build_http_session
+        from app.infrastructure.external.pokeapi_service import PokeAPIService
+        from app.infrastructure.external.request_hedger import RequestHedger
+        from app.infrastructure.external.processing_service import ProcessingService
+        from app.infrastructure.persistence.dynamodb_post_repository import DynamoDBPostRepository
+        from app.infrastructure.persistence.dynamodb_comment_repository import DynamoDBCommentRepository
+        from app.presentation.controllers.social_media_controller import SocialMediaController
+
+        profiler = StageProfiler(enabled=True, cpu_mode='timing', trace_memory=False)
+        # Real sockets use a shared keep-alive session, as main.py does
+        session = build_http_session() if transport == 'http' else None
+        controller = SocialMediaController(
+            post_repository=DynamoDBPostRepository(table_name='Posts'),
+            comment_repository=DynamoDBCommentRepository(table_name='Comments'),
+            pokeapi_service=PokeAPIService(
+                circuit_breaker=CircuitBreaker(redis_client=stack.redis),
+                base_url=pokeapi_url,
+                session=session,
+                # Opt in with POKEAPI_HEDGE=true
+                hedger=RequestHedger.from_env(metrics=metrics)
+            ),
+            processing_service=ProcessingService(
+                dlq=DeadLetterQueue(queue_url='http://localstack:4566/000000000000/dead-letter-queue'),
+                endpoint=processing_url,
+                session=session,
+                metrics=metrics
+            ),
+            profiler=profiler
+        )
+
+        started = time.perf_counter()
+        result = controller.execute_pipeline()
+        elapsed = time.perf_counter() - started
+        served = simulator.stats.snapshot() if simulator else None
+
+    stats = result.get('stats', {})
+    items = stats.get('posts_processed', 0) + stats.get('comments_processed', 0)
+    report = {
+        'scenario': 'pipeline',
+        'transport': transport,
+        'berries': berry_count,
+        'items': items,
+        'posts_stored': len(stack.dynamodb.Table('Posts')),
+        'comments_stored': len(stack.dynamodb.Table('Comments')),
+        'documents_indexed': stack.opensearch.count('posts')['count'],
+        'dlq_messages': stack.sqs.sent,
+        'seconds': elapsed,
+        'items_per_sec': items / elapsed if elapsed else 0.0,
+        'processing_payload_bytes': metrics.summary('processing.payload_bytes')['sum'],
+        'processing_request_bytes': metrics.summary('processing.request_bytes')['sum'],
+        'pokeapi_hedged': metrics.counter('pokeapi.hedged'),
+        'pokeapi_hedge_wins': metrics.counter('pokeapi.hedge_wins'),
+        'stages': profiler.latencies()
+    }
+    if served is None:
+        report.update(upstream_gets=stack.http.gets, processing_posts=stack.http.posts)
+    else:
+        report['simulator'] = served
+    return report
+
+
+def run_dlq_scenario(berry_count: int, transport: str = 'fake', fault_args: str = '') -> Dict[str, Any]:
+    """Enqueue one failed post and its comments per berry, then drain the DLQ"""
+    from benchmarks.fakes import LocalStack
+    from benchmarks.synthetic import berry_detail
+    from app.infrastructure.observability.metrics import get_metrics
+    from app.infrastructure.observability.profiler import StageProfiler
+
+    stack = LocalStack(berry_count)
+    with _transport(berry_count, transport, fault_args) as (_, processing_url, simulator), \
+            stack.install(patch_http=transport == 'fake'):
+        from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+        from app.domain.entities.post import Post
+        from app.domain.entities.comment import Comment
+        from app.infrastructure.workers import dlq_reprocessor
+
+        dlq = DeadLetterQueue(queue_url=dlq_reprocessor.DLQ_URL)
+        for berry_id in range(1, berry_count + 1):
+            details = berry_detail(berry_id)
+            post = Post(
+                id=berry_id,
+                name=details['name'],
+                growth_time=details['growth_time'],
+                max_harvest=details['max_harvest'],
+                natural_gift_power=details['natural_gift_power'],
+                size=details['size'],
+                smoothness=details['smoothness'],
+                soil_dryness=details['soil_dryness'],
+                raw_data=details
+            )
+            # The pipeline stores posts before processing them; the worker
+            # reads them back to index the full document
+            dlq_reprocessor.post_repo.save(post)
+            dlq.add_failed_item('post', post.to_dict())
+            for flavor in details['flavors']:
+                dlq.add_failed_item('comment', Comment.create(berry_id, flavor).to_dict())
+
+        enqueued = stack.sqs.depth(dlq_reprocessor.DLQ_URL)
+        dlq_reprocessor.processor.processing_endpoint = processing_url
+        profiler = StageProfiler(enabled=True, cpu_mode='timing', trace_memory=False)
+        dlq_reprocessor.profiler = profiler
+
+        started = time.perf_counter()
+        while dlq_reprocessor.poll_once(wait_seconds=0):
+            pass
+        elapsed = time.perf_counter() - started
+
+    return {
+        'scenario': 'dlq',
+        'transport': transport,
+        'berries': berry_count,
+        'items': stack.sqs.deleted,
+        'enqueued': enqueued,
+        'remaining': stack.sqs.depth(dlq_reprocessor.DLQ_URL),
+        'duplicates_skipped': get_metrics().counter('dlq.dedupe.reprocess_skipped'),
+        'documents_indexed': stack.opensearch.count('posts')['count'],
+        'seconds': elapsed,
+        'items_per_sec': stack.sqs.deleted / elapsed if elapsed else 0.0,
+        'stages': profiler.latencies()
+    }
+
+
+def run_single(scenario: str, berry_count: int, transport: str = 'fake', fault_args: str = '') -> Dict[str, Any]:
+    runner = run_pipeline_scenario if scenario == 'pipeline' else run_dlq_scenario
+    result = runner(berry_count, transport=transport, fault_args=fault_args)
+    result['peak_rss_kb'] = _peak_rss_kb()
+    return result
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return 'unknown'
+
+
+def run_suite(
+    scenarios: List[str],
+    sizes: List[int],
+    log_level: str,
+    transport: str = 'fake',
+    fault_args: str = ''
+) -> Dict[str, Any]:
+    results = []
+    for scenario in scenarios:
+        for size in sizes:
+            command = [sys.executable, '-m', 'benchmarks.run_pipeline',
+                       '--single', scenario, '--sizes', str(size), '--log-level', log_level,
+                       '--transport', transport, '--fault-args', fault_args]
+            completed = subprocess.run(command, capture_output=True, text=True, env=os.environ.copy())
+            if completed.returncode != 0:
+                raise RuntimeError(f"Benchmark {scenario}/{size} failed:\n{completed.stderr}")
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            print(f"{scenario:>8} {size:>8} berries: {result['items_per_sec']:>10.1f} items/s "
+                  f"in {result['seconds']:.2f}s, peak RSS {result['peak_rss_kb'] / 1024:.1f} MiB",
+                  file=sys.stderr)
+            results.append(result)
+
+    return {
+        'meta': {
+            'revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'transport': transport,
+            'fault_args': fault_args,
+        },
+        'results': results
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Ingest pipeline throughput benchmark')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='Comma-separated: pipeline,dlq')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='Comma-separated berry counts')
+    parser.add_argument('--output', help='Write JSON results to this path')
+    parser.add_argument('--log-level', default='WARNING', help='Application log level during runs')
+    parser.add_argument('--transport', choices=('fake', 'http'), default='fake',
+                        help='fake: patched requests; http: real sockets against benchmarks.simulator')
+    parser.add_argument('--fault-args', default='', help='Simulator options, e.g. "--pokeapi-error-rate 0.05"')
+    parser.add_argument('--single', choices=SCENARIOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level)
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+
+    if args.single:
+        print(json.dumps(run_single(args.single, sizes[0], args.transport, args.fault_args)))
+        return 0
+
+    scenarios = [scenario for scenario in args.scenarios.split(',') if scenario]
+    report = run_suite(scenarios, sizes, args.log_level, args.transport, args.fault_args)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
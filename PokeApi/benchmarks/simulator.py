@@ -0,0 +1,341 @@
+# benchmarks/simulator.py
+"""
+Synthetic PokeAPI and processing-endpoint HTTP simulator with fault injection
+
+Serves:
+- GET  /api/v2/berry/?offset=&limit=   PokeAPI-shaped listing with `next` links
+- GET  /api/v2/berry/{id}/             Berry details for any synthetic id
+- POST /post                           httpbin-style echo of the request body
+
+Each route family has its own fault profile: latency distribution, error rate,
+periodic 429 bursts (with Retry-After) and slow-drip responses.
+
+Usage:
+    python -m benchmarks.simulator --berries 10000 --port 8080 \\
+        --pokeapi-latency lognormal:-3.5,0.8 --pokeapi-error-rate 0.01 \\
+        --processing-latency pareto:0.02,1.5 --processing-429-every 30 --processing-429-duration 3
+
+Point the app at it with POKEAPI_BASE_URL=http://localhost:8080/api/v2/berry and
+PROCESSING_ENDPOINT=http://localhost:8080/post.
+"""
+import sys
+import gzip
+import json
+import time
+import random
+import argparse
+import logging
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from benchmarks.synthetic import berry_detail, berry_listing
+
+logger = logging.getLogger(__name__)
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Parse a latency distribution spec into a sampler returning seconds
+
+    Supported specs:
+        constant:S            always S seconds
+        uniform:A,B           uniform between A and B seconds
+        lognormal:MU,SIGMA    exp(normal(MU, SIGMA)) seconds
+        pareto:SCALE,ALPHA    SCALE * pareto(ALPHA) seconds (heavy tail)
+    """
+    kind, _, raw_args = spec.partition(':')
+    args = [float(value) for value in raw_args.split(',') if value]
+    if kind == 'constant':
+        return lambda rng: args[0]
+    if kind == 'uniform':
+        return lambda rng: rng.uniform(args[0], args[1])
+    if kind == 'lognormal':
+        return lambda rng: rng.lognormvariate(args[0], args[1])
+    if kind == 'pareto':
+        return lambda rng: args[0] * rng.paretovariate(args[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+@dataclass
+class FaultProfile:
+    """
+    Fault injection settings for one route family
+
+    Attributes:
+        latency: Latency distribution spec (see parse_latency)
+        error_rate: Probability of answering with `error_status`
+        error_status: HTTP status used for injected errors
+        burst_every: Seconds between the starts of 429 bursts (0 disables)
+        burst_duration: Seconds each 429 burst lasts
+        retry_after: Retry-After header value sent with 429s
+        slow_drip_rate: Probability of trickling the body out in chunks
+        drip_chunk_size: Bytes per slow-drip chunk
+        drip_delay: Seconds between slow-drip chunks
+    """
+    latency: str = 'constant:0'
+    error_rate: float = 0.0
+    error_status: int = 500
+    burst_every: float = 0.0
+    burst_duration: float = 0.0
+    retry_after: int = 1
+    slow_drip_rate: float = 0.0
+    drip_chunk_size: int = 64
+    drip_delay: float = 0.05
+    _sampler: Callable = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._sampler = parse_latency(self.latency)
+
+    def sample_latency(self, rng: random.Random) -> float:
+        return max(0.0, self._sampler(rng))
+
+    def in_burst(self, elapsed: float) -> bool:
+        if self.burst_every <= 0 or self.burst_duration <= 0:
+            return False
+        return elapsed % self.burst_every < self.burst_duration
+
+
+class SimulatorStats:
+    """Thread-safe per-route counters of what the simulator served"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+
+    def incr(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+
+class _LockedRandom(random.Random):
+    """random.Random safe to share between handler threads"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._lock = threading.Lock()
+        super().__init__(seed)
+
+    def random(self) -> float:
+        with self._lock:
+            return super().random()
+
+
+class _SimulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; with Nagle enabled, keep-alive
+    # clients stall on delayed ACKs (~40ms per response)
+    disable_nagle_algorithm = True
+    server: 'SimulatorServer'
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        parts = [part for part in parsed.path.split('/') if part]
+        if parts[:2] != ['api', 'v2'] or len(parts) < 3 or parts[2] != 'berry':
+            self._send(404, {'detail': 'Not found.'}, route='unknown')
+            return
+
+        api_root = f"http://{self.headers.get('Host', 'localhost')}/api/v2"
+        if len(parts) == 3:
+            query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+            body = berry_listing(
+                self.server.berry_count,
+                offset=int(query.get('offset', 0)),
+                limit=int(query.get('limit', 20)),
+                api_root=api_root
+            )
+            self._respond('pokeapi', 'listing', body)
+            return
+
+        try:
+            berry_id = int(parts[3])
+        except ValueError:
+            berry_id = 0
+        if not 1 <= berry_id <= self.server.berry_count:
+            self._send(404, {'detail': 'Not found.'}, route='pokeapi.not_found')
+            return
+        self._respond('pokeapi', 'detail', berry_detail(berry_id, api_root=api_root))
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip('/') != '/post':
+            self._send(404, {'detail': 'Not found.'}, route='unknown')
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        raw = self.rfile.read(length) if length else b''
+        if self.headers.get('Content-Encoding') == 'gzip':
+            raw = gzip.decompress(raw)
+        try:
+            parsed = json.loads(raw) if raw else None
+        except ValueError:
+            parsed = None
+        body = {
+            'args': {},
+            'data': raw.decode('utf-8', errors='replace'),
+            'headers': {key: value for key, value in self.headers.items()},
+            'json': parsed,
+            'url': f"http://{self.headers.get('Host', 'localhost')}{self.path}"
+        }
+        self._respond('processing', 'post', body)
+
+    def _respond(self, family: str, route: str, body: Dict) -> None:
+        server = self.server
+        profile = server.profiles[family]
+        rng = server.rng()
+        key = f"{family}.{route}"
+
+        time.sleep(profile.sample_latency(rng))
+
+        if profile.in_burst(time.monotonic() - server.started):
+            self._send(429, {'detail': 'Too many requests.'}, route=f"{key}.429",
+                       headers={'Retry-After': str(profile.retry_after)})
+            return
+        if profile.error_rate and rng.random() < profile.error_rate:
+            self._send(profile.error_status, {'detail': 'Injected failure.'}, route=f"{key}.error")
+            return
+
+        drip = profile.slow_drip_rate and rng.random() < profile.slow_drip_rate
+        self._send(200, body, route=f"{key}.drip" if drip else key, drip=profile if drip else None)
+
+    def _send(
+        self,
+        status: int,
+        body: Dict,
+        route: str,
+        headers: Optional[Dict[str, str]] = None,
+        drip: Optional[FaultProfile] = None
+    ) -> None:
+        self.server.stats.incr(route)
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        try:
+            if drip is None:
+                self.wfile.write(payload)
+                return
+            for start in range(0, len(payload), drip.drip_chunk_size):
+                self.wfile.write(payload[start:start + drip.drip_chunk_size])
+                self.wfile.flush()
+                time.sleep(drip.drip_delay)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up (timeout or hedged request); nothing left to do
+            pass
+
+
+class SimulatorServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the simulator state"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        berry_count: int,
+        pokeapi_profile: Optional[FaultProfile] = None,
+        processing_profile: Optional[FaultProfile] = None,
+        seed: Optional[int] = None
+    ):
+        super().__init__(address, _SimulatorHandler)
+        self.berry_count = berry_count
+        self.profiles = {
+            'pokeapi': pokeapi_profile or FaultProfile(),
+            'processing': processing_profile or FaultProfile()
+        }
+        self.stats = SimulatorStats()
+        self.started = time.monotonic()
+        self._rng = _LockedRandom(seed)
+
+    def rng(self) -> random.Random:
+        """Shared random generator; seeded runs draw one reproducible sequence"""
+        return self._rng
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def pokeapi_url(self) -> str:
+        return f"{self.base_url}/api/v2/berry"
+
+    @property
+    def processing_url(self) -> str:
+        return f"{self.base_url}/post"
+
+
+def start_in_background(server: SimulatorServer) -> threading.Thread:
+    """Serve requests on a daemon thread; stop with server.shutdown()"""
+    thread = threading.Thread(target=server.serve_forever, name='pokeapi-simulator', daemon=True)
+    thread.start()
+    return thread
+
+
+def _profile_from_args(args: argparse.Namespace, prefix: str) -> FaultProfile:
+    values = vars(args)
+    return FaultProfile(
+        latency=values[f'{prefix}_latency'],
+        error_rate=values[f'{prefix}_error_rate'],
+        error_status=values[f'{prefix}_error_status'],
+        burst_every=values[f'{prefix}_429_every'],
+        burst_duration=values[f'{prefix}_429_duration'],
+        retry_after=values[f'{prefix}_retry_after'],
+        slow_drip_rate=values[f'{prefix}_slow_drip_rate'],
+        drip_delay=values[f'{prefix}_drip_delay']
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Synthetic PokeAPI / processing endpoint simulator')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--berries', type=int, default=1000, help='Number of synthetic berries')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible fault injection')
+    for prefix in ('pokeapi', 'processing'):
+        option = f'--{prefix}'
+        parser.add_argument(f'{option}-latency', default='constant:0', help='Latency distribution spec')
+        parser.add_argument(f'{option}-error-rate', type=float, default=0.0)
+        parser.add_argument(f'{option}-error-status', type=int, default=500)
+        parser.add_argument(f'{option}-429-every', type=float, default=0.0, help='Seconds between 429 bursts')
+        parser.add_argument(f'{option}-429-duration', type=float, default=0.0, help='Length of each 429 burst')
+        parser.add_argument(f'{option}-retry-after', type=int, default=1)
+        parser.add_argument(f'{option}-slow-drip-rate', type=float, default=0.0)
+        parser.add_argument(f'{option}-drip-delay', type=float, default=0.05)
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    logging.basicConfig(level=logging.INFO)
+    server = SimulatorServer(
+        (args.host, args.port),
+        berry_count=args.berries,
+        pokeapi_profile=_profile_from_args(args, 'pokeapi'),
+        processing_profile=_profile_from_args(args, 'processing'),
+        seed=args.seed
+    )
+    logger.info("Simulator serving %s berries on %s", args.berries, server.base_url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        logger.info("Served: %s", server.stats.snapshot())
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# benchmarks/synthetic.py
+"""
+Deterministic synthetic PokeAPI berry data
+
+Shapes mirror the real `/berry/` listing and `/berry/{id}/` detail responses
+so the ingest pipeline does the same parsing and copying work it does in
+production.
+"""
+from typing import Dict, Optional
+
+FLAVORS = ('spicy', 'dry', 'sweet', 'bitter', 'sour')
+FIRMNESS = ('very-soft', 'soft', 'hard', 'very-hard', 'super-hard')
+GIFT_TYPES = ('fire', 'water', 'grass', 'electric', 'ice', 'fighting', 'poison', 'ground')
+
+POKEAPI_ROOT = 'https://pokeapi.co/api/v2'
+
+
+def berry_name(berry_id: int) -> str:
+    return f"berry-{berry_id}"
+
+
+def berry_detail(berry_id: int, api_root: str = POKEAPI_ROOT) -> Dict:
+    """Build a PokeAPI-shaped berry detail document for the given id"""
+    flavors = []
+    for index, flavor in enumerate(FLAVORS):
+        flavors.append({
+            'flavor': {
+                'name': flavor,
+                'url': f"{api_root}/berry-flavor/{index + 1}/"
+            },
+            'potency': (berry_id * (index + 3)) % 41
+        })
+
+    firmness = FIRMNESS[berry_id % len(FIRMNESS)]
+    gift_type = GIFT_TYPES[berry_id % len(GIFT_TYPES)]
+    return {
+        'id': berry_id,
+        'name': berry_name(berry_id),
+        'growth_time': 2 + berry_id % 23,
+        'max_harvest': 5 + berry_id % 11,
+        'natural_gift_power': 60 + (berry_id % 3) * 10,
+        'size': 20 + (berry_id * 7) % 280,
+        'smoothness': 20 + (berry_id * 3) % 40,
+        'soil_dryness': 4 + berry_id % 32,
+        'firmness': {
+            'name': firmness,
+            'url': f"{api_root}/berry-firmness/{FIRMNESS.index(firmness) + 1}/"
+        },
+        'flavors': flavors,
+        'item': {
+            'name': f"{berry_name(berry_id)}-item",
+            'url': f"{api_root}/item/{125 + berry_id}/"
+        },
+        'natural_gift_type': {
+            'name': gift_type,
+            'url': f"{api_root}/type/{GIFT_TYPES.index(gift_type) + 10}/"
+        }
+    }
+
+
+def berry_listing(
+    total: int,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    api_root: str = POKEAPI_ROOT
+) -> Dict:
+    """
+    Build a PokeAPI-shaped `/berry/` listing page
+
+    Args:
+        total: Number of synthetic berries in the catalogue
+        offset: Index of the first berry on the page
+        limit: Page size (None returns the rest of the catalogue in one page)
+        api_root: Root URL used for `url`, `next` and `previous` links
+    """
+    limit = total if limit is None else limit
+    end = min(total, offset + limit)
+    results = [
+        {'name': berry_name(berry_id), 'url': f"{api_root}/berry/{berry_id}/"}
+        for berry_id in range(offset + 1, end + 1)
+    ]
+    next_url = f"{api_root}/berry/?offset={end}&limit={limit}" if end < total else None
+    previous_url = None
+    if offset > 0:
+        previous_url = f"{api_root}/berry/?offset={max(0, offset - limit)}&limit={limit}"
+    return {
+        'count': total,
+        'next': next_url,
+        'previous': previous_url,
+        'results': results
+    }
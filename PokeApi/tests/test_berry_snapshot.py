@@ -0,0 +1,126 @@
+# tests/test_berry_snapshot.py
+import json
+import random
+from unittest.mock import MagicMock
+import pytest
+from benchmarks.fakes import FakeRedis, InMemoryDynamoDB
+from app.domain.entities.post import Post
+from app.domain.exceptions import RepositoryError
+from app.infrastructure.cache import CacheVersion
+from app.infrastructure.persistence import DynamoDBPostRepository
+from app.infrastructure.snapshot import BerrySnapshot
+from app.presentation.http import ReadApi
+
+def _post(post_id, rng):
+    return Post(id=post_id, name=f"berry-{post_id}", growth_time=rng.randint(1, 24), max_harvest=rng.randint(1, 10),
+                natural_gift_power=rng.randint(60, 100), size=rng.randint(10, 300), smoothness=rng.randint(5, 60),
+                soil_dryness=rng.randint(5, 35), raw_data={})
+
+def _repository(posts):
+    repository = DynamoDBPostRepository(table_name="Posts")
+    repository._dynamodb = InMemoryDynamoDB()
+    for post in posts:
+        repository.save(post)
+    return repository
+
+def test_query_matches_brute_force():
+    rng = random.Random(3)
+    posts = [_post(post_id, rng) for post_id in range(1, 400)]
+    snapshot = BerrySnapshot(initial_capacity=16)
+    snapshot.upsert(posts)
+
+    rows = snapshot.query([("size", "gte", 50), ("size", "lte", 200), ("smoothness", "lt", 30)],
+                          order_by="growth_time", descending=True, limit=10)
+
+    expected = sorted((p for p in posts if 50 <= p.size <= 200 and p.smoothness < 30),
+                      key=lambda p: -p.growth_time)[:10]
+    assert [row["growth_time"] for row in rows] == [p.growth_time for p in expected]
+    assert all(50 <= row["size"] <= 200 and row["smoothness"] < 30 for row in rows)
+    assert snapshot.count([("size", "gte", 50), ("size", "lte", 200), ("smoothness", "lt", 30)]) == \
+        sum(1 for p in posts if 50 <= p.size <= 200 and p.smoothness < 30)
+
+def test_sync_applies_only_changed_posts():
+    rng = random.Random(5)
+    repository = _repository([_post(post_id, rng) for post_id in range(1, 30)])
+    version = CacheVersion(FakeRedis(), check_interval=0, history=2)
+    snapshot = BerrySnapshot()
+    snapshot.sync(repository, version)
+    assert len(snapshot) == 29
+
+    repository.save(Post(id=3, name="berry-3", growth_time=99, max_harvest=1, natural_gift_power=60,
+                         size=1, smoothness=1, soil_dryness=1, raw_data={}))
+    version.bump([3])
+    repository.get_many = MagicMock(wraps=repository.get_many)
+    repository.list_page = MagicMock(wraps=repository.list_page)
+    snapshot.sync(repository, version)
+
+    repository.get_many.assert_called_once_with(["3"])
+    repository.list_page.assert_not_called()
+    assert snapshot.query(order_by="growth_time", descending=True, limit=1)[0]["id"] == 3
+
+    # Falling further behind than the change log reaches forces a full reload
+    for _ in range(3):
+        version.bump([4])
+    snapshot.sync(repository, version)
+    assert repository.list_page.called
+
+def test_read_api_berries_route():
+    rng = random.Random(7)
+    repository = _repository([_post(post_id, rng) for post_id in range(1, 50)])
+    api = ReadApi(repository, MagicMock(), snapshot=BerrySnapshot())
+
+    body = json.loads(api.handle("GET", "/berries?size=50..200&smoothness=lt:30&order_by=-growth_time&limit=3").body)
+    assert len(body["items"]) <= 3
+    assert all(50 <= row["size"] <= 200 and row["smoothness"] < 30 for row in body["items"])
+    assert api.handle("GET", "/berries?size=big").status == 400
+    assert api.handle("GET", "/berries?order_by=flavor").status == 400
+
+def test_failed_reload_keeps_the_previous_snapshot():
+    rng = random.Random(9)
+    repository = _repository([_post(post_id, rng) for post_id in range(1, 30)])
+    snapshot = BerrySnapshot()
+    snapshot.load(repository, page_size=10, version=1)
+    api = ReadApi(repository, MagicMock(), snapshot=BerrySnapshot())
+
+    real_scan, calls = repository.table.scan, []
+
+    def failing_scan(**kwargs):
+        calls.append(None)
+        if len(calls) == 2:
+            raise ConnectionError("dynamodb unavailable")
+        return real_scan(**kwargs)
+
+    repository.table.scan = failing_scan
+    with pytest.raises(RepositoryError):
+        snapshot.load(repository, page_size=10, version=2)
+    assert len(snapshot) == 29 and snapshot.version == 1
+
+    # An unreadable table is a server error, not an empty result
+    repository.table.scan = MagicMock(side_effect=ConnectionError("dynamodb unavailable"))
+    assert api.handle("GET", "/berries").status == 500
+    repository.table.scan = real_scan
+    assert len(json.loads(api.handle("GET", "/berries").body)["items"]) == 20
+
+def test_sync_retries_failed_reads_and_drops_deleted_posts():
+    rng = random.Random(11)
+    repository = _repository([_post(post_id, rng) for post_id in range(1, 10)])
+    version = CacheVersion(FakeRedis(), check_interval=0)
+    snapshot = BerrySnapshot()
+    snapshot.sync(repository, version)
+
+    repository.save(Post(id=2, name="berry-2", growth_time=99, max_harvest=1, natural_gift_power=60,
+                         size=1, smoothness=1, soil_dryness=1, raw_data={}))
+    repository.table.delete_item(Key={"id": "5"})
+    version.bump([2, 5])
+    real_get = repository.table.get_item
+    repository.table.get_item = MagicMock(side_effect=ConnectionError("dynamodb unavailable"))
+    with pytest.raises(RepositoryError):
+        snapshot.sync(repository, version)
+    assert snapshot.version == 0
+
+    repository.table.get_item = real_get
+    snapshot.sync(repository, version)
+    assert snapshot.version == 1 and len(snapshot) == 8
+    assert 5 not in [row["id"] for row in snapshot.query()]
+    assert snapshot.query(order_by="growth_time", descending=True, limit=1)[0]["id"] == 2
+    assert snapshot.count([("growth_time", "eq", 99)]) == 1
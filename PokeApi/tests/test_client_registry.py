@@ -0,0 +1,98 @@
+# tests/test_client_registry.py
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from app.infrastructure.config.client_registry import ClientRegistry
+from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+from app.infrastructure.persistence.dynamodb_comment_repository import DynamoDBCommentRepository
+from app.infrastructure.persistence.dynamodb_post_repository import DynamoDBPostRepository
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+def test_clients_are_built_once_and_shared_across_threads():
+    registry = ClientRegistry(pool_size=4)
+    resource = MagicMock(name="dynamodb")
+    with patch('app.infrastructure.config.database.build_dynamodb_resource', return_value=resource) as build:
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.dynamodb('http://local'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    build.assert_called_once()
+    assert build.call_args.kwargs['config'].max_pool_connections == 4
+    assert all(result is resource for result in results)
+
+
+def test_repositories_and_dlq_use_the_given_registry(tmp_path, monkeypatch):
+    monkeypatch.setenv('DLQ_FALLBACK_PATH', str(tmp_path))
+    registry = ClientRegistry()
+    registry._clients[('dynamodb', 'http://local')] = resource = MagicMock(name="dynamodb")
+    registry._clients[('sqs', 'us-east-1', None)] = sqs = MagicMock(name="sqs")
+
+    posts = DynamoDBPostRepository(endpoint_url='http://local', clients=registry)
+    comments = DynamoDBCommentRepository(endpoint_url='http://local', clients=registry)
+    dlq = DeadLetterQueue(queue_url='http://queue', region_name='us-east-1', clients=registry)
+
+    assert posts.dynamodb is resource and comments.dynamodb is resource
+    assert dlq.client is sqs
+
+
+def test_pool_stats_report_http_pool_usage():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    registry = ClientRegistry(pool_size=3)
+    try:
+        session = registry.http_session()
+        for _ in range(5):
+            session.get(f"http://127.0.0.1:{server.server_port}/")
+        stats = registry.pool_stats()['http']
+    finally:
+        registry.close()
+        server.shutdown()
+        server.server_close()
+
+    assert stats['pools'] == 1 and stats['max_size'] == 3
+    assert stats['requests'] == 5
+    # Keep-alive: sequential requests reuse one connection
+    assert stats['connections_created'] == 1
+    assert stats['in_use'] == 0 and stats['utilisation'] == 0.0
+
+
+def test_pool_stats_tolerate_clients_without_pools():
+    registry = ClientRegistry()
+    registry._clients[('opensearch',)] = object()
+
+    assert registry.pool_stats() == {'opensearch': {'available': False}}
+
+
+def test_redis_callers_wait_for_a_free_connection():
+    registry = ClientRegistry(pool_size=2, redis_pool_size=3, redis_pool_timeout=0.05)
+    pool = registry.redis().connection_pool
+    pool.connection_class = lambda **kwargs: MagicMock(pid=os.getpid())
+
+    held = [pool.get_connection() for _ in range(3)]
+    with pytest.raises(redis.ConnectionError):
+        pool.get_connection()
+    assert registry.pool_stats()['redis'] == {'max_size': 3, 'in_use': 3, 'connections_created': 3,
+                                              'utilisation': 1.0}
+
+    pool.release(held.pop())
+    assert registry.pool_stats()['redis']['in_use'] == 2
+    assert pool.get_connection() is not None
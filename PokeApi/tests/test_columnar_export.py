@@ -0,0 +1,62 @@
+# tests/test_columnar_export.py
+import json
+import pytest
+from benchmarks.fakes import InMemoryDynamoDB
+from app.domain.entities.comment import Comment
+from app.domain.entities.post import Post
+from app.infrastructure.export import export_tables, read_npz_export
+from app.infrastructure.persistence import DynamoDBCommentRepository, DynamoDBPostRepository
+
+def _raw(post_id):
+    return {"id": post_id, "firmness": {"name": "soft", "url": "u"},
+            "flavors": [{"flavor": {"name": "spicy", "url": "u"}, "potency": post_id % 7},
+                        {"flavor": {"name": "sour", "url": "u"}, "potency": 10}]}
+
+def _tables(created_at="2024-01-01T00:00:00"):
+    dynamodb = InMemoryDynamoDB()
+    posts = DynamoDBPostRepository(table_name="Posts")
+    comments = DynamoDBCommentRepository(table_name="Comments")
+    posts._dynamodb = comments._dynamodb = dynamodb
+    _add(posts, comments, range(1, 26), created_at)
+    return posts, comments
+
+def _add(posts, comments, ids, created_at):
+    for post_id in ids:
+        posts.save(Post(id=post_id, name=f"berry-{post_id}", growth_time=post_id, max_harvest=5,
+                        natural_gift_power=60, size=20, smoothness=25, soil_dryness=15,
+                        raw_data=_raw(post_id), created_at=created_at))
+        comments.save(Comment(id=f"c-{post_id}", post_id=post_id, flavor="spicy", potency=post_id % 7,
+                              raw_data=_raw(post_id)["flavors"][0], created_at=created_at))
+
+def test_parquet_export_flattens_raw_data_into_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    posts, comments = _tables()
+    results = export_tables({"posts": posts.table, "comments": comments.table}, str(tmp_path),
+                            fmt="parquet", row_group_size=10, page_size=7)
+
+    post_file = pq.ParquetFile(results[0]["path"])
+    assert post_file.metadata.num_row_groups == 3
+    table = post_file.read()
+    assert sorted(table.column("id").to_pylist()) == list(range(1, 26))
+    assert set(table.column("firmness").to_pylist()) == {"soft"}
+    assert table.column("potency_sour").to_pylist() == [10] * 25
+    assert table.column("potency_sweet").null_count == 25
+    assert pq.read_table(results[1]["path"]).column("flavor_url").to_pylist() == ["u"] * 25
+    assert json.loads(post_file.metadata.metadata[b"export"])["rows"] == 25
+
+def test_incremental_npz_export_only_includes_new_items(tmp_path):
+    posts, comments = _tables()
+    tables = {"posts": posts.table, "comments": comments.table}
+    first = export_tables(tables, str(tmp_path), fmt="npz", row_group_size=4, page_size=6)
+    assert [result["rows"] for result in first] == [25, 25]
+
+    _add(posts, comments, range(26, 31), "2024-02-01T00:00:00")
+    second = export_tables(tables, str(tmp_path), fmt="npz", incremental=True)
+
+    assert [result["rows"] for result in second] == [5, 5]
+    assert second[0]["since"] == "2024-01-01T00:00:00"
+    columns = read_npz_export(second[0]["path"])
+    assert sorted(columns["id"].tolist()) == [26, 27, 28, 29, 30]
+    assert columns["potency_sweet"].tolist() == [-1] * 5
+    assert read_npz_export(first[0]["path"])["name"].shape == (25,)
+    assert json.load(open(tmp_path / "export_state.json"))["comments"] == "2024-02-01T00:00:00"
@@ -0,0 +1,41 @@
+# tests/test_comment_ids.py
+import uuid
+from benchmarks.fakes import InMemoryDynamoDB
+from app.domain.entities.comment import Comment
+from app.infrastructure.persistence import DynamoDBCommentRepository
+
+FLAVORS = [{"flavor": {"name": "spicy", "url": "u"}, "potency": 10},
+           {"flavor": {"name": "dry", "url": "u"}, "potency": 0}]
+
+def _repository():
+    repository = DynamoDBCommentRepository(table_name="Comments")
+    repository._dynamodb = InMemoryDynamoDB()
+    return repository
+
+def test_reingest_overwrites_instead_of_duplicating():
+    assert Comment.create(1, FLAVORS[0]).id == Comment.create("1", FLAVORS[0]).id == Comment.make_id(1, "spicy")
+    assert Comment.create(1, FLAVORS[0]).id != Comment.create(1, FLAVORS[1]).id != Comment.create(2, FLAVORS[1]).id
+
+    repository = _repository()
+    for _ in range(3):
+        repository.save_many(Comment.create(post_id, flavor) for post_id in (1, 2) for flavor in FLAVORS)
+    assert len(repository.table._items) == 4
+    assert sorted(c.flavor for c in repository.get_by_post_id(1)) == ["dry", "spicy"]
+
+def test_compact_collapses_legacy_random_ids():
+    repository = _repository()
+    for day in range(3):
+        for flavor in FLAVORS:
+            repository.save(Comment(id=str(uuid.uuid4()), post_id=1, flavor=flavor["flavor"]["name"],
+                                    potency=flavor["potency"] + day, raw_data=flavor,
+                                    created_at=f"2024-01-0{day + 1}T00:00:00"))
+    repository.save(Comment.create(2, FLAVORS[0]))
+
+    assert repository.compact(dry_run=True) == {"scanned": 7, "kept": 3, "rewritten": 2, "deleted": 6}
+    assert len(repository.table._items) == 7
+
+    repository.compact(page_size=2)
+    comments = {c.flavor: c for c in repository.get_by_post_id(1)}
+    assert len(repository.table._items) == 3
+    assert comments["spicy"].id == Comment.make_id(1, "spicy") and comments["spicy"].potency == 12
+    assert repository.compact() == {"scanned": 3, "kept": 3, "rewritten": 0, "deleted": 0}
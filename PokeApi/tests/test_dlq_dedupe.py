@@ -0,0 +1,99 @@
+# tests/test_dlq_dedupe.py
+from unittest.mock import MagicMock, patch
+
+from benchmarks.fakes import FakeRedis, FakeSQSClient
+from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+from app.infrastructure.external.dlq_dedupe import DLQDeduplicator
+from app.infrastructure.observability.metrics import MetricsRegistry
+from app.infrastructure.workers import dlq_reprocessor
+
+QUEUE_URL = "http://localstack:4566/000000000000/dead-letter-queue"
+
+
+def _dlq(sqs, dedupe=None):
+    dlq = DeadLetterQueue(queue_url=QUEUE_URL, dedupe=dedupe)
+    dlq._client = sqs
+    return dlq
+
+
+def _drain(sqs, dedupe, processor):
+    with patch.object(dlq_reprocessor, "sqs", sqs), \
+            patch.object(dlq_reprocessor, "processor", processor), \
+            patch.object(dlq_reprocessor, "opensearch", MagicMock()), \
+            patch.object(dlq_reprocessor, "deduplicator", lambda: dedupe), \
+            patch.object(dlq_reprocessor, "DLQ_URL", QUEUE_URL):
+        while dlq_reprocessor.poll_once(wait_seconds=0):
+            pass
+
+
+def test_identical_failures_are_enqueued_once():
+    sqs, metrics = FakeSQSClient(), MetricsRegistry()
+    dlq = _dlq(sqs, DLQDeduplicator(FakeRedis(), metrics=metrics))
+
+    assert dlq.add_failed_item("post", {"id": 1, "name": "cheri", "created_at": "2024-01-01T00:00:00"})
+    assert dlq.add_failed_item("post", {"created_at": "2024-02-01T00:00:00", "name": "cheri", "id": 1})
+    assert dlq.add_failed_item("post", {"id": 1, "name": "chesto"})
+    assert dlq.add_failed_item("comment", {"id": 1, "name": "cheri"})
+
+    assert sqs.sent == 3
+    assert metrics.counter("dlq.dedupe.enqueue_skipped") == 1
+    assert metrics.counter("dlq.dedupe.enqueue_skipped[post]") == 1
+
+
+def test_backlog_drain_reprocesses_each_unique_failure_once():
+    sqs, metrics = FakeSQSClient(), MetricsRegistry()
+    # Backlog written before deduplication was enabled
+    backlog = _dlq(sqs)
+    for _ in range(3):
+        backlog.add_failed_item("post", {"id": 7, "name": "oran"})
+    backlog.add_failed_item("comment", {"id": "7-spicy", "post_id": 7})
+    processor = MagicMock()
+
+    _drain(sqs, DLQDeduplicator(FakeRedis(), metrics=metrics), processor)
+
+    assert processor.process_post.call_count == 1
+    assert processor.process_comment.call_count == 1
+    assert sqs.deleted == 4 and sqs.depth(QUEUE_URL) == 0
+    assert metrics.counter("dlq.dedupe.reprocess_skipped") == 2
+
+
+def test_failed_retry_is_not_requeued_and_later_failures_are():
+    sqs, redis = FakeSQSClient(), FakeRedis()
+    dedupe = DLQDeduplicator(redis, metrics=MetricsRegistry())
+    dlq = _dlq(sqs, dedupe)
+    dlq.add_failed_item("post", {"id": 9, "name": "pecha"})
+
+    # The retry fails and its ProcessingService tries to enqueue it again
+    processor = MagicMock()
+    processor.process_post.side_effect = lambda payload: dlq.add_failed_item("post", dict(payload)) and None
+    with patch.object(dlq_reprocessor, "sqs", sqs), patch.object(dlq_reprocessor, "processor", processor), \
+            patch.object(dlq_reprocessor, "deduplicator", lambda: dedupe), \
+            patch.object(dlq_reprocessor, "DLQ_URL", QUEUE_URL):
+        dlq_reprocessor.poll_once(wait_seconds=0)
+    assert sqs.sent == 1 and sqs.deleted == 0
+    sqs.release_in_flight()
+
+    _drain(sqs, dedupe, MagicMock())
+    assert sqs.deleted == 1
+
+    # Once reprocessed, the same content failing again is a new failure
+    assert dlq.add_failed_item("post", {"id": 9, "name": "pecha"})
+    processor = MagicMock()
+    _drain(sqs, dedupe, processor)
+    assert sqs.sent == 2 and processor.process_post.call_count == 1
+
+
+def test_failure_kept_in_local_fallback_does_not_block_later_ones(tmp_path, monkeypatch):
+    monkeypatch.setenv("DLQ_FALLBACK_PATH", str(tmp_path))
+    sqs = FakeSQSClient()
+    dlq = _dlq(sqs, DLQDeduplicator(FakeRedis(), metrics=MetricsRegistry()))
+    real_send = sqs.send_message
+    sqs.send_message = MagicMock(side_effect=ConnectionError("sqs unavailable"))
+
+    assert dlq.add_failed_item("post", {"id": 3, "name": "rawst"})
+    assert len(dlq.get_fallback_items()) == 1
+
+    # Once SQS is back, the same failure still reaches the worker's queue
+    sqs.send_message = real_send
+    assert dlq.add_failed_item("post", {"id": 3, "name": "rawst"})
+    assert sqs.sent == 1
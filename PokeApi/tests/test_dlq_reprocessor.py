@@ -16,3 +16,18 @@ def test_process_success(mock_repo, mock_processor, mock_sqs):
     result = dlq_reprocessor.process_message("post", payload)
 
     assert result is True
+
+@patch("app.infrastructure.workers.dlq_reprocessor.opensearch")
+@patch("app.infrastructure.workers.dlq_reprocessor.processor")
+@patch("app.infrastructure.workers.dlq_reprocessor.post_repo")
+def test_reprocessed_post_is_indexed_from_the_stored_document(mock_repo, mock_processor, mock_opensearch):
+    stored = MagicMock(id=123)
+    stored.to_json.return_value = b'{"id": 123, "raw_data": {"name": "cheri"}}'
+    mock_repo.get_by_id.return_value = stored
+    mock_processor.process_post.return_value = {"ok": True}
+
+    # The DLQ holds the projected payload, without raw_data
+    assert dlq_reprocessor.process_message("post", {"id": 123, "name": "cheri"}) is True
+
+    mock_repo.get_by_id.assert_called_once_with("123")
+    mock_opensearch.index_post.assert_called_once_with(123, stored.to_json.return_value)
@@ -0,0 +1,49 @@
+# tests/test_entities.py
+import json
+import time
+from decimal import Decimal
+from app.domain.entities import Post, Comment, RawPayload
+
+DETAILS = {
+    "id": 1, "name": "cheri", "growth_time": 3, "max_harvest": 5,
+    "natural_gift_power": 60, "size": 20, "smoothness": 25, "soil_dryness": 15,
+    "flavors": [{"flavor": {"name": "spicy", "url": "https://pokeapi.co/api/v2/berry-flavor/1/"}, "potency": 10}]
+}
+
+def _post(**overrides):
+    fields = {key: DETAILS[key] for key in ("id", "name", "growth_time", "max_harvest",
+                                            "natural_gift_power", "size", "smoothness", "soil_dryness")}
+    fields.update(overrides)
+    return Post(raw_data=RawPayload.wrap(DETAILS), **fields)
+
+def test_entities_are_slotted_and_timestamped_per_instance():
+    first = _post()
+    time.sleep(0.001)
+    second = _post()
+
+    assert not hasattr(first, "__dict__")
+    assert first.created_at != second.created_at
+
+def test_to_dict_is_memoized_and_invalidated_on_change():
+    post = _post()
+    first = post.to_dict()
+    first["id"] = "mutated"
+
+    assert post.to_dict()["id"] == 1
+    assert post.to_dict()["raw_data"] == DETAILS
+
+    post.name = "chesto"
+    assert post.to_dict()["name"] == "chesto"
+
+def test_to_json_splices_raw_buffer():
+    post = _post()
+    assert json.loads(post.to_json()) == post.to_dict()
+
+def test_from_dict_restores_stored_items():
+    stored = dict(_post().to_dict(), id="1", size=Decimal("20"), title="ignored")
+    assert Post.from_dict(stored).to_dict() == _post(created_at=stored["created_at"]).to_dict()
+
+    comment = Comment.create(1, DETAILS["flavors"][0])
+    item = dict(comment.to_dict(), post_id="1", potency="10", content="spicy (potency: 10)")
+    restored = Comment.from_dict(item)
+    assert restored == comment
@@ -0,0 +1,42 @@
+# tests/test_flavor_aggregates.py
+import json
+from benchmarks.fakes import FakeRedis, InMemoryDynamoDB
+from app.domain.entities.comment import Comment
+from app.infrastructure.aggregates import FlavorAggregates
+from app.infrastructure.persistence import DynamoDBCommentRepository
+from app.presentation.http import ReadApi
+
+def _comment(post_id, flavor, potency):
+    return Comment.create(post_id, {"flavor": {"name": flavor}, "potency": potency})
+
+def _repository(aggregates):
+    repository = DynamoDBCommentRepository(table_name="Comments", aggregates=aggregates)
+    repository._dynamodb = InMemoryDynamoDB()
+    return repository
+
+def test_reingesting_does_not_double_count():
+    aggregates = FlavorAggregates(FakeRedis())
+    repository = _repository(aggregates)
+
+    assert repository.save_many([_comment(1, "spicy", 10), _comment(2, "spicy", 30), _comment(2, "dry", 5)]) == 3
+    # Same berries again (new comment ids), one with a changed potency
+    repository.save(_comment(1, "spicy", 10))
+    repository.save(_comment(2, "spicy", 20))
+
+    spicy = aggregates.get("spicy", top_k=2)
+    assert spicy["berry_count"] == 2
+    assert spicy["total_potency"] == 30
+    assert spicy["average_potency"] == 15
+    assert spicy["strongest"] == [{"post_id": 2, "potency": 20}, {"post_id": 1, "potency": 10}]
+    assert aggregates.flavors() == ["dry", "spicy"]
+    assert aggregates.get("sweet") is None
+
+def test_read_api_serves_flavor_aggregates():
+    aggregates = FlavorAggregates(FakeRedis())
+    aggregates.record([_comment(1, "spicy", 10), _comment(2, "spicy", 40)])
+    api = ReadApi(post_repository=None, comment_repository=None, aggregates=aggregates)
+
+    summary = json.loads(api.handle("GET", "/flavors").body)
+    assert summary["items"][0]["strongest"] == [{"post_id": 2, "potency": 40}]
+    assert api.handle("GET", "/flavors/sweet").status == 404
+    assert api.handle("GET", "/flavors/spicy?top=x").status == 400
@@ -0,0 +1,56 @@
+# tests/test_item_codec.py
+from decimal import Decimal
+from benchmarks.fakes import InMemoryDynamoDB
+from benchmarks.synthetic import berry_detail
+from app.domain.entities.comment import Comment
+from app.domain.entities.post import Post
+from app.infrastructure.persistence import DynamoDBCommentRepository, DynamoDBPostRepository
+from app.infrastructure.persistence.item_codec import RAW_ATTRIBUTE, ItemCodec
+
+def _post(berry_id=3):
+    details = berry_detail(berry_id)
+    return Post(raw_data=details, **{field: details[field] for field in ("id", "name") + Post.NUMERIC_FIELDS})
+
+def _repositories(migrate_on_read=True):
+    dynamodb = InMemoryDynamoDB()
+    posts = DynamoDBPostRepository(table_name="Posts", codec=ItemCodec(migrate_on_read=migrate_on_read))
+    comments = DynamoDBCommentRepository(table_name="Comments", codec=ItemCodec(migrate_on_read=migrate_on_read))
+    posts._dynamodb = comments._dynamodb = dynamodb
+    return posts, comments
+
+def test_round_trip_stores_compressed_raw_data():
+    posts, comments = _repositories()
+    post = _post()
+    comment = Comment.create(post.id, post.raw_data["flavors"][1])
+    posts.save(post)
+    comments.save(comment)
+
+    stored = posts.table.get_item(Key={"id": "3"})["Item"]
+    assert "raw_data" not in stored and stored["size"] == post.size
+    assert len(stored[RAW_ATTRIBUTE].value) < len(bytes(post.raw_payload)) / 2
+    assert posts.get_by_id("3") == post
+    assert posts.get_all() == [post]
+    assert comments.get_by_post_id(post.id) == [comment]
+    assert comments.table.get_item(Key={"id": comment.id})["Item"]["potency"] == comment.potency
+
+def test_legacy_items_decode_and_migrate():
+    posts, comments = _repositories(migrate_on_read=False)
+    post = _post()
+    posts.table.put_item(Item=dict(post.to_dict(), id="3"))
+    comment = Comment.create(3, post.raw_data["flavors"][0])
+    comments.table.put_item(Item=dict(comment.to_dict(), post_id="3", potency=str(comment.potency),
+                                      content="spicy (potency: 5)"))
+
+    assert posts.get_by_id("3") == post
+    assert "raw_data" in posts.table.get_item(Key={"id": "3"})["Item"]
+    assert comments.backfill(dry_run=True) == {"scanned": 1, "legacy": 1, "migrated": 0}
+
+    assert comments.backfill() == {"scanned": 1, "legacy": 1, "migrated": 1}
+    migrated = comments.table.get_item(Key={"id": comment.id})["Item"]
+    assert "content" not in migrated and migrated["potency"] == Decimal(comment.potency)
+    assert comments.get_by_post_id(3) == [comment]
+
+    posts.codec.migrate_on_read = True
+    posts.list_page(10)
+    assert RAW_ATTRIBUTE in posts.table.get_item(Key={"id": "3"})["Item"]
+    assert posts.backfill()["legacy"] == 0
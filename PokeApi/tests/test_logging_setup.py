@@ -0,0 +1,69 @@
+# tests/test_logging_setup.py
+import io
+import json
+import logging
+
+import pytest
+
+from app.infrastructure.observability import logging_setup
+from app.infrastructure.observability.logging_setup import JsonFormatter, LogSampler, configure_logging
+from app.infrastructure.observability.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    logging_setup._stop_listener()
+    logging_setup._listener = None
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_sampler_logs_every_nth_record_and_counts_the_rest(caplog):
+    metrics = MetricsRegistry()
+    sampler = LogSampler(logging.getLogger("test.sampler"), every=3, metrics=metrics)
+
+    with caplog.at_level(logging.INFO, logger="test.sampler"):
+        for item_id in range(7):
+            sampler.info("item_saved", "Saved %s", item_id)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Saved 0", "Saved 3 (2 similar suppressed)", "Saved 6 (2 similar suppressed)"
+    ]
+    assert metrics.counter('logging.suppressed') == 4
+    assert metrics.counter('logging.suppressed[item_saved]') == 4
+
+
+def test_sampler_skips_filtered_levels_without_counting():
+    metrics = MetricsRegistry()
+    logger = logging.getLogger("test.sampler.filtered")
+    logger.setLevel(logging.WARNING)
+    sampler = LogSampler(logger, every=2, metrics=metrics)
+
+    for item_id in range(5):
+        sampler.info("item_saved", "Saved %s", item_id)
+
+    assert metrics.counter('logging.suppressed') == 0
+
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, "Post %s saved", (7,), None)
+    record.post_id = 7
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['message'] == "Post 7 saved"
+    assert entry['level'] == "INFO" and entry['logger'] == "app.test"
+    assert entry['post_id'] == 7
+
+
+def test_asynchronous_logging_is_written_by_the_listener(restore_root_logger):
+    stream = io.StringIO()
+    configure_logging(level='INFO', json_format=True, asynchronous=True, stream=stream)
+
+    logging.getLogger("app.test").info("Run %s finished", "r1")
+    logging_setup._stop_listener()
+
+    assert json.loads(stream.getvalue())['message'] == "Run r1 finished"
@@ -0,0 +1,15 @@
+# tests/test_pipeline_stats.py
+from app.application.dtos.pipeline_stats import ErrorSummary
+
+def test_error_summary_counts_every_failure_but_keeps_bounded_sample():
+    summary = ErrorSummary(sample_size=10, max_message_length=8)
+    for i in range(10000):
+        summary.record("processing_failed" if i % 4 else "store_failed", item_id=i, message="boom" * 10)
+
+    result = summary.to_dict()
+    assert result["total"] == 10000
+    assert result["by_type"] == {"processing_failed": 7500, "store_failed": 2500}
+    assert len(result["samples"]) == 10
+    assert all(len(sample["message"]) == 8 for sample in result["samples"])
+    # Reservoir keeps items from across the whole run, not just the first ones
+    assert max(sample["id"] for sample in result["samples"]) >= 10
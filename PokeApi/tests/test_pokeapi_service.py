@@ -0,0 +1,66 @@
+# tests/test_pokeapi_service.py
+import pytest
+from unittest.mock import MagicMock, patch
+from app.infrastructure.external.pokeapi_service import PokeAPIService
+
+def _response(payload):
+    response = MagicMock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = payload
+    return response
+
+@pytest.fixture
+def service():
+    circuit_breaker = MagicMock()
+    circuit_breaker.is_open.return_value = False
+    return PokeAPIService(circuit_breaker=circuit_breaker, base_url="http://pokeapi.local/api/v2/berry", page_size=2)
+
+def test_get_all_posts_follows_next_links(service):
+    pages = {
+        "http://pokeapi.local/api/v2/berry/?limit=2": {
+            "results": [{"name": "cheri", "url": "http://pokeapi.local/api/v2/berry/1/"},
+                        {"name": "chesto", "url": "http://pokeapi.local/api/v2/berry/2/"}],
+            "next": "http://pokeapi.local/api/v2/berry/?offset=2&limit=2"
+        },
+        "http://pokeapi.local/api/v2/berry/?offset=2&limit=2": {
+            "results": [{"name": "pecha", "url": "http://pokeapi.local/api/v2/berry/3/"}],
+            "next": None
+        }
+    }
+
+    with patch("app.infrastructure.external.pokeapi_service.requests.get",
+               side_effect=lambda url, **kwargs: _response(pages[url])) as mock_get:
+        posts = service.get_all_posts()
+
+    assert [post["name"] for post in posts] == ["cheri", "chesto", "pecha"]
+    assert mock_get.call_count == 2
+
+def test_failed_request_records_failure_for_pokeapi(service):
+    import requests
+
+    with patch("app.infrastructure.external.pokeapi_service.requests.get",
+               side_effect=requests.exceptions.ConnectionError("down")):
+        with pytest.raises(Exception):
+            service.get_post_details(1)
+
+    service.circuit_breaker.record_failure.assert_called_once_with("pokeapi")
+
+def test_concurrent_detail_fetches_share_one_request(service):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    release = threading.Event()
+
+    def slow_get(url, **kwargs):
+        release.wait(timeout=5)
+        response = _response(None)
+        response.content = b'{"id": 1, "name": "cheri"}'
+        return response
+
+    with patch("app.infrastructure.external.pokeapi_service.requests.get", side_effect=slow_get) as mock_get, \
+            ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(service.get_post_details, 1) for _ in range(3)]
+        threading.Timer(0.1, release.set).start()
+        details = [future.result() for future in futures]
+
+    assert details == [{"id": 1, "name": "cheri"}] * 3
+    mock_get.assert_called_once()
@@ -0,0 +1,115 @@
+# tests/test_post_search.py
+import pytest
+
+from benchmarks.fakes import FakeOpenSearch, FakeOpenSearchError, FakeRedis
+from benchmarks.synthetic import berry_detail
+from app.domain.entities.post import Post
+from app.domain.exceptions import ValidationError
+from app.infrastructure.cache import TTLCache, CacheVersion
+from app.infrastructure.search.opensearch_service import OpenSearchService
+from app.infrastructure.search.post_search import PostSearchService
+
+
+def _indexed(count=25):
+    service = OpenSearchService()
+    service._client = FakeOpenSearch()
+    for post_id in range(1, count + 1):
+        details = berry_detail(post_id)
+        details['name'] = f"{'cheri' if post_id % 2 else 'oran'}-{post_id}"
+        post = Post(id=post_id, raw_data=details, **{field: details[field] for field in ('name',) + Post.NUMERIC_FIELDS})
+        service.index_post(post.id, post.to_dict())
+    return service
+
+
+def _search(service, redis_client=None, **kwargs):
+    return PostSearchService(service, cache=TTLCache(ttl=60), version=CacheVersion(redis_client, check_interval=0),
+                             **kwargs)
+
+
+def test_deep_pages_use_search_after_in_one_point_in_time():
+    service = _indexed()
+    search = _search(service)
+
+    seen, cursor = [], None
+    while True:
+        page = search.search(filters=[('size', 'gte', 50)], order_by='-growth_time', limit=4, cursor=cursor)
+        seen.extend(page['items'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+
+    expected = sorted((berry_detail(i) for i in range(1, 26) if berry_detail(i)['size'] >= 50),
+                      key=lambda doc: (-doc['growth_time'], doc['id']))
+    assert [item['id'] for item in seen] == [doc['id'] for doc in expected]
+    assert all('raw_data' not in item for item in seen)
+
+    requests = service.client.searches
+    assert 'pit' not in requests[0] and 'search_after' not in requests[0]
+    assert len({request['pit']['id'] for request in requests[1:]}) == 1
+    assert all('from' not in request for request in requests)
+    assert service.client.pits == {}
+
+
+def test_equivalent_queries_share_a_cache_entry_until_the_version_changes():
+    service = _indexed()
+    redis_client = FakeRedis()
+    search = _search(service, redis_client)
+
+    first = search.search(name='Cheri', filters=[('size', 'gte', 10), ('size', 'lte', 200)], limit=5)
+    second = search.search(name='  cheri ', filters=[('size', 'lte', 200), ('size', 'gte', 10)], limit=5)
+    assert first == second
+    assert all(item['name'].startswith('cheri') for item in first['items'])
+    assert len(service.client.searches) == 1
+
+    CacheVersion(redis_client).bump()
+    search.search(name='cheri', filters=[('size', 'gte', 10), ('size', 'lte', 200)], limit=5)
+    assert len(service.client.searches) == 2
+
+
+def test_expired_point_in_time_is_reopened_and_foreign_cursors_rejected():
+    service = _indexed()
+    search = _search(service)
+
+    page1 = search.search(order_by='id', limit=5)
+    page2 = search.search(order_by='id', limit=5, cursor=page1['next_cursor'])
+    service.client.pits.clear()
+    search.cache.clear()
+    page3 = search.search(order_by='id', limit=5, cursor=page2['next_cursor'])
+
+    assert [item['id'] for item in page3['items']] == [11, 12, 13, 14, 15]
+    with pytest.raises(ValidationError):
+        search.search(order_by='-id', limit=5, cursor=page1['next_cursor'])
+    with pytest.raises(ValidationError):
+        search.search(filters=[('raw_data', 'gte', 1)])
+
+
+def test_abandoned_cursors_share_a_bounded_set_of_points_in_time():
+    service = _indexed()
+    redis_client = FakeRedis()
+    search = _search(service, redis_client, max_pits=2)
+
+    # Clients that read the second page of a query and walk away
+    for order_by in ('id', 'id', 'id', '-id', 'size', '-size'):
+        first = search.search(order_by=order_by, limit=3)
+        search.search(order_by=order_by, limit=3, cursor=first['next_cursor'])
+        search.cache.clear()
+    assert len(service.client.pits) == 2
+
+    CacheVersion(redis_client).bump()
+    search.search(order_by='id', limit=3)
+    assert service.client.pits == {}
+
+
+def test_pages_are_read_without_a_point_in_time_when_one_cannot_be_opened():
+    service = _indexed()
+    search = _search(service)
+
+    def rejected(**kwargs):
+        raise FakeOpenSearchError(429, 'too many point in time contexts')
+
+    service.client.create_point_in_time = rejected
+    page1 = search.search(order_by='id', limit=5)
+    page2 = search.search(order_by='id', limit=5, cursor=page1['next_cursor'])
+
+    assert [item['id'] for item in page2['items']] == [6, 7, 8, 9, 10]
+    assert 'pit' not in service.client.searches[-1]
@@ -0,0 +1,69 @@
+# tests/test_prefetcher.py
+import time
+import threading
+
+import pytest
+
+from app.infrastructure.external.prefetcher import Prefetcher
+from app.infrastructure.observability.metrics import MetricsRegistry
+
+
+def test_results_keep_source_order_and_fetch_errors_stay_per_key():
+    prefetcher = Prefetcher(lookahead=4, workers=4, metrics=MetricsRegistry())
+
+    def fetch(key):
+        time.sleep(0.01 * (5 - key % 5))
+        if key == 3:
+            raise ValueError("bad berry")
+        return key * 10
+
+    results = []
+    for key, future in prefetcher.map(range(10), fetch):
+        if key == 3:
+            with pytest.raises(ValueError):
+                future.result()
+        else:
+            results.append(future.result())
+
+    assert results == [key * 10 for key in range(10) if key != 3]
+    prefetcher.close()
+
+
+def test_producer_stops_at_lookahead_until_consumer_catches_up():
+    metrics = MetricsRegistry()
+    prefetcher = Prefetcher(lookahead=3, workers=2, metrics=metrics)
+    pulled = []
+    lock = threading.Lock()
+
+    def source():
+        for key in range(100):
+            with lock:
+                pulled.append(key)
+            yield key
+
+    stream = prefetcher.map(source(), lambda key: key)
+    assert next(stream)[0] == 0
+    time.sleep(0.2)
+
+    # One key in the consumer's hands, `lookahead` buffered, one waiting to be put
+    assert len(pulled) <= 1 + 3 + 1
+    assert metrics.counter('pokeapi.prefetch.producer_blocked') >= 1
+    stream.close()
+    prefetcher.close()
+
+
+def test_source_error_is_raised_after_earlier_keys():
+    prefetcher = Prefetcher(lookahead=2, workers=2, metrics=MetricsRegistry())
+
+    def source():
+        yield 1
+        yield 2
+        raise ConnectionError("listing unavailable")
+
+    keys = []
+    with pytest.raises(ConnectionError):
+        for key, future in prefetcher.map(source(), lambda key: key):
+            keys.append(future.result())
+
+    assert keys == [1, 2]
+    prefetcher.close()
@@ -1,8 +1,14 @@
+import gzip
+import json
 import pytest
 import requests
 from unittest.mock import MagicMock, patch
 from app.infrastructure.external.processing_service import ProcessingService
 from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+from app.infrastructure.external.payload_projection import PayloadProjector
+from app.infrastructure.observability.metrics import MetricsRegistry
+from app.infrastructure.serialization import EncodedPayload
+from app.domain.entities import Post, RawPayload
 
 @pytest.fixture
 def mock_dlq():
@@ -10,7 +16,8 @@ def mock_dlq():
 
 @pytest.fixture
 def service(mock_dlq):
-    return ProcessingService(dlq=mock_dlq, endpoint="http://mocked-endpoint.com")
+    # No projections: these tests cover the pass-through behaviour
+    return ProcessingService(dlq=mock_dlq, endpoint="http://mocked-endpoint.com", projector=PayloadProjector({}))
 
 def test_process_post_success(service):
     with patch.object(service, '_make_request', return_value={"status": "ok"}) as mock_request:
@@ -44,7 +51,7 @@ def test_successful_process_post(service, mock_dlq):
 
     with patch("app.infrastructure.external.processing_service.requests.post") as mock_post:
         mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {"result": "ok"}
+        mock_post.return_value.content = b'{"result": "ok"}'
         mock_post.return_value.raise_for_status.return_value = None
 
         result = service.process_post(data)
@@ -73,11 +80,56 @@ def test_retry_on_transient_failure(service):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.raise_for_status.return_value = None
-        mock_resp.json.return_value = {"result": "recovered"}
+        mock_resp.content = b'{"result": "recovered"}'
         return mock_resp
 
     with patch("app.infrastructure.external.processing_service.requests.post", side_effect=flaky_request):
         result = service.process_post(data)
 
     assert result == {"result": "recovered"}
-    assert call_tracker["attempts"] == 3
\ No newline at end of file
+    assert call_tracker["attempts"] == 3
+
+def test_projection_compression_and_metrics(mock_dlq):
+    metrics = MetricsRegistry()
+    session = MagicMock()
+    session.post.return_value.content = b'{"result": "ok"}'
+    service = ProcessingService(dlq=mock_dlq, endpoint="http://mocked-endpoint.com", session=session,
+                                projector=PayloadProjector({"post": ("id", "size", "raw_data.firmness.name")}),
+                                gzip_min_bytes=64, metrics=metrics)
+    post = {"id": 1, "size": 20, "name": "cheri", "raw_data": {"firmness": {"name": "soft", "url": "u"},
+                                                                "flavors": [{"potency": 10}] * 50}}
+
+    service.process_post(post)
+    sent = session.post.call_args.kwargs
+    assert "Content-Encoding" not in sent["headers"]
+    assert json.loads(sent["data"]) == {"id": 1, "size": 20, "raw_data": {"firmness": {"name": "soft"}}}
+
+    service.process_comment({"id": "c", "flavor": "spicy", "raw_data": {"text": "x" * 500}})
+    sent = session.post.call_args.kwargs
+    assert sent["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(sent["data"]))["raw_data"]["text"] == "x" * 500
+    assert metrics.counter("processing.requests_compressed") == 1
+    assert metrics.summary("processing.request_bytes")["count"] == 2
+    assert metrics.summary("processing.payload_bytes")["max"] > len(sent["data"])
+
+def test_dlq_receives_projected_payload(mock_dlq):
+    service = ProcessingService(dlq=mock_dlq, endpoint="http://mocked-endpoint.com")
+    with patch.object(service, '_make_request', side_effect=Exception("Mocked failure")):
+        service.process_comment({"id": "c", "post_id": 1, "flavor": "spicy", "potency": 10,
+                                 "raw_data": {"flavor": {"name": "spicy"}}, "created_at": "t"})
+    item_type, payload = mock_dlq.add_failed_item.call_args.args
+    assert (item_type, dict(payload)) == ("comment", {"id": "c", "post_id": 1, "flavor": "spicy",
+                                                      "potency": 10, "created_at": "t"})
+
+def test_entity_fields_parse_raw_data_only_when_projected(mock_dlq):
+    raw = b'{"firmness": {"name": "soft", "url": "u"}, "flavors": []}'
+    post = Post(id=1, name="cheri", growth_time=3, max_harvest=5, natural_gift_power=60,
+                size=20, smoothness=25, soil_dryness=15, raw_data=raw, created_at="t")
+    payload = EncodedPayload(post.to_fields(), encoded=post.to_json())
+
+    with patch.object(RawPayload, "to_dict", side_effect=AssertionError("raw_data parsed")):
+        assert "raw_data" not in PayloadProjector().project("post", payload)
+    assert PayloadProjector({"post": None}).project("post", payload).encoded() == post.to_json()
+
+    projected = PayloadProjector({"post": ("id", "raw_data.firmness.name")}).project("post", payload)
+    assert json.loads(projected.encoded()) == {"id": 1, "raw_data": {"firmness": {"name": "soft"}}}
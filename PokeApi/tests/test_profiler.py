@@ -0,0 +1,34 @@
+# tests/test_profiler.py
+import pytest
+from app.infrastructure.observability.profiler import StageProfiler
+
+def _work():
+    return [str(i) for i in range(2000)]
+
+def test_disabled_profiler_records_nothing():
+    profiler = StageProfiler()
+    with profiler.stage("process_post"):
+        _work()
+
+    assert profiler.latencies() == {}
+    assert profiler.dump() is None
+
+@pytest.mark.parametrize("mode", ["deterministic", "sampling"])
+def test_enabled_profiler_writes_stage_reports(tmp_path, mode):
+    profiler = StageProfiler(enabled=True, cpu_mode=mode, output_dir=str(tmp_path),
+                             sample_interval=0.001, snapshot_every=1)
+    try:
+        for _ in range(3):
+            with profiler.stage("process_post"):
+                _work()
+    finally:
+        profiler.stop()
+
+    latencies = profiler.latencies()
+    assert latencies["process_post"]["calls"] == 3
+
+    report_dir = profiler.dump()
+    assert (report_dir / "summary.json").exists()
+    assert (report_dir / "allocations.txt").exists()
+    if mode == "deterministic":
+        assert (report_dir / "process_post.pstats").exists()
@@ -0,0 +1,119 @@
+# tests/test_read_api.py
+import json
+import threading
+import http.client
+from unittest.mock import MagicMock
+from benchmarks.fakes import FakeRedis, InMemoryDynamoDB
+from benchmarks.synthetic import berry_detail
+from app.domain.entities.post import Post
+from app.domain.exceptions import RepositoryError
+from app.infrastructure.cache import TTLCache, CacheVersion
+from app.infrastructure.persistence import DynamoDBPostRepository
+from app.presentation.http import ReadApi, build_server
+
+def _post(post_id):
+    details = berry_detail(post_id)
+    return Post(id=post_id, name=details["name"], growth_time=3, max_harvest=5, natural_gift_power=60,
+                size=20, smoothness=25, soil_dryness=15, raw_data=details)
+
+def _api(post_repository, comment_repository=None, redis_client=None):
+    return ReadApi(post_repository, comment_repository or MagicMock(), cache=TTLCache(ttl=60),
+                   version=CacheVersion(redis_client, check_interval=0))
+
+def test_cursor_pagination_reads_one_page_at_a_time():
+    repository = DynamoDBPostRepository(table_name="Posts")
+    repository._dynamodb = InMemoryDynamoDB()
+    for post_id in range(1, 6):
+        repository.save(_post(post_id))
+    repository.table.scan = MagicMock(wraps=repository.table.scan)
+    api = _api(repository)
+
+    seen, target = [], "/posts?limit=2"
+    while target:
+        page = json.loads(api.handle("GET", target).body)
+        seen.extend(item["id"] for item in page["items"])
+        target = f"/posts?limit=2&cursor={page['next_cursor']}" if page["next_cursor"] else None
+
+    assert sorted(seen, key=int) == [1, 2, 3, 4, 5]
+    assert all(call.kwargs["Limit"] == 2 for call in repository.table.scan.call_args_list)
+
+def test_cached_responses_etag_and_write_invalidation():
+    posts = MagicMock()
+    posts.get_by_id.return_value = _post(7)
+    redis_client = FakeRedis()
+    api = _api(posts, redis_client=redis_client)
+
+    first = api.handle("GET", "/posts/7")
+    second = api.handle("GET", "/posts/7", {"If-None-Match": first.headers["ETag"]})
+    assert first.status == 200 and second.status == 304 and second.body == b""
+    posts.get_by_id.assert_called_once()
+
+    CacheVersion(redis_client).bump()
+    assert api.handle("GET", "/posts/7").status == 200
+    assert posts.get_by_id.call_count == 2
+
+def test_missing_post_and_invalid_input():
+    posts = MagicMock()
+    posts.get_by_id.return_value = None
+    api = _api(posts)
+
+    missing = api.handle("GET", "/posts/404")
+    assert missing.status == 404
+    assert api.handle("GET", "/posts/404", {"If-None-Match": missing.headers["ETag"]}).status == 404
+    posts.get_by_id.assert_called_once()
+    assert api.handle("GET", "/posts?limit=abc").status == 400
+    assert api.handle("GET", "/posts?cursor=%%%").status == 400
+    assert api.handle("DELETE", "/posts/1").status == 405
+
+def test_concurrent_misses_load_once():
+    cache = TTLCache(ttl=60)
+    release = threading.Event()
+    loader = MagicMock(side_effect=lambda: (release.wait(1), "value")[1])
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("key", loader))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 5
+    loader.assert_called_once()
+
+def test_search_route_parses_filters_and_rejects_bad_queries():
+    search = MagicMock()
+    search.search.return_value = {"items": [{"id": 3}], "next_cursor": None}
+    api = ReadApi(MagicMock(), MagicMock(), cache=TTLCache(ttl=60), version=CacheVersion(), search=search)
+
+    response = api.handle("GET", "/search?q=cheri&size=10..50&order_by=-growth_time&limit=5")
+    assert response.status == 200 and json.loads(response.body)["items"] == [{"id": 3}]
+    search.search.assert_called_once_with(name="cheri", filters=[("size", "gte", 10), ("size", "lte", 50)],
+                                          order_by="-growth_time", limit=5, cursor=None)
+    assert api.handle("GET", "/search?size=big").status == 400
+
+def test_server_serves_comments_over_keep_alive():
+    comments = MagicMock()
+    comments.get_by_post_id.return_value = []
+    server = build_server(_api(MagicMock(), comments), host="127.0.0.1", port=0, worker_model="pool", threads=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        for _ in range(2):
+            connection.request("GET", "/posts/7/comments")
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read()) == {"post_id": "7", "items": []}
+        comments.get_by_post_id.assert_called_once_with("7")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_repository_failure_is_not_cached():
+    posts = MagicMock()
+    posts.list_page.side_effect = [RepositoryError("Failed to read posts page"), ([_post(1)], None)]
+    api = _api(posts)
+
+    failed = api.handle("GET", "/posts?limit=5")
+    assert failed.status == 500 and json.loads(failed.body)["error"]["type"] == "repository_error"
+    assert [item["id"] for item in json.loads(api.handle("GET", "/posts?limit=5").body)["items"]] == [1]
@@ -0,0 +1,101 @@
+# tests/test_reindex.py
+import json
+
+import pytest
+
+from benchmarks.fakes import FakeOpenSearch, FakeRedis, InMemoryDynamoDB
+from benchmarks.synthetic import berry_detail
+from app.domain.entities.post import Post
+from app.domain.exceptions import ServiceError
+from app.infrastructure.cache import CacheVersion
+from app.infrastructure.observability.metrics import MetricsRegistry
+from app.infrastructure.persistence import DynamoDBPostRepository
+from app.infrastructure.search.opensearch_service import OpenSearchService
+from app.infrastructure.search.reindex import PostReindexer
+
+
+def _post(post_id, created_at="2024-01-01T00:00:00"):
+    details = berry_detail(post_id)
+    return Post(id=post_id, raw_data=details, created_at=created_at,
+                **{field: details[field] for field in ('name',) + Post.NUMERIC_FIELDS})
+
+
+def _setup(count=30, legacy_docs=3):
+    repository = DynamoDBPostRepository(table_name="Posts")
+    repository._dynamodb = InMemoryDynamoDB()
+    for post_id in range(1, count + 1):
+        repository.save(_post(post_id))
+    search = OpenSearchService()
+    search._client = FakeOpenSearch()
+    for post_id in range(1, legacy_docs + 1):
+        search.index_post(post_id, _post(post_id).to_dict())
+    return repository, search
+
+
+def _reindexer(repository, search, tmp_path, **kwargs):
+    return PostReindexer(repository, search_service=search, segments=3, workers=2, page_size=4,
+                         state_path=str(tmp_path / "state.json"), metrics=MetricsRegistry(), **kwargs)
+
+
+def test_parallel_copy_swaps_alias_over_legacy_index(tmp_path):
+    repository, search = _setup()
+    redis_client = FakeRedis()
+    reindexer = _reindexer(repository, search, tmp_path, version=CacheVersion(redis_client))
+
+    result = reindexer.run()
+
+    client = search.client
+    index = result["index"]
+    assert client.aliases["posts"] == {index}
+    assert "posts" not in client.indexes
+    assert result["scanned"] == result["count"] == 30
+    assert client.settings[index] == {"refresh_interval": "1s", "number_of_replicas": 0}
+    assert json.loads(client.indexes[index]["7"]) == json.loads(_post(7).to_json())
+    assert reindexer.metrics.counter("reindex.indexed") == 30
+    assert redis_client.get("cache:posts:version") == "1"
+    assert not (tmp_path / "state.json").exists()
+
+    # The pipeline keeps writing through the alias
+    search.index_post(31, _post(31).to_dict())
+    assert client.count(index="posts")["count"] == 31
+
+
+def test_interrupted_job_resumes_from_checkpoints(tmp_path):
+    repository, search = _setup()
+    client = search.client
+    real_bulk, calls = client.bulk, []
+
+    def failing_bulk(body, **kwargs):
+        calls.append(None)
+        if len(calls) == 4:
+            raise ConnectionError("opensearch unavailable")
+        return real_bulk(body, **kwargs)
+
+    client.bulk = failing_bulk
+    with pytest.raises(ConnectionError):
+        _reindexer(repository, search, tmp_path).run()
+
+    state = json.loads((tmp_path / "state.json").read_text())
+    assert "posts" in client.indexes and "posts" not in client.aliases
+    assert 0 < sum(progress["scanned"] for progress in state["segments"].values()) < 30
+
+    client.bulk = real_bulk
+    repository.save(_post(40, created_at="2099-01-01T00:00:00"))
+    result = _reindexer(repository, search, tmp_path).run()
+
+    assert result["index"] == state["index"]
+    assert result["scanned"] == result["count"]
+    assert result["caught_up"] == 1
+    assert client.count(index="posts")["count"] == 31
+    assert client.aliases["posts"] == {state["index"]}
+
+
+def test_count_check_keeps_the_live_index(tmp_path):
+    repository, search = _setup(count=5, legacy_docs=8)
+
+    with pytest.raises(ServiceError):
+        _reindexer(repository, search, tmp_path).run()
+    assert "posts" in search.client.indexes and not search.client.aliases
+
+    result = _reindexer(repository, search, tmp_path).run(force=True)
+    assert search.client.aliases["posts"] == {result["index"]}
@@ -0,0 +1,86 @@
+# tests/test_request_hedger.py
+import time
+import threading
+
+import pytest
+
+from app.infrastructure.external.request_hedger import RequestHedger
+from app.infrastructure.observability.metrics import MetricsRegistry
+
+
+def _warm_up(hedger, count=20):
+    for _ in range(count):
+        hedger.call(lambda: time.sleep(0.001))
+
+
+def _slow_first_call(result="ok", slow=1.0):
+    calls = []
+    lock = threading.Lock()
+
+    def func():
+        with lock:
+            calls.append(None)
+            first = len(calls) == 1
+        if first:
+            time.sleep(slow)
+            return "slow"
+        return result
+
+    return func, calls
+
+
+def test_slow_call_is_hedged_and_fast_hedge_wins():
+    metrics = MetricsRegistry()
+    hedger = RequestHedger(min_delay=0.02, metrics=metrics)
+    _warm_up(hedger)
+    func, calls = _slow_first_call()
+
+    started = time.perf_counter()
+    result = hedger.call(func)
+
+    assert result == "ok"
+    assert time.perf_counter() - started < 0.5
+    assert len(calls) == 2
+    assert metrics.counter('hedge.hedged') == 1
+    assert metrics.counter('hedge.hedge_wins') == 1
+    hedger.close()
+
+
+def test_no_hedging_while_warming_up_or_when_fast():
+    metrics = MetricsRegistry()
+    hedger = RequestHedger(min_delay=0.05, metrics=metrics)
+    assert hedger.delay() is None
+    _warm_up(hedger)
+
+    assert hedger.call(lambda: "fast") == "fast"
+    assert hedger.delay() == pytest.approx(0.05)
+    assert metrics.counter('hedge.calls') == 21
+    assert metrics.counter('hedge.hedged') == 0
+    hedger.close()
+
+
+def test_budget_caps_hedges():
+    metrics = MetricsRegistry()
+    hedger = RequestHedger(min_delay=0.01, budget=0.0, burst=1, metrics=metrics)
+    _warm_up(hedger)
+
+    for _ in range(2):
+        func, _ = _slow_first_call(slow=0.05)
+        hedger.call(func)
+
+    assert metrics.counter('hedge.hedged') == 1
+    assert metrics.counter('hedge.budget_exhausted') == 1
+    hedger.close()
+
+
+def test_error_is_raised_when_every_attempt_fails():
+    hedger = RequestHedger(min_delay=0.01, metrics=MetricsRegistry())
+    _warm_up(hedger)
+
+    def failing():
+        time.sleep(0.03)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        hedger.call(failing)
+    hedger.close()
@@ -0,0 +1,76 @@
+# tests/test_run_scheduler.py
+import threading
+from unittest.mock import MagicMock
+from benchmarks.fakes import FakeRedis
+from app.infrastructure.scheduling import RunScheduler
+
+def test_only_one_replica_runs_each_slot():
+    redis_client = FakeRedis()
+    job = MagicMock(return_value={"status": "success"})
+    first = RunScheduler(job, interval=60, jitter=0, redis_client=redis_client)
+    second = RunScheduler(job, interval=60, jitter=0, redis_client=redis_client)
+
+    assert first.run_slot(100).run_id == "ingest-100"
+    assert second.run_slot(100) is None
+    assert second.run_slot(101) is not None
+    assert [call.args[0] for call in job.call_args_list] == ["ingest-100", "ingest-101"]
+
+def test_overlapping_run_is_skipped_and_failures_are_recorded():
+    started, release = threading.Event(), threading.Event()
+
+    def slow_job(run_id):
+        started.set()
+        release.wait(1)
+        raise RuntimeError("upstream down")
+
+    scheduler = RunScheduler(slow_job, interval=60, jitter=0)
+    worker = threading.Thread(target=scheduler.run_slot, args=(1,))
+    worker.start()
+    started.wait(1)
+    assert scheduler.run_slot(2) is None
+    release.set()
+    worker.join()
+
+    summary = scheduler.timing_summary()
+    assert summary["runs"] == 1 and summary["failed"] == 1
+    assert scheduler.recent_runs()[0]["error"] == "upstream down"
+
+def test_run_forever_runs_immediately_and_stops():
+    scheduler = None
+
+    def job(run_id):
+        scheduler.stop()
+        return {"status": "success"}
+
+    scheduler = RunScheduler(job, interval=3600, jitter=0)
+    thread = threading.Thread(target=scheduler.run_forever)
+    thread.start()
+    thread.join(2)
+    assert not thread.is_alive()
+    assert scheduler.timing_summary()["runs"] == 1
+
+def test_run_lock_keeps_replicas_from_overlapping():
+    redis_client = FakeRedis()
+    started, release = threading.Event(), threading.Event()
+
+    def long_job(run_id):
+        started.set()
+        release.wait(2)
+        return {"status": "success"}
+
+    first = RunScheduler(long_job, interval=60, jitter=0, redis_client=redis_client, lock_ttl=0.15)
+    second = RunScheduler(MagicMock(return_value={"status": "success"}), interval=60, jitter=0,
+                          redis_client=redis_client, lock_ttl=0.15)
+    worker = threading.Thread(target=first.run_slot, args=(100,))
+    worker.start()
+    started.wait(1)
+
+    # The run outlives several lock TTLs; the heartbeat keeps the lock held
+    for slot in (101, 102, 103):
+        assert second.run_slot(slot) is None
+        threading.Event().wait(0.1)
+    release.set()
+    worker.join()
+
+    assert redis_client.get("scheduler:ingest:running") is None
+    assert second.run_slot(104).run_id == "ingest-104"
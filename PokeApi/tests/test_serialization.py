@@ -0,0 +1,46 @@
+# tests/test_serialization.py
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock
+import pytest
+from app.infrastructure.serialization import (
+    JsonCodec, EncodedPayload, get_codec, encode, encode_envelope
+)
+from app.infrastructure.external.dead_letter_queue import DeadLetterQueue
+
+CODECS = ['json', 'orjson']
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codecs_round_trip_with_decimals(name):
+    pytest.importorskip(name)
+    codec = get_codec(name)
+    encoded = codec.dumps({"id": Decimal("7"), "ratio": Decimal("0.5"), "name": "cheri"})
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {"id": 7, "ratio": 0.5, "name": "cheri"}
+
+def test_encoded_payload_encodes_once_and_resets_on_change():
+    codec = MagicMock(wraps=JsonCodec())
+    payload = EncodedPayload({"id": 1})
+    first = payload.encoded(codec)
+    assert payload.encoded(codec) is first
+    assert codec.dumps.call_count == 1
+
+    payload["name"] = "cheri"
+    assert json.loads(payload.encoded(codec)) == {"id": 1, "name": "cheri"}
+    assert codec.dumps.call_count == 2
+
+def test_encode_envelope_splices_cached_bytes():
+    payload = EncodedPayload({"id": 1}, encoded=b'{"id":1}')
+    body = encode_envelope({"type": "post", "retry_count": 0}, "data", payload)
+    assert json.loads(body) == {"type": "post", "retry_count": 0, "data": {"id": 1}}
+    assert encode(payload) is payload.encoded()
+
+def test_dlq_message_body_contains_item(tmp_path, monkeypatch):
+    monkeypatch.setenv("DLQ_FALLBACK_PATH", str(tmp_path))
+    dlq = DeadLetterQueue(queue_url="http://localstack:4566/000000000000/dead-letter-queue")
+    dlq._client = MagicMock()
+
+    assert dlq.add_failed_item("comment", EncodedPayload({"id": "abc", "potency": 10}))
+    body = json.loads(dlq._client.send_message.call_args.kwargs["MessageBody"])
+    assert body["type"] == "comment"
+    assert body["data"] == {"id": "abc", "potency": 10}
@@ -0,0 +1,75 @@
+# tests/test_shard_coordinator.py
+import time
+import pytest
+from benchmarks.fakes import FakeRedis
+from app.infrastructure.coordination import ShardCoordinator, LeaseLostError
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+def _replica(redis_client, **kwargs):
+    options = dict(run_id="test-run", shard_size=10, lease_ttl=0.2)
+    options.update(kwargs)
+    return ShardCoordinator(redis_client, **options)
+
+def test_replicas_claim_disjoint_shards_and_agree_on_layout(redis_client):
+    first, second = _replica(redis_client), _replica(redis_client, shard_size=25)
+
+    assert first.initialize(35) == 4
+    assert second.initialize(35) == 4
+    assert second.shard_size == 10
+
+    claimed = {first.claim_next(), second.claim_next(), first.claim_next(), second.claim_next()}
+    assert claimed == {0, 1, 2, 3}
+    assert first.claim_next() is None
+    assert second.shard_range(3) == {'offset': 30, 'limit': 10}
+
+def test_stats_are_aggregated_once_per_shard(redis_client):
+    first, second = _replica(redis_client), _replica(redis_client)
+    first.initialize(20)
+    shard = first.claim_next()
+
+    assert first.complete(shard, {"posts_processed": 10, "post_errors:processing_failed": 1})
+    assert not second.complete(shard, {"posts_processed": 10})
+    assert not first.is_complete()
+
+    other = second.claim_next()
+    assert other == 1
+    second.complete(other, {"posts_processed": 9})
+    assert first.wait_for_completion(timeout=1)
+    assert first.run_stats() == {"posts_processed": 19, "post_errors:processing_failed": 1}
+
+def test_expired_lease_is_handed_over_and_old_owner_notices(redis_client):
+    dead, survivor = _replica(redis_client), _replica(redis_client)
+    dead.initialize(10)
+    assert dead.claim_next() == 0
+    assert survivor.claim_next() is None
+
+    time.sleep(0.25)
+    assert survivor.claim_next() == 0
+
+    dead.renew_all()
+    with pytest.raises(LeaseLostError):
+        dead.check_lease(0)
+
+def test_heartbeat_keeps_lease_alive_and_release_hands_it_back(redis_client):
+    owner, other = _replica(redis_client), _replica(redis_client)
+    owner.initialize(10)
+    owner.claim_next()
+    owner.start_heartbeat()
+    try:
+        time.sleep(0.5)
+        assert other.claim_next() is None
+    finally:
+        owner.stop_heartbeat()
+    owner.release_all()
+    assert other.claim_next() == 0
+
+def test_run_id_is_required(redis_client, monkeypatch):
+    monkeypatch.delenv("INGEST_RUN_ID", raising=False)
+    with pytest.raises(ValueError):
+        ShardCoordinator(redis_client)
+
+    monkeypatch.setenv("INGEST_RUN_ID", "deploy-42")
+    assert ShardCoordinator(redis_client).run_id == "deploy-42"
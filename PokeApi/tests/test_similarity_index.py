@@ -0,0 +1,138 @@
+# tests/test_similarity_index.py
+import json
+import random
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+from benchmarks.fakes import FakeRedis, InMemoryDynamoDB
+from app.application.use_cases import FindSimilarBerriesUseCase
+from app.domain.entities.comment import Comment
+from app.domain.entities.post import Post
+from app.domain.exceptions import NotFoundError, RepositoryError
+from app.infrastructure.cache import CacheVersion
+from app.infrastructure.persistence import DynamoDBCommentRepository, DynamoDBPostRepository
+from app.infrastructure.snapshot import SimilarityIndex
+from app.presentation.http import ReadApi
+
+def _berry(post_id, rng):
+    post = Post(id=post_id, name=f"berry-{post_id}", growth_time=rng.randint(1, 24), max_harvest=rng.randint(1, 10),
+                natural_gift_power=rng.randint(60, 100), size=rng.randint(10, 300), smoothness=rng.randint(5, 60),
+                soil_dryness=rng.randint(5, 35), raw_data={})
+    comments = [Comment(id=f"{post_id}-{flavor}", post_id=post_id, flavor=flavor, potency=rng.choice((0, 10, 20)),
+                        raw_data={}) for flavor in Comment.FLAVORS]
+    return post, comments
+
+def _repositories(berries):
+    dynamodb = InMemoryDynamoDB()
+    posts = DynamoDBPostRepository(table_name="Posts")
+    comments = DynamoDBCommentRepository(table_name="Comments")
+    posts._dynamodb = comments._dynamodb = dynamodb
+    for post, post_comments in berries:
+        posts.save(post)
+        comments.save_many(post_comments)
+    return posts, comments
+
+def test_similar_matches_brute_force():
+    rng = random.Random(3)
+    berries = [_berry(post_id, rng) for post_id in range(1, 120)]
+    index = SimilarityIndex(initial_capacity=8)
+    index.upsert(berries)
+
+    matrix = np.array([SimilarityIndex.vector(post, comments) for post, comments in berries])
+    matrix = (matrix - matrix.mean(axis=0)) / matrix.std(axis=0)
+    unit = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+    for metric, scores in (("cosine", -(unit @ unit[9])), ("l2", np.linalg.norm(matrix - matrix[9], axis=1))):
+        expected = [int(row) + 1 for row in np.argsort(scores, kind="stable") if row != 9][:4]
+        assert [row["id"] for row in index.similar(10, k=4, metric=metric)] == expected
+
+    batch = index.similar_many([10, 20, 30], k=3)
+    assert [len(rows) for rows in batch] == [3, 3, 3]
+    with patch("app.infrastructure.snapshot.similarity_index._MAX_SCORE_CELLS", 250):
+        assert index.similar_many([10, 20, 30], k=3) == batch
+    assert batch[0] == index.similar(10, k=3)
+    assert all(row["id"] != 20 for row in batch[1])
+    with pytest.raises(ValueError):
+        index.similar(10, metric="manhattan")
+
+def test_sync_rebuilds_only_changed_berries():
+    rng = random.Random(5)
+    berries = [_berry(post_id, rng) for post_id in range(1, 30)]
+    posts, comments = _repositories(berries)
+    version = CacheVersion(FakeRedis(), check_interval=0)
+    use_case = FindSimilarBerriesUseCase(posts, comments, SimilarityIndex(), version)
+    assert len(use_case.execute(1, k=3)) == 3
+
+    # Make berry 3 an exact copy of berry 7
+    twin = Post.from_dict(dict(berries[6][0].to_dict(), id=3, name="berry-3"))
+    posts.save(twin)
+    comments.save_many(Comment(id=f"3-{c.flavor}", post_id=3, flavor=c.flavor, potency=c.potency, raw_data={})
+                       for c in berries[6][1])
+    version.bump([3])
+    posts.list_page = MagicMock(wraps=posts.list_page)
+    comments.table.query = MagicMock(wraps=comments.table.query)
+
+    nearest = use_case.execute(7, k=1)[0]
+    assert nearest["id"] == 3 and nearest["score"] == pytest.approx(1.0)
+    posts.list_page.assert_not_called()
+    comments.table.query.assert_called_once()
+    with pytest.raises(NotFoundError):
+        use_case.execute(999)
+
+def test_read_api_similar_route():
+    rng = random.Random(7)
+    posts, comments = _repositories([_berry(post_id, rng) for post_id in range(1, 20)])
+    use_case = FindSimilarBerriesUseCase(posts, comments, SimilarityIndex())
+    api = ReadApi(posts, comments, similarity=use_case)
+
+    body = json.loads(api.handle("GET", "/berries/4/similar?k=2&metric=l2").body)
+    assert [row["id"] for row in body["items"]] == [row["id"] for row in use_case.execute(4, 2, "l2")]
+    assert api.handle("GET", "/berries/404/similar").status == 404
+    assert api.handle("GET", "/berries/4/similar?metric=dot").status == 400
+    assert api.handle("GET", "/berries/4/similar?k=0").status == 400
+
+def test_failed_refresh_keeps_serving_the_previous_index():
+    rng = random.Random(9)
+    posts, comments = _repositories([_berry(post_id, rng) for post_id in range(1, 20)])
+    version = CacheVersion(FakeRedis(), check_interval=0, history=1)
+    index = SimilarityIndex()
+    use_case = FindSimilarBerriesUseCase(posts, comments, index, version)
+    api = ReadApi(posts, comments, similarity=use_case)
+    comments.table.scan = MagicMock(side_effect=ConnectionError("dynamodb unavailable"))
+
+    # Nothing to serve yet: a server error rather than an empty index
+    assert api.handle("GET", "/berries/4/similar").status == 500
+    assert not index.loaded
+
+    del comments.table.scan
+    expected = use_case.execute(4, k=2)
+    for _ in range(2):
+        version.bump([5])
+    comments.table.scan = MagicMock(side_effect=ConnectionError("dynamodb unavailable"))
+
+    # The change log no longer reaches back, and the reload fails midway
+    assert use_case.execute(4, k=2) == expected
+    assert len(index) == 19 and index.version == 0
+
+
+def test_failed_sync_keeps_vectors_and_deleted_berries_are_dropped():
+    rng = random.Random(13)
+    berries = [_berry(post_id, rng) for post_id in range(1, 15)]
+    posts, comments = _repositories(berries)
+    version = CacheVersion(FakeRedis(), check_interval=0)
+    index = SimilarityIndex()
+    index.sync(posts, comments, version)
+    before = index.similar(2, k=3)
+
+    for comment in berries[1][1]:
+        comments.save(Comment(id=comment.id, post_id=2, flavor=comment.flavor, potency=99, raw_data={}))
+    posts.table.delete_item(Key={"id": "9"})
+    version.bump([2, 9])
+    comments.table.query = MagicMock(side_effect=ConnectionError("dynamodb unavailable"))
+    with pytest.raises(RepositoryError):
+        index.sync(posts, comments, version)
+    assert index.version == 0 and index.similar(2, k=3) == before
+
+    del comments.table.query
+    index.sync(posts, comments, version)
+    assert index.version == 1 and len(index) == 13 and 9 not in index
+    assert index.similar(2, k=3) != before
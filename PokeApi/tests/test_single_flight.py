@@ -0,0 +1,94 @@
+# tests/test_single_flight.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.coordination.single_flight import SingleFlight
+from app.infrastructure.observability.metrics import MetricsRegistry
+from benchmarks.fakes import FakeRedis
+
+
+def _blocking_fetch(release: threading.Event, calls: list, body: bytes = b'{"id": 1}'):
+    def fetch():
+        calls.append(None)
+        release.wait(timeout=5)
+        return body
+    return fetch
+
+
+def _wait_for(condition, timeout=5.0):
+    finished = threading.Event()
+    while not condition() and not finished.wait(0.005):
+        timeout -= 0.005
+        if timeout <= 0:
+            raise AssertionError("condition not reached")
+
+
+def test_concurrent_callers_in_process_share_one_call():
+    metrics = MetricsRegistry()
+    flight = SingleFlight(metrics=metrics)
+    release, calls = threading.Event(), []
+    fetch = _blocking_fetch(release, calls)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flight.do, "berry/1", fetch) for _ in range(4)]
+        _wait_for(lambda: metrics.counter('pokeapi.single_flight.coalesced') == 3)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [b'{"id": 1}'] * 4
+    assert len(calls) == 1
+    assert metrics.counter('pokeapi.single_flight.upstream') == 1
+    assert flight.hot_keys() == [{'key': 'berry/1', 'coalesced': 3}]
+    assert not any('[' in name for name in metrics.snapshot()['counters'])
+
+
+def test_follower_in_another_process_reuses_published_result():
+    redis = FakeRedis()
+    leader_metrics, follower_metrics = MetricsRegistry(), MetricsRegistry()
+    leader = SingleFlight(redis_client=redis, metrics=leader_metrics)
+    follower = SingleFlight(redis_client=redis, metrics=follower_metrics)
+    release, leader_calls, follower_calls = threading.Event(), [], []
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leading = pool.submit(leader.do, "berry/2", _blocking_fetch(release, leader_calls))
+        _wait_for(lambda: leader_calls)
+        following = pool.submit(follower.do, "berry/2", _blocking_fetch(release, follower_calls))
+        release.set()
+        assert leading.result() == following.result() == b'{"id": 1}'
+
+    assert follower_calls == []
+    assert follower_metrics.counter('pokeapi.single_flight.coalesced_remote') == 1
+    assert redis.get("sf:pokeapi:lock:berry/2") is None
+
+
+def test_leader_error_reaches_followers_and_releases_lock():
+    redis = FakeRedis()
+    flight = SingleFlight(redis_client=redis, metrics=MetricsRegistry())
+    release = threading.Event()
+
+    def failing():
+        release.wait(timeout=5)
+        raise ConnectionError("down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(flight.do, "berry/3", failing) for _ in range(2)]
+        _wait_for(lambda: flight.metrics.counter('pokeapi.single_flight.coalesced') == 1)
+        release.set()
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result()
+
+    assert redis.get("sf:pokeapi:lock:berry/3") is None
+    assert flight.do("berry/3", lambda: b"ok") == b"ok"
+
+
+def test_hot_keys_are_bounded():
+    flight = SingleFlight(metrics=MetricsRegistry(), tracked_keys=2)
+    for key, times in (("berry/1", 3), ("berry/2", 1), ("berry/3", 2)):
+        for _ in range(times):
+            flight._coalesced(key, 'coalesced')
+
+    assert flight.hot_keys() == [{'key': 'berry/3', 'coalesced': 2}, {'key': 'berry/2', 'coalesced': 1}]
+    assert flight.metrics.counter('pokeapi.single_flight.coalesced') == 6
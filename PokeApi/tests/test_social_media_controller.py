@@ -13,8 +13,8 @@ def controller():
     )
 
 def test_execute_pipeline_success(controller):
-    post = MagicMock(id="post123", to_dict=lambda: {"id": "post123"})
-    comment = MagicMock(id="cmt456", to_dict=lambda: {"id": "cmt456"})
+    post = MagicMock(id="post123", to_fields=lambda: {"id": "post123"})
+    comment = MagicMock(id="cmt456", to_fields=lambda: {"id": "cmt456"})
 
     controller.pokeapi_service.fetch_and_transform_posts.return_value = [post]
     controller.pokeapi_service.fetch_comments_for_post.return_value = [comment]
@@ -27,3 +27,19 @@ def test_execute_pipeline_success(controller):
     assert result["status"] == "completed"
     assert result["stats"]["posts_processed"] == 1
     assert result["stats"]["comments_processed"] == 1
+
+def test_streaming_pipeline_summarizes_errors(controller):
+    posts = [MagicMock(id=i, to_fields=lambda i=i: {"id": i}) for i in range(50)]
+    controller.streaming = True
+    controller.error_sample_size = 5
+    controller.pokeapi_service.iter_posts.side_effect = lambda **kwargs: iter(posts)
+    controller.pokeapi_service.iter_comments_for_post.side_effect = lambda post: iter([])
+    controller.post_repository.save.return_value = True
+    controller.processing_service.process_post.side_effect = lambda data: data["id"] % 2 == 0
+
+    result = controller.execute_pipeline()
+    errors = result["stats"]["post_errors"]
+    assert result["stats"]["posts_processed"] == 25
+    assert errors["total"] == 25
+    assert errors["by_type"] == {"processing_failed": 25}
+    assert len(errors["samples"]) == 5
@@ -0,0 +1,43 @@
+# tests/test_startup.py
+import time
+from unittest.mock import MagicMock
+from app.infrastructure.config import LazyProxy
+from app.infrastructure.config.readiness import run_readiness_checks, failed_required
+
+def test_lazy_proxy_builds_target_once_on_first_use():
+    factory = MagicMock(return_value=MagicMock(name="client"))
+    proxy = LazyProxy(factory)
+    assert not proxy.is_resolved
+    factory.assert_not_called()
+
+    proxy.send_message(QueueUrl="q")
+    proxy.send_message(QueueUrl="q")
+
+    factory.assert_called_once()
+    assert proxy.is_resolved
+    assert factory.return_value.send_message.call_count == 2
+
+def test_readiness_checks_run_concurrently():
+    def slow():
+        time.sleep(0.2)
+        return "ok"
+
+    started = time.perf_counter()
+    results = run_readiness_checks({"a": slow, "b": slow, "c": slow}, timeout=5)
+
+    assert time.perf_counter() - started < 0.5
+    assert all(result.ok and result.value == "ok" for result in results.values())
+
+def test_readiness_reports_failures_and_timeouts():
+    def broken():
+        raise ConnectionError("refused")
+
+    results = run_readiness_checks(
+        {"redis": broken, "search": lambda: time.sleep(1), "dynamodb": lambda: None},
+        required=("redis",),
+        timeout=0.1
+    )
+
+    assert failed_required(results, ("redis",)) == {"redis": "refused"}
+    assert not results["search"].ok and "timed out" in results["search"].error
+    assert results["dynamodb"].ok